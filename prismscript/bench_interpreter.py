@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+"""
+bench_interpreter
+=================
+Purpose
+-------
+Provides an entry-point for measuring the performance of the language's execution engines on the
+workloads exercised by ``processor/tests``. Numbers vary wildly between machines, so compare the
+engines against each other, or runs made on the same host before and after a change, rather than
+against any absolute figure.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import gc
+import timeit
+import unittest
+
+from processor import interpreter
+from processor import tests
+from processor.interpreter import (
+ StatementReturn, StatementExit,
+ Sequence, String,
+)
+from processor.tests import (
+ expressions, nodes, functions, conditionals, complex, types, optimizer,
+)
+import stdlib
+import discover_functions
+
+_ENGINES = (
+ interpreter.ENGINE_TREE, interpreter.ENGINE_CLOSURE, interpreter.ENGINE_PYTHON, interpreter.ENGINE_BYTECODE,
+)
+
+_LOOP_LIMIT = 2500 #Some tests hard-break infinite loops; keep them from dominating every workload
+_MATH_ARGUMENTS = {'x': 17, 'y': 5}
+_WORKLOADS = ( #(label, source, [(kind, name, arguments)])
+ ('complex: conditionals_in_loop, 2,000 iterations', 'complex', [
+  ('function', 'conditionals_in_loop', {
+   'iterations': 2000, 'else_iterations': 2000, 'x': 2, 'y': 1,
+   'break_on_if': False, 'break_on_elif_1': False, 'break_on_elif_2': False, 'break_on_else': True,
+  }),
+ ]),
+ ('math: every function', 'math', None),
+ ('conditionals: every argument-free function', 'conditionals', None),
+ ('expressions: every argument-free function', 'expressions', None),
+ ('nodes: every node', 'nodes', None),
+)
+
+_STATEMENT_ITERATIONS = 500
+_STATEMENT_COPIES = 10
+_STATEMENT_LOOP = """
+f(){
+}
+baseline{
+    i = 0;
+    x = 1;
+    pair = [1, 2];
+    nothing = [];
+    while(i < %(iterations)i){
+        i += 1;%(statements)s
+    }
+}
+"""
+_STATEMENTS = ( #(label, statement), each repeated within a loop
+ ('assignment', 'x = i;'),
+ ('augmented assignment', 'x += 1;'),
+ ('unpacking', '[x, y] = pair;'),
+ ('if', 'if(x){}'),
+ ('if/elif/else', 'if(!x){}elif(!x){}else{}'),
+ ('while, never entered', 'while(!x){}'),
+ ('while, broken at once', 'while(x){break;}'),
+ ('for, over nothing', 'for(k in nothing){}'),
+ ('expression', 'x + i;'),
+ ('local function-call', 'f();'),
+ ('scoped function-call', 'test.test();'),
+)
+_TERMINATORS = ( #(label, node), each executed in place of an empty node
+ ('exit', 'exit x;'),
+ ('goto', 'goto empty;'),
+)
+
+_HOST_ROWS = 200000
+_HOST_RETURNS = """
+first{
+    rows = storage.rows();
+    storage.measure();
+    exit rows.get(index=0).get(index=1);
+}
+length{
+    rows = storage.rows();
+    storage.measure();
+    exit rows.length;
+}
+range{
+    numbers = lang.build_range(stop=%(rows)i);
+    storage.measure();
+    exit numbers.get(index=-1);
+}
+""" % {
+ 'rows': _HOST_ROWS,
+}
+
+def _report(label, seconds, operations, unit, baseline=None):
+    speedup = ''
+    if baseline:
+        speedup = '%(speedup)5.2fx' % {
+         'speedup': baseline / seconds,
+        }
+    print("%(label)-64s %(rate)12.1f %(unit)s/s   (%(operations)i in %(seconds).3fs) %(speedup)s" % {
+     'label': label,
+     'rate': operations / seconds,
+     'unit': unit,
+     'operations': operations,
+     'seconds': seconds,
+     'speedup': speedup,
+    })
+
+def _build(source, engine):
+    instance = interpreter.Interpreter(open('processor/test_sources/%(name)s.src' % {
+     'name': source,
+    }).read(), engine=engine)
+    instance.register_scoped_functions(discover_functions.scan(stdlib, ''))
+    instance.register_scoped_functions([('test.test', lambda: 82)])
+    instance.set_loop_limit(_LOOP_LIMIT)
+    return instance
+
+def _list_entry_points(instance):
+    entry_points = [('node', node, None) for node in sorted(instance.list_nodes())]
+    for (function, parameters) in sorted(instance.list_functions()):
+        if not parameters:
+            entry_points.append(('function', function, {}))
+        elif parameters == frozenset(_MATH_ARGUMENTS):
+            entry_points.append(('function', function, _MATH_ARGUMENTS))
+    return entry_points
+
+def _run(instance, entry_points):
+    for (kind, name, arguments) in entry_points:
+        if kind == 'node':
+            generator = instance.execute_node(name)
+        else:
+            generator = instance.execute_function(name, arguments)
+        try:
+            for prompt in generator:
+                generator.send(None)
+        except (StatementReturn, StatementExit):
+            pass
+        except Exception: #Some workloads exercise failures deliberately
+            pass
+
+def bench_workloads(repetitions=50):
+    """
+    Measures how quickly each engine executes the nodes and functions used by ``processor/tests``,
+    with every interpreter constructed, and every entry-point compiled, before timing begins.
+    """
+    for (label, source, entry_points) in _WORKLOADS:
+        baseline = None
+        for engine in _ENGINES:
+            instance = _build(source, engine)
+            points = entry_points or _list_entry_points(instance)
+            count = repetitions
+            if entry_points:
+                count = max(1, repetitions // 20)
+            _run(instance, points)
+            seconds = min(timeit.repeat(lambda: _run(instance, points), number=count, repeat=3))
+            _report("%(label)s [%(engine)s]" % {
+             'label': label,
+             'engine': engine,
+            }, seconds, count * len(points), 'calls', baseline)
+            if baseline is None:
+                baseline = seconds
+
+def _time_node(instance, node, repetitions):
+    _run(instance, [('node', node, None)]) #Compile it first
+    return min(timeit.repeat(lambda: _run(instance, [('node', node, None)]), number=repetitions, repeat=5))
+
+def _report_statement(label, engine, seconds, count):
+    print("%(label)-48s %(nanoseconds)10.0f ns/statement" % {
+     'label': "%(statement)s [%(engine)s]" % {
+      'statement': label,
+      'engine': engine,
+     },
+     'nanoseconds': max(0.0, seconds) * 1e9 / count,
+    })
+
+def bench_statements(repetitions=5):
+    """
+    Measures what each kind of statement costs each engine, once the cost of the loop, or of the
+    node, in which it executes is subtracted.
+    """
+    count = _STATEMENT_ITERATIONS * _STATEMENT_COPIES
+    for engine in _ENGINES:
+        def build(statements):
+            instance = interpreter.Interpreter(_STATEMENT_LOOP % {
+             'iterations': _STATEMENT_ITERATIONS,
+             'statements': ''.join('\n        ' + statement for statement in statements),
+            }, optimize=False, engine=engine) #Nothing may be folded away
+            instance.register_scoped_functions([('test.test', lambda: 82)])
+            instance.set_loop_limit(0)
+            return instance
+        baseline = _time_node(build(()), 'baseline', repetitions)
+        for (label, statement) in _STATEMENTS:
+            seconds = _time_node(build((statement,) * _STATEMENT_COPIES), 'baseline', repetitions)
+            _report_statement(label, engine, seconds - baseline, count * repetitions)
+
+        instance = interpreter.Interpreter("empty{\n}\nunterminated{\n    x = 1;\n}\n" + ''.join(
+         "terminated_%(index)i{\n    x = 1;\n    %(node)s\n}\n" % {
+          'index': index,
+          'node': node,
+         } for (index, (label, node)) in enumerate(_TERMINATORS)
+        ), optimize=False, engine=engine)
+        baseline = _time_node(instance, 'unterminated', count)
+        for (index, (label, node)) in enumerate(_TERMINATORS):
+            seconds = _time_node(instance, 'terminated_%(index)i' % {
+             'index': index,
+            }, count)
+            _report_statement(label, engine, seconds - baseline, count)
+
+def _copy_deeply(value):
+    """
+    Converts `value` as every host container was converted before they were viewed in place.
+    """
+    if isinstance(value, (list, tuple)):
+        return Sequence([_copy_deeply(element) for element in value])
+    elif isinstance(value, str):
+        return String(value)
+    return value
+
+def bench_host_returns(repetitions=5):
+    """
+    Measures what it costs a script to receive a large container from the host, viewed in place,
+    against the same container copied deeply, as it was before views were introduced: the time
+    taken by each run, and the number of objects kept alive by what the script holds, as counted by
+    the garbage-collector, which does not track numbers or strings.
+    """
+    rows = [(i, 'row %(i)i' % {'i': i,}) for i in range(_HOST_ROWS)]
+    for (mode, convert) in (('copied', _copy_deeply), ('viewed', lambda value: value)):
+        objects = [0]
+        instance = interpreter.Interpreter(_HOST_RETURNS)
+        instance.register_scoped_functions([
+         ('storage.rows', lambda: convert(rows)),
+         ('storage.measure', lambda: None),
+         ('lang.build_range', lambda stop: convert(list(range(stop)))),
+        ])
+        for node in ('first', 'length', 'range'):
+            seconds = _time_node(instance, node, repetitions) / repetitions
+            gc.collect()
+            baseline = len(gc.get_objects())
+            def measure():
+                objects[0] = len(gc.get_objects()) - baseline
+            instance.register_scoped_functions([('storage.measure', measure)])
+            _run(instance, [('node', node, None)])
+            instance.register_scoped_functions([('storage.measure', lambda: None)])
+            print("%(label)-48s %(milliseconds)10.2f ms/run %(objects)10i objects" % {
+             'label': "%(node)s, %(rows)i rows [%(mode)s]" % {
+              'node': node,
+              'rows': _HOST_ROWS,
+              'mode': mode,
+             },
+             'milliseconds': seconds * 1000,
+             'objects': objects[0],
+            })
+
+def bench_suite(runs=5):
+    """
+    Measures how quickly each engine gets through the ``processor/tests`` suite, apart from the
+    threading tests, whose time is spent mostly sleeping.
+    """
+    def build_suite():
+        loader = unittest.TestLoader()
+        return unittest.TestSuite([loader.loadTestsFromTestCase(case) for case in (
+         types.MarshallingTestCase, types.RecursionTestCase,
+         expressions.ScopesTestCase, expressions.TypesTestCase, expressions.ConversionTestCase,
+         expressions.SequenceTestCase, expressions.SetTestCase, expressions.DictionaryTestCase,
+         expressions.TestsTestCase, expressions.SuffixesTestCase,
+         nodes.SimpleTestCase, nodes.ExitTestCase, nodes.ExtensionTestCase,
+         functions.MathTestCase,
+         conditionals.IfTestCase, conditionals.WhileTestCase, conditionals.ForTestCase,
+         complex.NestedTestCase, complex.CoroutineTestCase,
+         optimizer.OptimizerTestCase,
+        )])
+
+    baseline = None
+    for engine in _ENGINES:
+        tests.set_engine(engine)
+        count = build_suite().countTestCases()
+        def run():
+            build_suite().run(unittest.TestResult())
+        run() #Warm the parser's cache
+        seconds = min(timeit.repeat(run, number=1, repeat=runs))
+        _report("processor/tests [%(engine)s]" % {
+         'engine': engine,
+        }, seconds, count, 'tests', baseline)
+        if baseline is None:
+            baseline = seconds
+    tests.set_engine(interpreter.ENGINE_TREE)
+
+if __name__ == '__main__':
+    bench_workloads()
+    bench_statements()
+    bench_host_returns()
+    bench_suite()
+
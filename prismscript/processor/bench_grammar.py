@@ -0,0 +1,311 @@
+#!/usr/bin/env python
+"""
+bench
+=====
+Purpose
+-------
+Provides an entry-point for measuring the performance of the language's grammar. Numbers vary
+wildly between machines, so compare runs made on the same host, before and after a change, rather
+than against any absolute figure.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import random
+import subprocess
+import sys
+import threading
+import timeit
+
+from grammar import parser
+from grammar.structure import closed_lexicon
+from grammar.tests import get_source
+
+IMPORT_BUDGET = 0.050 #: The number of seconds importing the grammar may take, at most.
+LEXING_BUDGET = 0.002 #: The number of seconds lexing one KiB of any input may take, at most.
+
+_SOURCES = (
+ 'theoretical_io_model', 'conditional_nested', 'for_nested', 'function_expressions',
+ 'math_exponentiate', 'namespace', 'sequence', 'functioncall_scoped_suffix_call_call',
+)
+
+def _report(label, seconds, operations, unit):
+    print("%(label)-56s %(rate)12.1f %(unit)s/s   (%(operations)i in %(seconds).3fs)" % {
+     'label': label,
+     'rate': operations / seconds,
+     'unit': unit,
+     'operations': operations,
+     'seconds': seconds,
+    })
+
+def bench_import(runs=5):
+    """
+    Measures, in fresh processes, how long it takes to import the grammar and then to digest a
+    first script, which includes constructing the lexer and parser from their precomputed tables.
+    
+    The best import-time observed is checked against ``IMPORT_BUDGET``; ``False`` is returned if
+    it was exceeded.
+    """
+    script = '; '.join((
+     'import timeit',
+     'start = timeit.default_timer()',
+     'from grammar import parser',
+     'imported = timeit.default_timer()',
+     'parser.parse("node{x = 1;}")',
+     'print("%r %r" % (imported - start, timeit.default_timer() - imported))',
+    ))
+    timings = []
+    for i in range(runs):
+        output = subprocess.Popen([sys.executable, '-c', script], stdout=subprocess.PIPE).communicate()[0]
+        timings.append(tuple(float(t) for t in output.decode('utf-8').split()))
+    (import_time, first_parse_time) = min(timings)
+    met = import_time <= IMPORT_BUDGET
+    print("%(label)-56s %(import).1fms (budget: %(budget).1fms, %(verdict)s)" % {
+     'label': "import",
+     'import': import_time * 1000,
+     'budget': IMPORT_BUDGET * 1000,
+     'verdict': met and 'met' or 'EXCEEDED',
+    })
+    print("%(label)-56s %(parse).1fms" % {
+     'label': "first parse, including construction",
+     'parse': first_parse_time * 1000,
+    })
+    return met
+    
+#Inputs designed to provoke backtracking or repeated work in the lexer, as functions that produce
+#roughly `size` characters
+_PATHOLOGICAL_INPUTS = (
+ ('unterminated string of escaped quotes', lambda size: '"' + '\\"' * (size // 2)),
+ ('unterminated string of backslashes', lambda size: "'" + '\\' * size),
+ ('string dense with escapes', lambda size: '"' + '\\\\\\"\\n\\q' * (size // 8) + '"'),
+ ('many short strings', lambda size: '"a\\"b" \'c\' ' * (size // 12)),
+ ('identifier chain', lambda size: 'a' + '.b' * (size // 2)),
+ ('identifier chain ending in a dot', lambda size: 'a' + '.b' * (size // 2) + '.'),
+ ('long identifier', lambda size: 'a' * size),
+ ('digits ending in a dot', lambda size: '1' * size + '.'),
+ ('many integers', lambda size: '-1234 ' * (size // 6)),
+ ('mixed line-endings', lambda size: '\r\n\r\n\n\r' * (size // 6)),
+ ('comment full of quotes', lambda size: '#' + '"\'' * (size // 2)),
+ ('operators', lambda size: '==!=<=>=&&||+=-=^=' * (size // 18)),
+)
+_FUZZ_FRAGMENTS = (
+ '"', "'", '\\', '\\"', 'a', '.', '.a', '1', '-', '1.5', '\r', '\n', '\r\n', '#', '//', ' ', '=', '==',
+ '{', '}', '(', ')', '[', ']', ',', ';', 'if', 'None', '!', '&&', '^=',
+)
+
+def _lex(lexer, source):
+    """
+    Consumes every token in ``source``, stopping quietly at the first illegal character.
+    """
+    lexer.input(source)
+    lexer.lineno = 1
+    try:
+        while lexer.token() is not None:
+            pass
+    except ValueError:
+        pass
+        
+def bench_lexing(sizes=(16, 64, 256), fuzz_inputs=200, seed=0):
+    """
+    Lexes each of a set of pathological inputs, at every size in ``sizes`` (in KiB), and then
+    ``fuzz_inputs`` random, pathology-dense inputs of the largest size, reporting throughput.
+    
+    Every input is checked against ``LEXING_BUDGET``; since lexing is linear, the per-KiB cost
+    should not grow with the size of the input. ``False`` is returned if the budget was exceeded.
+    """
+    lexer = closed_lexicon.get_lexer().clone()
+    met = True
+    for (label, generate) in _PATHOLOGICAL_INPUTS:
+        for size in sizes:
+            source = generate(size * 1024)
+            start = timeit.default_timer()
+            _lex(lexer, source)
+            seconds = timeit.default_timer() - start
+            kibibytes = len(source) / 1024.0
+            if seconds > LEXING_BUDGET * kibibytes:
+                met = False
+                print("EXCEEDED: %(label)s, %(size)iKiB: %(per_kibibyte).3fms/KiB" % {
+                 'label': label,
+                 'size': size,
+                 'per_kibibyte': seconds * 1000 / kibibytes,
+                })
+            _report("lex, %(label)s, %(size)iKiB" % {
+             'label': label,
+             'size': size,
+            }, seconds, kibibytes, 'KiB')
+            
+    generator = random.Random(seed)
+    worst = 0.0
+    total_seconds = 0.0
+    total_kibibytes = 0.0
+    for i in range(fuzz_inputs):
+        fragments = []
+        length = 0
+        while length < sizes[-1] * 1024:
+            fragment = generator.choice(_FUZZ_FRAGMENTS) * generator.randint(1, 64)
+            fragments.append(fragment)
+            length += len(fragment)
+        source = ''.join(fragments)
+        #Lexing stops at the first illegal character, so measure from each of several offsets
+        for offset in [len(source) * eighth // 8 for eighth in range(8)]:
+            start = timeit.default_timer()
+            _lex(lexer, source[offset:])
+            seconds = timeit.default_timer() - start
+            kibibytes = (len(source) - offset) / 1024.0
+            worst = max(worst, seconds / kibibytes)
+            total_seconds += seconds
+            total_kibibytes += kibibytes
+    _report("lex, fuzzed", total_seconds, total_kibibytes, 'KiB')
+    fuzz_met = worst <= LEXING_BUDGET
+    print("%(label)-56s %(worst).3fms/KiB (budget: %(budget).3fms/KiB, %(verdict)s)" % {
+     'label': "lex, fuzzed, worst case",
+     'worst': worst * 1000,
+     'budget': LEXING_BUDGET * 1000,
+     'verdict': fuzz_met and 'met' or 'EXCEEDED',
+    })
+    return met and fuzz_met
+    
+def bench_threaded_parsing(thread_counts=(1, 2, 4, 8), parses_per_thread=200):
+    """
+    Parses the same corpus from a growing number of threads at once, reporting the aggregate number
+    of scripts loaded per second.
+
+    Every thread works against its own lexer and parser, so none of them wait on the others; under
+    CPython, the interpreter-lock still bounds how far a purely computational load can scale, but
+    the figures should no longer collapse as threads are added.
+    """
+    sources = [get_source(name) for name in _SOURCES]
+    original_cache = parser.get_cache()
+    parser.set_cache(None) #Measure the parser, not the cache
+    try:
+        for thread_count in thread_counts:
+            def work():
+                for i in range(parses_per_thread):
+                    parser.parse(sources[i % len(sources)])
+            threads = [threading.Thread(target=work) for i in range(thread_count)]
+            start = timeit.default_timer()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            _report("parse, %(threads)i thread(s)" % {
+             'threads': thread_count,
+            }, timeit.default_timer() - start, thread_count * parses_per_thread, 'scripts')
+    finally:
+        parser.set_cache(original_cache)
+
+def bench_backends(parses=500):
+    """
+    Parses the same corpus with each backend in turn, reporting the number of scripts loaded per
+    second by each.
+    """
+    sources = [get_source(name) for name in _SOURCES]
+    original_cache = parser.get_cache()
+    parser.set_cache(None) #Measure the parser, not the cache
+    try:
+        for backend in (parser.BACKEND_PLY, parser.BACKEND_DESCENT):
+            parser.parse(sources[0], backend=backend) #Construct the lexer and parser first
+            start = timeit.default_timer()
+            for i in range(parses):
+                parser.parse(sources[i % len(sources)], backend=backend)
+            _report("parse, %(backend)s backend" % {
+             'backend': backend,
+            }, timeit.default_timer() - start, parses, 'scripts')
+    finally:
+        parser.set_cache(original_cache)
+        
+def bench_large_scripts(statements=10000, elements=50000):
+    """
+    Parses a node with a body of ``statements`` statements, a ten-way ``elif`` chain repeated to
+    the same length, and a sequence literal of ``elements`` elements, with each backend.
+    
+    Every collection in the grammar is built in linear time, so doubling either figure should
+    roughly double the time taken.
+    """
+    scripts = (
+     ("%(statements)i-statement body" % {
+      'statements': statements,
+     }, 'node{\n' + ''.join(
+      "    x_%(i)i = x_%(i)i + 1;\n" % {
+       'i': i,
+      } for i in range(statements)
+     ) + '}\n'),
+     ("%(statements)i-branch elif chain" % {
+      'statements': statements,
+     }, 'node{\n    if(x == -1){\n        y = -1;\n    }' + ''.join(
+      "elif(x == %(i)i){\n        y = %(i)i;\n    }" % {
+       'i': i,
+      } for i in range(statements)
+     ) + 'else{\n        y = None;\n    }\n}\n'),
+     ("%(elements)i-element sequence" % {
+      'elements': elements,
+     }, 'node{\n    x = [' + ', '.join(str(i) for i in range(elements)) + '];\n}\n'),
+    )
+    original_cache = parser.get_cache()
+    parser.set_cache(None) #Measure the parser, not the cache
+    try:
+        for (label, source) in scripts:
+            for backend in (parser.BACKEND_PLY, parser.BACKEND_DESCENT):
+                start = timeit.default_timer()
+                parser.parse(source, backend=backend)
+                _report("parse, %(label)s, %(backend)s backend" % {
+                 'label': label,
+                 'backend': backend,
+                }, timeit.default_timer() - start, len(source) / 1024.0, 'KiB')
+    finally:
+        parser.set_cache(original_cache)
+        
+def bench_incremental_reload(definitions=300, reloads=20):
+    """
+    Reloads a script of roughly ten lines per definition, with one of its definitions edited each
+    time, comparing a full parse against an incremental one.
+    """
+    from grammar.cache import ParseCache
+    
+    source = ''.join(
+     "node_%(i)i{\n    x = %(i)i;\n    if(x > 1){\n        y = [x, x * 2, f(a=x)];\n    }else{\n        exit x;\n    }\n    goto node_0;\n}\n\n" % {
+      'i': i,
+     } for i in range(definitions)
+    )
+    edits = [source.replace('x = %(i)i;' % {'i': i,}, 'x = -%(i)i;' % {'i': i,}) for i in range(reloads)]
+    original_cache = parser.get_cache()
+    parser.set_cache(None) #Measure the parser, not the cache
+    try:
+        start = timeit.default_timer()
+        for edit in edits:
+            parser.parse(edit)
+        _report("reload, %(lines)i lines, full" % {
+         'lines': source.count('\n'),
+        }, timeit.default_timer() - start, reloads, 'scripts')
+        
+        cache = ParseCache(max_entries=definitions * 2)
+        parser.parse_incrementally(source, cache)
+        start = timeit.default_timer()
+        for edit in edits:
+            parser.parse_incrementally(edit, cache)
+        _report("reload, %(lines)i lines, incremental" % {
+         'lines': source.count('\n'),
+        }, timeit.default_timer() - start, reloads, 'scripts')
+    finally:
+        parser.set_cache(original_cache)
+        
+if __name__ == '__main__':
+    budgets_met = bench_import()
+    budgets_met = bench_lexing() and budgets_met
+    bench_backends()
+    bench_large_scripts()
+    bench_incremental_reload()
+    bench_threaded_parsing()
+    if not budgets_met:
+        sys.exit(1)
+
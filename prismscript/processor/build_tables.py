@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+"""
+build_tables
+============
+Purpose
+-------
+Regenerates the precomputed lexing and parsing tables that ship with the grammar, so that processes
+never need to construct them at runtime. Run this from the ``processor`` directory whenever a rule
+in ``grammar/structure`` changes, then commit the resulting ``lextab`` and ``parsetab`` modules.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import os
+
+from grammar.structure import closed_lexicon
+from grammar.structure import syntax
+
+if __name__ == '__main__':
+    outputdir = os.path.dirname(os.path.abspath(syntax.__file__))
+    closed_lexicon.write_table(outputdir)
+    syntax.write_table(outputdir)
+
@@ -0,0 +1,791 @@
+"""
+bytecode
+========
+Purpose
+-------
+Provides an execution engine that compiles each node and function, the first time it is executed,
+into a compact, register-based bytecode, and runs it in a single virtual-machine loop on an
+explicit stack of frames.
+
+Notes
+-----
+Each compiled definition is a `Code` object: an array of instructions, each an opcode and four
+integer operands, alongside a pool of constants, a table of the names it refers to, and the
+statement-position of every instruction. Intermediate values live in a frame's registers.
+
+Variables are resolved when a definition is compiled: each name in the table doubles as the index
+of a slot in every frame that executes it, so reading or assigning a local variable is a list
+access, rather than a search of dictionaries. A name whose slot is unassigned falls back to the
+global scope, exactly as under the reference engine, and ``global``-qualified names go straight
+there. Anything that needs a frame's variables by name, like the description of an error or the
+interpreter's resolution of a scoped identifier, sees them through a `_Locals` view of its slots.
+
+Calls to script functions push frames onto the stack, rather than nesting generators or recursing
+in Python, so the whole state of a run is held in its frames, and their number is bounded only by
+`Interpreter.set_depth_limit()`; a ``goto``, from which control never returns, replaces every frame
+with the target node's, so a run's state never grows with the number of transitions. When a
+host-function prompts, the machine's loop passes the prompt straight through; a prompt's answer
+reaches the host-function no matter how deeply the script had nested.
+
+Errors are described as the frames that were executing are unwound, so `ExecutionError`s report the
+same locations as the reference engine, and logging and loop-limits match it too.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import types
+
+from .errors import (
+ Error,
+ ExecutionError,
+ NodeNotFoundError, FunctionNotFoundError,
+ VariableNotFoundError,
+ FlowControl,
+ StatementReturn, StatementExit,
+ get_origin_details,
+)
+from . import log
+from . import marshalling
+from . import operations
+from . import sites
+from .grammar import parser
+from .grammar.parser import Sequence
+
+#Opcodes; operands are given as (a, b, c, d), with R[x] denoting register x
+LOAD_NAME = 1 #: R[a] = the variable names[b], from its slot, then the global scope.
+LOAD_CONST = 2 #: R[a] = constants[b].
+COMPUTE = 3 #: R[a] = constants[d](R[b], R[c]), for arithmetic and comparisons.
+JUMP_IF_FALSE = 4 #: Continue at b if R[a] is false; otherwise, if c is set, consume fuel.
+JUMP_IF_TRUE = 5 #: Continue at b if R[a] is true.
+JUMP = 6 #: Continue at a.
+STORE_LOCAL = 7 #: The local variable names[a], in its slot, = R[b].
+STORE_GLOBAL = 8 #: The global variable names[a] = R[b].
+SCOPE = 9 #: R[a] = the slots or globals that hold names[b], which must be declared within the scope c.
+AUGMENT = 10 #: Apply the augmentation constants[d] to names[b], within the store R[a], with R[c].
+LIMIT = 11 #: Count an iteration in R[a]; continue at b if the loop-limit has been exceeded.
+FOR_PREPARE = 12 #: R[a] = an iterator over R[b], which must be a collection.
+FOR_NEXT = 13 #: R[a] = the next value from the iterator R[b], consuming fuel; continue at c if there is none.
+LOG = 14 #: Log constants[a]; if b is set, consume fuel.
+NOT = 15 #: R[a] = not R[b].
+MOVE = 16 #: R[a] = R[b].
+LOAD_LOCAL = 17 #: R[a] = the local variable names[b], from its slot.
+LOAD_GLOBAL = 18 #: R[a] = the global variable names[b].
+LOAD_SCOPED = 19 #: R[a] = the scoped identifier named at the `sites.Site` constants[b].
+LOAD_SEQUENCE = 20 #: R[a] = a new Sequence copied from constants[b].
+BUILD_SEQUENCE = 21 #: R[a] = a new Sequence of the registers listed in constants[b].
+LOAD_ATTRIBUTE = 22 #: R[a] = the marshalled value at the attribute-path constants[c] of R[b].
+RESOLVE = 23 #: R[a] = the value at the attribute-path constants[c] of R[b].
+CALL_LOCAL = 24 #: R[a] = the result of the local function names[b], given constants[c], linked through the `sites.CallSite` constants[d].
+CALL_SCOPED = 25 #: R[a] = the result of the scoped function names[b], given constants[c], found through the `sites.Site` constants[d].
+CALL_BOUND = 26 #: R[a] = the result of the callable R[b], given constants[c].
+UNPACK = 27 #: Unpack R[b] into the variables constants[a].
+RETURN = 28 #: Return R[a] from the current frame.
+EXIT = 29 #: Exit with R[a].
+GOTO = 30 #: Transfer control to the node names[a].
+END = 31 #: The end of a node or function.
+MISPLACED = 32 #: Fail because of the ``break`` or ``continue`` constants[a], outside of any loop.
+FAIL = 33 #: Fail with a ValueError describing constants[a].
+
+_KIND_NODE = 1
+_KIND_FUNCTION = 2
+_ENTRY_MESSAGES = {
+ _KIND_NODE: "Entering node...",
+ _KIND_FUNCTION: "Entering function...",
+}
+
+_CONSTANTS = frozenset((
+ parser.TERM_NONE, parser.TERM_BOOL, parser.TERM_STRING, parser.TERM_INTEGER, parser.TERM_FLOAT,
+))
+_MATHS = frozenset((
+ parser.MATH_EXPONENTIATE, parser.MATH_MULTIPLY, parser.MATH_DIVIDE, parser.MATH_DIVIDE_INTEGER,
+ parser.MATH_ADD, parser.MATH_SUBTRACT, parser.MATH_MOD,
+))
+_TESTS = frozenset((
+ parser.TEST_EQUALITY, parser.TEST_INEQUALITY,
+ parser.TEST_GREATER_EQUAL, parser.TEST_GREATER, parser.TEST_LESSER_EQUAL, parser.TEST_LESSER,
+))
+_AUGMENTATIONS = frozenset((
+ parser.ASSIGN_ADD, parser.ASSIGN_SUBTRACT, parser.ASSIGN_EXPONENTIATE,
+ parser.ASSIGN_MULTIPLY, parser.ASSIGN_DIVIDE, parser.ASSIGN_DIVIDE_INTEGER, parser.ASSIGN_MOD,
+))
+_LOADS = {
+ parser.TERM_IDENTIFIER_LOCAL: LOAD_NAME,
+ parser.TERM_IDENTIFIER_LOCAL_LOCAL: LOAD_LOCAL,
+ parser.TERM_IDENTIFIER_LOCAL_GLOBAL: LOAD_GLOBAL,
+}
+
+_UNBOUND = object() #Fills the slot of every variable not yet assigned in a frame
+
+class _MisplacedFlowControl(Exception):
+    """
+    Raised by a ``break`` or ``continue`` that was compiled outside of any loop.
+    """
+
+class Code:
+    """
+    A compiled node or function.
+    """
+    instructions = None #A tuple of (opcode, a, b, c, d) tuples
+    constants = None #A tuple of the values the instructions refer to
+    names = None #A tuple of the variable, function, and node names the instructions refer to
+    indices = None #The index of each name, which is also the slot of the variable it names
+    positions = None #The statement-position of each instruction, or None if it has none
+    register_count = 0 #The number of registers each frame needs
+
+    def __init__(self, instructions, constants, names, positions, register_count):
+        self.instructions = instructions
+        self.constants = constants
+        self.names = names
+        self.indices = dict((name, index) for (index, name) in enumerate(names))
+        self.positions = positions
+        self.register_count = register_count
+
+class _Locals:
+    """
+    Presents the slots of a frame as a dictionary of its local variables, by name.
+    """
+    _code = None #The `Code` whose names identify the slots
+    _slots = None #The frame's slots
+
+    def __init__(self, code, slots):
+        self._code = code
+        self._slots = slots
+
+    def __contains__(self, name):
+        index = self._code.indices.get(name)
+        return not index is None and not self._slots[index] is _UNBOUND
+
+    def __getitem__(self, name):
+        index = self._code.indices.get(name)
+        if index is None or self._slots[index] is _UNBOUND:
+            raise KeyError(name)
+        return self._slots[index]
+
+    def __setitem__(self, name, value):
+        self._slots[self._code.indices[name]] = value #Every name a script can assign is compiled
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def get(self, name, default=None):
+        if name in self:
+            return self[name]
+        return default
+
+    def items(self):
+        return [(name, value) for (name, value) in zip(self._code.names, self._slots) if not value is _UNBOUND]
+
+    def keys(self):
+        return [name for (name, value) in self.items()]
+
+class _Frame:
+    """
+    The state of one executing node or function.
+    """
+    code = None #The `Code` being executed
+    registers = None #The values of its registers
+    slots = None #The values of its variables, indexed like the names of its `Code`
+    locals = None #Its variables, by name, as `_Locals`
+    pc = 0 #The index of the next instruction to be executed
+    kind = None #`_KIND_NODE` or `_KIND_FUNCTION`
+    container_name = None #The name under which errors are reported, or a `log.Call` that formats it
+    destination = None #The caller's register that receives a function's result
+
+    def __init__(self, code, kind, container_name, destination):
+        self.code = code
+        self.registers = [None] * code.register_count
+        self.slots = [_UNBOUND] * len(code.names)
+        self.locals = _Locals(code, self.slots)
+        self.kind = kind
+        self.container_name = container_name
+        self.destination = destination
+
+    def describe_error(self, error, interpreter):
+        """
+        Wraps `error`, raised by the instruction before `pc`, in an `ExecutionError` that identifies
+        the statement responsible, exactly as the reference engine would.
+        """
+        container_name = str(self.container_name)
+        position = self.code.positions[self.pc - 1]
+        if position is None:
+            if isinstance(error, ExecutionError):
+                return ExecutionError(container_name, error.location_path, error.message, error.base_exception)
+            elif isinstance(error, Error): #Raised on entry, like running out of fuel
+                return ExecutionError(container_name, [], str(error), error)
+            return ExecutionError(container_name, [], "An unexpected error occurred: %(error)s : %(origin)s" % {
+             'error': str(error),
+             'origin': get_origin_details(),
+            }, error)
+        elif isinstance(error, _MisplacedFlowControl):
+            return ExecutionError(container_name, position, "`%(statement)s` statement not allowed outside of a loop" % {
+             'statement': error.args[0],
+            }, None)
+        elif isinstance(error, ExecutionError):
+            return ExecutionError(container_name, position + error.location_path, error.message, error.base_exception)
+        elif isinstance(error, Error):
+            return ExecutionError(container_name, position, str(error), error)
+        return ExecutionError(container_name, position, "An unexpected error occurred: %(error)s : %(origin)s | locals: %(locals)r | globals: %(globals)r" % {
+         'error': str(error),
+         'origin': get_origin_details(),
+         'locals': sorted(self.locals.items()),
+         'globals': sorted(interpreter._globals.items()),
+        }, error)
+
+class BytecodeEngine:
+    """
+    Executes an `Interpreter`'s nodes and functions as bytecode.
+    """
+    _interpreter = None #The interpreter whose namespace and operating environment are used
+    _nodes = None #Compiled nodes, as (statements, code) pairs, keyed by name
+    _functions = None #Compiled functions, as (statements, code) pairs, keyed by signature
+
+    def __init__(self, interpreter, compiled):
+        """
+        Runs the nodes and functions of `interpreter`, caching their compiled forms in `compiled`,
+        a (nodes, functions) pair of dictionaries, which may be shared with other engines.
+        """
+        self._interpreter = interpreter
+        (self._nodes, self._functions) = compiled
+
+    def execute_function(self, function_name, arguments):
+        """
+        Begins execution of the named function, exactly as `Interpreter.execute_function()`.
+        """
+        return self._run(_KIND_FUNCTION, sites.CallSite(function_name, arguments.keys()), arguments)
+
+    def execute_node(self, node_name):
+        """
+        Begins execution of the named node, exactly as `Interpreter.execute_node()`.
+        """
+        return self._run(_KIND_NODE, node_name, None)
+
+    def _enter_function(self, site, arguments, destination=None):
+        """
+        Provides a new frame for the function called at `site`, a `sites.CallSite`, logging its
+        execution as the reference engine does.
+        """
+        interpreter = self._interpreter
+        interpreter._log.debug("Executing function '%s'...", site.call)
+        code = interpreter._link_function(site, self._link_function)
+        if code is None:
+            raise FunctionNotFoundError(str(site.call), "Function not defined")
+        frame = _Frame(code, _KIND_FUNCTION, site.call, destination)
+        slots = frame.slots
+        indices = code.indices
+        try: #Names address slots, so only values need marshalling
+            for (parameter, value) in arguments.items():
+                slots[indices[parameter]] = interpreter._marshall_type(value)
+        except Exception as e:
+            raise ExecutionError(str(site.call), [], "An unexpected error occurred: %(error)s : %(origin)s" % {
+             'error': str(e),
+             'origin': get_origin_details(),
+            }, e)
+        return frame
+
+    def _enter_node(self, name):
+        """
+        Provides a new frame for the named node, logging its execution as the reference engine does.
+        """
+        interpreter = self._interpreter
+        interpreter._log.debug("Executing node '%s'...", name)
+        statements = interpreter._nodes.get(name)
+        if statements is None:
+            raise NodeNotFoundError(name, "Node not defined")
+        return _Frame(_get_code(self._nodes, name, statements, _KIND_NODE), _KIND_NODE, name, None)
+
+    def _link_function(self, signature, statements):
+        """
+        Provides the compiled form of the function with the given `signature`.
+        """
+        return _get_code(self._functions, signature, statements, _KIND_FUNCTION, signature[1])
+
+    def _run(self, kind, target, arguments):
+        """
+        Runs the node named by `target`, or the function called at `target`, a `sites.CallSite`,
+        until it exits, returns, or fails, passing through any prompts from host-functions.
+        """
+        interpreter = self._interpreter
+        marshall = interpreter._marshall_type
+        materialize_arguments = marshalling.materialize_arguments
+        if kind == _KIND_NODE:
+            frames = [self._enter_node(target)]
+        else:
+            frames = [self._enter_function(target, arguments)]
+        returning = None #A (register, value) pair, for the frame being resumed
+        while True:
+            frame = frames[-1]
+            code = frame.code
+            instructions = code.instructions
+            constants = code.constants
+            names = code.names
+            registers = frame.registers
+            slots = frame.slots
+            _locals = frame.locals
+            _globals = interpreter._globals
+            pc = frame.pc
+            try:
+                if returning is not None: #Marshalled here, so failures are the caller's
+                    registers[returning[0]] = marshall(returning[1])
+                    returning = None
+
+                while True:
+                    (opcode, a, b, c, d) = instructions[pc]
+                    pc += 1
+                    if opcode == LOAD_NAME:
+                        value = slots[b]
+                        if value is _UNBOUND:
+                            try:
+                                value = _globals[names[b]]
+                            except KeyError:
+                                raise VariableNotFoundError(names[b], "Local identifier not declared")
+                        registers[a] = value
+                    elif opcode == LOAD_CONST:
+                        registers[a] = constants[b]
+                    elif opcode == COMPUTE:
+                        registers[a] = constants[d](registers[b], registers[c])
+                    elif opcode == JUMP_IF_FALSE:
+                        if not registers[a]:
+                            pc = b
+                        elif c and interpreter._metered: #The start of a loop's iteration
+                            interpreter._charge()
+                    elif opcode == JUMP_IF_TRUE:
+                        if registers[a]:
+                            pc = b
+                    elif opcode == JUMP:
+                        pc = a
+                    elif opcode == STORE_LOCAL:
+                        slots[a] = registers[b]
+                    elif opcode == STORE_GLOBAL:
+                        _globals[names[a]] = registers[b]
+                    elif opcode == SCOPE:
+                        if not c == parser.TERM_IDENTIFIER_LOCAL_GLOBAL and not slots[b] is _UNBOUND:
+                            registers[a] = slots
+                        else:
+                            registers[a] = interpreter._identify_assignment_scope(names[b], _locals, c)
+                    elif opcode == AUGMENT:
+                        if registers[a] is slots: #Addressed by slot, rather than by name
+                            constants[d](slots, b, registers[c])
+                        else:
+                            constants[d](registers[a], names[b], registers[c])
+                    elif opcode == LIMIT:
+                        registers[a] += 1
+                        if interpreter._loop_limit and interpreter._loop_limit < registers[a]:
+                            interpreter._log.warning("Hard-breaking loop for exceeding iteration-limit of %i cycles", interpreter._loop_limit)
+                            pc = b
+                    elif opcode == FOR_NEXT:
+                        try:
+                            registers[a] = next(registers[b])
+                        except StopIteration:
+                            pc = c
+                        else:
+                            if interpreter._metered:
+                                interpreter._charge()
+                    elif opcode == LOG:
+                        interpreter._log.debug(constants[a])
+                        if b and interpreter._metered: #The start of a statement-list
+                            interpreter._charge()
+                    elif opcode == NOT:
+                        registers[a] = not registers[b]
+                    elif opcode == MOVE:
+                        registers[a] = registers[b]
+                    elif opcode == LOAD_LOCAL:
+                        if slots[b] is _UNBOUND:
+                            raise VariableNotFoundError(names[b], "Local identifier not declared")
+                        registers[a] = slots[b]
+                    elif opcode == LOAD_GLOBAL:
+                        try:
+                            registers[a] = _globals[names[b]]
+                        except KeyError:
+                            raise VariableNotFoundError(names[b], "Local identifier not declared")
+                    elif opcode == LOAD_SCOPED:
+                        registers[a] = interpreter._resolve_scoped_identifier(constants[b], _locals)
+                    elif opcode == LOAD_SEQUENCE:
+                        registers[a] = Sequence(constants[b])
+                    elif opcode == BUILD_SEQUENCE:
+                        registers[a] = Sequence([registers[register] for register in constants[b]])
+                    elif opcode in (LOAD_ATTRIBUTE, RESOLVE):
+                        target = registers[b]
+                        for token in constants[c]:
+                            target = getattr(target, token)
+                        if opcode == LOAD_ATTRIBUTE:
+                            target = marshall(target)
+                        registers[a] = target
+                    elif opcode in (CALL_LOCAL, CALL_SCOPED, CALL_BOUND):
+                        values = {}
+                        for (argument, register) in constants[c]:
+                            values[argument] = registers[register]
+                        if opcode == CALL_BOUND:
+                            function = registers[b]
+                        else:
+                            function = names[b]
+                        interpreter._log.debug("Invoking function '%s'...", log.Call(function, values))
+
+                        try:
+                            if opcode == CALL_LOCAL: #Resolved as by `Interpreter._execute_local_function()`
+                                site = constants[d]
+                                target = slots[b]
+                                if target is _UNBOUND:
+                                    target = _globals.get(function)
+                                if target is None or not site.is_callable(target): #A script function, run in a new frame
+                                    depth = len(frames)
+                                    if frames[0].kind == _KIND_NODE: #Every other frame is a call's
+                                        depth -= 1
+                                    interpreter._deepen(depth)
+                                    frame.pc = pc
+                                    frames.append(self._enter_function(site, values, a))
+                                    break
+                                result = target(**materialize_arguments(target, values))
+                            elif opcode == CALL_SCOPED:
+                                result = interpreter._execute_scoped_function(constants[d], values, _locals)
+                            else:
+                                result = function(**materialize_arguments(function, values))
+                        except StatementReturn as e:
+                            registers[a] = marshall(e.value)
+                            continue
+
+                        if type(result) == types.GeneratorType:
+                            try:
+                                prompt = result.send(None) #Coroutine boilerplate
+                                while True:
+                                    x = yield prompt
+                                    prompt = result.send(x)
+                            except StopIteration: #Let None be returned.
+                                registers[a] = None
+                            except StatementReturn as e: #The function is expected to raise a `StatementReturn` if it has a value
+                                registers[a] = marshall(e.value)
+                        else:
+                            registers[a] = marshall(result)
+                    elif opcode == FOR_PREPARE:
+                        if registers[b] is None: #Logged as the reference engine does, which treats it as a plain body
+                            interpreter._log.debug("Entering node...")
+                            raise ValueError("A foreach-loop cannot iterate over a non-collection")
+                        interpreter._log.debug("Entering foreach-loop...")
+                        registers[a] = iter(registers[b])
+                    elif opcode == UNPACK:
+                        interpreter._unpack(constants[a], registers[b], _locals)
+                    elif opcode in (RETURN, END):
+                        value = None
+                        if opcode == RETURN:
+                            value = registers[a]
+                        if frame.kind == _KIND_NODE:
+                            if opcode == RETURN: #Not actually legal, but suppressing it would be bad.
+                                interpreter._log.warning("Warning: exit-statement inferred from top-level return.")
+                            raise StatementExit(value)
+                        frames.pop()
+                        if not frames:
+                            raise StatementReturn(value)
+                        returning = (frame.destination, value)
+                        break
+                    elif opcode == EXIT:
+                        raise StatementExit(registers[a])
+                    elif opcode == GOTO: #Control never returns, so every frame is replaced by the target's
+                        if not names[a] in interpreter._nodes: #Reported where the goto is
+                            raise NodeNotFoundError(names[a], "Node not defined")
+                        target = self._enter_node(names[a])
+                        del frames[:]
+                        frames.append(target)
+                        break
+                    elif opcode == MISPLACED:
+                        raise _MisplacedFlowControl(constants[a])
+                    else:
+                        raise ValueError(constants[a])
+            except FlowControl:
+                raise
+            except Exception as e: #Nothing in a script can handle it, so unwind every frame
+                frame.pc = pc
+                error = frame.describe_error(e, interpreter)
+                frames.pop()
+                while frames:
+                    error = frames.pop().describe_error(error, interpreter)
+                raise error
+
+def _get_code(cache, key, statements, kind, parameters=()):
+    """
+    Provides the compiled form of `statements`, from `cache` if it was built from the same list.
+    """
+    entry = cache.get(key)
+    if entry is None or not entry[0] is statements:
+        entry = (statements, compile_statements(statements, kind, parameters))
+        cache[key] = entry
+    return entry[1]
+
+#Compilation
+############
+class _Assembler:
+    """
+    Accumulates the instructions, constants, and names of a `Code` object.
+    """
+    instructions = None #Instructions, as mutable lists, so jumps can be patched
+    positions = None #The statement-position of each instruction
+    constants = None #The constant pool
+    names = None #The name table
+    _name_indices = None #The index of each name in the table
+    register_count = 0 #The number of registers allocated
+
+    def __init__(self):
+        self.instructions = []
+        self.positions = []
+        self.constants = []
+        self.names = []
+        self._name_indices = {}
+
+    def emit(self, position, opcode, a=0, b=0, c=0, d=0):
+        """
+        Adds an instruction, providing its index.
+        """
+        self.instructions.append([opcode, a, b, c, d])
+        self.positions.append(position)
+        return len(self.instructions) - 1
+
+    def patch(self, index, operand, target):
+        """
+        Sets the `operand`, numbered from 1, of the instruction at `index` to `target`.
+        """
+        self.instructions[index][operand] = target
+
+    def here(self):
+        return len(self.instructions)
+
+    def register(self):
+        self.register_count += 1
+        return self.register_count - 1
+
+    def constant(self, value):
+        self.constants.append(value)
+        return len(self.constants) - 1
+
+    def name(self, name):
+        index = self._name_indices.get(name)
+        if index is None:
+            index = self._name_indices[name] = len(self.names)
+            self.names.append(name)
+        return index
+
+    def assemble(self):
+        return Code(
+         tuple(tuple(instruction) for instruction in self.instructions),
+         tuple(self.constants), tuple(self.names), tuple(self.positions),
+         self.register_count,
+        )
+
+class _Loop:
+    """
+    Where ``continue`` and ``break`` lead within a loop being compiled.
+    """
+    start = None #The index of the instruction at which the next iteration begins
+    exits = None #The indices of jumps to be patched to the instruction after the loop
+
+    def __init__(self, start):
+        self.start = start
+        self.exits = []
+
+def compile_statements(statements, kind=_KIND_NODE, parameters=()):
+    """
+    Compiles the statement-list `statements`, the body of a node or function, into a `Code` object.
+
+    `parameters` are the names of a function's parameters, each of which gets a slot, like every
+    variable the statements assign.
+    """
+    assembler = _Assembler()
+    for parameter in sorted(parameters):
+        assembler.name(parameter)
+    assembler.emit(None, LOG, assembler.constant(_ENTRY_MESSAGES[kind]), 1)
+    _compile_body(assembler, statements, [], None)
+    assembler.emit(None, END)
+    return assembler.assemble()
+
+def _compile_body(assembler, statements, path, loop):
+    for (i, statement) in enumerate(statements):
+        _compile_statement(assembler, statement, path + [str(i + 1)], loop)
+
+def _compile_statement(assembler, statement, position, loop):
+    statement_type = statement[0]
+    if statement_type == parser.ASSIGN:
+        (scope, name) = statement[1]
+        value = _compile_expression(assembler, statement[2], position)
+        assembler.emit(position, scope == parser.TERM_IDENTIFIER_LOCAL_GLOBAL and STORE_GLOBAL or STORE_LOCAL, assembler.name(name), value)
+    elif statement_type in _AUGMENTATIONS:
+        (scope, name) = statement[1]
+        store = assembler.register()
+        assembler.emit(position, SCOPE, store, assembler.name(name), scope)
+        value = _compile_expression(assembler, statement[2], position)
+        assembler.emit(position, AUGMENT, store, assembler.name(name), value, assembler.constant(operations.get_augmentation(statement_type)))
+    elif statement_type == parser.ASSIGN_SEQUENCE:
+        value = _compile_expression(assembler, statement[2], position)
+        assembler.emit(position, UNPACK, _compile_destination(assembler, statement[1][1]), value)
+    elif statement_type == parser.STMT_RETURN:
+        assembler.emit(position, RETURN, _compile_expression(assembler, statement[1], position))
+    elif statement_type == parser.STMT_EXIT:
+        assembler.emit(position, EXIT, _compile_expression(assembler, statement[1], position))
+    elif statement_type == parser.STMT_GOTO:
+        assembler.emit(position, GOTO, assembler.name(statement[1]))
+    elif statement_type in (parser.STMT_BREAK, parser.STMT_CONTINUE):
+        if loop is None: #Reported against the outermost statement, as the reference engine does
+            assembler.emit(position[:1], MISPLACED, assembler.constant(
+             statement_type == parser.STMT_BREAK and 'break' or 'continue'
+            ))
+        elif statement_type == parser.STMT_BREAK:
+            loop.exits.append(assembler.emit(position, JUMP))
+        else:
+            assembler.emit(position, JUMP, loop.start)
+    elif statement_type == parser.COND_IF:
+        _compile_conditional(assembler, statement[1:], position, loop)
+    elif statement_type == parser.COND_WHILE:
+        _compile_while(assembler, statement[1], statement[2], position)
+    elif statement_type == parser.COND_FOR:
+        _compile_for(assembler, statement[1], statement[2], statement[3], position)
+    else: #An expression, evaluated only for its side-effects
+        _compile_expression(assembler, statement, position)
+
+def _compile_conditional(assembler, statement, position, loop):
+    """
+    Compiles the ``if``-statement `statement`, minus its ``COND_IF`` head.
+    """
+    exits = []
+    for (i, branch) in enumerate(statement):
+        if i == 0:
+            (condition, statements) = branch
+        elif branch[0] == parser.COND_ELIF:
+            (condition, statements) = branch[1:]
+        else:
+            (condition, statements) = (None, branch[1])
+
+        skip = None
+        if not condition is None:
+            skip = assembler.emit(position, JUMP_IF_FALSE, _compile_expression(assembler, condition, position))
+        if statements:
+            assembler.emit(position, LOG, assembler.constant("Entering node..."), 1)
+            _compile_body(assembler, statements, position, loop)
+        if skip is None: #Nothing follows an `else`
+            break
+        exits.append(assembler.emit(position, JUMP))
+        assembler.patch(skip, 2, assembler.here())
+    for index in exits:
+        assembler.patch(index, 1, assembler.here())
+
+def _compile_loop_end(assembler, counter, loop, position):
+    """
+    Counts an iteration and returns to the start of `loop`, leaving it if the loop-limit has been
+    exceeded; the check is made after every iteration that completes without a ``continue``, which
+    is equivalent to the reference engine's checking before the next.
+    """
+    loop.exits.append(assembler.emit(position, LIMIT, counter))
+    assembler.emit(position, JUMP, loop.start)
+    end = assembler.here()
+    for index in loop.exits:
+        instruction = assembler.instructions[index]
+        assembler.patch(index, instruction[0] == JUMP and 1 or 2, end)
+
+def _compile_while(assembler, condition, statements, position):
+    assembler.emit(position, LOG, assembler.constant("Entering while-loop..."))
+    counter = assembler.register()
+    assembler.emit(position, LOAD_CONST, counter, assembler.constant(0))
+    loop = _Loop(assembler.here())
+    loop.exits.append(assembler.emit(position, JUMP_IF_FALSE, _compile_expression(assembler, condition, position), 0, 1))
+    _compile_body(assembler, statements, position, loop)
+    _compile_loop_end(assembler, counter, loop, position)
+
+def _compile_for(assembler, identifier, iterable, statements, position):
+    iterator = assembler.register()
+    assembler.emit(position, FOR_PREPARE, iterator, _compile_expression(assembler, iterable, position))
+    counter = assembler.register()
+    assembler.emit(position, LOAD_CONST, counter, assembler.constant(0))
+    loop = _Loop(assembler.here())
+    value = assembler.register()
+    exhausted = assembler.emit(position, FOR_NEXT, value, iterator)
+    if identifier[0] == parser.SEQUENCE:
+        assembler.emit(position, UNPACK, _compile_destination(assembler, identifier[1]), value)
+    else:
+        assembler.emit(position, identifier[0] == parser.TERM_IDENTIFIER_LOCAL_GLOBAL and STORE_GLOBAL or STORE_LOCAL, assembler.name(identifier[1]), value)
+    _compile_body(assembler, statements, position, loop)
+    _compile_loop_end(assembler, counter, loop, position)
+    assembler.patch(exhausted, 3, assembler.here())
+
+def _compile_destination(assembler, destination):
+    """
+    Gives a slot to every variable in the unpack-`destination`, which is assigned by name, providing
+    the index of the constant that holds it.
+    """
+    for identifier in destination:
+        if identifier[0] in _LOADS:
+            assembler.name(identifier[1])
+    return assembler.constant(destination)
+
+def _compile_expression(assembler, expression, position):
+    """
+    Compiles `expression`, providing the register that will hold its value.
+    """
+    expression_type = expression[0]
+    register = assembler.register()
+    if expression_type in _CONSTANTS:
+        assembler.emit(position, LOAD_CONST, register, assembler.constant(expression[1]))
+    elif expression_type == parser.SEQUENCE_CONSTANT: #Prebuilt by the optimizer; hand out a fresh copy
+        assembler.emit(position, LOAD_SEQUENCE, register, assembler.constant(expression[1]))
+    elif expression_type in _LOADS:
+        assembler.emit(position, _LOADS[expression_type], register, assembler.name(expression[1]))
+    elif expression_type == parser.TERM_IDENTIFIER_SCOPED:
+        assembler.emit(position, LOAD_SCOPED, register, assembler.constant(sites.Site(expression[1])))
+    elif expression_type in _MATHS or expression_type in _TESTS:
+        if expression_type in _MATHS:
+            operation = operations.get_computation(expression_type)
+        else:
+            operation = operations.get_comparison(expression_type)
+        left = _compile_expression(assembler, expression[1], position)
+        right = _compile_expression(assembler, expression[2], position)
+        assembler.emit(position, COMPUTE, register, left, right, assembler.constant(operation))
+    elif expression_type in (parser.TEST_BOOL_OR, parser.TEST_BOOL_AND):
+        assembler.emit(position, MOVE, register, _compile_expression(assembler, expression[1], position))
+        #The right side is reached only if needed
+        decided = assembler.emit(position, expression_type == parser.TEST_BOOL_OR and JUMP_IF_TRUE or JUMP_IF_FALSE, register)
+        assembler.emit(position, MOVE, register, _compile_expression(assembler, expression[2], position))
+        assembler.patch(decided, 2, assembler.here())
+    elif expression_type == parser.TEST_NEGATE:
+        assembler.emit(position, NOT, register, _compile_expression(assembler, expression[1], position))
+    elif expression_type in (parser.FUNCTIONCALL_LOCAL, parser.FUNCTIONCALL_SCOPED):
+        arguments = _compile_arguments(assembler, expression[2], position)
+        if expression_type == parser.FUNCTIONCALL_LOCAL:
+            assembler.emit(position, CALL_LOCAL, register, assembler.name(expression[1]), arguments, assembler.constant(sites.CallSite(expression[1], expression[2].keys())))
+        else:
+            assembler.emit(position, CALL_SCOPED, register, assembler.name(expression[1]), arguments, assembler.constant(sites.Site(expression[1])))
+    elif expression_type == parser.SUFFIX:
+        base = _compile_expression(assembler, expression[1], position)
+        suffix = expression[2]
+        path = assembler.constant(tuple(suffix[1].split('.')))
+        if suffix[0] == parser.TERM_IDENTIFIER_SUFFIX:
+            assembler.emit(position, LOAD_ATTRIBUTE, register, base, path)
+        else: #Resolved before any argument is evaluated
+            target = assembler.register()
+            assembler.emit(position, RESOLVE, target, base, path)
+            arguments = _compile_arguments(assembler, suffix[2], position)
+            assembler.emit(position, CALL_BOUND, register, target, arguments)
+    elif expression_type == parser.SEQUENCE:
+        elements = tuple(_compile_expression(assembler, element, position) for element in expression[1])
+        assembler.emit(position, BUILD_SEQUENCE, register, assembler.constant(elements))
+    else: #Fail only if it is actually reached, as the reference engine would
+        assembler.emit(position, FAIL, assembler.constant("Unknown expression encountered: %(expression)r" % {
+         'expression': expression,
+        }))
+    return register
+
+def _compile_arguments(assembler, arguments, position):
+    """
+    Compiles the values of `arguments`, in order, providing the index of a constant that pairs each
+    argument's name with the register that will hold its value.
+    """
+    return assembler.constant(tuple(
+     (name, _compile_expression(assembler, expression, position))
+     for (name, expression) in arguments.items()
+    ))
@@ -0,0 +1,874 @@
+"""
+closures
+========
+Purpose
+-------
+Provides an execution engine that compiles each node and function, the first time it is executed,
+into a tree of Python closures, each pre-bound to the operands and handlers of one statement or
+expression, so that nothing has to be dispatched on a tuple's type while a script runs.
+
+Notes
+-----
+Every compiled statement or expression is a ``(blocking, function)`` pair. Anything that contains a
+function-call may reach a host-function that prompts, so it is blocking: its function
+provides a generator, with expressions raising their values as `StatementReturn`s, which yields
+whatever it needs run, including calls to the script's functions, to be run by `driver.drive()`, so
+recursion in a script never recurses in Python. A call may provide the `driver.Call` or
+`driver.Host` itself, whose value is sent back instead, so everything that yields a blocking
+expression takes its value either way. Everything else is compiled into plain functions
+that return their values directly, so arithmetic, tests, and variable-access cost no more than the
+Python calls that perform them, and a loop with no calls in it runs without any generators at all.
+
+Compiled bodies are cached against the statement-lists from which they were built, so anything
+replaced by `Interpreter.extend_namespace()` is recompiled the next time it is executed.
+
+Scoping, function-resolution, and type-marshalling are left to the `Interpreter`, so behaviour,
+including logging, loop-limits, and the locations reported by `ExecutionError`s, matches that of
+the reference engine.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import types
+
+from .errors import (
+ Error,
+ ExecutionError,
+ NodeNotFoundError, FunctionNotFoundError,
+ VariableNotFoundError,
+ FlowControl, StatementBreak, StatementContinue,
+ StatementReturn, StatementExit, StatementGoto,
+ get_origin_details,
+)
+from . import driver
+from . import log
+from . import marshalling
+from . import operations
+from . import sites
+from .grammar import parser
+from .grammar.parser import Sequence
+
+#Body-kinds, which determine what is logged on entry and how ``break`` and ``continue`` are treated
+_BODY_NODE = 1
+_BODY_FUNCTION = 2
+_BODY_CONDITIONAL = 3
+_BODY_LOOP = 4
+_ENTRY_MESSAGES = {
+ _BODY_NODE: "Entering node...",
+ _BODY_FUNCTION: "Entering function...",
+ _BODY_CONDITIONAL: "Entering node...",
+}
+
+_MATHS = frozenset((
+ parser.MATH_EXPONENTIATE, parser.MATH_MULTIPLY, parser.MATH_DIVIDE, parser.MATH_DIVIDE_INTEGER,
+ parser.MATH_ADD, parser.MATH_SUBTRACT, parser.MATH_MOD,
+))
+_TESTS = frozenset((
+ parser.TEST_EQUALITY, parser.TEST_INEQUALITY,
+ parser.TEST_GREATER_EQUAL, parser.TEST_GREATER, parser.TEST_LESSER_EQUAL, parser.TEST_LESSER,
+))
+_AUGMENTATIONS = frozenset((
+ parser.ASSIGN_ADD, parser.ASSIGN_SUBTRACT, parser.ASSIGN_EXPONENTIATE,
+ parser.ASSIGN_MULTIPLY, parser.ASSIGN_DIVIDE, parser.ASSIGN_DIVIDE_INTEGER, parser.ASSIGN_MOD,
+))
+_LOCAL_IDENTIFIERS = frozenset((
+ parser.TERM_IDENTIFIER_LOCAL, parser.TERM_IDENTIFIER_LOCAL_LOCAL, parser.TERM_IDENTIFIER_LOCAL_GLOBAL,
+))
+
+class ClosureEngine:
+    """
+    Executes an `Interpreter`'s nodes and functions as compiled closures.
+    """
+    _interpreter = None #The interpreter whose namespace and operating environment are used
+    _nodes = None #Compiled nodes, as (statements, body) pairs, keyed by name
+    _functions = None #Compiled functions, as (statements, body) pairs, keyed by signature
+
+    def __init__(self, interpreter, compiled):
+        """
+        Runs the nodes and functions of `interpreter`, caching their compiled forms in `compiled`,
+        a (nodes, functions) pair of dictionaries, which may be shared with other engines.
+        """
+        self._interpreter = interpreter
+        (self._nodes, self._functions) = compiled
+
+    def call_function(self, site, arguments):
+        """
+        Begins execution of the function called at `site`, a `sites.CallSite`, exactly as
+        `Interpreter.execute_function()`.
+        """
+        return driver.drive(self._interpreter, driver.enter(self._run_function, site, arguments), self._run_function, 1)
+
+    def execute_function(self, function_name, arguments):
+        """
+        Begins execution of the named function, exactly as `Interpreter.execute_function()`.
+        """
+        return self.call_function(sites.CallSite(function_name, arguments.keys()), arguments)
+
+    def execute_node(self, node_name):
+        """
+        Begins execution of the named node, exactly as `Interpreter.execute_node()`.
+        """
+        return driver.drive(self._interpreter, self._run_node(node_name), self._run_function)
+
+    def _link_function(self, signature, statements):
+        """
+        Provides the compiled form of the function with the given `signature`.
+        """
+        return _get_body(self._functions, signature, statements, _BODY_FUNCTION)
+
+    def _run_blocking_function(self, site, body, _locals):
+        """
+        Provides the generator that runs `body`, the blocking function called at `site`.
+        """
+        try:
+            yield body(self._interpreter, _locals)
+        except FlowControl:
+            raise
+        except Exception as e:
+            raise _describe_failure(str(site.call), e)
+        raise StatementReturn(None)
+
+    def _run_function(self, site, arguments):
+        """
+        Runs the function called at `site`, a `sites.CallSite`, as `driver.drive()` runs a
+        `driver.Call`: if nothing in it is blocking, its result is raised as a `StatementReturn` on
+        the spot; otherwise, a generator that raises it is provided.
+        """
+        interpreter = self._interpreter
+        interpreter._log.debug("Executing function '%s'...", site.call)
+
+        compiled = interpreter._link_function(site, self._link_function)
+        if compiled is None:
+            raise FunctionNotFoundError(str(site.call), "Function not defined")
+        (blocking, body) = compiled
+
+        try:
+            _locals = {}
+            _locals.update(interpreter._marshall_arguments(arguments))
+            if blocking:
+                return self._run_blocking_function(site, body, _locals)
+            body(interpreter, _locals)
+        except FlowControl:
+            raise
+        except Exception as e:
+            raise _describe_failure(str(site.call), e)
+        raise StatementReturn(None)
+
+    def _run_node(self, node_name):
+        """
+        Provides the generator, to be run by `driver.drive()`, that executes the named node.
+        """
+        interpreter = self._interpreter
+        interpreter._log.debug("Executing node '%s'...", node_name)
+
+        statements = interpreter._nodes.get(node_name)
+        if statements is None:
+            raise NodeNotFoundError(node_name, "Node not defined")
+        (blocking, body) = _get_body(self._nodes, node_name, statements, _BODY_NODE)
+
+        try:
+            if blocking:
+                yield body(interpreter, {})
+            else:
+                body(interpreter, {})
+        except StatementExit as e:
+            raise StatementExit(e.value)
+        except StatementReturn as e: #Not actually legal, but suppressing it would be bad.
+            interpreter._log.warning("Warning: exit-statement inferred from top-level return.")
+            raise StatementExit(e.value)
+        except StatementGoto: #Handled by `Interpreter._transfer()`
+            raise
+        except Exception as e:
+            raise _describe_failure(node_name, e)
+        raise StatementExit(None) #The end of any node signifies a dead end.
+
+def _get_body(cache, key, statements, kind):
+    """
+    Provides the compiled form of `statements`, from `cache` if it was built from the same list.
+    """
+    entry = cache.get(key)
+    if entry is None or not entry[0] is statements:
+        entry = (statements, compile_statements(statements, kind))
+        cache[key] = entry
+    return entry[1]
+
+def _describe_failure(container_name, error):
+    """
+    Wraps `error`, which escaped the node or function `container_name`, in an `ExecutionError`.
+    """
+    if isinstance(error, ExecutionError):
+        return ExecutionError(container_name, error.location_path, error.message, error.base_exception)
+    elif isinstance(error, Error): #Raised on entry, like running out of fuel
+        return ExecutionError(container_name, [], str(error), error)
+    return ExecutionError(container_name, [], "An unexpected error occurred: %(error)s : %(origin)s" % {
+     'error': str(error),
+     'origin': get_origin_details(),
+    }, error)
+
+def _describe_error(position, error, interpreter, _locals):
+    """
+    Wraps `error`, raised by the statement at `position`, in an `ExecutionError`.
+    """
+    if isinstance(error, ExecutionError):
+        return ExecutionError(position, error.location_path, error.message, error.base_exception)
+    elif isinstance(error, Error):
+        return ExecutionError(position, [], str(error), error)
+    return ExecutionError(position, [], "An unexpected error occurred: %(error)s : %(origin)s | locals: %(locals)r | globals: %(globals)r" % {
+     'error': str(error),
+     'origin': get_origin_details(),
+     'locals': sorted(_locals.items()),
+     'globals': sorted(interpreter._globals.items()),
+    }, error)
+
+def _describe_misplaced(position, flow_control):
+    """
+    Describes a ``break`` or ``continue`` that was encountered outside of any loop.
+    """
+    return ExecutionError(position, [], "`%(statement)s` statement not allowed outside of a loop" % {
+     'statement': isinstance(flow_control, StatementBreak) and 'break' or 'continue',
+    }, None)
+
+#Statements
+###########
+def compile_statements(statements, kind=_BODY_NODE):
+    """
+    Compiles the statement-list `statements` into a ``(blocking, body)`` pair, where ``body``
+    takes ``(interpreter, _locals)``.
+    """
+    compiled = [compile_statement(statement) for statement in statements]
+    message = _ENTRY_MESSAGES.get(kind)
+    confined = kind in (_BODY_NODE, _BODY_FUNCTION) #Whether ``break`` and ``continue`` are misplaced
+
+    if not [True for (blocking, function) in compiled if blocking]:
+        functions = tuple(function for (blocking, function) in compiled)
+        def body(interpreter, _locals):
+            if message:
+                interpreter._log.debug(message)
+            if interpreter._metered: #Every pass through a statement-list consumes fuel
+                interpreter._charge()
+            i = 0
+            try:
+                for (i, function) in enumerate(functions):
+                    function(interpreter, _locals)
+            except (StatementBreak, StatementContinue) as e:
+                if confined:
+                    raise _describe_misplaced(str(i + 1), e)
+                raise
+            except FlowControl:
+                raise
+            except Exception as e:
+                raise _describe_error(str(i + 1), e, interpreter, _locals)
+        return (False, body)
+
+    compiled = tuple(compiled)
+    def body(interpreter, _locals):
+        if message:
+            interpreter._log.debug(message)
+        if interpreter._metered: #Every pass through a statement-list consumes fuel
+            interpreter._charge()
+        i = 0
+        try:
+            for (i, (blocking, function)) in enumerate(compiled):
+                if blocking:
+                    yield function(interpreter, _locals)
+                else:
+                    function(interpreter, _locals)
+        except (StatementBreak, StatementContinue) as e:
+            if confined:
+                raise _describe_misplaced(str(i + 1), e)
+            raise
+        except FlowControl:
+            raise
+        except Exception as e:
+            raise _describe_error(str(i + 1), e, interpreter, _locals)
+    return (True, body)
+
+def compile_statement(statement):
+    """
+    Compiles `statement` into a ``(blocking, function)`` pair, where ``function`` takes
+    ``(interpreter, _locals)``.
+    """
+    statement_type = statement[0]
+    if statement_type == parser.ASSIGN:
+        return _compile_assign(statement[1], compile_expression(statement[2]))
+    elif statement_type in _AUGMENTATIONS:
+        return _compile_augment(statement_type, statement[1], compile_expression(statement[2]))
+    elif statement_type == parser.ASSIGN_SEQUENCE:
+        return _compile_unpack(statement[1][1], compile_expression(statement[2]))
+    elif statement_type == parser.STMT_RETURN:
+        return _compile_return(compile_expression(statement[1]))
+    elif statement_type == parser.STMT_EXIT:
+        return _compile_exit(compile_expression(statement[1]))
+    elif statement_type == parser.STMT_GOTO:
+        return _compile_goto(statement[1])
+    elif statement_type == parser.STMT_BREAK:
+        def break_(interpreter, _locals):
+            raise StatementBreak()
+        return (False, break_)
+    elif statement_type == parser.STMT_CONTINUE:
+        def continue_(interpreter, _locals):
+            raise StatementContinue()
+        return (False, continue_)
+    elif statement_type == parser.COND_IF:
+        return _compile_conditional(statement[1:])
+    elif statement_type == parser.COND_WHILE:
+        return _compile_while(compile_expression(statement[1]), compile_statements(statement[2], _BODY_LOOP))
+    elif statement_type == parser.COND_FOR:
+        return _compile_for(statement[1], compile_expression(statement[2]), compile_statements(statement[3], _BODY_LOOP))
+    return _compile_discard(compile_expression(statement)) #An expression, evaluated only for its side-effects
+
+def _compile_assign(identifier, expression):
+    (scope, name) = identifier
+    (blocking, evaluate) = expression
+    is_global = scope == parser.TERM_IDENTIFIER_LOCAL_GLOBAL
+    if not blocking:
+        if is_global:
+            def assign(interpreter, _locals):
+                interpreter._globals[name] = evaluate(interpreter, _locals)
+        else:
+            def assign(interpreter, _locals):
+                _locals[name] = evaluate(interpreter, _locals)
+        return (False, assign)
+
+    def assign(interpreter, _locals):
+        store = _locals
+        if is_global:
+            store = interpreter._globals
+        try:
+            value = yield evaluate(interpreter, _locals)
+        except StatementReturn as e:
+            value = e.value
+        store[name] = value
+    return (True, assign)
+
+def _compile_augment(method, identifier, expression):
+    (scope, name) = identifier
+    (blocking, evaluate) = expression
+    augmentation = operations.get_augmentation(method)
+    if not blocking:
+        def augment(interpreter, _locals):
+            store = interpreter._identify_assignment_scope(name, _locals, scope)
+            augmentation(store, name, evaluate(interpreter, _locals))
+        return (False, augment)
+
+    def augment(interpreter, _locals):
+        store = interpreter._identify_assignment_scope(name, _locals, scope)
+        try:
+            value = yield evaluate(interpreter, _locals)
+        except StatementReturn as e:
+            value = e.value
+        augmentation(store, name, value)
+    return (True, augment)
+
+def _compile_unpack(destination, expression):
+    (blocking, evaluate) = expression
+    if not blocking:
+        def unpack(interpreter, _locals):
+            interpreter._unpack(destination, evaluate(interpreter, _locals), _locals)
+        return (False, unpack)
+
+    def unpack(interpreter, _locals):
+        try:
+            value = yield evaluate(interpreter, _locals)
+        except StatementReturn as e:
+            value = e.value
+        interpreter._unpack(destination, value, _locals)
+    return (True, unpack)
+
+def _compile_return(expression):
+    (blocking, evaluate) = expression
+    if not blocking:
+        def return_(interpreter, _locals):
+            raise StatementReturn(evaluate(interpreter, _locals))
+        return (False, return_)
+
+    def return_(interpreter, _locals):
+        value = yield evaluate(interpreter, _locals) #A generator raises its value through
+        raise StatementReturn(value)
+    return (True, return_)
+
+def _compile_exit(expression):
+    (blocking, evaluate) = expression
+    if not blocking:
+        def exit_(interpreter, _locals):
+            raise StatementExit(evaluate(interpreter, _locals))
+        return (False, exit_)
+
+    def exit_(interpreter, _locals):
+        try:
+            value = yield evaluate(interpreter, _locals)
+        except StatementReturn as e:
+            value = e.value
+        raise StatementExit(value)
+    return (True, exit_)
+
+def _compile_goto(node_name):
+    def goto(interpreter, _locals): #Control never returns, so nothing waits on the target node
+        interpreter._goto(node_name)
+    return (False, goto)
+
+def _compile_discard(expression):
+    (blocking, evaluate) = expression
+    if not blocking:
+        return expression
+
+    def discard(interpreter, _locals):
+        try:
+            yield evaluate(interpreter, _locals)
+        except StatementReturn:
+            pass
+    return (True, discard)
+
+def _compile_conditional(statement):
+    """
+    Compiles the ``if``-statement `statement`, minus its ``COND_IF`` head.
+    """
+    branches = [] #(condition, body) pairs, where a condition of None always holds
+    for (i, branch) in enumerate(statement):
+        if i == 0:
+            (condition, statements) = branch
+        elif branch[0] == parser.COND_ELIF:
+            (condition, statements) = branch[1:]
+        else:
+            (condition, statements) = (None, branch[1])
+
+        if not condition is None:
+            condition = compile_expression(condition)
+        body = None
+        if statements:
+            body = compile_statements(statements, _BODY_CONDITIONAL)
+        branches.append((condition, body))
+
+    if not [True for (condition, body) in branches if (condition and condition[0]) or (body and body[0])]:
+        branches = tuple(
+         (condition and condition[1], body and body[1])
+         for (condition, body) in branches
+        )
+        def conditional(interpreter, _locals):
+            for (condition, body) in branches:
+                if condition is None or condition(interpreter, _locals):
+                    if body:
+                        body(interpreter, _locals)
+                    return
+        return (False, conditional)
+
+    branches = tuple(branches)
+    def conditional(interpreter, _locals):
+        for (condition, body) in branches:
+            if not condition is None:
+                (blocking, evaluate) = condition
+                if blocking:
+                    try:
+                        allow = yield evaluate(interpreter, _locals)
+                    except StatementReturn as e:
+                        allow = e.value
+                else:
+                    allow = evaluate(interpreter, _locals)
+                if not allow:
+                    continue
+
+            if body:
+                (blocking, run) = body
+                if blocking:
+                    yield run(interpreter, _locals)
+                else:
+                    run(interpreter, _locals)
+            return
+    return (True, conditional)
+
+def _log_hard_break(interpreter):
+    interpreter._log.warning("Hard-breaking loop for exceeding iteration-limit of %i cycles", interpreter._loop_limit)
+
+def _compile_while(condition, body):
+    """
+    Compiles a ``while``-loop; the loop-limit is checked after every iteration that completes
+    without a ``continue``, which is equivalent to the reference engine's checking before the next.
+    """
+    (condition_blocking, evaluate) = condition
+    (body_blocking, run) = body
+    if not condition_blocking and not body_blocking:
+        def loop(interpreter, _locals):
+            interpreter._log.debug("Entering while-loop...")
+            iteration_count = 0
+            while evaluate(interpreter, _locals):
+                try:
+                    run(interpreter, _locals)
+                except StatementBreak:
+                    break
+                except StatementContinue:
+                    continue
+                iteration_count += 1
+                if interpreter._loop_limit and interpreter._loop_limit < iteration_count:
+                    _log_hard_break(interpreter)
+                    break
+        return (False, loop)
+
+    def loop(interpreter, _locals):
+        interpreter._log.debug("Entering while-loop...")
+        iteration_count = 0
+        while True:
+            if condition_blocking:
+                try:
+                    allow = yield evaluate(interpreter, _locals)
+                except StatementReturn as e:
+                    allow = e.value
+            else:
+                allow = evaluate(interpreter, _locals)
+            if not allow:
+                break
+
+            try:
+                if body_blocking:
+                    yield run(interpreter, _locals)
+                else:
+                    run(interpreter, _locals)
+            except StatementBreak:
+                break
+            except StatementContinue:
+                continue
+            iteration_count += 1
+            if interpreter._loop_limit and interpreter._loop_limit < iteration_count:
+                _log_hard_break(interpreter)
+                break
+    return (True, loop)
+
+def _compile_target(identifier):
+    """
+    Compiles the target of a ``for``-loop into a function that takes
+    ``(interpreter, _locals, value)``.
+    """
+    if identifier[0] == parser.SEQUENCE:
+        destination = identifier[1]
+        def assign(interpreter, _locals, value):
+            interpreter._unpack(destination, value, _locals)
+    elif identifier[0] == parser.TERM_IDENTIFIER_LOCAL_GLOBAL:
+        name = identifier[1]
+        def assign(interpreter, _locals, value):
+            interpreter._globals[name] = value
+    else:
+        name = identifier[1]
+        def assign(interpreter, _locals, value):
+            _locals[name] = value
+    return assign
+
+def _compile_for(identifier, iterable, body):
+    """
+    Compiles a ``for``-loop, with the loop-limit handled as in `_compile_while()`.
+    """
+    assign = _compile_target(identifier)
+    (iterable_blocking, evaluate) = iterable
+    (body_blocking, run) = body
+    if not iterable_blocking and not body_blocking:
+        def loop(interpreter, _locals):
+            values = evaluate(interpreter, _locals)
+            if values is None: #Logged as the reference engine does, which treats it as a plain body
+                interpreter._log.debug("Entering node...")
+                raise ValueError("A foreach-loop cannot iterate over a non-collection")
+            interpreter._log.debug("Entering foreach-loop...")
+            iteration_count = 0
+            for value in values:
+                assign(interpreter, _locals, value)
+                try:
+                    run(interpreter, _locals)
+                except StatementBreak:
+                    break
+                except StatementContinue:
+                    continue
+                iteration_count += 1
+                if interpreter._loop_limit and interpreter._loop_limit < iteration_count:
+                    _log_hard_break(interpreter)
+                    break
+        return (False, loop)
+
+    def loop(interpreter, _locals):
+        if iterable_blocking:
+            try:
+                values = yield evaluate(interpreter, _locals)
+            except StatementReturn as e:
+                values = e.value
+        else:
+            values = evaluate(interpreter, _locals)
+        if values is None: #Logged as the reference engine does, which treats it as a plain body
+            interpreter._log.debug("Entering node...")
+            raise ValueError("A foreach-loop cannot iterate over a non-collection")
+        interpreter._log.debug("Entering foreach-loop...")
+        iteration_count = 0
+        for value in values:
+            assign(interpreter, _locals, value)
+            try:
+                if body_blocking:
+                    yield run(interpreter, _locals)
+                else:
+                    run(interpreter, _locals)
+            except StatementBreak:
+                break
+            except StatementContinue:
+                continue
+            iteration_count += 1
+            if interpreter._loop_limit and interpreter._loop_limit < iteration_count:
+                _log_hard_break(interpreter)
+                break
+    return (True, loop)
+
+#Expressions
+############
+def compile_expression(expression):
+    """
+    Compiles `expression` into a ``(blocking, function)`` pair, where ``function`` takes
+    ``(interpreter, _locals)`` and either returns the expression's value or, if ``blocking``,
+    provides a generator that raises it as a `StatementReturn`.
+    """
+    expression_type = expression[0]
+    if expression_type in (parser.TERM_BOOL, parser.TERM_STRING, parser.TERM_INTEGER, parser.TERM_FLOAT, parser.TERM_NONE):
+        value = expression[1]
+        def term(interpreter, _locals):
+            return value
+        return (False, term)
+    elif expression_type == parser.SEQUENCE_CONSTANT: #Prebuilt by the optimizer; hand out a fresh copy
+        values = expression[1]
+        def sequence(interpreter, _locals):
+            return Sequence(values)
+        return (False, sequence)
+    elif expression_type in _LOCAL_IDENTIFIERS:
+        return (False, _compile_local_identifier(expression_type, expression[1]))
+    elif expression_type == parser.TERM_IDENTIFIER_SCOPED:
+        site = sites.Site(expression[1])
+        def scoped_identifier(interpreter, _locals):
+            return interpreter._resolve_scoped_identifier(site, _locals)
+        return (False, scoped_identifier)
+    elif expression_type in _MATHS:
+        return _compile_operation(operations.get_computation(expression_type), expression[1], expression[2])
+    elif expression_type in _TESTS:
+        return _compile_operation(operations.get_comparison(expression_type), expression[1], expression[2])
+    elif expression_type in (parser.TEST_BOOL_OR, parser.TEST_BOOL_AND):
+        return _compile_boolean(expression_type == parser.TEST_BOOL_OR, compile_expression(expression[1]), compile_expression(expression[2]))
+    elif expression_type == parser.TEST_NEGATE:
+        return _compile_negation(compile_expression(expression[1]))
+    elif expression_type in (parser.FUNCTIONCALL_LOCAL, parser.FUNCTIONCALL_SCOPED):
+        return _compile_call(expression_type, expression[1], expression[2])
+    elif expression_type == parser.SUFFIX:
+        return _compile_suffix(compile_expression(expression[1]), expression[2])
+    elif expression_type == parser.SEQUENCE:
+        return _compile_sequence([compile_expression(element) for element in expression[1]])
+
+    def unknown(interpreter, _locals): #Fail only if it is actually reached, as the reference engine would
+        raise ValueError("Unknown expression encountered: %(expression)r" % {
+         'expression': expression,
+        })
+    return (False, unknown)
+
+def _compile_local_identifier(scope, name):
+    if scope == parser.TERM_IDENTIFIER_LOCAL:
+        def local_identifier(interpreter, _locals):
+            try:
+                return _locals[name]
+            except KeyError:
+                return interpreter._resolve_local_identifier(name, _locals)
+    elif scope == parser.TERM_IDENTIFIER_LOCAL_LOCAL:
+        def local_identifier(interpreter, _locals):
+            try:
+                return _locals[name]
+            except KeyError:
+                raise VariableNotFoundError(name, "Local identifier not declared")
+    else:
+        def local_identifier(interpreter, _locals):
+            try:
+                return interpreter._globals[name]
+            except KeyError:
+                raise VariableNotFoundError(name, "Local identifier not declared")
+    return local_identifier
+
+def _gather(operands):
+    """
+    Provides a function that takes ``(interpreter, _locals)`` and provides a generator that
+    evaluates every compiled expression in `operands`, in order, raising a list of their values as
+    a `StatementReturn`.
+    """
+    def gather(interpreter, _locals):
+        values = []
+        for (blocking, evaluate) in operands:
+            if blocking:
+                try:
+                    value = yield evaluate(interpreter, _locals)
+                except StatementReturn as e:
+                    value = e.value
+                values.append(value)
+            else:
+                values.append(evaluate(interpreter, _locals))
+        raise StatementReturn(values)
+    return gather
+
+def _defer(operands, combine):
+    """
+    Provides a blocking expression that gathers the values of `operands` and raises the result of
+    passing them, as a list, to `combine`, along with ``(interpreter, _locals)``.
+    """
+    gather = _gather(operands)
+    def deferred(interpreter, _locals):
+        try:
+            yield gather(interpreter, _locals)
+        except StatementReturn as e:
+            values = e.value
+        raise StatementReturn(combine(interpreter, _locals, values))
+    return (True, deferred)
+
+def _compile_operation(operation, left, right):
+    left = compile_expression(left)
+    right = compile_expression(right)
+    if not left[0] and not right[0]:
+        (evaluate_left, evaluate_right) = (left[1], right[1])
+        def operate(interpreter, _locals):
+            return operation(evaluate_left(interpreter, _locals), evaluate_right(interpreter, _locals))
+        return (False, operate)
+    return _defer((left, right), lambda interpreter, _locals, values: operation(values[0], values[1]))
+
+def _compile_boolean(disjunction, left, right):
+    if not left[0] and not right[0]:
+        (evaluate_left, evaluate_right) = (left[1], right[1])
+        if disjunction:
+            def test(interpreter, _locals):
+                return evaluate_left(interpreter, _locals) or evaluate_right(interpreter, _locals)
+        else:
+            def test(interpreter, _locals):
+                return evaluate_left(interpreter, _locals) and evaluate_right(interpreter, _locals)
+        return (False, test)
+
+    gather_left = _gather((left,))
+    gather_right = _gather((right,))
+    def test(interpreter, _locals):
+        for gather in (gather_left, gather_right): #The right side is reached only if needed
+            try:
+                yield gather(interpreter, _locals)
+            except StatementReturn as e:
+                value = e.value[0]
+            if bool(value) == disjunction:
+                break
+        raise StatementReturn(value)
+    return (True, test)
+
+def _compile_negation(operand):
+    if not operand[0]:
+        evaluate = operand[1]
+        def negate(interpreter, _locals):
+            return not evaluate(interpreter, _locals)
+        return (False, negate)
+    return _defer((operand,), lambda interpreter, _locals, values: not values[0])
+
+def _compile_sequence(elements):
+    if not [True for (blocking, evaluate) in elements if blocking]:
+        elements = tuple(evaluate for (blocking, evaluate) in elements)
+        def sequence(interpreter, _locals):
+            return Sequence([evaluate(interpreter, _locals) for evaluate in elements])
+        return (False, sequence)
+    return _defer(elements, lambda interpreter, _locals, values: Sequence(values))
+
+def _compile_suffix(base, suffix):
+    path = tuple(suffix[1].split('.'))
+    def resolve(target):
+        for token in path:
+            target = getattr(target, token)
+        return target
+
+    if suffix[0] == parser.TERM_IDENTIFIER_SUFFIX:
+        if not base[0]:
+            evaluate = base[1]
+            def attribute(interpreter, _locals):
+                return interpreter._marshall_type(resolve(evaluate(interpreter, _locals)))
+            return (False, attribute)
+        return _defer((base,), lambda interpreter, _locals, values: interpreter._marshall_type(resolve(values[0])))
+
+    invoke = _compile_arguments(suffix[2])
+    (blocking, evaluate) = base
+    if not blocking:
+        def call(interpreter, _locals):
+            return invoke(interpreter, _locals, _call_bound, resolve(evaluate(interpreter, _locals)))
+        return (True, call)
+
+    def call(interpreter, _locals):
+        try:
+            value = yield evaluate(interpreter, _locals)
+        except StatementReturn as e:
+            value = e.value
+        value = yield invoke(interpreter, _locals, _call_bound, resolve(value)) #A generator raises its value through
+        raise StatementReturn(value)
+    return (True, call)
+
+#Function-calls
+###############
+def _compile_arguments(arguments):
+    """
+    Compiles `arguments` into a function that takes ``(interpreter, _locals, caller, function)``
+    and has `caller` invoke `function` with their values, as described in `_delegate()`, or, if
+    any of them is blocking, provides a generator that evaluates them first.
+    """
+    arguments = tuple((name, blocking, evaluate) for (name, (blocking, evaluate)) in (
+     (name, compile_expression(expression)) for (name, expression) in arguments.items()
+    ))
+    if not [True for (name, blocking, evaluate) in arguments if blocking]:
+        def invoke(interpreter, _locals, caller, function):
+            values = {}
+            for (name, blocking, evaluate) in arguments:
+                values[name] = evaluate(interpreter, _locals)
+            return _delegate(interpreter, _locals, caller, function, values)
+        return invoke
+
+    def invoke(interpreter, _locals, caller, function):
+        values = {}
+        for (name, blocking, evaluate) in arguments:
+            if blocking:
+                try:
+                    value = yield evaluate(interpreter, _locals)
+                except StatementReturn as e:
+                    value = e.value
+                values[name] = value
+            else:
+                values[name] = evaluate(interpreter, _locals)
+        value = yield _delegate(interpreter, _locals, caller, function, values)
+        raise StatementReturn(value)
+    return invoke
+
+def _call_bound(interpreter, function, arguments, _locals):
+    return function(**marshalling.materialize_arguments(function, arguments))
+
+def _compile_call(expression_type, name, arguments):
+    invoke = _compile_arguments(arguments)
+    if expression_type == parser.FUNCTIONCALL_SCOPED:
+        site = sites.Site(name)
+        def caller(interpreter, function, arguments, _locals):
+            return interpreter._execute_scoped_function(site, arguments, _locals)
+    else:
+        site = sites.CallSite(name, arguments.keys())
+        def caller(interpreter, function, arguments, _locals):
+            return interpreter._execute_local_function(site, arguments, _locals, driver.Call)
+    def call(interpreter, _locals):
+        return invoke(interpreter, _locals, caller, name)
+    return (True, call)
+
+def _delegate(interpreter, _locals, caller, function, values):
+    """
+    Has `caller` invoke `function` with `values`, providing the `driver.Call` or `driver.Host`
+    through which the driver runs whatever it provides, or raising its marshalled result as a
+    `StatementReturn` on the spot.
+    """
+    interpreter._log.debug("Invoking function '%s'...", log.Call(function, values))
+
+    try:
+        result = caller(interpreter, function, values, _locals)
+    except StatementReturn as e:
+        raise StatementReturn(interpreter._marshall_type(e.value))
+
+    if type(result) == types.GeneratorType:
+        return driver.Host(result)
+    elif result.__class__ is driver.Call:
+        return result
+    raise StatementReturn(interpreter._marshall_type(result))
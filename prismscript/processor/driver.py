@@ -0,0 +1,166 @@
+"""
+driver
+======
+Purpose
+-------
+Runs the generators of the ``closure`` and ``python`` engines on a stack of their own, so that
+nesting in a script, including recursion through its functions, never nests generators in Python.
+
+Notes
+-----
+A compiled body never drives anything itself. It delegates by yielding what it needs run, and the
+driver runs that in its place, until it finishes:
+    - a generator, from another compiled body or expression, is run as it is;
+    - a `Call`, made to one of the script's functions, is run as whatever generator the engine
+      provides for it, once `Interpreter._deepen()` allows another level of nesting; a function
+      in which nothing blocks is run on the spot instead, since it can nest no further;
+    - a `Host`, carrying a coroutine returned by a host-function, is run as it is, except that
+      everything it yields is a prompt, which the driver passes through to its caller.
+
+The value of a `Call` or `Host`, marshalled, or ``None`` if it provided none, is sent back to
+whatever yielded it. A generator that finishes without raising anything sends back ``None``;
+otherwise, what it raised, including the `StatementReturn` that carries an expression's value, is
+thrown in at the same point, exactly as though it had been raised there. A `StatementGoto` is the
+exception: control never returns to anything on the stack, so it is passed straight to
+`Interpreter._transfer()`, discarding everything else.
+
+A blocking expression may therefore provide a `Call` or `Host` in place of a generator, sparing a
+level of the stack for every call whose arguments can be evaluated on the spot, so long as whatever
+yields it takes a value sent back as readily as a `StatementReturn`.
+
+Passing a prompt through therefore costs the same at any depth of nesting. This is ``yield from`` by
+hand, since the language still supports Python 2.7, which lacks it.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import sys
+import types
+
+from .errors import (
+ StatementReturn, StatementGoto,
+)
+
+class Delegation:
+    """
+    Something other than a generator that a compiled body may yield to have it run.
+    """
+
+class Call(Delegation):
+    """
+    A call to one of the script's functions, made at `site`, a `sites.CallSite`.
+    """
+    site = None #The `sites.CallSite` of the function to be run
+    arguments = None #The arguments with which it is to be run
+
+    def __init__(self, site, arguments):
+        self.site = site
+        self.arguments = arguments
+
+class Host(Delegation):
+    """
+    A coroutine returned by a host-function, everything yielded by which is a prompt.
+    """
+    generator = None #The host's coroutine
+
+    def __init__(self, generator):
+        self.generator = generator
+
+def enter(call, site, arguments):
+    """
+    Provides a generator that runs the function called at `site`, through `call`, at the root of a
+    run, where its result, unlike that of a `Call`, is raised as it is.
+    """
+    yield call(site, arguments)
+
+def drive(interpreter, generator, call, depth=0):
+    """
+    Runs `generator` to completion, as a coroutine that offers only the prompts of host-functions
+    to its caller, running everything it delegates, as described above, in its place.
+
+    `call` runs a `Call`, given its site and arguments, either raising its result or providing a
+    generator that does; `depth` is the number of calls that `generator` represents.
+
+    Whatever `generator` raises is passed through.
+    """
+    stack = [] #The generators waiting on the running one; only the running one may be a host's
+    calls = [] #The height of `stack` at which each call in progress is running
+    host = False #Whether the running generator is a host's coroutine
+    value = None
+    failure = None
+    while True:
+        try:
+            if failure is None:
+                yielded = generator.send(value)
+            else:
+                (error, failure) = (failure, None)
+                yielded = generator.throw(*error)
+        except StopIteration:
+            if not stack:
+                return
+            value = None
+        except StatementReturn as e:
+            if not stack:
+                raise
+            if host or (calls and calls[-1] == len(stack)): #The result of a `Host` or `Call`
+                try:
+                    value = interpreter._marshall_type(e.value)
+                except Exception: #Raised where the function was called
+                    failure = sys.exc_info()
+            else:
+                failure = sys.exc_info()
+        except StatementGoto: #Nothing on the stack is ever resumed
+            raise
+        except Exception:
+            if not stack:
+                raise
+            failure = sys.exc_info()
+        else:
+            if host: #A prompt, to be answered by the caller
+                try:
+                    value = yield yielded
+                except Exception: #The caller's response is an error to be raised by the coroutine
+                    failure = sys.exc_info()
+                continue
+
+            kind = yielded.__class__
+            if kind is types.GeneratorType:
+                stack.append(generator)
+                generator = yielded
+            elif kind is Call:
+                try:
+                    interpreter._deepen(depth + len(calls))
+                    yielded = call(yielded.site, yielded.arguments)
+                except StatementReturn as e: #Finished on the spot
+                    try:
+                        value = interpreter._marshall_type(e.value)
+                    except Exception: #Raised where the function was called
+                        failure = sys.exc_info()
+                    continue
+                except Exception: #Raised where the function was called
+                    failure = sys.exc_info()
+                    continue
+                stack.append(generator)
+                calls.append(len(stack))
+                generator = yielded
+            else: #A `Host`
+                stack.append(generator)
+                generator = yielded.generator
+                host = True
+            value = None
+            continue
+
+        generator = stack.pop()
+        host = False
+        if calls and calls[-1] > len(stack): #The running call has finished
+            calls.pop()
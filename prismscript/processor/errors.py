@@ -25,6 +25,39 @@ class ExecutionError(Error):
          'message': self.message,
         }
         
+class PromptError(Error):
+    """
+    Indicates that a coroutine prompted where no prompt can be answered.
+    """
+    prompt = None #The prompt that was offered.
+    def __init__(self, identifier, prompt):
+        Error.__init__(self, "'%(identifier)s' prompted during synchronous execution: %(prompt)r" % {
+         'identifier': identifier,
+         'prompt': prompt,
+        })
+        self.prompt = prompt
+        
+class ExecutionLimitError(Error):
+    """
+    Indicates that execution was stopped for exceeding a limit set on the interpreter.
+    """
+    
+class FuelExhaustedError(ExecutionLimitError):
+    """
+    Indicates that execution consumed all of the fuel allowed by `Interpreter.set_fuel_limit()`.
+    """
+    
+class DeadlineExceededError(ExecutionLimitError):
+    """
+    Indicates that execution ran for longer than allowed by `Interpreter.set_time_limit()`.
+    """
+    
+class DepthExceededError(ExecutionLimitError):
+    """
+    Indicates that calls to a script's functions were nested more deeply than allowed by
+    `Interpreter.set_depth_limit()`.
+    """
+    
 class NamespaceLookupError(Error):
     """str(self._evaluate_expression(statement[1], _locals))
     Indicates that the requested namespace element could not be found.
@@ -100,6 +133,15 @@ class StatementExit(_StatementCede):
     Indicates that an ``exit`` statement was encountered.
     """
     
+class StatementGoto(FlowControl):
+    """
+    Indicates that a ``goto`` statement was encountered, transferring control to the node whose
+    name is given as `node`.
+    """
+    node = None #The name of the node to which control is transferred.
+    def __init__(self, node):
+        self.node = node
+        
 class StatementsEnd(FlowControl):
     """
     Indicates that the current statement-block has been exhausted normally.
@@ -0,0 +1,242 @@
+"""
+cache
+=====
+Purpose
+-------
+Provides a content-addressed cache for digested scripts, so that identical sources can skip lexing
+and parsing entirely.
+
+Digests are held in a bounded, least-recently-used memory store and may, optionally, be mirrored to
+a directory on disk, allowing short-lived processes to benefit from the work done by their
+predecessors.
+
+Serialisation format
+--------------------
+Every entry written to disk is laid out as follows::
+    MAGIC (4 bytes) | FORMAT_VERSION (2 bytes, big-endian) | key (32 bytes) | checksum (32 bytes) | payload
+
+``key`` is the SHA-256 digest used to address the entry, ``checksum`` is the SHA-256 digest of
+``payload``, and ``payload`` is the pickled (``nodes``, ``functions``) tuple. Any entry that has the
+wrong magic, version, or key, or whose checksum does not match its payload, is treated as a miss and
+discarded.
+
+``FORMAT_VERSION`` also salts every key, so it must be incremented whenever the structure of the
+parser's output changes; doing so orphans every previously cached digest.
+
+Warning
+-------
+On-disk entries are unpickled when read, so the cache's directory must be writable only by trusted
+processes.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import binascii
+import collections
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+
+try: #cPickle was merged into pickle in py3k
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+MAGIC = b'PSPC' #: Identifies a file as a Prismscript parse-cache entry.
+FORMAT_VERSION = 1 #: The revision of the serialisation format and of the digest structure.
+
+_HEADER = struct.Struct('>4sH32s32s') #magic, version, key, checksum
+_SUFFIX = '.pspc' #The extension given to on-disk entries
+
+def compute_key(source):
+    """
+    Provides the hexadecimal content-address of `source`, salted with ``FORMAT_VERSION``.
+    """
+    if not isinstance(source, bytes):
+        source = source.encode('utf-8')
+    return hashlib.sha256(struct.pack('>H', FORMAT_VERSION) + source).hexdigest()
+
+class ParseCache:
+    """
+    A thread-safe store of (``nodes``, ``functions``) digests, addressed by the hash of the source
+    from which they were produced.
+
+    Digests handed out by this cache share their statement-lists with every other consumer of the
+    same source, so they must be treated as read-only; the ``nodes`` and ``functions`` dictionaries
+    themselves are always fresh copies, however, and may be modified freely.
+    """
+    def __init__(self, max_entries=128, directory=None, max_disk_bytes=64 * 1024 * 1024):
+        """
+        `max_entries` bounds the number of digests held in memory; the least recently used is
+        evicted first.
+
+        `directory`, if given, is the path under which digests are persisted; it is created if it
+        does not exist. `max_disk_bytes` bounds the total size of the entries stored there; the
+        least recently used are removed first.
+        """
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._max_entries = max_entries
+
+        self._directory = directory
+        self._max_disk_bytes = max_disk_bytes
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def clear(self):
+        """
+        Discards every digest held in memory; on-disk entries are left in place.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, source):
+        """
+        Provides the cached (``nodes``, ``functions``) digest of `source`, or ``None`` if it has not
+        been seen.
+        """
+        key = compute_key(source)
+        with self._lock:
+            digest = self._entries.pop(key, None)
+            if digest is not None: #Re-insert it as the most recently used
+                self._entries[key] = digest
+
+        if digest is None and self._directory:
+            digest = self._read(key)
+            if digest is not None:
+                self._remember(key, digest)
+
+        if digest is None:
+            return None
+        return (dict(digest[0]), dict(digest[1]))
+
+    def put(self, source, digest):
+        """
+        Stores the (``nodes``, ``functions``) `digest` produced from `source`.
+        """
+        key = compute_key(source)
+        digest = (dict(digest[0]), dict(digest[1]))
+        self._remember(key, digest)
+        if self._directory:
+            self._write(key, digest)
+
+    def _remember(self, key, digest):
+        """
+        Adds `digest` to the memory store, evicting the least recently used entries as needed.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = digest
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _get_path(self, key):
+        return os.path.join(self._directory, key + _SUFFIX)
+
+    def _read(self, key):
+        """
+        Loads the digest addressed by `key` from disk, returning ``None`` if it is absent or fails
+        its integrity checks. Corrupt entries are removed.
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, 'rb') as entry:
+                data = entry.read()
+        except (IOError, OSError):
+            return None
+
+        digest = None
+        if len(data) >= _HEADER.size:
+            (magic, version, stored_key, checksum) = _HEADER.unpack(data[:_HEADER.size])
+            payload = data[_HEADER.size:]
+            if (
+             magic == MAGIC and version == FORMAT_VERSION and
+             stored_key == binascii.unhexlify(key) and
+             checksum == hashlib.sha256(payload).digest()
+            ):
+                try:
+                    digest = pickle.loads(payload)
+                except Exception:
+                    digest = None
+
+        if digest is None:
+            self._discard(path)
+        else:
+            try: #Mark the entry as recently used, for eviction purposes
+                os.utime(path, None)
+            except OSError:
+                pass
+        return digest
+
+    def _write(self, key, digest):
+        """
+        Persists `digest` under `key`, atomically, then trims the directory to its size-limit.
+
+        Failures are not fatal: the cache is an optimisation, not a store of record.
+        """
+        payload = pickle.dumps(digest, 2)
+        data = _HEADER.pack(MAGIC, FORMAT_VERSION, binascii.unhexlify(key), hashlib.sha256(payload).digest()) + payload
+        try:
+            (handle, temporary_path) = tempfile.mkstemp(suffix='.tmp', dir=self._directory)
+            try:
+                with os.fdopen(handle, 'wb') as entry:
+                    entry.write(data)
+                path = self._get_path(key)
+                try:
+                    os.rename(temporary_path, path)
+                except OSError: #Windows will not replace an existing file
+                    self._discard(path)
+                    os.rename(temporary_path, path)
+            except Exception:
+                self._discard(temporary_path)
+                raise
+        except (IOError, OSError):
+            return
+        self._evict_disk()
+
+    def _evict_disk(self):
+        """
+        Removes the least recently used on-disk entries until their total size fits within the
+        configured limit.
+        """
+        entries = []
+        total_size = 0
+        try:
+            for name in os.listdir(self._directory):
+                if not name.endswith(_SUFFIX):
+                    continue
+                path = os.path.join(self._directory, name)
+                try:
+                    details = os.stat(path)
+                except OSError: #Removed concurrently
+                    continue
+                entries.append((details.st_mtime, details.st_size, path))
+                total_size += details.st_size
+        except OSError:
+            return
+
+        entries.sort()
+        for (mtime, size, path) in entries:
+            if total_size <= self._max_disk_bytes:
+                break
+            self._discard(path)
+            total_size -= size
+
+    def _discard(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
@@ -22,10 +22,15 @@ This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unpo
 To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
 letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
 """
+import copy
+import re
 import threading
 
-from .structure.closed_lexicon import lexer as _lexer
-from .structure.syntax import parser as _parser
+from .cache import ParseCache
+from .structure import closed_lexicon as _closed_lexicon
+from .structure import descent as _descent
+from .structure.closed_lexicon import get_lexer as _get_lexer
+from .structure.syntax import get_parser as _get_parser
 from .structure.syntax import (
  STMT_GOTO, STMT_RETURN, STMT_EXIT,
  STMT_BREAK, STMT_CONTINUE,
@@ -37,7 +42,7 @@ from .structure.syntax import (
  TERM_IDENTIFIER_SUFFIX, TERM_IDENTIFIER_SCOPED,
  TERM_NONE, TERM_BOOL, TERM_STRING, TERM_INTEGER, TERM_FLOAT,
  
- SEQUENCE,
+ SEQUENCE, SEQUENCE_CONSTANT,
  SUFFIX,
  
  TEST_EQUALITY, TEST_INEQUALITY, TEST_GREATER_EQUAL, TEST_GREATER, TEST_LESSER_EQUAL, TEST_LESSER,
@@ -56,11 +61,77 @@ from .structure.syntax import (
 from .structure.type_abstractions import (
  convert_bool, convert_float, convert_int, convert_string,
  Dictionary, Set, Sequence, String,
+ LazyDictionary, LazySet, LazySequence,
 )
 
-_LOCK = threading.Lock()
+BACKEND_PLY = 'ply' #: The table-driven LALR parser generated by PLY.
+BACKEND_DESCENT = 'descent' #: The hand-written recursive-descent parser.
+_BACKENDS = (BACKEND_PLY, BACKEND_DESCENT)
 
-def parse(source):
+_state = threading.local() #Each thread's private lexer and parser
+_cache = ParseCache() #Consulted before any source is digested; None disables caching
+_backend = BACKEND_PLY #Used whenever parse() is not told otherwise
+
+#Finds the braces that delimit top-level definitions, skipping over any that appear in strings or
+#comments; the lexer's own patterns are used so that the two can never disagree
+_DEFINITION_DELIMITERS = re.compile('|'.join((
+ _closed_lexicon.t_STRING.__doc__,
+ _closed_lexicon.t_ignore_comment,
+ r'[{}]',
+)))
+
+def get_cache():
+    """
+    Provides the `ParseCache` consulted by `parse()`, or ``None`` if caching is disabled.
+    """
+    return _cache
+
+def set_cache(cache):
+    """
+    Replaces the `ParseCache` consulted by `parse()`. By default, a memory-only cache is used;
+    provide an instance with a ``directory`` to share digests between processes, or ``None`` to
+    disable caching entirely.
+    """
+    global _cache
+    _cache = cache
+
+def get_backend():
+    """
+    Provides the name of the backend `parse()` uses by default.
+    """
+    return _backend
+
+def set_backend(backend):
+    """
+    Sets the backend `parse()` uses by default, either `BACKEND_PLY` or `BACKEND_DESCENT`.
+    
+    Both produce identical output and identical errors; the descent parser is simply faster,
+    since it has no table-lookups or reductions to perform. Source nested too deeply for it to
+    parse recursively is passed to the table-driven parser instead.
+    """
+    global _backend
+    if backend not in _BACKENDS:
+        raise ValueError("Unknown backend: %(backend)r" % {
+         'backend': backend,
+        })
+    _backend = backend
+    
+def _get_state():
+    """
+    Provides the calling thread's (``lexer``, ``parser``) pair, creating it on first use.
+    
+    PLY keeps all of the state of a parse on the lexer and parser objects themselves, so sharing
+    them would mean serialising every parse in the process; the tables they consume are read-only,
+    however, so each thread receives shallow copies that share them.
+    """
+    try:
+        return (_state.lexer, _state.parser)
+    except AttributeError:
+        _state.lexer = _get_lexer().clone()
+        _state.parser = copy.copy(_get_parser())
+        return (_state.lexer, _state.parser)
+        
+def parse(source, backend=None):
     """
     Digests a script as ``source`` and provides a (``nodes``, ``functions``) tuple as output:
 
@@ -71,12 +142,121 @@ def parse(source):
     ``expressionlist`` items are any type of interpretable expression, as described in the
     programming guide.
 
+    If an identical source has been digested before, the cached result is provided instead; its
+    ``expressionlist`` items are shared with every other consumer and must not be modified.
+
+    ``backend`` may be used to choose between `BACKEND_PLY` and `BACKEND_DESCENT` for this call;
+    if omitted, the default set by `set_backend()` is used. Digests are cached without regard to
+    the backend that produced them, since they are identical.
+
     An invalid script will never be partially salvaged by this routine. If something is illegal,
     `ValueError` will be raised.
     """
-    with _LOCK:
-        result = _parser.parse(source)
-        _parser.restart()
-        _lexer.lineno = 1
-        return result
+    if backend is None:
+        backend = _backend
+    elif backend not in _BACKENDS:
+        raise ValueError("Unknown backend: %(backend)r" % {
+         'backend': backend,
+        })
+        
+    cache = _cache
+    if cache is not None:
+        result = cache.get(source)
+        if result is not None:
+            return result
+            
+    result = _digest(source, backend)
+    if cache is not None:
+        cache.put(source, result)
+    return result
+    
+def parse_incrementally(source, cache, backend=None, transform=None):
+    """
+    Digests a script as ``source`` exactly as `parse()` would, but one top-level node or function
+    at a time, consulting ``cache``, a `ParseCache`, for each and adding any it lacks.
+
+    If ``transform`` is provided, it receives each newly digested definition's (``nodes``,
+    ``functions``) tuple and provides the one to be cached in its place, so that its work, too, is
+    only repeated for definitions that changed; a given ``cache`` should always be used with the
+    same ``transform``.
+
+    Reusing the same ``cache`` whenever an edited script is reloaded means that only the
+    definitions that changed need to be digested again, so the cost of a small edit is
+    proportional to its size, rather than to that of the script.
+
+    Errors are identical to those raised by `parse()`: if any definition is illegal, the whole
+    script is digested again to describe the problem.
+    """
+    if backend is None:
+        backend = _backend
+    elif backend not in _BACKENDS:
+        raise ValueError("Unknown backend: %(backend)r" % {
+         'backend': backend,
+        })
         
+    definitions = _split_definitions(source)
+    if definitions is not None:
+        nodes = {}
+        functions = {}
+        try:
+            for definition in definitions:
+                result = cache.get(definition)
+                if result is None:
+                    result = _digest(definition, backend)
+                    if transform is not None:
+                        result = transform(result)
+                    cache.put(definition, result)
+                nodes.update(result[0])
+                functions.update(result[1])
+        except ValueError:
+            pass
+        else:
+            return (nodes, functions)
+            
+    #The braces are unbalanced or a definition is illegal, so let the parser explain
+    result = parse(source, backend=backend)
+    if transform is not None:
+        result = transform(result)
+    return result
+    
+def _split_definitions(source):
+    """
+    Divides ``source`` at the end of each top-level block, providing a list of contiguous slices
+    that, together, cover all of it; anything following the last block forms the final slice.
+
+    ``None`` is provided if a closing brace appears at the top level.
+    """
+    definitions = []
+    depth = 0
+    start = 0
+    for match in _DEFINITION_DELIMITERS.finditer(source):
+        delimiter = match.group()
+        if delimiter == '{':
+            depth += 1
+        elif delimiter == '}':
+            depth -= 1
+            if depth == 0:
+                end = match.end()
+                definitions.append(source[start:end])
+                start = end
+            elif depth < 0:
+                return None
+    definitions.append(source[start:])
+    return definitions
+    
+def _digest(source, backend):
+    """
+    Digests ``source`` with the given backend, without consulting any cache.
+    """
+    (lexer, parser) = _get_state()
+    lexer.lineno = 1
+    if backend == BACKEND_DESCENT:
+        try:
+            return _descent.parse(source, lexer)
+        except _descent.NestingError: #The table-driven parser has no Python stack to exhaust
+            lexer.lineno = 1
+    try:
+        return parser.parse(source, lexer=lexer)
+    finally:
+        parser.restart()
+    
@@ -8,6 +8,15 @@ Collects all of the lexing rules required for the language.
 In linguistic terms, this forms the basis of the language's phonology and provides its closed
 lexical categories, like determiners and propositions.
 
+Notes
+-----
+Scripts may come from semi-trusted authors, so lexing is kept linear in the size of the input.
+Every pattern can consume any given text in only one way, so a failing attempt backtracks at most
+once over what it scanned, and no attempt scans past the end of the token that is eventually
+matched, except for an unterminated string, which ends lexing. Escape-sequences are decoded in a
+single pass, and integer literals are limited to `MAX_INTEGER_DIGITS`, since converting a decimal
+string to an integer is quadratic in its length.
+
 Meta
 ----
 :Authors:
@@ -21,7 +30,9 @@ This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unpo
 To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
 letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
 """
-import ply.lex
+import re
+import sys
+import threading
 
 import type_abstractions
 
@@ -97,6 +108,23 @@ tokens = [
 ] + list(reserved.values())
 
 
+MAX_INTEGER_DIGITS = 4300 #: The longest integer literal accepted, matching Python's own default.
+
+_ESCAPES = {
+ '\\': '\\',
+ 'b': '\b',
+ 't': '\t',
+ 'n': '\n',
+ 'a': '\a',
+ 'r': '\r',
+ '"': '"',
+ "'": "'",
+}
+_ESCAPE_SEQUENCE = re.compile(r'\\([\\btnar"\'])') #Anything else after a backslash is literal
+
+def _decode_escape(match):
+    return _ESCAPES[match.group(1)]
+    
 #Token-mapping
 ##############
 def t_IDENTIFIER_SCOPED(t):
@@ -113,19 +141,10 @@ def t_IDENTIFIER_LOCAL(t):
     return t
     
 def t_STRING(t):
-    r'(?:"(?:[^"]|(?<=\\)")*"|\'(?:[^\']|(?<=\\)\')*\')'
+    r'(?:"(?:[^"\\]|\\[\s\S])*"|\'(?:[^\'\\]|\\[\s\S])*\')'
     value = t.value[1:-1]
-    for (escape, replacement) in (
-     ('\\\\', '\\'),
-     ('\\b', '\b'),
-     ('\\t', '\t'),
-     ('\\n', '\n'),
-     ('\\a', '\a'),
-     ('\\r', '\r'),
-     ('\\"', '"'),
-     ("\\'", "'"),
-    ):
-        value = value.replace(escape, replacement)
+    if '\\' in value:
+        value = _ESCAPE_SEQUENCE.sub(_decode_escape, value)
     t.value = type_abstractions.String(value)
     return t
 def t_FLOAT(t):
@@ -134,6 +153,12 @@ def t_FLOAT(t):
     return t
 def t_INTEGER(t):
     r'-?\d+'
+    digits = len(t.value.lstrip('-'))
+    if digits > MAX_INTEGER_DIGITS:
+        raise ValueError("Integer literal too long on line %(line)i: %(digits)i digits" % {
+         'line': t.lexer.lineno,
+         'digits': digits,
+        })
     t.value = int(t.value)
     return t
     
@@ -174,7 +199,7 @@ t_COMMA = r','
 t_SEMICOLON = r'\;'
 
 def t_newline(t):
-    r'(?:\r\n|\n|\r)+'
+    r'(?:\r\n?|\n)+'
     t.lexer.lineno += len(t.value) - t.value.count('\r\n')
     
 t_ignore_whitespace = r'[ \t]'
@@ -192,5 +217,43 @@ def t_error(t):
     
 #Digest functional categories
 #############################
-lexer = ply.lex.lex()
+_lexer = None #The prototype lexer, built on first use
+_lexer_lock = threading.Lock()
+
+def get_lexer():
+    """
+    Provides the prototype lexer, building it on first use. Its master expressions are read from the
+    precomputed `lextab` module, if present and compatible with the installed version of PLY, and
+    compiled from the rules above otherwise; nothing is ever written to disk.
+    
+    The prototype is shared, so it must be cloned before being given input.
+    """
+    global _lexer
+    if _lexer is None:
+        with _lexer_lock:
+            if _lexer is None:
+                _lexer = _build_lexer()
+    return _lexer
+    
+def _build_lexer():
+    import ply.lex #Deferred, since importing PLY accounts for much of the package's import-time
+    
+    module = sys.modules[__name__]
+    try:
+        from . import lextab
+    except ImportError:
+        lextab = None
+    if getattr(lextab, '_tabversion', None) == ply.lex.__tabversion__:
+        return ply.lex.lex(module=module, optimize=True, lextab=lextab)
+    return ply.lex.lex(module=module)
+    
+def write_table(outputdir):
+    """
+    Regenerates the `lextab` module in `outputdir`. This must be done whenever a token-rule changes,
+    since PLY cannot tell when the precomputed expressions have gone stale.
+    """
+    import ply.lex
+    
+    ply.lex.lex(module=sys.modules[__name__]).writetab('lextab', outputdir)
+    
 
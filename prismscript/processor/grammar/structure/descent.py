@@ -0,0 +1,434 @@
+"""
+structure.descent
+=================
+Purpose
+-------
+Provides a hand-written recursive-descent parser for the language, using precedence-climbing (Pratt
+parsing) for expressions, as a faster alternative to the table-driven parser in `syntax`.
+
+It consumes the same token-stream and produces exactly the same structures as `syntax`, down to the
+way in which its precedence declarations are resolved, so the two are interchangeable; the
+``grammar/test_sources`` corpus is used to verify that they agree.
+
+Notes
+-----
+PLY resolves a shift/reduce conflict in favour of reducing whenever the pending rule has a higher
+precedence than the lookahead token, and tokens without a declared precedence rank below everything
+that has one. Suffixes (``.name`` and ``.name(...)``) have no declared precedence, so they apply to
+the whole of any operator-expression to their left: ``!a.b`` is ``(!a).b`` and ``x + f().y`` is
+``(x + f()).y``. This module reproduces that behaviour deliberately.
+
+Nesting, whether of parentheses, sequences, or arguments, recurses in Python, so source nested more
+deeply than Python's stack allows raises `NestingError`, a `ValueError`, rather than being parsed;
+the table-driven parser keeps its own stack, so `parser.parse()` falls back to it in that case.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+from .syntax import (
+ STMT_GOTO, STMT_RETURN, STMT_EXIT, STMT_BREAK, STMT_CONTINUE,
+ COND_IF, COND_ELIF, COND_ELSE, COND_WHILE, COND_FOR,
+ TERM_IDENTIFIER_LOCAL, TERM_IDENTIFIER_SCOPED, TERM_NONE, TERM_BOOL, TERM_STRING, TERM_INTEGER,
+ TERM_FLOAT, TERM_IDENTIFIER_SUFFIX, TERM_IDENTIFIER_LOCAL_LOCAL, TERM_IDENTIFIER_LOCAL_GLOBAL,
+ SEQUENCE, SUFFIX,
+ TEST_EQUALITY, TEST_INEQUALITY, TEST_GREATER_EQUAL, TEST_GREATER, TEST_LESSER_EQUAL, TEST_LESSER,
+ TEST_BOOL_OR, TEST_BOOL_AND, TEST_NEGATE,
+ MATH_MULTIPLY, MATH_DIVIDE, MATH_DIVIDE_INTEGER, MATH_ADD, MATH_SUBTRACT, MATH_MOD,
+ MATH_EXPONENTIATE,
+ FUNCTIONCALL_LOCAL, FUNCTIONCALL_SCOPED, FUNCTIONCALL_SUFFIX,
+ ASSIGN, ASSIGN_ADD, ASSIGN_SUBTRACT, ASSIGN_MULTIPLY, ASSIGN_DIVIDE, ASSIGN_DIVIDE_INTEGER,
+ ASSIGN_SEQUENCE, ASSIGN_MOD, ASSIGN_EXPONENTIATE,
+)
+
+_END = '$end' #The type of the sentinel token that follows the last real one
+_LEXING_ERROR = '$error' #The type of the sentinel token that stands in for an illegal character
+
+#Binary operators, mapped to (type, precedence-level, left-associative), mirroring `syntax.precedence`
+_BINARY_OPERATORS = {
+ 'EQUALITY': (TEST_EQUALITY, 1, False),
+ 'INEQUALITY': (TEST_INEQUALITY, 1, False),
+ 'GREATER_EQUAL': (TEST_GREATER_EQUAL, 1, False),
+ 'GREATER': (TEST_GREATER, 1, False),
+ 'LESSER_EQUAL': (TEST_LESSER_EQUAL, 1, False),
+ 'LESSER': (TEST_LESSER, 1, False),
+ 'SUBTRACT': (MATH_SUBTRACT, 2, True),
+ 'ADD': (MATH_ADD, 2, True),
+ 'MULTIPLY': (MATH_MULTIPLY, 3, True),
+ 'DIVIDE': (MATH_DIVIDE, 3, True),
+ 'DIVIDE_INTEGER': (MATH_DIVIDE_INTEGER, 3, True),
+ 'MOD': (MATH_MOD, 3, True),
+ 'EXPONENTIATE': (MATH_EXPONENTIATE, 4, True),
+ 'BOOL_OR': (TEST_BOOL_OR, 5, True),
+ 'BOOL_AND': (TEST_BOOL_AND, 5, True),
+}
+_NEGATE_LEVEL = 6 #NEGATE is right-associative, so its operand stops at every binary operator
+
+_ASSIGNMENT_OPERATORS = {
+ 'ASSIGN': ASSIGN,
+ 'ASSIGN_ADD': ASSIGN_ADD,
+ 'ASSIGN_SUBTRACT': ASSIGN_SUBTRACT,
+ 'ASSIGN_EXPONENTIATE': ASSIGN_EXPONENTIATE,
+ 'ASSIGN_MULTIPLY': ASSIGN_MULTIPLY,
+ 'ASSIGN_DIVIDE': ASSIGN_DIVIDE,
+ 'ASSIGN_DIVIDE_INTEGER': ASSIGN_DIVIDE_INTEGER,
+ 'ASSIGN_MOD': ASSIGN_MOD,
+}
+
+_LITERAL_TERMS = {
+ 'STRING': TERM_STRING,
+ 'INTEGER': TERM_INTEGER,
+ 'FLOAT': TERM_FLOAT,
+}
+_SPECIAL_TERMS = {
+ 'NONE': (TERM_NONE, None),
+ 'TRUE': (TERM_BOOL, True),
+ 'FALSE': (TERM_BOOL, False),
+}
+_QUALIFIERS = {
+ 'QUALIFIER_LOCAL': TERM_IDENTIFIER_LOCAL_LOCAL,
+ 'QUALIFIER_GLOBAL': TERM_IDENTIFIER_LOCAL_GLOBAL,
+}
+
+class NestingError(ValueError):
+    """
+    Indicates that source was nested too deeply to be parsed recursively.
+    """
+
+def parse(source, lexer):
+    """
+    Digests `source`, tokenised by `lexer`, which must not be shared with any other thread, and
+    provides the same (``nodes``, ``functions``) tuple as the table-driven parser.
+
+    `ValueError` is raised if the source is illegal, or `NestingError` if it is nested too deeply.
+    """
+    parser = _DescentParser(source, lexer)
+    try:
+        return parser.parse_nodelist()
+    except RuntimeError: #Python's stack was exhausted
+        raise NestingError("Source nested too deeply to be parsed recursively, near line %(line)i" % {
+         'line': parser._lines[parser._position],
+        })
+
+class _DescentParser:
+    """
+    Holds the state of a single parse.
+    """
+    def __init__(self, source, lexer):
+        types = []
+        values = []
+        lines = []
+        self._lexing_error = None
+        lexer.input(source)
+        token = lexer.token
+        try:
+            while True:
+                t = token()
+                if t is None:
+                    break
+                types.append(t.type)
+                values.append(t.value)
+                lines.append(t.lineno)
+        except ValueError as e: #Deferred, so that errors are reported in the order PLY would
+            self._lexing_error = e
+            types.append(_LEXING_ERROR)
+        else:
+            types.append(_END)
+        values.append(None)
+        lines.append(lexer.lineno)
+
+        self._types = types
+        self._values = values
+        self._lines = lines
+        self._position = 0
+
+    def _fail(self):
+        """
+        Raises the error appropriate to the token at the current position, which cannot be accepted.
+        """
+        token_type = self._types[self._position]
+        if token_type == _LEXING_ERROR:
+            raise self._lexing_error
+        elif token_type == _END:
+            raise ValueError("Unexpectedly reached end of file")
+        raise ValueError("Syntax error; offending token on line %(line)i: %(token)s" % {
+         'line': self._lines[self._position],
+         'token': repr(self._values[self._position]),
+        })
+
+    def _expect(self, token_type):
+        """
+        Consumes a token of the given type, providing its value, or fails.
+        """
+        position = self._position
+        if self._types[position] != token_type:
+            self._fail()
+        self._position = position + 1
+        return self._values[position]
+
+    def parse_nodelist(self):
+        nodes = {}
+        functions = {}
+        types = self._types
+        while types[self._position] != _END:
+            name = self._expect('IDENTIFIER_LOCAL')
+            if types[self._position] == 'LCURLY':
+                self._position += 1
+                nodes[name] = self._parse_expressionlist()
+            else:
+                self._expect('LPAREN')
+                parameters = self._parse_parameterset()
+                self._expect('RPAREN')
+                self._expect('LCURLY')
+                functions[(name, frozenset(parameters))] = self._parse_expressionlist()
+        return (nodes, functions)
+
+    def _parse_parameterset(self):
+        parameters = set()
+        types = self._types
+        while types[self._position] == 'IDENTIFIER_LOCAL':
+            parameters.add(self._values[self._position])
+            self._position += 1
+            if types[self._position] != 'COMMA':
+                break
+            self._position += 1
+        return parameters
+
+    def _parse_argumentset(self):
+        arguments = {}
+        types = self._types
+        while types[self._position] == 'IDENTIFIER_LOCAL':
+            name = self._values[self._position]
+            self._position += 1
+            self._expect('ASSIGN')
+            arguments[name] = self.parse_expression()
+            if types[self._position] != 'COMMA':
+                break
+            self._position += 1
+        return arguments
+
+    def _parse_expressionlist(self):
+        """
+        Parses statements up to and including the closing brace of the current block.
+        """
+        statements = []
+        types = self._types
+        while True:
+            token_type = types[self._position]
+            if token_type == 'RCURLY':
+                self._position += 1
+                return statements
+            elif token_type == 'IF':
+                statements.append(self._parse_conditional())
+            elif token_type == 'WHILE':
+                self._position += 1
+                self._expect('LPAREN')
+                condition = self.parse_expression()
+                self._expect('RPAREN')
+                self._expect('LCURLY')
+                statements.append((COND_WHILE, condition, self._parse_expressionlist()))
+            elif token_type == 'FOR':
+                statements.append(self._parse_for())
+            else:
+                statements.append(self._parse_simple_statement(token_type))
+                self._expect('SEMICOLON')
+
+    def _parse_conditional(self):
+        types = self._types
+        self._position += 1
+        self._expect('LPAREN')
+        condition = self.parse_expression()
+        self._expect('RPAREN')
+        self._expect('LCURLY')
+        conditional = [COND_IF, (condition, self._parse_expressionlist())]
+        while types[self._position] == 'ELIF':
+            self._position += 1
+            self._expect('LPAREN')
+            condition = self.parse_expression()
+            self._expect('RPAREN')
+            self._expect('LCURLY')
+            conditional.append((COND_ELIF, condition, self._parse_expressionlist()))
+        if types[self._position] == 'ELSE':
+            self._position += 1
+            self._expect('LCURLY')
+            conditional.append((COND_ELSE, self._parse_expressionlist()))
+        return conditional
+
+    def _parse_for(self):
+        types = self._types
+        self._position += 1
+        self._expect('LPAREN')
+        token_type = types[self._position]
+        if token_type == 'LSQUARE':
+            self._position += 1
+            target = self._parse_sequence()
+        elif token_type == 'IDENTIFIER_LOCAL' or token_type in _QUALIFIERS:
+            target = self._parse_identifier_local()
+        else:
+            self._fail()
+        self._expect('IN')
+        iterable = self.parse_expression()
+        self._expect('RPAREN')
+        self._expect('LCURLY')
+        return (COND_FOR, target, iterable, self._parse_expressionlist())
+
+    def _parse_identifier_local(self):
+        position = self._position
+        qualifier = _QUALIFIERS.get(self._types[position])
+        if qualifier is None:
+            self._position = position + 1
+            return (TERM_IDENTIFIER_LOCAL, self._values[position])
+        self._position = position + 1
+        return (qualifier, self._expect('IDENTIFIER_LOCAL'))
+
+    def _parse_simple_statement(self, token_type):
+        """
+        Parses an assignment, a statement, or an expression, none of which consume their terminating
+        semicolon.
+        """
+        types = self._types
+        position = self._position
+        if token_type == 'IDENTIFIER_LOCAL' or token_type in _QUALIFIERS:
+            if token_type != 'IDENTIFIER_LOCAL': #Skip over the qualifier
+                position += 1
+                if types[position] != 'IDENTIFIER_LOCAL':
+                    self._position = position
+                    self._fail()
+            assignment = _ASSIGNMENT_OPERATORS.get(types[position + 1])
+            if assignment is not None:
+                target = self._parse_identifier_local()
+                self._position += 1
+                return (assignment, target, self.parse_expression())
+        elif token_type == 'LSQUARE':
+            self._position += 1
+            sequence = self._parse_sequence()
+            if types[self._position] == 'ASSIGN':
+                self._position += 1
+                return (ASSIGN_SEQUENCE, sequence, self.parse_expression())
+            return self._parse_expression_tail(sequence, 0, False)
+        elif token_type == 'STMT_GOTO':
+            self._position += 1
+            return (STMT_GOTO, self._expect('IDENTIFIER_LOCAL'))
+        elif token_type == 'STMT_RETURN':
+            self._position += 1
+            if types[self._position] == 'SEMICOLON':
+                return (STMT_RETURN, (TERM_NONE, None))
+            return (STMT_RETURN, self.parse_expression())
+        elif token_type == 'STMT_EXIT':
+            self._position += 1
+            if types[self._position] == 'SEMICOLON':
+                return (STMT_EXIT, (TERM_STRING, ''))
+            return (STMT_EXIT, self.parse_expression())
+        elif token_type == 'STMT_BREAK':
+            self._position += 1
+            return (STMT_BREAK,)
+        elif token_type == 'STMT_CONTINUE':
+            self._position += 1
+            return (STMT_CONTINUE,)
+        return self.parse_expression()
+
+    def parse_expression(self, level=0, left_associative=False):
+        """
+        Parses an expression whose operators all bind more tightly than an operator of the given
+        precedence `level` and associativity would, with level 0 accepting everything.
+        """
+        return self._parse_expression_tail(self._parse_operand(), level, left_associative)
+
+    def _parse_expression_tail(self, left, level, left_associative):
+        """
+        Extends the already-parsed `left` operand with any operators and suffixes that follow it,
+        subject to the same constraints as `parse_expression`.
+        """
+        types = self._types
+        while True:
+            token_type = types[self._position]
+            if token_type == 'IDENTIFIER_SUFFIX':
+                if level: #The pending operator takes precedence; see the module's notes
+                    return left
+                left = (SUFFIX, left, self._parse_suffix())
+                continue
+
+            operator = _BINARY_OPERATORS.get(token_type)
+            if operator is None:
+                return left
+            (expression_type, operator_level, operator_left_associative) = operator
+            if operator_level < level or (operator_level == level and left_associative):
+                return left
+            self._position += 1
+            left = (expression_type, left, self.parse_expression(operator_level, operator_left_associative))
+
+    def _parse_suffix(self):
+        position = self._position
+        name = self._values[position][1:]
+        if self._types[position + 1] == 'LPAREN':
+            self._position = position + 2
+            arguments = self._parse_argumentset()
+            self._expect('RPAREN')
+            return (FUNCTIONCALL_SUFFIX, name, arguments)
+        self._position = position + 1
+        return (TERM_IDENTIFIER_SUFFIX, name)
+
+    def _parse_sequence(self):
+        """
+        Parses the elements of a sequence, after its opening bracket, and its closing bracket.
+        """
+        elements = []
+        types = self._types
+        while types[self._position] != 'RSQUARE':
+            elements.append(self.parse_expression())
+            if types[self._position] != 'COMMA':
+                break
+            self._position += 1
+        self._expect('RSQUARE')
+        return (SEQUENCE, elements)
+
+    def _parse_operand(self):
+        """
+        Parses a term, a function-call, a sequence, a parenthesised expression, or a negation.
+        """
+        position = self._position
+        token_type = self._types[position]
+        literal = _LITERAL_TERMS.get(token_type)
+        if literal is not None:
+            self._position = position + 1
+            return (literal, self._values[position])
+        elif token_type == 'IDENTIFIER_LOCAL' or token_type == 'IDENTIFIER_SCOPED':
+            name = self._values[position]
+            if self._types[position + 1] == 'LPAREN':
+                self._position = position + 2
+                arguments = self._parse_argumentset()
+                self._expect('RPAREN')
+                if token_type == 'IDENTIFIER_LOCAL':
+                    return (FUNCTIONCALL_LOCAL, name, arguments)
+                return (FUNCTIONCALL_SCOPED, name, arguments)
+            self._position = position + 1
+            if token_type == 'IDENTIFIER_LOCAL':
+                return (TERM_IDENTIFIER_LOCAL, name)
+            return (TERM_IDENTIFIER_SCOPED, name)
+        elif token_type == 'LPAREN':
+            self._position = position + 1
+            expression = self.parse_expression()
+            self._expect('RPAREN')
+            return expression
+        elif token_type == 'LSQUARE':
+            self._position = position + 1
+            return self._parse_sequence()
+        elif token_type == 'NEGATE':
+            self._position = position + 1
+            return (TEST_NEGATE, self.parse_expression(_NEGATE_LEVEL, False))
+        elif token_type in _SPECIAL_TERMS:
+            self._position = position + 1
+            return _SPECIAL_TERMS[token_type]
+        elif token_type in _QUALIFIERS:
+            return self._parse_identifier_local()
+        self._fail()
+
@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ADD', 'ASSIGN', 'ASSIGN_ADD', 'ASSIGN_DIVIDE', 'ASSIGN_DIVIDE_INTEGER', 'ASSIGN_EXPONENTIATE', 'ASSIGN_MOD', 'ASSIGN_MULTIPLY', 'ASSIGN_SUBTRACT', 'BOOL_AND', 'BOOL_OR', 'COMMA', 'DIVIDE', 'DIVIDE_INTEGER', 'ELIF', 'ELSE', 'EQUALITY', 'EXPONENTIATE', 'FALSE', 'FLOAT', 'FOR', 'GREATER', 'GREATER_EQUAL', 'IDENTIFIER_LOCAL', 'IDENTIFIER_SCOPED', 'IDENTIFIER_SUFFIX', 'IF', 'IN', 'INEQUALITY', 'INTEGER', 'LCURLY', 'LESSER', 'LESSER_EQUAL', 'LPAREN', 'LSQUARE', 'MOD', 'MULTIPLY', 'NEGATE', 'NONE', 'QUALIFIER_GLOBAL', 'QUALIFIER_LOCAL', 'RCURLY', 'RPAREN', 'RSQUARE', 'SEMICOLON', 'STMT_BREAK', 'STMT_CONTINUE', 'STMT_EXIT', 'STMT_GOTO', 'STMT_RETURN', 'STRING', 'SUBTRACT', 'TRUE', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_IDENTIFIER_SCOPED>[a-zA-Z_][a-zA-Z0-9_]*(?:\\.[a-zA-Z_][a-zA-Z0-9_]*)+)|(?P<t_IDENTIFIER_SUFFIX>(?:\\.[a-zA-Z_][a-zA-Z0-9_]*)+)|(?P<t_IDENTIFIER_LOCAL>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_STRING>(?:"(?:[^"\\\\]|\\\\[\\s\\S])*"|\\\'(?:[^\\\'\\\\]|\\\\[\\s\\S])*\\\'))|(?P<t_FLOAT>-?\\d+\\.\\d+)|(?P<t_INTEGER>-?\\d+)|(?P<t_newline>(?:\\r\\n?|\\n)+)|(?P<t_ignore_comment>(?:\\#|//).*)|(?P<t_ignore_whitespace>[ \\t])|(?P<t_BOOL_AND>\\&\\&)|(?P<t_BOOL_OR>\\|\\|)|(?P<t_ASSIGN_MULTIPLY>\\*=)|(?P<t_ASSIGN_EXPONENTIATE>\\^=)|(?P<t_ASSIGN_SUBTRACT>\\-=)|(?P<t_ASSIGN_ADD>\\+=)|(?P<t_ASSIGN_DIVIDE_INTEGER>\\\\=)|(?P<t_ASSIGN_DIVIDE>/=)|(?P<t_EXPONENTIATE>\\^)|(?P<t_MULTIPLY>\\*)|(?P<t_GREATER_EQUAL>>=)|(?P<t_DIVIDE_INTEGER>\\\\)|(?P<t_ASSIGN_MOD>%=)|(?P<t_SUBTRACT>\\-)|(?P<t_LPAREN>\\()|(?P<t_LSQUARE>\\[)|(?P<t_RSQUARE>\\])|(?P<t_LESSER_EQUAL><=)|(?P<t_ADD>\\+)|(?P<t_SEMICOLON>\\;)|(?P<t_INEQUALITY>!=)|(?P<t_RPAREN>\\))|(?P<t_EQUALITY>==)|(?P<t_NEGATE>!)|(?P<t_DIVIDE>/)|(?P<t_ASSIGN>=)|(?P<t_COMMA>,)|(?P<t_GREATER>>)|(?P<t_RCURLY>})|(?P<t_LESSER><)|(?P<t_MOD>%)|(?P<t_LCURLY>{)', [None, ('t_IDENTIFIER_SCOPED', 'IDENTIFIER_SCOPED'), ('t_IDENTIFIER_SUFFIX', 'IDENTIFIER_SUFFIX'), ('t_IDENTIFIER_LOCAL', 'IDENTIFIER_LOCAL'), ('t_STRING', 'STRING'), ('t_FLOAT', 'FLOAT'), ('t_INTEGER', 'INTEGER'), ('t_newline', 'newline'), (None, None), (None, None), (None, 'BOOL_AND'), (None, 'BOOL_OR'), (None, 'ASSIGN_MULTIPLY'), (None, 'ASSIGN_EXPONENTIATE'), (None, 'ASSIGN_SUBTRACT'), (None, 'ASSIGN_ADD'), (None, 'ASSIGN_DIVIDE_INTEGER'), (None, 'ASSIGN_DIVIDE'), (None, 'EXPONENTIATE'), (None, 'MULTIPLY'), (None, 'GREATER_EQUAL'), (None, 'DIVIDE_INTEGER'), (None, 'ASSIGN_MOD'), (None, 'SUBTRACT'), (None, 'LPAREN'), (None, 'LSQUARE'), (None, 'RSQUARE'), (None, 'LESSER_EQUAL'), (None, 'ADD'), (None, 'SEMICOLON'), (None, 'INEQUALITY'), (None, 'RPAREN'), (None, 'EQUALITY'), (None, 'NEGATE'), (None, 'DIVIDE'), (None, 'ASSIGN'), (None, 'COMMA'), (None, 'GREATER'), (None, 'RCURLY'), (None, 'LESSER'), (None, 'MOD'), (None, 'LCURLY')])]}
+_lexstateignore = {'INITIAL': ''}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
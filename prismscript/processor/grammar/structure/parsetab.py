@@ -0,0 +1,119 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'nodelistrightEQUALITYINEQUALITYGREATER_EQUALGREATERLESSER_EQUALLESSERleftSUBTRACTADDleftMULTIPLYDIVIDEDIVIDE_INTEGERMODleftEXPONENTIATEleftBOOL_ORBOOL_ANDrightNEGATEADD ASSIGN ASSIGN_ADD ASSIGN_DIVIDE ASSIGN_DIVIDE_INTEGER ASSIGN_EXPONENTIATE ASSIGN_MOD ASSIGN_MULTIPLY ASSIGN_SUBTRACT BOOL_AND BOOL_OR COMMA DIVIDE DIVIDE_INTEGER ELIF ELSE EQUALITY EXPONENTIATE FALSE FLOAT FOR GREATER GREATER_EQUAL IDENTIFIER_LOCAL IDENTIFIER_SCOPED IDENTIFIER_SUFFIX IF IN INEQUALITY INTEGER LCURLY LESSER LESSER_EQUAL LPAREN LSQUARE MOD MULTIPLY NEGATE NONE QUALIFIER_GLOBAL QUALIFIER_LOCAL RCURLY RPAREN RSQUARE SEMICOLON STMT_BREAK STMT_CONTINUE STMT_EXIT STMT_GOTO STMT_RETURN STRING SUBTRACT TRUE WHILE\n    empty :\n    \n    nodelist : nodelist node\n             | nodelist function\n             | empty\n    \n    node : IDENTIFIER_LOCAL LCURLY expressionlist RCURLY\n    \n    function : IDENTIFIER_LOCAL LPAREN parameterset RPAREN LCURLY expressionlist RCURLY\n    \n    parameterset : parameters\n                 | parameters COMMA\n                 | empty\n    \n    parameters : parameters COMMA IDENTIFIER_LOCAL\n               | IDENTIFIER_LOCAL\n    \n    argumentset : arguments\n                | arguments COMMA\n                | empty\n    \n    arguments : arguments COMMA IDENTIFIER_LOCAL ASSIGN expression\n              | IDENTIFIER_LOCAL ASSIGN expression\n    \n    expressionlist : expressionlist conditional\n                   | expressionlist while\n                   | expressionlist for\n                   | expressionlist assignment SEMICOLON\n                   | expressionlist statement SEMICOLON\n                   | expressionlist expression SEMICOLON\n                   | empty\n    \n    conditional : IF LPAREN expression RPAREN LCURLY expressionlist RCURLY conditionalalternate conditionalterminal\n    \n    conditionalalternate : conditionalalternate ELIF LPAREN expression RPAREN LCURLY expressionlist RCURLY\n                         | empty\n    \n    conditionalterminal : ELSE LCURLY expressionlist RCURLY\n                        | empty\n    \n    while : WHILE LPAREN expression RPAREN LCURLY expressionlist RCURLY\n    \n    for : FOR LPAREN identifier_local IN expression RPAREN LCURLY expressionlist RCURLY\n        | FOR LPAREN sequence IN expression RPAREN LCURLY expressionlist RCURLY\n    \n    assignment : identifier_local ASSIGN expression\n    \n    assignment : identifier_local ASSIGN_ADD expression\n               | identifier_local ASSIGN_SUBTRACT expression\n               | identifier_local ASSIGN_EXPONENTIATE expression\n               | identifier_local ASSIGN_MULTIPLY expression\n               | identifier_local ASSIGN_DIVIDE expression\n               | identifier_local ASSIGN_DIVIDE_INTEGER expression\n               | identifier_local ASSIGN_MOD expression\n    \n    assignment : sequence ASSIGN expression\n    \n    statement : STMT_GOTO IDENTIFIER_LOCAL\n    \n    statement : STMT_RETURN expression\n              | STMT_RETURN\n    \n    statement : STMT_EXIT expression\n              | STMT_EXIT\n    \n    statement : STMT_BREAK\n    \n    statement : STMT_CONTINUE\n    \n    expression : LPAREN expression RPAREN\n               | sequence\n               | functioncall\n               | term\n               | expression suffix_expression\n    \n    expression : expression EXPONENTIATE expression\n               | expression MULTIPLY expression\n               | expression DIVIDE_INTEGER expression\n               | expression DIVIDE expression\n               | expression SUBTRACT expression\n               | expression ADD expression\n               | expression MOD expression\n    \n    expression : expression EQUALITY expression\n               | expression INEQUALITY expression\n               | expression GREATER_EQUAL expression\n               | expression GREATER expression\n               | expression LESSER_EQUAL expression\n               | expression LESSER expression\n               | expression BOOL_OR expression\n               | expression BOOL_AND expression\n               | NEGATE expression\n    \n    sequence : LSQUARE expressionsequence RSQUARE\n    \n    expressionsequence : expressions\n                       | expressions COMMA\n                       | empty\n    \n    expressions : expressions COMMA expression\n                | expression\n    \n    functioncall : IDENTIFIER_SCOPED LPAREN argumentset RPAREN\n    \n    functioncall : IDENTIFIER_LOCAL LPAREN argumentset RPAREN\n    \n    suffix_expression : IDENTIFIER_SUFFIX LPAREN argumentset RPAREN\n                      | IDENTIFIER_SUFFIX\n    \n    term : STRING\n         | INTEGER\n         | FLOAT\n    \n    term : NONE\n         | TRUE\n         | FALSE\n    \n    term : IDENTIFIER_SCOPED\n    \n    term : identifier_local\n    \n    identifier_local : IDENTIFIER_LOCAL\n                     | QUALIFIER_LOCAL IDENTIFIER_LOCAL\n                     | QUALIFIER_GLOBAL IDENTIFIER_LOCAL\n    '
+    
+_lr_action_items = {'ASSIGN_DIVIDE':([22,28,56,59,],[60,-87,-89,-88,]),'DIVIDE':([15,20,22,24,26,27,28,36,37,40,43,44,45,48,50,52,54,56,58,59,72,74,76,78,88,99,100,101,102,103,104,105,106,107,108,109,117,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,151,152,154,161,177,],[-49,-82,-86,-83,-80,-79,-87,-51,-84,-81,-50,-85,87,-49,-86,-87,87,-89,87,-88,-68,87,87,-52,-78,-69,87,87,87,87,87,87,87,87,87,87,-48,87,87,-67,-54,-55,87,87,87,-66,-56,87,87,87,87,-53,-59,87,-76,-75,87,87,87,-77,87,87,]),'LESSER_EQUAL':([15,20,22,24,26,27,28,36,37,40,43,44,45,48,50,52,54,56,58,59,72,74,76,78,88,99,100,101,102,103,104,105,106,107,108,109,117,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,151,152,154,161,177,],[-49,-82,-86,-83,-80,-79,-87,-51,-84,-81,-50,-85,79,-49,-86,-87,79,-89,79,-88,-68,79,79,-52,-78,-69,79,79,79,79,79,79,79,79,79,79,-48,79,79,-67,-54,-55,-57,79,79,-66,-56,-58,79,79,79,-53,-59,79,-76,-75,79,79,79,-77,79,79,]),'LPAREN':([5,6,8,9,14,16,18,19,28,29,31,33,34,35,38,41,44,52,55,57,60,61,62,63,64,65,66,67,68,71,75,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,98,136,139,142,143,148,153,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,174,175,176,178,180,181,182,183,],[7,-1,33,-23,33,-17,57,33,69,70,33,33,75,33,-19,-18,77,69,33,33,33,33,33,33,33,33,33,33,-21,-20,33,33,33,33,33,33,33,33,33,33,129,33,33,-22,33,33,33,33,-1,33,33,33,33,33,-1,-1,33,33,33,-29,-1,-1,-1,33,33,-1,-26,-30,-31,175,-24,-28,33,-1,33,-27,-1,33,-25,]),'ELIF':([164,167,168,183,],[-1,171,-26,-25,]),'QUALIFIER_GLOBAL':([6,8,9,14,16,19,31,33,35,38,41,55,57,60,61,62,63,64,65,66,67,68,70,71,75,79,80,81,82,83,84,85,86,87,89,90,91,92,93,94,95,97,98,136,139,142,143,148,153,155,156,159,160,162,163,164,165,166,167,168,169,170,172,174,175,176,178,180,181,182,183,],[-1,17,-23,17,-17,17,17,17,17,-19,-18,17,17,17,17,17,17,17,17,17,17,-21,17,-20,17,17,17,17,17,17,17,17,17,17,17,17,-22,17,17,17,17,-1,17,17,17,17,17,-1,-1,17,17,17,-29,-1,-1,-1,17,17,-1,-26,-30,-31,-24,-28,17,-1,17,-27,-1,17,-25,]),'LCURLY':([5,47,138,144,157,158,173,179,],[6,97,148,153,162,163,176,181,]),'WHILE':([6,8,9,16,38,41,68,71,91,97,136,148,153,155,159,160,162,163,164,165,166,167,168,169,170,172,174,176,178,180,181,182,183,],[-1,18,-23,-17,-19,-18,-21,-20,-22,-1,18,-1,-1,18,18,-29,-1,-1,-1,18,18,-1,-26,-30,-31,-24,-28,-1,18,-27,-1,18,-25,]),'STMT_EXIT':([6,8,9,16,38,41,68,71,91,97,136,148,153,155,159,160,162,163,164,165,166,167,168,169,170,172,174,176,178,180,181,182,183,],[-1,19,-23,-17,-19,-18,-21,-20,-22,-1,19,-1,-1,19,19,-29,-1,-1,-1,19,19,-1,-26,-30,-31,-24,-28,-1,19,-27,-1,19,-25,]),'GREATER':([15,20,22,24,26,27,28,36,37,40,43,44,45,48,50,52,54,56,58,59,72,74,76,78,88,99,100,101,102,103,104,105,106,107,108,109,117,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,151,152,154,161,177,],[-49,-82,-86,-83,-80,-79,-87,-51,-84,-81,-50,-85,90,-49,-86,-87,90,-89,90,-88,-68,90,90,-52,-78,-69,90,90,90,90,90,90,90,90,90,90,-48,90,90,-67,-54,-55,-57,90,90,-66,-56,-58,90,90,90,-53,-59,90,-76,-75,90,90,90,-77,90,90,]),'NEGATE':([6,8,9,14,16,19,31,33,35,38,41,55,57,60,61,62,63,64,65,66,67,68,71,75,79,80,81,82,83,84,85,86,87,89,90,91,92,93,94,95,97,98,136,139,142,143,148,153,155,156,159,160,162,163,164,165,166,167,168,169,170,172,174,175,176,178,180,181,182,183,],[-1,31,-23,31,-17,31,31,31,31,-19,-18,31,31,31,31,31,31,31,31,31,31,-21,-20,31,31,31,31,31,31,31,31,31,31,31,31,-22,31,31,31,31,-1,31,31,31,31,31,-1,-1,31,31,31,-29,-1,-1,-1,31,31,-1,-26,-30,-31,-24,-28,31,-1,31,-27,-1,31,-25,]),'DIVIDE_INTEGER':([15,20,22,24,26,27,28,36,37,40,43,44,45,48,50,52,54,56,58,59,72,74,76,78,88,99,100,101,102,103,104,105,106,107,108,109,117,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,151,152,154,161,177,],[-49,-82,-86,-83,-80,-79,-87,-51,-84,-81,-50,-85,82,-49,-86,-87,82,-89,82,-88,-68,82,82,-52,-78,-69,82,82,82,82,82,82,82,82,82,82,-48,82,82,-67,-54,-55,82,82,82,-66,-56,82,82,82,82,-53,-59,82,-76,-75,82,82,82,-77,82,82,]),'TRUE':([6,8,9,14,16,19,31,33,35,38,41,55,57,60,61,62,63,64,65,66,67,68,71,75,79,80,81,82,83,84,85,86,87,89,90,91,92,93,94,95,97,98,136,139,142,143,148,153,155,156,159,160,162,163,164,165,166,167,168,169,170,172,174,175,176,178,180,181,182,183,],[-1,24,-23,24,-17,24,24,24,24,-19,-18,24,24,24,24,24,24,24,24,24,24,-21,-20,24,24,24,24,24,24,24,24,24,24,24,24,-22,24,24,24,24,-1,24,24,24,24,24,-1,-1,24,24,24,-29,-1,-1,-1,24,24,-1,-26,-30,-31,-24,-28,24,-1,24,-27,-1,24,-25,]),'STRING':([6,8,9,14,16,19,31,33,35,38,41,55,57,60,61,62,63,64,65,66,67,68,71,75,79,80,81,82,83,84,85,86,87,89,90,91,92,93,94,95,97,98,136,139,142,143,148,153,155,156,159,160,162,163,164,165,166,167,168,169,170,172,174,175,176,178,180,181,182,183,],[-1,27,-23,27,-17,27,27,27,27,-19,-18,27,27,27,27,27,27,27,27,27,27,-21,-20,27,27,27,27,27,27,27,27,27,27,27,27,-22,27,27,27,27,-1,27,27,27,27,27,-1,-1,27,27,27,-29,-1,-1,-1,27,27,-1,-26,-30,-31,-24,-28,27,-1,27,-27,-1,27,-25,]),'RSQUARE':([14,20,24,26,27,36,37,40,43,44,48,49,50,51,52,53,54,56,59,72,78,88,98,99,117,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,154,],[-1,-82,-83,-80,-79,-51,-84,-81,-50,-85,-49,-70,-86,-72,-87,99,-74,-89,-88,-68,-52,-78,-71,-69,-48,-64,-67,-54,-55,-57,-60,-62,-66,-56,-58,-63,-65,-61,-53,-59,-73,-76,-75,-77,]),'ASSIGN_ADD':([22,28,56,59,],[61,-87,-89,-88,]),'NONE':([6,8,9,14,16,19,31,33,35,38,41,55,57,60,61,62,63,64,65,66,67,68,71,75,79,80,81,82,83,84,85,86,87,89,90,91,92,93,94,95,97,98,136,139,142,143,148,153,155,156,159,160,162,163,164,165,166,167,168,169,170,172,174,175,176,178,180,181,182,183,],[-1,20,-23,20,-17,20,20,20,20,-19,-18,20,20,20,20,20,20,20,20,20,20,-21,-20,20,20,20,20,20,20,20,20,20,20,20,20,-22,20,20,20,20,-1,20,20,20,20,20,-1,-1,20,20,20,-29,-1,-1,-1,20,20,-1,-26,-30,-31,-24,-28,20,-1,20,-27,-1,20,-25,]),'QUALIFIER_LOCAL':([6,8,9,14,16,19,31,33,35,38,41,55,57,60,61,62,63,64,65,66,67,68,70,71,75,79,80,81,82,83,84,85,86,87,89,90,91,92,93,94,95,97,98,136,139,142,143,148,153,155,156,159,160,162,163,164,165,166,167,168,169,170,172,174,175,176,178,180,181,182,183,],[-1,21,-23,21,-17,21,21,21,21,-19,-18,21,21,21,21,21,21,21,21,21,21,-21,21,-20,21,21,21,21,21,21,21,21,21,21,21,21,-22,21,21,21,21,-1,21,21,21,21,21,-1,-1,21,21,21,-29,-1,-1,-1,21,21,-1,-26,-30,-31,-24,-28,21,-1,21,-27,-1,21,-25,]),'RPAREN':([7,10,11,12,13,20,24,26,27,36,37,40,43,44,46,48,50,52,56,59,69,72,74,77,78,88,96,99,101,111,112,113,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,140,141,145,146,149,151,152,154,161,177,],[-1,-11,-7,47,-9,-82,-83,-80,-79,-51,-84,-81,-50,-85,-8,-49,-86,-87,-89,-88,-1,-68,117,-1,-52,-78,-10,-69,138,140,-12,-14,-48,144,145,-64,-67,-54,-55,-57,-60,-62,-66,-56,-1,-58,-63,-65,-61,-53,-59,-76,-13,-75,154,-16,157,158,-77,-15,179,]),'IDENTIFIER_SUFFIX':([15,20,22,24,26,27,28,36,37,40,43,44,45,48,50,52,54,56,58,59,72,74,76,78,88,99,100,101,102,103,104,105,106,107,108,109,117,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,151,152,154,161,177,],[-49,-82,-86,-83,-80,-79,-87,-51,-84,-81,-50,-85,88,-49,-86,-87,88,-89,88,-88,-68,88,88,-52,-78,-69,88,88,88,88,88,88,88,88,88,88,-48,88,-64,-67,-54,-55,-57,-60,-62,-66,-56,-58,-63,-65,-61,-53,-59,88,-76,-75,88,88,88,-77,88,88,]),'GREATER_EQUAL':([15,20,22,24,26,27,28,36,37,40,43,44,45,48,50,52,54,56,58,59,72,74,76,78,88,99,100,101,102,103,104,105,106,107,108,109,117,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,151,152,154,161,177,],[-49,-82,-86,-83,-80,-79,-87,-51,-84,-81,-50,-85,85,-49,-86,-87,85,-89,85,-88,-68,85,85,-52,-78,-69,85,85,85,85,85,85,85,85,85,85,-48,85,85,-67,-54,-55,-57,85,85,-66,-56,-58,85,85,85,-53,-59,85,-76,-75,85,85,85,-77,85,85,]),'RCURLY':([6,8,9,16,38,41,68,71,91,97,136,148,153,155,159,160,162,163,164,165,166,167,168,169,170,172,174,176,178,180,181,182,183,],[-1,23,-23,-17,-19,-18,-21,-20,-22,-1,147,-1,-1,160,164,-29,-1,-1,-1,169,170,-1,-26,-30,-31,-24,-28,-1,180,-27,-1,183,-25,]),'SUBTRACT':([15,20,22,24,26,27,28,36,37,40,43,44,45,48,50,52,54,56,58,59,72,74,76,78,88,99,100,101,102,103,104,105,106,107,108,109,117,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,151,152,154,161,177,],[-49,-82,-86,-83,-80,-79,-87,-51,-84,-81,-50,-85,83,-49,-86,-87,83,-89,83,-88,-68,83,83,-52,-78,-69,83,83,83,83,83,83,83,83,83,83,-48,83,83,-67,-54,-55,-57,83,83,-66,-56,-58,83,83,83,-53,-59,83,-76,-75,83,83,83,-77,83,83,]),'BOOL_OR':([15,20,22,24,26,27,28,36,37,40,43,44,45,48,50,52,54,56,58,59,72,74,76,78,88,99,100,101,102,103,104,105,106,107,108,109,117,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,151,152,154,161,177,],[-49,-82,-86,-83,-80,-79,-87,-51,-84,-81,-50,-85,86,-49,-86,-87,86,-89,86,-88,-68,86,86,-52,-78,-69,86,86,86,86,86,86,86,86,86,86,-48,86,86,-67,86,86,86,86,86,-66,86,86,86,86,86,86,86,86,-76,-75,86,86,86,-77,86,86,]),'COMMA':([10,11,20,24,26,27,36,37,40,43,44,48,49,50,52,54,56,59,72,78,88,96,99,112,117,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,154,161,],[-11,46,-82,-83,-80,-79,-51,-84,-81,-50,-85,-49,98,-86,-87,-74,-89,-88,-68,-52,-78,-10,-69,141,-48,-64,-67,-54,-55,-57,-60,-62,-66,-56,-58,-63,-65,-61,-53,-59,-73,-76,-75,-16,-77,-15,]),'ASSIGN_SUBTRACT':([22,28,56,59,],[65,-87,-89,-88,]),'INTEGER':([6,8,9,14,16,19,31,33,35,38,41,55,57,60,61,62,63,64,65,66,67,68,71,75,79,80,81,82,83,84,85,86,87,89,90,91,92,93,94,95,97,98,136,139,142,143,148,153,155,156,159,160,162,163,164,165,166,167,168,169,170,172,174,175,176,178,180,181,182,183,],[-1,26,-23,26,-17,26,26,26,26,-19,-18,26,26,26,26,26,26,26,26,26,26,-21,-20,26,26,26,26,26,26,26,26,26,26,26,26,-22,26,26,26,26,-1,26,26,26,26,26,-1,-1,26,26,26,-29,-1,-1,-1,26,26,-1,-26,-30,-31,-24,-28,26,-1,26,-27,-1,26,-25,]),'ASSIGN_EXPONENTIATE':([22,28,56,59,],[67,-87,-89,-88,]),'ASSIGN':([15,22,28,56,59,99,110,150,],[55,66,-87,-89,-88,-69,139,156,]),'$end':([0,1,2,3,4,23,147,],[-1,0,-4,-2,-3,-5,-6,]),'ASSIGN_MOD':([22,28,56,59,],[62,-87,-89,-88,]),'ASSIGN_MULTIPLY':([22,28,56,59,],[63,-87,-89,-88,]),'IDENTIFIER_LOCAL':([0,1,2,3,4,6,7,8,9,14,16,17,19,21,23,31,32,33,35,38,41,46,55,57,60,61,62,63,64,65,66,67,68,69,70,71,75,77,79,80,81,82,83,84,85,86,87,89,90,91,92,93,94,95,97,98,129,136,139,141,142,143,147,148,153,155,156,159,160,162,163,164,165,166,167,168,169,170,172,174,175,176,178,180,181,182,183,],[-1,5,-4,-2,-3,-1,10,28,-23,52,-17,56,52,59,-5,52,73,52,52,-19,-18,96,52,52,52,52,52,52,52,52,52,52,-21,110,116,-20,52,110,52,52,52,52,52,52,52,52,52,52,52,-22,52,52,52,52,-1,52,110,28,52,150,52,52,-6,-1,-1,28,52,28,-29,-1,-1,-1,28,28,-1,-26,-30,-31,-24,-28,52,-1,28,-27,-1,28,-25,]),'FOR':([6,8,9,16,38,41,68,71,91,97,136,148,153,155,159,160,162,163,164,165,166,167,168,169,170,172,174,176,178,180,181,182,183,],[-1,29,-23,-17,-19,-18,-21,-20,-22,-1,29,-1,-1,29,29,-29,-1,-1,-1,29,29,-1,-26,-30,-31,-24,-28,-1,29,-27,-1,29,-25,]),'ELSE':([164,167,168,183,],[-1,173,-26,-25,]),'STMT_GOTO':([6,8,9,16,38,41,68,71,91,97,136,148,153,155,159,160,162,163,164,165,166,167,168,169,170,172,174,176,178,180,181,182,183,],[-1,32,-23,-17,-19,-18,-21,-20,-22,-1,32,-1,-1,32,32,-29,-1,-1,-1,32,32,-1,-26,-30,-31,-24,-28,-1,32,-27,-1,32,-25,]),'ADD':([15,20,22,24,26,27,28,36,37,40,43,44,45,48,50,52,54,56,58,59,72,74,76,78,88,99,100,101,102,103,104,105,106,107,108,109,117,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,151,152,154,161,177,],[-49,-82,-86,-83,-80,-79,-87,-51,-84,-81,-50,-85,89,-49,-86,-87,89,-89,89,-88,-68,89,89,-52,-78,-69,89,89,89,89,89,89,89,89,89,89,-48,89,89,-67,-54,-55,-57,89,89,-66,-56,-58,89,89,89,-53,-59,89,-76,-75,89,89,89,-77,89,89,]),'STMT_CONTINUE':([6,8,9,16,38,41,68,71,91,97,136,148,153,155,159,160,162,163,164,165,166,167,168,169,170,172,174,176,178,180,181,182,183,],[-1,42,-23,-17,-19,-18,-21,-20,-22,-1,42,-1,-1,42,42,-29,-1,-1,-1,42,42,-1,-26,-30,-31,-24,-28,-1,42,-27,-1,42,-25,]),'LSQUARE':([6,8,9,14,16,19,31,33,35,38,41,55,57,60,61,62,63,64,65,66,67,68,70,71,75,79,80,81,82,83,84,85,86,87,89,90,91,92,93,94,95,97,98,136,139,142,143,148,153,155,156,159,160,162,163,164,165,166,167,168,169,170,172,174,175,176,178,180,181,182,183,],[-1,14,-23,14,-17,14,14,14,14,-19,-18,14,14,14,14,14,14,14,14,14,14,-21,14,-20,14,14,14,14,14,14,14,14,14,14,14,14,-22,14,14,14,14,-1,14,14,14,14,14,-1,-1,14,14,14,-29,-1,-1,-1,14,14,-1,-26,-30,-31,-24,-28,14,-1,14,-27,-1,14,-25,]),'IN':([56,59,99,114,115,116,],[-89,-88,-69,142,143,-87,]),'EQUALITY':([15,20,22,24,26,27,28,36,37,40,43,44,45,48,50,52,54,56,58,59,72,74,76,78,88,99,100,101,102,103,104,105,106,107,108,109,117,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,151,152,154,161,177,],[-49,-82,-86,-83,-80,-79,-87,-51,-84,-81,-50,-85,84,-49,-86,-87,84,-89,84,-88,-68,84,84,-52,-78,-69,84,84,84,84,84,84,84,84,84,84,-48,84,84,-67,-54,-55,-57,84,84,-66,-56,-58,84,84,84,-53,-59,84,-76,-75,84,84,84,-77,84,84,]),'IF':([6,8,9,16,38,41,68,71,91,97,136,148,153,155,159,160,162,163,164,165,166,167,168,169,170,172,174,176,178,180,181,182,183,],[-1,34,-23,-17,-19,-18,-21,-20,-22,-1,34,-1,-1,34,34,-29,-1,-1,-1,34,34,-1,-26,-30,-31,-24,-28,-1,34,-27,-1,34,-25,]),'STMT_RETURN':([6,8,9,16,38,41,68,71,91,97,136,148,153,155,159,160,162,163,164,165,166,167,168,169,170,172,174,176,178,180,181,182,183,],[-1,35,-23,-17,-19,-18,-21,-20,-22,-1,35,-1,-1,35,35,-29,-1,-1,-1,35,35,-1,-26,-30,-31,-24,-28,-1,35,-27,-1,35,-25,]),'FALSE':([6,8,9,14,16,19,31,33,35,38,41,55,57,60,61,62,63,64,65,66,67,68,71,75,79,80,81,82,83,84,85,86,87,89,90,91,92,93,94,95,97,98,136,139,142,143,148,153,155,156,159,160,162,163,164,165,166,167,168,169,170,172,174,175,176,178,180,181,182,183,],[-1,37,-23,37,-17,37,37,37,37,-19,-18,37,37,37,37,37,37,37,37,37,37,-21,-20,37,37,37,37,37,37,37,37,37,37,37,37,-22,37,37,37,37,-1,37,37,37,37,37,-1,-1,37,37,37,-29,-1,-1,-1,37,37,-1,-26,-30,-31,-24,-28,37,-1,37,-27,-1,37,-25,]),'SEMICOLON':([15,19,20,22,24,25,26,27,28,30,35,36,37,39,40,42,43,44,45,48,50,52,56,58,59,72,73,76,78,88,99,100,102,103,104,105,106,107,108,109,117,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,140,145,154,],[-49,-45,-82,-86,-83,68,-80,-79,-87,71,-43,-51,-84,-46,-81,-47,-50,-85,91,-49,-86,-87,-89,-44,-88,-68,-41,-42,-52,-78,-69,-40,-37,-33,-39,-36,-38,-34,-32,-35,-48,-64,-67,-54,-55,-57,-60,-62,-66,-56,-58,-63,-65,-61,-53,-59,-76,-75,-77,]),'MULTIPLY':([15,20,22,24,26,27,28,36,37,40,43,44,45,48,50,52,54,56,58,59,72,74,76,78,88,99,100,101,102,103,104,105,106,107,108,109,117,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,151,152,154,161,177,],[-49,-82,-86,-83,-80,-79,-87,-51,-84,-81,-50,-85,81,-49,-86,-87,81,-89,81,-88,-68,81,81,-52,-78,-69,81,81,81,81,81,81,81,81,81,81,-48,81,81,-67,-54,-55,81,81,81,-66,-56,81,81,81,81,-53,-59,81,-76,-75,81,81,81,-77,81,81,]),'STMT_BREAK':([6,8,9,16,38,41,68,71,91,97,136,148,153,155,159,160,162,163,164,165,166,167,168,169,170,172,174,176,178,180,181,182,183,],[-1,39,-23,-17,-19,-18,-21,-20,-22,-1,39,-1,-1,39,39,-29,-1,-1,-1,39,39,-1,-26,-30,-31,-24,-28,-1,39,-27,-1,39,-25,]),'FLOAT':([6,8,9,14,16,19,31,33,35,38,41,55,57,60,61,62,63,64,65,66,67,68,71,75,79,80,81,82,83,84,85,86,87,89,90,91,92,93,94,95,97,98,136,139,142,143,148,153,155,156,159,160,162,163,164,165,166,167,168,169,170,172,174,175,176,178,180,181,182,183,],[-1,40,-23,40,-17,40,40,40,40,-19,-18,40,40,40,40,40,40,40,40,40,40,-21,-20,40,40,40,40,40,40,40,40,40,40,40,40,-22,40,40,40,40,-1,40,40,40,40,40,-1,-1,40,40,40,-29,-1,-1,-1,40,40,-1,-26,-30,-31,-24,-28,40,-1,40,-27,-1,40,-25,]),'BOOL_AND':([15,20,22,24,26,27,28,36,37,40,43,44,45,48,50,52,54,56,58,59,72,74,76,78,88,99,100,101,102,103,104,105,106,107,108,109,117,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,151,152,154,161,177,],[-49,-82,-86,-83,-80,-79,-87,-51,-84,-81,-50,-85,80,-49,-86,-87,80,-89,80,-88,-68,80,80,-52,-78,-69,80,80,80,80,80,80,80,80,80,80,-48,80,80,-67,80,80,80,80,80,-66,80,80,80,80,80,80,80,80,-76,-75,80,80,80,-77,80,80,]),'LESSER':([15,20,22,24,26,27,28,36,37,40,43,44,45,48,50,52,54,56,58,59,72,74,76,78,88,99,100,101,102,103,104,105,106,107,108,109,117,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,151,152,154,161,177,],[-49,-82,-86,-83,-80,-79,-87,-51,-84,-81,-50,-85,92,-49,-86,-87,92,-89,92,-88,-68,92,92,-52,-78,-69,92,92,92,92,92,92,92,92,92,92,-48,92,92,-67,-54,-55,-57,92,92,-66,-56,-58,92,92,92,-53,-59,92,-76,-75,92,92,92,-77,92,92,]),'ASSIGN_DIVIDE_INTEGER':([22,28,56,59,],[64,-87,-89,-88,]),'INEQUALITY':([15,20,22,24,26,27,28,36,37,40,43,44,45,48,50,52,54,56,58,59,72,74,76,78,88,99,100,101,102,103,104,105,106,107,108,109,117,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,151,152,154,161,177,],[-49,-82,-86,-83,-80,-79,-87,-51,-84,-81,-50,-85,93,-49,-86,-87,93,-89,93,-88,-68,93,93,-52,-78,-69,93,93,93,93,93,93,93,93,93,93,-48,93,93,-67,-54,-55,-57,93,93,-66,-56,-58,93,93,93,-53,-59,93,-76,-75,93,93,93,-77,93,93,]),'EXPONENTIATE':([15,20,22,24,26,27,28,36,37,40,43,44,45,48,50,52,54,56,58,59,72,74,76,78,88,99,100,101,102,103,104,105,106,107,108,109,117,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,151,152,154,161,177,],[-49,-82,-86,-83,-80,-79,-87,-51,-84,-81,-50,-85,94,-49,-86,-87,94,-89,94,-88,-68,94,94,-52,-78,-69,94,94,94,94,94,94,94,94,94,94,-48,94,94,-67,94,94,94,94,94,-66,94,94,94,94,94,-53,94,94,-76,-75,94,94,94,-77,94,94,]),'IDENTIFIER_SCOPED':([6,8,9,14,16,19,31,33,35,38,41,55,57,60,61,62,63,64,65,66,67,68,71,75,79,80,81,82,83,84,85,86,87,89,90,91,92,93,94,95,97,98,136,139,142,143,148,153,155,156,159,160,162,163,164,165,166,167,168,169,170,172,174,175,176,178,180,181,182,183,],[-1,44,-23,44,-17,44,44,44,44,-19,-18,44,44,44,44,44,44,44,44,44,44,-21,-20,44,44,44,44,44,44,44,44,44,44,44,44,-22,44,44,44,44,-1,44,44,44,44,44,-1,-1,44,44,44,-29,-1,-1,-1,44,44,-1,-26,-30,-31,-24,-28,44,-1,44,-27,-1,44,-25,]),'MOD':([15,20,22,24,26,27,28,36,37,40,43,44,45,48,50,52,54,56,58,59,72,74,76,78,88,99,100,101,102,103,104,105,106,107,108,109,117,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,140,145,149,151,152,154,161,177,],[-49,-82,-86,-83,-80,-79,-87,-51,-84,-81,-50,-85,95,-49,-86,-87,95,-89,95,-88,-68,95,95,-52,-78,-69,95,95,95,95,95,95,95,95,95,95,-48,95,95,-67,-54,-55,95,95,95,-66,-56,95,95,95,95,-53,-59,95,-76,-75,95,95,95,-77,95,95,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'function':([1,],[4,]),'nodelist':([0,],[1,]),'sequence':([8,14,19,31,33,35,55,57,60,61,62,63,64,65,66,67,70,75,79,80,81,82,83,84,85,86,87,89,90,92,93,94,95,98,136,139,142,143,155,156,159,165,166,175,178,182,],[15,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,115,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,15,48,48,48,15,48,15,15,15,48,15,15,]),'conditional':([8,136,155,159,165,166,178,182,],[16,16,16,16,16,16,16,16,]),'expressionlist':([6,97,148,153,162,163,176,181,],[8,136,155,159,165,166,178,182,]),'expressions':([14,],[49,]),'parameterset':([7,],[12,]),'identifier_local':([8,14,19,31,33,35,55,57,60,61,62,63,64,65,66,67,70,75,79,80,81,82,83,84,85,86,87,89,90,92,93,94,95,98,136,139,142,143,155,156,159,165,166,175,178,182,],[22,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,114,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,22,50,50,50,22,50,22,22,22,50,22,22,]),'parameters':([7,],[11,]),'conditionalterminal':([167,],[172,]),'suffix_expression':([45,54,58,72,74,76,100,101,102,103,104,105,106,107,108,109,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,149,151,152,161,177,],[78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),'arguments':([69,77,129,],[112,112,112,]),'statement':([8,136,155,159,165,166,178,182,],[25,25,25,25,25,25,25,25,]),'empty':([0,6,7,14,69,77,97,129,148,153,162,163,164,167,176,181,],[2,9,13,51,113,113,9,113,9,9,9,9,168,174,9,9,]),'node':([1,],[3,]),'conditionalalternate':([164,],[167,]),'assignment':([8,136,155,159,165,166,178,182,],[30,30,30,30,30,30,30,30,]),'argumentset':([69,77,129,],[111,119,146,]),'term':([8,14,19,31,33,35,55,57,60,61,62,63,64,65,66,67,75,79,80,81,82,83,84,85,86,87,89,90,92,93,94,95,98,136,139,142,143,155,156,159,165,166,175,178,182,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'for':([8,136,155,159,165,166,178,182,],[38,38,38,38,38,38,38,38,]),'while':([8,136,155,159,165,166,178,182,],[41,41,41,41,41,41,41,41,]),'functioncall':([8,14,19,31,33,35,55,57,60,61,62,63,64,65,66,67,75,79,80,81,82,83,84,85,86,87,89,90,92,93,94,95,98,136,139,142,143,155,156,159,165,166,175,178,182,],[43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'expressionsequence':([14,],[53,]),'expression':([8,14,19,31,33,35,55,57,60,61,62,63,64,65,66,67,75,79,80,81,82,83,84,85,86,87,89,90,92,93,94,95,98,136,139,142,143,155,156,159,165,166,175,178,182,],[45,54,58,72,74,76,100,101,102,103,104,105,106,107,108,109,118,120,121,122,123,124,125,126,127,128,130,131,132,133,134,135,137,45,149,151,152,45,161,45,45,45,177,45,45,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> nodelist","S'",1,None,None,None),
+  ('empty -> <empty>','empty',0,'p_empty','syntax.py',107),
+  ('nodelist -> nodelist node','nodelist',2,'p_nodeset','syntax.py',112),
+  ('nodelist -> nodelist function','nodelist',2,'p_nodeset','syntax.py',113),
+  ('nodelist -> empty','nodelist',1,'p_nodeset','syntax.py',114),
+  ('node -> IDENTIFIER_LOCAL LCURLY expressionlist RCURLY','node',4,'p_node','syntax.py',125),
+  ('function -> IDENTIFIER_LOCAL LPAREN parameterset RPAREN LCURLY expressionlist RCURLY','function',7,'p_function','syntax.py',131),
+  ('parameterset -> parameters','parameterset',1,'p_parameterset','syntax.py',139),
+  ('parameterset -> parameters COMMA','parameterset',2,'p_parameterset','syntax.py',140),
+  ('parameterset -> empty','parameterset',1,'p_parameterset','syntax.py',141),
+  ('parameters -> parameters COMMA IDENTIFIER_LOCAL','parameters',3,'p_parameters','syntax.py',149),
+  ('parameters -> IDENTIFIER_LOCAL','parameters',1,'p_parameters','syntax.py',150),
+  ('argumentset -> arguments','argumentset',1,'p_argumentset','syntax.py',160),
+  ('argumentset -> arguments COMMA','argumentset',2,'p_argumentset','syntax.py',161),
+  ('argumentset -> empty','argumentset',1,'p_argumentset','syntax.py',162),
+  ('arguments -> arguments COMMA IDENTIFIER_LOCAL ASSIGN expression','arguments',5,'p_arguments','syntax.py',170),
+  ('arguments -> IDENTIFIER_LOCAL ASSIGN expression','arguments',3,'p_arguments','syntax.py',171),
+  ('expressionlist -> expressionlist conditional','expressionlist',2,'p_expressionlist','syntax.py',181),
+  ('expressionlist -> expressionlist while','expressionlist',2,'p_expressionlist','syntax.py',182),
+  ('expressionlist -> expressionlist for','expressionlist',2,'p_expressionlist','syntax.py',183),
+  ('expressionlist -> expressionlist assignment SEMICOLON','expressionlist',3,'p_expressionlist','syntax.py',184),
+  ('expressionlist -> expressionlist statement SEMICOLON','expressionlist',3,'p_expressionlist','syntax.py',185),
+  ('expressionlist -> expressionlist expression SEMICOLON','expressionlist',3,'p_expressionlist','syntax.py',186),
+  ('expressionlist -> empty','expressionlist',1,'p_expressionlist','syntax.py',187),
+  ('conditional -> IF LPAREN expression RPAREN LCURLY expressionlist RCURLY conditionalalternate conditionalterminal','conditional',9,'p_conditional','syntax.py',197),
+  ('conditionalalternate -> conditionalalternate ELIF LPAREN expression RPAREN LCURLY expressionlist RCURLY','conditionalalternate',8,'p_conditionalalternate','syntax.py',205),
+  ('conditionalalternate -> empty','conditionalalternate',1,'p_conditionalalternate','syntax.py',206),
+  ('conditionalterminal -> ELSE LCURLY expressionlist RCURLY','conditionalterminal',4,'p_conditionalterminal','syntax.py',216),
+  ('conditionalterminal -> empty','conditionalterminal',1,'p_conditionalterminal','syntax.py',217),
+  ('while -> WHILE LPAREN expression RPAREN LCURLY expressionlist RCURLY','while',7,'p_while','syntax.py',226),
+  ('for -> FOR LPAREN identifier_local IN expression RPAREN LCURLY expressionlist RCURLY','for',9,'p_for','syntax.py',232),
+  ('for -> FOR LPAREN sequence IN expression RPAREN LCURLY expressionlist RCURLY','for',9,'p_for','syntax.py',233),
+  ('assignment -> identifier_local ASSIGN expression','assignment',3,'p_assignment','syntax.py',239),
+  ('assignment -> identifier_local ASSIGN_ADD expression','assignment',3,'p_assignment_augmented','syntax.py',244),
+  ('assignment -> identifier_local ASSIGN_SUBTRACT expression','assignment',3,'p_assignment_augmented','syntax.py',245),
+  ('assignment -> identifier_local ASSIGN_EXPONENTIATE expression','assignment',3,'p_assignment_augmented','syntax.py',246),
+  ('assignment -> identifier_local ASSIGN_MULTIPLY expression','assignment',3,'p_assignment_augmented','syntax.py',247),
+  ('assignment -> identifier_local ASSIGN_DIVIDE expression','assignment',3,'p_assignment_augmented','syntax.py',248),
+  ('assignment -> identifier_local ASSIGN_DIVIDE_INTEGER expression','assignment',3,'p_assignment_augmented','syntax.py',249),
+  ('assignment -> identifier_local ASSIGN_MOD expression','assignment',3,'p_assignment_augmented','syntax.py',250),
+  ('assignment -> sequence ASSIGN expression','assignment',3,'p_assignment_sequence','syntax.py',268),
+  ('statement -> STMT_GOTO IDENTIFIER_LOCAL','statement',2,'p_statement_goto','syntax.py',274),
+  ('statement -> STMT_RETURN expression','statement',2,'p_statement_return','syntax.py',279),
+  ('statement -> STMT_RETURN','statement',1,'p_statement_return','syntax.py',280),
+  ('statement -> STMT_EXIT expression','statement',2,'p_statement_exit','syntax.py',288),
+  ('statement -> STMT_EXIT','statement',1,'p_statement_exit','syntax.py',289),
+  ('statement -> STMT_BREAK','statement',1,'p_statement_break','syntax.py',297),
+  ('statement -> STMT_CONTINUE','statement',1,'p_statement_continue','syntax.py',302),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression','syntax.py',308),
+  ('expression -> sequence','expression',1,'p_expression','syntax.py',309),
+  ('expression -> functioncall','expression',1,'p_expression','syntax.py',310),
+  ('expression -> term','expression',1,'p_expression','syntax.py',311),
+  ('expression -> expression suffix_expression','expression',2,'p_expression','syntax.py',312),
+  ('expression -> expression EXPONENTIATE expression','expression',3,'p_expression_math','syntax.py',322),
+  ('expression -> expression MULTIPLY expression','expression',3,'p_expression_math','syntax.py',323),
+  ('expression -> expression DIVIDE_INTEGER expression','expression',3,'p_expression_math','syntax.py',324),
+  ('expression -> expression DIVIDE expression','expression',3,'p_expression_math','syntax.py',325),
+  ('expression -> expression SUBTRACT expression','expression',3,'p_expression_math','syntax.py',326),
+  ('expression -> expression ADD expression','expression',3,'p_expression_math','syntax.py',327),
+  ('expression -> expression MOD expression','expression',3,'p_expression_math','syntax.py',328),
+  ('expression -> expression EQUALITY expression','expression',3,'p_expression_test','syntax.py',346),
+  ('expression -> expression INEQUALITY expression','expression',3,'p_expression_test','syntax.py',347),
+  ('expression -> expression GREATER_EQUAL expression','expression',3,'p_expression_test','syntax.py',348),
+  ('expression -> expression GREATER expression','expression',3,'p_expression_test','syntax.py',349),
+  ('expression -> expression LESSER_EQUAL expression','expression',3,'p_expression_test','syntax.py',350),
+  ('expression -> expression LESSER expression','expression',3,'p_expression_test','syntax.py',351),
+  ('expression -> expression BOOL_OR expression','expression',3,'p_expression_test','syntax.py',352),
+  ('expression -> expression BOOL_AND expression','expression',3,'p_expression_test','syntax.py',353),
+  ('expression -> NEGATE expression','expression',2,'p_expression_test','syntax.py',354),
+  ('sequence -> LSQUARE expressionsequence RSQUARE','sequence',3,'p_sequence','syntax.py',377),
+  ('expressionsequence -> expressions','expressionsequence',1,'p_expressionsequence','syntax.py',383),
+  ('expressionsequence -> expressions COMMA','expressionsequence',2,'p_expressionsequence','syntax.py',384),
+  ('expressionsequence -> empty','expressionsequence',1,'p_expressionsequence','syntax.py',385),
+  ('expressions -> expressions COMMA expression','expressions',3,'p_expressions','syntax.py',393),
+  ('expressions -> expression','expressions',1,'p_expressions','syntax.py',394),
+  ('functioncall -> IDENTIFIER_SCOPED LPAREN argumentset RPAREN','functioncall',4,'p_functioncall_scoped','syntax.py',404),
+  ('functioncall -> IDENTIFIER_LOCAL LPAREN argumentset RPAREN','functioncall',4,'p_functioncall_local','syntax.py',409),
+  ('suffix_expression -> IDENTIFIER_SUFFIX LPAREN argumentset RPAREN','suffix_expression',4,'p_suffix_expression','syntax.py',415),
+  ('suffix_expression -> IDENTIFIER_SUFFIX','suffix_expression',1,'p_suffix_expression','syntax.py',416),
+  ('term -> STRING','term',1,'p_term','syntax.py',425),
+  ('term -> INTEGER','term',1,'p_term','syntax.py',426),
+  ('term -> FLOAT','term',1,'p_term','syntax.py',427),
+  ('term -> NONE','term',1,'p_term_special','syntax.py',437),
+  ('term -> TRUE','term',1,'p_term_special','syntax.py',438),
+  ('term -> FALSE','term',1,'p_term_special','syntax.py',439),
+  ('term -> IDENTIFIER_SCOPED','term',1,'p_term_identifier_scoped','syntax.py',449),
+  ('term -> identifier_local','term',1,'p_term_identifier_local','syntax.py',454),
+  ('identifier_local -> IDENTIFIER_LOCAL','identifier_local',1,'p_identifier_local','syntax.py',460),
+  ('identifier_local -> QUALIFIER_LOCAL IDENTIFIER_LOCAL','identifier_local',2,'p_identifier_local','syntax.py',461),
+  ('identifier_local -> QUALIFIER_GLOBAL IDENTIFIER_LOCAL','identifier_local',2,'p_identifier_local','syntax.py',462),
+]
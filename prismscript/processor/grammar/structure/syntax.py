@@ -23,10 +23,10 @@ This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unpo
 To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
 letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
 """
+import sys
+import threading
 import types
 
-import ply.yacc
-
 from .closed_lexicon import tokens
 
 #Python 2.x/3.x compatibility
@@ -62,6 +62,7 @@ TERM_IDENTIFIER_LOCAL_LOCAL = 39
 TERM_IDENTIFIER_LOCAL_GLOBAL = 1030
 SEQUENCE = 40
 SUFFIX = 41
+SEQUENCE_CONSTANT = 42 #Never produced by the parser; see the optimizer
 TEST_EQUALITY = 50
 TEST_INEQUALITY = 51
 TEST_GREATER_EQUAL = 52
@@ -132,32 +133,50 @@ def p_function(p):
     """
     p[0] = ({}, {(p[1], frozenset(p[3])): p[6]})
 
+#Collections are built with left-recursive rules that extend their first symbol in place, so that
+#they grow in linear time and never deepen the parser's stack
 def p_parameterset(p):
     r"""
-    parameterset : IDENTIFIER_LOCAL COMMA parameterset
-                 | IDENTIFIER_LOCAL
+    parameterset : parameters
+                 | parameters COMMA
                  | empty
     """
     if p[1] is None:
         p[0] = set()
     else:
+        p[0] = p[1]
+def p_parameters(p):
+    r"""
+    parameters : parameters COMMA IDENTIFIER_LOCAL
+               | IDENTIFIER_LOCAL
+    """
+    if len(p) == 2:
         p[0] = set((p[1],))
-        if len(p) == 4:
-            p[0].update(p[3])
-            
+    else:
+        p[0] = p[1]
+        p[0].add(p[3])
+        
 def p_argumentset(p):
     r"""
-    argumentset : IDENTIFIER_LOCAL ASSIGN expression COMMA argumentset
-                | IDENTIFIER_LOCAL ASSIGN expression
+    argumentset : arguments
+                | arguments COMMA
                 | empty
     """
     if p[1] is None:
         p[0] = {}
     else:
+        p[0] = p[1]
+def p_arguments(p):
+    r"""
+    arguments : arguments COMMA IDENTIFIER_LOCAL ASSIGN expression
+              | IDENTIFIER_LOCAL ASSIGN expression
+    """
+    if len(p) == 4:
         p[0] = {p[1]: p[3]}
-        if len(p) == 6:
-            p[0].update(p[5])
-            
+    else:
+        p[0] = p[1]
+        p[0][p[3]] = p[5]
+        
 def p_expressionlist(p):
     r"""
     expressionlist : expressionlist conditional
@@ -171,13 +190,16 @@ def p_expressionlist(p):
     if p[1] is None:
         p[0] = []
     else:
-        p[0] = p[1] + [p[2]]
+        p[0] = p[1]
+        p[0].append(p[2])
         
 def p_conditional(p):
     r"""
     conditional : IF LPAREN expression RPAREN LCURLY expressionlist RCURLY conditionalalternate conditionalterminal
     """
-    p[0] = [COND_IF, (p[3], p[6])] + p[8] + p[9]
+    p[0] = [COND_IF, (p[3], p[6])]
+    p[0].extend(p[8])
+    p[0].extend(p[9])
     
 def p_conditionalalternate(p):
     r"""
@@ -187,7 +209,8 @@ def p_conditionalalternate(p):
     if p[1] is None:
         p[0] = []
     else:
-        p[0] = p[1] + [(COND_ELIF, p[4], p[7])]
+        p[0] = p[1]
+        p[0].append((COND_ELIF, p[4], p[7]))
         
 def p_conditionalterminal(p):
     r"""
@@ -257,7 +280,7 @@ def p_statement_return(p):
     statement : STMT_RETURN expression
               | STMT_RETURN
     """
-    if p[1] is None:
+    if len(p) == 2:
         p[0] = (STMT_RETURN, (TERM_NONE, None))
     else:
         p[0] = (STMT_RETURN, p[2])
@@ -358,16 +381,24 @@ def p_sequence(p):
 
 def p_expressionsequence(p):
     r"""
-    expressionsequence : expression COMMA expressionsequence
-                       | expression
+    expressionsequence : expressions
+                       | expressions COMMA
                        | empty
     """
     if p[1] is None:
         p[0] = []
     else:
+        p[0] = p[1]
+def p_expressions(p):
+    r"""
+    expressions : expressions COMMA expression
+                | expression
+    """
+    if len(p) == 2:
         p[0] = [p[1]]
-        if len(p) == 4:
-            p[0] += p[3]
+    else:
+        p[0] = p[1]
+        p[0].append(p[3])
             
 def p_functioncall_scoped(p):
     r"""
@@ -447,5 +478,41 @@ def p_error(t):
     else:
         raise ValueError("Unexpectedly reached end of file")
         
-parser = ply.yacc.yacc()
+_parser = None #The prototype parser, built on first use
+_parser_lock = threading.Lock()
+
+def get_parser():
+    """
+    Provides the prototype parser, building it on first use. Its LALR tables are read from the
+    precomputed `parsetab` module, if present and produced from the current grammar, and generated in
+    memory otherwise; nothing is ever written to disk.
+    
+    The prototype is shared, so it must be copied before being used to parse anything.
+    """
+    global _parser
+    if _parser is None:
+        with _parser_lock:
+            if _parser is None:
+                _parser = _build_parser()
+    return _parser
+    
+def _build_parser():
+    import ply.yacc #Deferred, since importing PLY accounts for much of the package's import-time
+    
+    try:
+        from . import parsetab
+    except ImportError:
+        parsetab = __name__.rpartition('.')[0] + '.parsetab' #PLY falls back to generating the tables
+    return ply.yacc.yacc(module=sys.modules[__name__], tabmodule=parsetab, debug=False, write_tables=False)
+    
+def write_table(outputdir):
+    """
+    Regenerates the `parsetab` module in `outputdir`. This should be done whenever a grammar-rule
+    changes; stale tables are detected and ignored, but at the cost of rebuilding them in every
+    process.
+    """
+    import ply.yacc
+    
+    ply.yacc.yacc(module=sys.modules[__name__], tabmodule='parsetab', outputdir=outputdir, debug=False, write_tables=True)
+    
 
@@ -3,7 +3,9 @@ structure.type_abstractions
 ===========================
 Purpose
 -------
-Provides portable definitions for the "primitive" types in Prismscript.
+Provides portable definitions for the "primitive" types in Prismscript, and the lazy views that
+stand in for them when a container is returned by the host, converting its elements only as they
+are read.
 
 Meta
 ----
@@ -18,6 +20,7 @@ This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unpo
 To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
 letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
 """
+import collections
 import random
 import re
 import types
@@ -174,6 +177,9 @@ class Dictionary(dict, _Container):
     def __init__(self, items=[], **kwargs):
         dict.__init__(self, items)
         
+    def copy(self, **kwargs): #dict's own would provide a plain dict
+        return Dictionary(self)
+        
     def get(self, key, default=None, **kwargs):
         return dict.get(self, key, default)
         
@@ -274,3 +280,249 @@ class Sequence(list, _Container):
             return self[:end]
         return self.copy()
         
+class _Lazy(object):
+    """
+    A read-only view of a container returned by the host, whose elements are converted, by the
+    `marshall` callable with which it was created, only as they are read. The first write replaces
+    the view's source with a converted, mutable copy, so the host's container is never changed.
+
+    The host must not change a container while a view of it is in use, and never receives one
+    itself: whatever goes back to it is first replaced by its copy, by `marshalling.materialize()`.
+    """
+    _source = None #The host's container, until the first write replaces it with a converted copy
+    _marshall = None #Converts each element of the host's container as it is read
+    _views = None #Converted elements that are themselves views, by index or key, so that writes to them persist; None once copied
+        
+    def __init__(self, source, marshall):
+        self._source = source
+        self._marshall = marshall
+        self._views = {}
+        
+    def _convert(self, key, element):
+        """
+        Provides the converted form of `element`, found in the source at `key`.
+        """
+        views = self._views
+        if views is None: #Read from the copy, whose elements are converted already
+            return element
+        value = views.get(key)
+        if value is None:
+            value = self._marshall(element)
+            if isinstance(value, _Lazy):
+                views[key] = value
+        return value
+        
+    def _write(self):
+        """
+        Provides the mutable copy that replaces the host's container, making it if necessary.
+        """
+        if not self._views is None:
+            self._source = self._copy()
+            self._views = None
+        return self._source
+        
+    def __len__(self):
+        return len(self._source)
+        
+    def __contains__(self, item):
+        return item in self._source
+        
+    def __eq__(self, other):
+        return self._view() == other
+        
+    def __ne__(self, other):
+        return self._view() != other
+        
+    __hash__ = None #Mutable, like what it stands in for
+        
+    def __repr__(self):
+        return repr(self._view())
+        
+class LazySequence(_Lazy, _Container):
+    """
+    A `Sequence` that reads a host's sequence in place, converting only the elements that are read.
+    """
+    def _copy(self):
+        return Sequence([self._convert(i, element) for (i, element) in enumerate(self._source)])
+        
+    def _view(self):
+        return list(self)
+        
+    def __iter__(self):
+        for (i, element) in enumerate(self._source):
+            yield self._convert(i, element)
+        
+    def __reversed__(self):
+        for i in reversed(range(len(self._source))):
+            yield self._convert(i, self._source[i])
+        
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Sequence([self._convert(i, self._source[i]) for i in range(*index.indices(len(self._source)))])
+        element = self._source[index] #Bounds-checked as the host's own container would be
+        if index < 0:
+            index += len(self._source)
+        return self._convert(index, element)
+        
+    def __setitem__(self, index, item):
+        self._write()[index] = item
+        
+    def __delitem__(self, index):
+        del self._write()[index]
+        
+    def __lt__(self, other):
+        return self._view() < other
+        
+    def __le__(self, other):
+        return self._view() <= other
+        
+    def __gt__(self, other):
+        return self._view() > other
+        
+    def __ge__(self, other):
+        return self._view() >= other
+        
+    def __add__(self, other):
+        return Sequence(self._view() + list(other))
+        
+    def __radd__(self, other):
+        return Sequence(list(other) + self._view())
+        
+    def copy(self, **kwargs):
+        return Sequence(self)
+        
+    def get(self, index, **kwargs):
+        return self[index]
+        
+    def slice(self, start=None, end=None, **kwargs):
+        return self[start:end]
+        
+    def append(self, item, **kwargs):
+        self._write().append(item)
+        
+    def prepend(self, item, **kwargs):
+        self._write().prepend(item)
+        
+    def insert(self, index, item, **kwargs):
+        self._write().insert(index, item)
+        
+    def remove(self, index, **kwargs):
+        self._write().remove(index)
+        
+    def pop_head(self, **kwargs):
+        return self._write().pop_head()
+        
+    def pop_item(self, index, **kwargs):
+        return self._write().pop_item(index)
+        
+    def pop_tail(self, **kwargs):
+        return self._write().pop_tail()
+        
+    def reverse(self, **kwargs):
+        self._write().reverse()
+        
+    def shuffle(self, **kwargs):
+        self._write().shuffle()
+        
+    def sort(self, **kwargs):
+        self._write().sort()
+        
+class LazyDictionary(_Lazy, _Container):
+    """
+    A `Dictionary` that reads a host's mapping in place, converting only the items that are read.
+    """
+    def _copy(self):
+        marshall = self._marshall
+        return Dictionary([(marshall(key), self._convert(key, value)) for (key, value) in self._source.items()])
+        
+    def _view(self):
+        return dict(self.items())
+        
+    def __iter__(self):
+        if self._views is None:
+            return iter(self._source)
+        return (self._marshall(key) for key in self._source)
+        
+    def __getitem__(self, key):
+        return self._convert(key, self._source[key])
+        
+    def __setitem__(self, key, value):
+        self._write()[key] = value
+        
+    def __delitem__(self, key):
+        del self._write()[key]
+        
+    def keys(self):
+        return list(self)
+        
+    def values(self):
+        return [self._convert(key, value) for (key, value) in self._source.items()]
+        
+    def items(self):
+        if self._views is None:
+            return list(self._source.items())
+        marshall = self._marshall
+        return [(marshall(key), self._convert(key, value)) for (key, value) in self._source.items()]
+        
+    def copy(self, **kwargs):
+        return Dictionary(self.items())
+        
+    def get(self, key, default=None, **kwargs):
+        if key in self._source:
+            return self[key]
+        return default
+        
+    def put(self, key, value, **kwargs):
+        self._write()[key] = value
+        
+    def remove(self, key, **kwargs):
+        self._write().remove(key)
+        
+    def get_items(self, **kwargs):
+        return Sequence([Sequence(item) for item in self.items()])
+        
+    def get_keys(self, **kwargs):
+        return Sequence(self.keys())
+        
+    def get_values(self, **kwargs):
+        return Sequence(self.values())
+        
+class LazySet(_Lazy, _Container):
+    """
+    A `Set` that reads a host's set in place, converting only the elements that are read.
+    """
+    def _copy(self):
+        return Set(self)
+        
+    def _view(self):
+        return set(self)
+        
+    def __iter__(self):
+        if self._views is None:
+            return iter(self._source)
+        return (self._marshall(element) for element in self._source)
+        
+    def copy(self, **kwargs):
+        return Set(self)
+        
+    def add(self, item, **kwargs):
+        self._write().add(item)
+        
+    def remove(self, item, **kwargs):
+        self._write().remove(item)
+        
+    def get_items(self, **kwargs):
+        return Sequence(self)
+        
+    def difference(self, other_set, **kwargs):
+        return Set(self._view().difference(other_set))
+        
+    def intersection(self, other_set, **kwargs):
+        return Set(self._view().intersection(other_set))
+        
+    def union(self, other_set, **kwargs):
+        return Set(self._view().union(other_set))
+
+collections.Sequence.register(LazySequence)
+collections.Mapping.register(LazyDictionary)
+collections.Set.register(LazySet)
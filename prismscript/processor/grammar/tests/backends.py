@@ -0,0 +1,105 @@
+"""
+tests.backends
+==============
+Purpose
+-------
+Ensures that the recursive-descent parser agrees with the table-driven one on every script in the
+corpus, producing identical digests or failing with identical errors.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import os
+import sys
+import unittest
+
+from .. import parser
+from ..structure import closed_lexicon
+from ..structure import descent
+from . import get_source
+
+_SOURCE_DIRECTORY = 'grammar/test_sources'
+
+def _parse(source, backend):
+    try:
+        return parser.parse(source, backend=backend)
+    except ValueError as e:
+        return (type(e), str(e))
+
+class BackendTestCase(unittest.TestCase):
+    _original_cache = None
+
+    def setUp(self):
+        self._original_cache = parser.get_cache()
+        parser.set_cache(None)
+
+    def tearDown(self):
+        parser.set_cache(self._original_cache)
+
+    def _compare(self, source):
+        self.assertEqual(
+         _parse(source, parser.BACKEND_DESCENT),
+         _parse(source, parser.BACKEND_PLY)
+        )
+
+    def test_corpus(self):
+        names = sorted(filename[:-4] for filename in os.listdir(_SOURCE_DIRECTORY) if filename.endswith('.src'))
+        self.assertTrue(names)
+        for name in names:
+            self._compare(get_source(name))
+
+    def test_precedence(self):
+        for expression in (
+         '!a.b + f().c * d', 'a == b && c == d', 'a - b - c', 'a ^ b ^ c', '!!a || b',
+         '-5 - -5', 'x.y.z(a=1,).w', '[a, [b,], c,].d', '(a + b).c', 'a < b > c',
+        ):
+            self._compare('node{x = %(expression)s;}' % {
+             'expression': expression,
+            })
+
+    def test_statements(self):
+        for statement in (
+         'return;', 'return 1;', 'exit;', 'exit "x";', '[a, b] = c;', '[a, b].c();', '[a, b];',
+         'local x += 1;', 'global x ^= 2;', 'x = local y;', 'goto n;', 'f(a=1, a=2);',
+         'f(a=1, b=[1, 2,], c=g(),);', 'if(a){}elif(b){x;}elif(c){}else{y;}',
+        ):
+            self._compare('node{%(statement)s}' % {
+             'statement': statement,
+            })
+
+    def test_definitions(self):
+        for source in (
+         'f(){}', 'f(a){}', 'f(a, b, a,){return b;}', 'n{} f(a, b){} n{x = 1;}',
+        ):
+            self._compare(source)
+
+    def test_errors(self):
+        for source in (
+         'node{', 'node{x = ;}', 'node{x = 1}', 'node{x = 1;}}', 'f(a,,){}', 'node{x = $;}',
+         'node{\n\n  x = 1 1;\n}', 'node{x = local;}', 'node{for(1 in x){}}', 'node{[a] += 1;}',
+         'f(,){}', 'node{x = [,];}', 'node{f(a=1,,);}', 'node{x = [1, 2,,];}',
+        ):
+            self._compare(source)
+
+    def test_deep_nesting(self):
+        depth = sys.getrecursionlimit() * 2 #Far deeper than the descent parser can recurse
+        source = 'node{x = %(opening)s1%(closing)s;}' % { #Parentheses leave no nesting to compare
+         'opening': '(' * depth,
+         'closing': ')' * depth,
+        }
+        self.assertRaises(ValueError, descent.parse, source, closed_lexicon.get_lexer().clone())
+        self._compare(source)
+
+    def test_unknown_backend(self):
+        self.assertRaises(ValueError, parser.parse, 'node{}', backend='lalr')
+        self.assertRaises(ValueError, parser.set_backend, 'lalr')
@@ -0,0 +1,103 @@
+"""
+tests.caching
+=============
+Purpose
+-------
+Ensures that digests served by the parse-cache are faithful to those produced by the parser and
+that the cache's on-disk store rejects anything it cannot vouch for.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from .. import parser
+from ..cache import (ParseCache, compute_key)
+from . import (get_digest, get_source, compare_nodesets)
+
+class CacheTestCase(unittest.TestCase):
+    _directory = None
+    _original_cache = None
+
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+        self._original_cache = parser.get_cache()
+
+    def tearDown(self):
+        parser.set_cache(self._original_cache)
+        shutil.rmtree(self._directory)
+
+    def _get_entry_path(self, source):
+        return os.path.join(self._directory, compute_key(source) + '.pspc')
+
+    def test_memory(self):
+        cache = ParseCache()
+        parser.set_cache(cache)
+        source = get_source('theoretical_io_model')
+        (nodes, functions) = get_digest('theoretical_io_model')
+
+        parser.parse(source)
+        self.assertIsNotNone(cache.get(source))
+        (digest_nodes, digest_functions) = parser.parse(source)
+        self.assertIsNone(compare_nodesets(digest_nodes, nodes))
+        self.assertIsNone(compare_nodesets(digest_functions, functions))
+
+    def test_memory_isolation(self):
+        cache = ParseCache()
+        parser.set_cache(cache)
+        source = get_source('namespace')
+
+        (digest_nodes, digest_functions) = parser.parse(source)
+        digest_nodes.clear()
+        digest_functions.clear()
+        self.assertTrue(parser.parse(source)[0])
+
+    def test_memory_eviction(self):
+        cache = ParseCache(max_entries=2)
+        for name in ('node', 'function', 'namespace'):
+            cache.put(get_source(name), get_digest(name))
+        self.assertIsNone(cache.get(get_source('node')))
+        self.assertIsNotNone(cache.get(get_source('function')))
+        self.assertIsNotNone(cache.get(get_source('namespace')))
+
+    def test_disk(self):
+        source = get_source('theoretical_io_model')
+        (nodes, functions) = get_digest('theoretical_io_model')
+        ParseCache(directory=self._directory).put(source, parser.parse(source))
+
+        (digest_nodes, digest_functions) = ParseCache(directory=self._directory).get(source)
+        self.assertIsNone(compare_nodesets(digest_nodes, nodes))
+        self.assertIsNone(compare_nodesets(digest_functions, functions))
+
+    def test_disk_corruption(self):
+        source = get_source('node')
+        ParseCache(directory=self._directory).put(source, parser.parse(source))
+        path = self._get_entry_path(source)
+        with open(path, 'r+b') as entry:
+            entry.seek(-1, os.SEEK_END)
+            byte = entry.read(1)
+            entry.seek(-1, os.SEEK_END)
+            entry.write(byte == b'\x00' and b'\x01' or b'\x00')
+
+        self.assertIsNone(ParseCache(directory=self._directory).get(source))
+        self.assertFalse(os.path.exists(path))
+
+    def test_disk_eviction(self):
+        cache = ParseCache(directory=self._directory, max_disk_bytes=0)
+        source = get_source('node')
+        cache.put(source, parser.parse(source))
+        self.assertFalse(os.path.exists(self._get_entry_path(source)))
+
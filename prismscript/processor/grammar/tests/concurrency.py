@@ -0,0 +1,67 @@
+"""
+tests.concurrency
+=================
+Purpose
+-------
+Ensures that scripts digested simultaneously by several threads come out exactly as they would have
+if they had been digested one at a time.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import threading
+import unittest
+
+from .. import parser
+from . import (get_digest, get_source, compare_nodesets)
+
+class ThreadedTestCase(unittest.TestCase):
+    _original_cache = None
+
+    def setUp(self):
+        self._original_cache = parser.get_cache()
+        parser.set_cache(None)
+
+    def tearDown(self):
+        parser.set_cache(self._original_cache)
+
+    def test_parallel(self):
+        names = ('theoretical_io_model', 'conditional_nested', 'for_nested', 'namespace')
+        failures = []
+        def work(name):
+            source = get_source(name)
+            (nodes, functions) = get_digest(name)
+            try:
+                for i in range(10):
+                    (digest_nodes, digest_functions) = parser.parse(source)
+                    compare_nodesets(digest_nodes, nodes)
+                    compare_nodesets(digest_functions, functions)
+            except Exception as e:
+                failures.append(e)
+
+        threads = [threading.Thread(target=work, args=(name,)) for name in names * 2]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+
+    def test_line_numbers_after_error(self):
+        self.assertRaises(ValueError, parser.parse, 'node{\n\n\n\n\n\n    x = ;\n}')
+        try:
+            parser.parse('\n\nnode{\n    x = ;\n}')
+        except ValueError as e:
+            self.assertTrue('line 4' in str(e))
+        else:
+            self.fail("ValueError not received")
+
@@ -0,0 +1,102 @@
+"""
+tests.incremental
+=================
+Purpose
+-------
+Ensures that digesting a script one definition at a time produces exactly what digesting it whole
+would, and that reloading an edited script only re-parses the definitions that changed.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import os
+import unittest
+
+from .. import parser
+from ..cache import ParseCache
+from . import get_source
+
+_SOURCE_DIRECTORY = 'grammar/test_sources'
+
+_SCRIPT = """
+first{
+    x = "}"; #Braces in strings and comments: {
+}
+second(a, b){
+    if(a){
+        return b;
+    }
+}
+third{
+    exit 3;
+}
+"""
+
+def _parse(function, *args):
+    try:
+        return function(*args)
+    except ValueError as e:
+        return str(e)
+
+class IncrementalTestCase(unittest.TestCase):
+    _original_cache = None
+    _original_digest = None
+    _digested = None
+
+    def setUp(self):
+        self._original_cache = parser.get_cache()
+        parser.set_cache(None)
+        self._original_digest = parser._digest
+        self._digested = []
+        def digest(source, backend):
+            self._digested.append(source)
+            return self._original_digest(source, backend)
+        parser._digest = digest
+
+    def tearDown(self):
+        parser._digest = self._original_digest
+        parser.set_cache(self._original_cache)
+
+    def test_corpus(self):
+        cache = ParseCache()
+        for filename in sorted(os.listdir(_SOURCE_DIRECTORY)):
+            if filename.endswith('.src'):
+                source = get_source(filename[:-4])
+                self.assertEqual(
+                 _parse(parser.parse_incrementally, source, cache),
+                 _parse(parser.parse, source)
+                )
+
+    def test_reload(self):
+        cache = ParseCache()
+        parser.parse_incrementally(_SCRIPT, cache)
+        self.assertEqual(len(self._digested), 4) #Three definitions and the trailing whitespace
+
+        del self._digested[:]
+        edited = _SCRIPT.replace('exit 3;', 'exit 4;')
+        (nodes, functions) = parser.parse_incrementally(edited, cache)
+        self.assertEqual(self._digested, ['\nthird{\n    exit 4;\n}'])
+        self.assertEqual((nodes, functions), parser.parse(edited))
+
+    def test_errors(self):
+        cache = ParseCache()
+        parser.parse_incrementally(_SCRIPT, cache)
+        for edited in (
+         _SCRIPT.replace('exit 3;', 'exit 3'),
+         _SCRIPT.replace('return b;', 'return b;}'),
+         _SCRIPT + 'fourth{',
+         _SCRIPT + '}',
+        ):
+            message = _parse(parser.parse_incrementally, edited, cache)
+            self.assertTrue(message.startswith('Syntax error') or message.startswith('Unexpectedly'))
+            self.assertEqual(message, _parse(parser.parse, edited))
@@ -0,0 +1,75 @@
+"""
+tests.lexing
+============
+Purpose
+-------
+Ensures that the lexer decodes string-literals faithfully, counts lines correctly regardless of
+line-ending style, and refuses literals it could not convert in linear time.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import unittest
+
+from .. import parser
+from ..structure import closed_lexicon
+
+def _tokenise(source):
+    lexer = closed_lexicon.get_lexer().clone()
+    lexer.input(source)
+    lexer.lineno = 1
+    tokens = []
+    while True:
+        token = lexer.token()
+        if token is None:
+            return tokens
+        tokens.append((token.type, token.value, token.lineno))
+
+class LexingTestCase(unittest.TestCase):
+    def test_escapes(self):
+        for (literal, value) in (
+         (r'"plain"', 'plain'),
+         (r'"a\tb\nc\rd\ae\bf"', 'a\tb\nc\rd\ae\bf'),
+         (r'"\"quoted\""', '"quoted"'),
+         (r"'it\'s'", "it's"),
+         (r'"\\"', '\\'),
+         (r'"\\n"', '\\n'), #An escaped backslash, then a literal n
+         (r'"\\\n"', '\\\n'),
+         (r'"\q\x"', '\\q\\x'), #Unknown escapes are kept intact
+         ('"a\\\nb"', 'a\\\nb'),
+        ):
+            self.assertEqual(_tokenise(literal), [('STRING', value, 1)])
+
+    def test_adjacent_strings(self):
+        self.assertEqual(
+         [value for (token_type, value, line) in _tokenise(r'"a\\" "b" ' + r"'c\\' 'd'")],
+         ['a\\', 'b', 'c\\', 'd']
+        )
+
+    def test_unterminated_string(self):
+        self.assertRaises(ValueError, _tokenise, '"' + '\\"' * 1000)
+        self.assertRaises(ValueError, _tokenise, "'" + '\\' * 1001)
+
+    def test_line_endings(self):
+        self.assertEqual(
+         [line for (token_type, value, line) in _tokenise('a\nb\r\nc\rd\r\r\ne\n\r\nf')],
+         [1, 2, 3, 4, 6, 8]
+        )
+
+    def test_integer_limit(self):
+        digits = '9' * closed_lexicon.MAX_INTEGER_DIGITS
+        self.assertEqual(_tokenise('-' + digits), [('INTEGER', -int(digits), 1)])
+        self.assertRaises(ValueError, _tokenise, digits + '9')
+        self.assertRaises(ValueError, parser.parse, 'node{x = %(digits)s9;}' % {
+         'digits': digits,
+        })
@@ -0,0 +1,64 @@
+"""
+tests.tables
+============
+Purpose
+-------
+Ensures that the precomputed lexing and parsing tables shipped with the grammar are current and that
+importing the grammar neither constructs anything nor touches the filesystem.
+
+If either of the staleness tests fails, run ``build_tables.py`` and commit its output.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import os
+import subprocess
+import sys
+import unittest
+
+import ply.lex
+import ply.yacc
+
+from ..structure import closed_lexicon
+from ..structure import lextab
+from ..structure import parsetab
+from ..structure import syntax
+
+class TablesTestCase(unittest.TestCase):
+    def test_parsetab_current(self):
+        pinfo = ply.yacc.ParserReflect(dict((k, getattr(syntax, k)) for k in dir(syntax)))
+        pinfo.get_all()
+        self.assertEqual(pinfo.signature(), parsetab._lr_signature)
+
+    def test_lextab_current(self):
+        lexer = ply.lex.lex(module=closed_lexicon)
+        self.assertEqual(lexer.lextokens, lextab._lextokens)
+        self.assertEqual(
+         [pattern for (pattern, function_names) in lextab._lexstatere['INITIAL']],
+         lexer.lexstateretext['INITIAL']
+        )
+
+    def test_deferred_construction(self):
+        structure_directory = os.path.dirname(os.path.abspath(syntax.__file__))
+        contents = set(os.listdir(structure_directory))
+        output = subprocess.Popen([sys.executable, '-c', '; '.join((
+         'import sys',
+         'sys.dont_write_bytecode = True',
+         'from grammar import parser',
+         'from grammar.structure import closed_lexicon, syntax',
+         'sys.stdout.write(str((closed_lexicon._lexer, syntax._parser)))',
+         'parser.parse("node{x = 1;}")',
+        ))], stdout=subprocess.PIPE, stderr=subprocess.STDOUT).communicate()[0]
+        self.assertEqual(output.decode('utf-8'), '(None, None)')
+        self.assertEqual(set(os.listdir(structure_directory)) - contents, set())
+
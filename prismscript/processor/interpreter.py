@@ -11,48 +11,47 @@ event of an exception.
 
 Notes
 -----
-At various points in this module, the following anti-pattern will appear::
-    try:
-        prompt = <some-generator>.send(None) #Coroutine boilerplate
-        while True:
-            x = yield prompt
-            prompt = <some-generator>.send(x)
-    except StopIteration:
-        pass #or bail
-        
-This is needed to support the coroutine-oriented design of the language this reference interpreter
-is meant to provide. The reason for this is that externally registered functions may need to block
-for asynchronous events and it's necessary to retain the state of the interpreter's environment
-until the event has completed. Building a recursive message-passing chain using generators as
-coroutine-handlers seemed like the most externally clean and structurally sound method, but it
-added a lot of seemingly duplicated code (that chunk) that, as far as I can fathom, cannot be
-simplified, since the generator's evaluation has to take place within the scope of the executing
-function. It seems like an acceptable tradeoff, though, since the language will be primarily
-extended through library-injection, not syntax/semantics augmentation (automatic Python
-type-marshalling makes it easy to define new data-structures and access-methods as language
-extensions), so only one or two dedicated maintance programmers will ever be touching this file at a
-time.
+The language is coroutine-oriented: externally registered functions may need to block for
+asynchronous events, so the state of the interpreter's environment has to be retained until the
+event has completed. The evaluator is therefore built from generators, but they never pass prompts
+to each other directly. Each one delegates to a child-evaluator by yielding it::
+    value = yield self._evaluate_expression(expression, _locals)
+    
+and provides its own result by yielding a `_Result` as the last thing it does::
+    yield _Result(value)
+    
+Expressions that need no evaluation, like constants and identifiers, are resolved on the spot and
+yielded as a `_Term`, which costs far less than a generator. So are expressions that can never reach
+a function, and therefore never prompt, as identified by `optimizer.never_yields()`; these are
+evaluated by `Interpreter._evaluate_term()`, a plain recursive evaluator, which assignments and
+conditions call directly, without yielding at all.
 
-If you wish to repurpose this interpreter for a simpler, purely synchronous library, most instances
-of the anti-pattern can be easily replaced with ``x = <some-generator>``. If you do it right, all
-unit tests should pass if you make the indicated changes to ``test_sources/__init__.py`` and disable
-the ``coroutine`` testcases in the driver.
+Nothing is found through chains of comparisons: each kind of statement, expression, and term has a
+handler in one of the dispatch-tables at the top of this module, which are resolved to the methods
+that implement them once, when the module is loaded, and shared by every interpreter. A statement's
+handler completes it on the spot if nothing in it can yield, and provides the evaluator that
+completes it, to be yielded, otherwise.
 
+A single driver, `Interpreter._drive()`, keeps the stack of suspended evaluators, sends each child's
+result back to its parent, and throws each child's exceptions into its parent, so that they can be
+handled at the point of delegation exactly as if they had been raised there. Coroutines returned by
+external functions are yielded inside a `_Host`; only their prompts ever leave the driver, which
+means that passing a prompt through costs the same at any depth of nesting. Calls to the script's
+own functions are yielded as a `_ScriptCall` and run on the same stack, so recursion in a script
+never recurses in Python; its depth is bounded by `Interpreter.set_depth_limit()`, rather than by
+Python's stack. This is ``yield from`` by hand, since the language still supports Python 2.7, which
+lacks it.
 
-Another anti-pattern, in the form of flow-control through exceptions, manifests itself for handling
-messages that need to transcend scope. Fortunately, they do not pervade outside of this module, and
-they are used quite consistently within. They are necessary because it is impossible to both yield
-to a co-routine and return an explicit value, so it came down to either having a loose standard of
-treating the last-yielded value of a function as its return-value (very, very error-prone and
-hard-to-follow) or wrapping them in exception-types and unwrapping them at the appropriate level of
-control. Once observed, the process of tracing them should be simple (hint: they're attached to
-every coroutine entry-point, which means if you search for 'yield', you'll find them all and know
-how to add them when expanding). The overhead associated with exception-handling in Python is
-marginal compared to many other languages (C++, I'm looking at your stack-unwinds), so there's no
-real penalty to handling things this way, other than being a bit of a slap in Martin Fowler's face,
-but I don't really like his preachy tone anyway. (Even though he's right about most things when
-thinking in a Gosling-like mindset, but this is more Kay's domain, so the rules are a fair bit
-different)
+If you wish to repurpose this interpreter for a simpler, purely synchronous library, the evaluators
+can become plain functions by replacing each ``yield <evaluator>`` with a call and each
+``yield _Result(value)`` with ``return value``.
+
+
+Flow-control through exceptions remains for messages that need to transcend scope: ``break``,
+``continue``, ``return``, and ``exit`` all unwind any number of nested statement-lists, so they are
+raised and caught at the appropriate level of control. Resolved values are never exceptions,
+though; only the public entry-points convert a function's result into a `StatementReturn`, for the
+benefit of callers.
 
 
 Standard usage
@@ -90,6 +89,18 @@ If calling a function directly::
         #This, however, will always occur, unless ``StatementExit`` is encountered.
         return_value = e.value
         
+If the same script is run many times, as when every incoming event gets an interpreter of its own,
+parse it once, as a `Program`, along with its scoped functions, and create an interpreter for each
+run from that::
+    program = Program(script, functions=discover_functions.scan(stdlib, ''))
+    ...
+    interpreter = program.create_session()
+    
+A program never changes, so every interpreter created from it, in any thread, shares its nodes,
+functions, and scoped functions, along with whatever the engine has compiled, and costs almost
+nothing to create; each has only its own globals, log, locks, and limits. Extending the namespace
+of one, or registering scoped functions with it, affects only that interpreter.
+
 External functions
 ------------------
 For the most part, designing an external function for registration is a simple process: just write
@@ -151,8 +162,10 @@ To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/
 letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
 """
 import collections
-import math
 import re
+import sys
+import threading
+import time
 import types
 
 #Python 2.x/3.x compatibility
@@ -164,44 +177,347 @@ try: #StringTypes were unified in py3k
     types.StringTypes
 except AttributeError:
     types.StringTypes = (str,)
+try: #'monotonic' was added in py3.3
+    _monotonic = time.monotonic
+except AttributeError: #The wall-clock is the best available substitute
+    _monotonic = time.time
 
 from .errors import (
  Error,
  ExecutionError,
+ PromptError,
+ ExecutionLimitError, FuelExhaustedError, DeadlineExceededError, DepthExceededError,
  NamespaceLookupError,
  NodeNotFoundError,   
  FunctionNotFoundError, ScopedFunctionNotFoundError,
  VariableNotFoundError, ScopedVariableNotFoundError,
  FlowControl, StatementBreak, StatementContinue,
- StatementReturn, StatementExit,
+ StatementReturn, StatementExit, StatementGoto,
  StatementsEnd,
  get_origin_details,
 )
 from .thread_types import (
  ThreadFactory, LockFactory,
 )
+from . import bytecode
+from . import closures
+from . import log
+from . import marshalling
+from . import operations
+from . import optimizer
+from . import sites
+from . import transpiler
 from .grammar import parser
+from .grammar.cache import ParseCache
 from .grammar.parser import (
  convert_bool, convert_float, convert_int, convert_string,
  Dictionary, Set, Sequence, String,
 )
 
+ENGINE_TREE = 'tree' #: The reference engine, which walks the digested tree directly.
+ENGINE_CLOSURE = 'closure' #: Compiles each node and function into closures, once, on first use.
+ENGINE_PYTHON = 'python' #: Translates each node and function into Python source, once, on first use.
+ENGINE_BYTECODE = 'bytecode' #: Compiles each node and function into bytecode, run on a frame stack.
+_ENGINES = {
+ ENGINE_TREE: None,
+ ENGINE_CLOSURE: closures.ClosureEngine,
+ ENGINE_PYTHON: transpiler.PythonEngine,
+ ENGINE_BYTECODE: bytecode.BytecodeEngine,
+}
+
+_MATHS = (
+ parser.MATH_EXPONENTIATE, parser.MATH_MULTIPLY, parser.MATH_DIVIDE,
+ parser.MATH_DIVIDE_INTEGER, parser.MATH_ADD, parser.MATH_SUBTRACT, parser.MATH_MOD,
+)
+_TESTS = (
+ parser.TEST_EQUALITY, parser.TEST_INEQUALITY,
+ parser.TEST_GREATER_EQUAL, parser.TEST_GREATER, parser.TEST_LESSER_EQUAL, parser.TEST_LESSER,
+)
+_AUGMENTATIONS = (
+ parser.ASSIGN_ADD, parser.ASSIGN_SUBTRACT, parser.ASSIGN_EXPONENTIATE,
+ parser.ASSIGN_MULTIPLY, parser.ASSIGN_DIVIDE, parser.ASSIGN_DIVIDE_INTEGER, parser.ASSIGN_MOD,
+)
+_LOCAL_IDENTIFIERS = (
+ parser.TERM_IDENTIFIER_LOCAL, parser.TERM_IDENTIFIER_LOCAL_LOCAL, parser.TERM_IDENTIFIER_LOCAL_GLOBAL,
+)
+_TRUE = (parser.TERM_BOOL, True) #Shared, so that `_never_yields()` remembers it once, rather than once per pass
+_FALSE = (parser.TERM_BOOL, False)
+_PRIMITIVES = frozenset((type(None), bool, int, long, float) + tuple(types.StringTypes)) #Never the root of a scoped identifier
+_SCOPED_NAME = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)+$') #A valid name for a scoped function
+_BOUND = object() #Stands in a `Program`'s registry for a scoped function that each `Interpreter` binds to itself
+_SCOPED_FUNCTIONS = { #The scoped functions with which every `Program` begins
+ 'types.bool': convert_bool,
+ 'types.float': convert_float,
+ 'types.int': convert_int,
+ 'types.string': convert_string,
+ 'types.Dictionary': Dictionary,
+ 'types.Set': Set,
+ 'types.Sequence': Sequence,
+ 'types.Thread': _BOUND,
+ 'types.Lock': _BOUND,
+}
+
+#The reference engine's dispatch-tables, naming the method that handles each kind of statement or
+#expression; they are resolved once, when the module is imported
+_STATEMENT_HANDLERS = dict([(kind, '_execute_augmentation') for kind in _AUGMENTATIONS] + [
+ (parser.ASSIGN, '_execute_assignment'),
+ (parser.ASSIGN_SEQUENCE, '_execute_unpacking'),
+ (parser.STMT_RETURN, '_execute_return'),
+ (parser.STMT_EXIT, '_execute_exit'),
+ (parser.STMT_GOTO, '_execute_goto'),
+ (parser.STMT_BREAK, '_execute_break'),
+ (parser.STMT_CONTINUE, '_execute_continue'),
+ (parser.COND_IF, '_execute_conditional'),
+ (parser.COND_WHILE, '_execute_while'),
+ (parser.COND_FOR, '_execute_for'),
+]) #Anything else is an expression, handled by `_execute_expression`
+_EXPRESSION_EVALUATORS = dict(
+ [(kind, '_compute') for kind in _MATHS] + [(kind, '_compare') for kind in _TESTS] + [
+ (parser.TEST_BOOL_OR, '_evaluate_or'),
+ (parser.TEST_BOOL_AND, '_evaluate_and'),
+ (parser.TEST_NEGATE, '_evaluate_negation'),
+ (parser.FUNCTIONCALL_LOCAL, '_invoke_function'),
+ (parser.FUNCTIONCALL_SCOPED, '_invoke_function'),
+ (parser.SUFFIX, '_evaluate_suffix'),
+ (parser.SEQUENCE, '_evaluate_sequence'),
+]) #Only expressions that may yield are evaluated this way; all others are terms
+_TERM_EVALUATORS = dict(
+ [(kind, '_term_constant') for kind in (parser.TERM_BOOL, parser.TERM_STRING, parser.TERM_INTEGER, parser.TERM_FLOAT)] +
+ [(kind, '_term_local_identifier') for kind in _LOCAL_IDENTIFIERS] +
+ [(kind, '_term_computation') for kind in _MATHS] + [(kind, '_term_comparison') for kind in _TESTS] + [
+ (parser.TERM_NONE, '_term_none'),
+ (parser.SEQUENCE_CONSTANT, '_term_sequence_constant'),
+ (parser.TERM_IDENTIFIER_SCOPED, '_term_scoped_identifier'),
+ (parser.TEST_BOOL_OR, '_term_or'),
+ (parser.TEST_BOOL_AND, '_term_and'),
+ (parser.TEST_NEGATE, '_term_negation'),
+ (parser.SUFFIX, '_term_suffix'),
+ (parser.SEQUENCE, '_term_sequence'),
+])
+
+def _resolve(table):
+    """
+    Resolves every method named in a dispatch-`table` to the function that implements it, to be
+    called with an `Interpreter` as its first argument.
+    """
+    return dict((kind, Interpreter.__dict__[name]) for (kind, name) in table.items())
+
+def _check_functions(functions):
+    """
+    Raises a ``ValueError`` if `functions`, a sequence of (name, function) pairs, is ill-formed, as
+    described in `Interpreter.register_scoped_functions()`.
+    """
+    for (name, function) in functions:
+        if not type(name) in types.StringTypes:
+            raise ValueError("%(name)r is not a string" % {
+             'name': name,
+            })
+        if not _SCOPED_NAME.match(name):
+            raise ValueError("'%(name)s' is not a valid scoped identifier" % {
+             'name': name,
+            })
+        if not isinstance(function, collections.Callable):
+            raise ValueError("%(function)r is not a function" % {
+             'function': function,
+            })
+
+def _digest(script, optimize, definitions=None):
+    """
+    Parses `script` into its (nodes, functions), passed through the optimizer if `optimize` is set,
+    one top-level definition at a time if `definitions`, a `ParseCache`, is given.
+    """
+    transform = None
+    if optimize:
+        transform = optimizer.optimize
+        
+    if not definitions is None:
+        return parser.parse_incrementally(script, definitions, transform=transform)
+    (nodes, functions) = parser.parse(script)
+    if transform:
+        return transform((nodes, functions))
+    return (nodes, functions)
+    
+def _link_statements(signature, statements):
+    """
+    Readies a function for the reference engine, which runs its `statements` as they are.
+    """
+    return statements
+
+def _split_branch(index, branch):
+    """
+    Provides the (condition, statement-list) of the `index`th branch of a conditional-block, after
+    its ``COND_IF`` head; the condition of an ``else`` branch is None.
+    """
+    if index == 0:
+        return (branch[0], branch[1])
+    elif branch[0] == parser.COND_ELIF:
+        return (branch[1], branch[2])
+    return (None, branch[1])
+
+class _Result:
+    """
+    Carries an evaluator's result to the driver; it is always the last thing the evaluator yields.
+    """
+    value = None #The resolved value
+    
+    def __init__(self, value):
+        self.value = value
+        
+class _Term:
+    """
+    Carries a term that was resolved without evaluation; the driver sends it straight back to the
+    evaluator that yielded it.
+    """
+    value = None #The resolved value
+    
+    def __init__(self, value):
+        self.value = value
+        
+class _Host:
+    """
+    Carries a coroutine returned by an external function to the driver, which passes its prompts
+    through to the caller.
+    """
+    generator = None #The external coroutine
+    
+    def __init__(self, generator):
+        self.generator = generator
+        
+class _ScriptCall:
+    """
+    Stands in for the result of a script-function that the reference engine evaluates itself,
+    rather than through `Interpreter.execute_function()`; the driver runs it on its own stack,
+    counting it against the limit set by `Interpreter.set_depth_limit()`.
+    """
+    site = None #The `sites.CallSite` of the function to be evaluated
+    arguments = None #The arguments with which it is to be evaluated
+    
+    def __init__(self, site, arguments):
+        self.site = site
+        self.arguments = arguments
+        
+class _Transfer:
+    """
+    Carries the name of the node to which a ``goto`` transfers control to the driver, which
+    abandons everything it was evaluating in favour of the node.
+    """
+    node = None #The name of the target node
+    
+    def __init__(self, node):
+        self.node = node
+        
+class _Meter:
+    """
+    Tracks the fuel and time that remain to a run of `Interpreter.execute_node()` or
+    `Interpreter.execute_function()`, which everything it calls shares.
+    """
+    fuel = None #The units of fuel remaining, or None if unlimited
+    time = None #The seconds of execution remaining, or None if unlimited
+    deadline = None #The monotonic time at which the remaining time runs out, while running
+    
+    def __init__(self, fuel, time):
+        self.fuel = fuel
+        self.time = time
+        
+class _ThreadState(threading.local):
+    """
+    Holds the state of whatever is executing in each thread.
+    """
+    meter = None #The `_Meter` of the run being metered, if any
+    
+class Program:
+    """
+    A parsed script and the scoped functions registered for it, which never change once it has been
+    created, so that any number of `Interpreter`s, in any number of threads, may run it at once.
+    
+    What its interpreters compile or work out is cached in it, to be reused by all of them; an entry
+    is only ever added or replaced whole, never changed in place.
+    """
+    _nodes = None #A dictionary of nodes
+    _functions = None #A dictionary of local functions
+    _namespace_generation = 0 #The generation of `_nodes` and `_functions`, from `sites.next_generation()`
+    _scoped_functions = None #A dictionary of non-local functions, with `_BOUND` for those each interpreter binds
+    _scoped_generation = 0 #The generation of `_scoped_functions`, from `sites.next_generation()`
+    _synchronous = None #Whether each expression never yields, by identity, as (expression, never-yields)
+    _sites = None #The reference engine's `sites.Site` for each scoped identifier or suffix, by identity, as (expression, site)
+    _compiled = None #The engine's caches of compiled nodes and functions, as a (nodes, functions) pair
+    
+    _optimize = True #Whether the script was passed through the optimizer
+    
+    _engine = ENGINE_TREE #The engine with which interpreters execute nodes and functions
+    
+    def __init__(self, script, functions=(), optimize=True, engine=ENGINE_TREE):
+        """
+        Parses the given script, with `optimize` and `engine` as described in
+        `Interpreter.__init__()`, and registers the scoped `functions`, as described in
+        `Interpreter.register_scoped_functions()`.
+        
+        If the script is invalid, an exception is raised.
+        
+        A ``ValueError`` is raised if the engine is not recognised or the function-list is
+        ill-formed.
+        """
+        if not engine in _ENGINES:
+            raise ValueError("Unknown engine: %(engine)r" % {
+             'engine': engine,
+            })
+        _check_functions(functions)
+        
+        self._engine = engine
+        self._optimize = optimize
+        (self._nodes, self._functions) = _digest(script, optimize)
+        self._namespace_generation = sites.next_generation()
+        self._synchronous = {}
+        self._sites = {}
+        self._compiled = ({}, {})
+        
+        self._scoped_functions = dict(_SCOPED_FUNCTIONS)
+        self._scoped_functions.update(dict(functions))
+        self._scoped_generation = sites.next_generation()
+        
+    def create_session(self, threading=True):
+        """
+        Provides a new `Interpreter` that runs the program, with globals, a log, locks, and limits of
+        its own; `threading` is as described in `Interpreter.__init__()`.
+        """
+        return Interpreter(self, threading=threading)
+        
 class Interpreter:
     """
     A shell for interacting with a script in a programmatic manner.
     """
     _functions = None #A dictionary of local functions
+    _namespace_generation = 0 #The generation of `_nodes` and `_functions`, from `sites.next_generation()`
     _scoped_functions = None #A dictionary of non-local functions
+    _scoped_generation = 0 #The generation of `_scoped_functions`, from `sites.next_generation()`
     _nodes = None #A dictionary of nodes
     _globals = None #A dictionary of global variables
+    _definitions = None #A cache of individually digested definitions, for incremental extension
+    _definitions_limit = 4096 #The number of digested definitions to retain for incremental extension
+    _synchronous = None #Whether each expression never yields, by identity, as (expression, never-yields)
+    _sites = None #The reference engine's `sites.Site` for each scoped identifier or suffix, by identity, as (expression, site)
+    _statement_handlers = None #The reference engine's statement-handlers, by statement-type, shared by every interpreter
+    _expression_evaluators = None #The reference engine's evaluators, by expression-type, shared by every interpreter
+    _term_evaluators = None #The reference engine's evaluators for expressions that never yield, by expression-type, shared by every interpreter
+    _compiled = None #The engine's caches of compiled nodes and functions, as a (nodes, functions) pair
     
-    _log = None #A high-level execution log to aid debugging
+    _log = None #A high-level execution log to aid debugging, as a `log.Log`
     
     _loop_limit = 100000 #Limit loop-iterations to 100,000 by default, to hard-break infinite loops
+    _depth_limit = 10000 #Limit calls to 10,000 levels of nesting by default, to stop runaway recursion
+    _fuel_limit = 0 #The units of fuel allowed to each run; 0 for no limit
+    _time_limit = 0 #The seconds of execution allowed to each run; 0 for no limit
+    _metered = False #Whether either limit is set, so that runs must be metered
+    _local = None #The `_ThreadState` of each thread
 
     _lock_factory = None #A lock-factory for concurrency-control primitives
+    _bound_functions = None #The scoped functions bound to this interpreter, like ``types.Lock``, by name
+    
+    _optimize = True #Whether scripts are passed through the optimizer before being stored
     
-    def __init__(self, script, threading=True):
+    _engine = None #The engine that executes nodes and functions; None for the reference engine
+    
+    def __init__(self, script, threading=True, optimize=True, engine=ENGINE_TREE):
         """
         Parses the given script and initialises the operating environment.
         
@@ -209,31 +525,52 @@ class Interpreter:
         
         If `threading` is ``False``, threads and locks will not be enabled and
         will cause exceptions.
+        
+        If `optimize` is ``False``, scripts will be executed exactly as written, rather than with
+        constant expressions folded and unreachable code removed; this makes the statement-positions
+        reported in `ExecutionError`s match the source.
+        
+        `engine` selects how nodes and functions are executed: ``ENGINE_TREE``, the reference
+        engine; ``ENGINE_CLOSURE``, which compiles them into closures and runs noticeably faster;
+        ``ENGINE_PYTHON``, which translates them into Python source, for CPython to compile, and
+        runs faster still; or ``ENGINE_BYTECODE``, which compiles them into bytecode, run on an
+        explicit stack of frames, so that script function-calls never nest generators. Behaviour is
+        identical. A ``ValueError`` is raised if it is not recognised.
+        
+        `script` may instead be a `Program`, as `Program.create_session()` provides, whose parsed
+        nodes and functions, scoped functions, and compiled form are shared, rather than rebuilt,
+        so that the interpreter costs almost nothing to create; `optimize` and `engine` are then
+        those of the program.
         """
-        self._nodes = {}
-        self._functions = {}
-        self.extend_namespace(script)
-
+        if not isinstance(script, Program):
+            script = Program(script, optimize=optimize, engine=engine)
+        self._optimize = script._optimize
+        self._nodes = script._nodes
+        self._functions = script._functions
+        self._namespace_generation = script._namespace_generation
+        self._synchronous = script._synchronous
+        self._sites = script._sites
+        self._compiled = script._compiled
+        self._scoped_functions = script._scoped_functions
+        self._scoped_generation = script._scoped_generation
+        
+        engine = _ENGINES[script._engine]
+        if engine:
+            self._engine = engine(self, self._compiled)
+            
         self._lock_factory = LockFactory(self)
-        self._scoped_functions = {
-         'types.bool': convert_bool,
-         'types.float': convert_float,
-         'types.int': convert_int,
-         'types.string': convert_string,
-         'types.Dictionary': Dictionary,
-         'types.Set': Set,
-         'types.Sequence': Sequence,
-        }
+        self._bound_functions = {}
         if threading:
-            self._scoped_functions.update({
+            self._bound_functions = {
              'types.Thread': ThreadFactory(self),
              'types.Lock': self._lock_factory,
-            })
+            }
             
         self._globals = {}
         
-        self._log = []
-
+        self._log = log.Log()
+        self._local = _ThreadState()
+        
     @property
     def globals(self):
         """
@@ -259,38 +596,18 @@ class Interpreter:
         
         If execution terminates with an ``exit`` statement, `StatementExit` is raised and the
         exit-value may be obtained from its `value` attribute.
-        """
-        container_name = "%(name)s(%(args)s)" % {
-         'name': function_name,
-         'args': ', '.join(sorted(arguments.keys())),
-        }
-        self._log.append("Executing function '%(name)s'..." % {
-         'name': container_name,
-        })
         
-        function = self._functions.get((function_name, frozenset(arguments.keys())))
-        if function is None:
-            raise FunctionNotFoundError(container_name, "Function not defined")
-            
-        try:
-            prompt = None
-            generator = self._process_statements(function, seed_locals=self._marshall_type(arguments), function=True)
-            prompt = generator.send(None) #Coroutine boilerplate
-            while True:
-                x = yield prompt
-                prompt = generator.send(x)
-        except StatementsEnd:
-            raise StatementReturn(None)
-        except FlowControl:
-            raise
-        except ExecutionError as e:
-            raise ExecutionError(container_name, e.location_path, e.message, e.base_exception)
-        except Exception as e:
-            raise ExecutionError(container_name, [], "An unexpected error occurred: %(error)s : %(origin)s" % {
-             'error': str(e),
-             'origin': get_origin_details(),
-            }, e)
-        raise StatementReturn(None)
+        If execution exceeds the limits set by `set_depth_limit()`, `set_fuel_limit()`, or
+        `set_time_limit()`, it is stopped with an `ExecutionError` whose ``base_exception`` is an
+        `ExecutionLimitError`.
+        """
+        if self._engine is None:
+            generator = self._execute_function(function_name, arguments)
+        else:
+            generator = self._transfer(self._engine.execute_function(function_name, arguments))
+        if self._metered:
+            return self._meter(generator)
+        return generator
         
     def execute_node(self, node_name):
         """
@@ -302,52 +619,62 @@ class Interpreter:
         
         If execution terminates with an ``exit`` statement, `StatementExit` is raised and the
         exit-value may be obtained from its `value` attribute.
+        
+        If execution exceeds the limits set by `set_depth_limit()`, `set_fuel_limit()`, or
+        `set_time_limit()`, it is stopped with an `ExecutionError` whose ``base_exception`` is an
+        `ExecutionLimitError`.
         """
-        self._log.append("Executing node '%(name)s'..." % {
-         'name': node_name,
-        })
+        if self._engine is None:
+            generator = self._execute_node(node_name)
+        else:
+            generator = self._transfer(self._engine.execute_node(node_name))
+        if self._metered:
+            return self._meter(generator)
+        return generator
         
-        node = self._nodes.get(node_name)
-        if node is None:
-            raise NodeNotFoundError(node_name, "Node not defined")
-            
-        try:
-            generator = self._process_statements(node)
-            prompt = generator.send(None) #Coroutine boilerplate
-            while True:
-                x = yield prompt
-                prompt = generator.send(x)
-        except StatementsEnd:
-            raise StatementExit(None) #The end of any node signifies a dead end.
-        except StatementExit as e:
-            raise StatementExit(e.value)
-        except StatementReturn as e: #Not actually legal, but suppressing it would be bad.
-            self._log.append("Warning: exit-statement inferred from top-level return.")
-            raise StatementExit(e.value)
-        except ExecutionError as e:
-            raise ExecutionError(node_name, e.location_path, e.message, e.base_exception)
-        except Exception as e:
-            raise ExecutionError(node_name, [], "An unexpected error occurred: %(error)s : %(origin)s" % {
-             'error': str(e),
-             'origin': get_origin_details(),
-            }, e)
-            
-    def extend_namespace(self, script):
+    def extend_namespace(self, script, incremental=False):
         """
         Adds the script's nodes and functions to the current namespace.
         
+        If `incremental` is ``True``, the script is digested one top-level node or function at a
+        time and each digest is retained, so that extending the namespace with an edited copy of
+        the same script only re-parses the definitions that changed. This is worthwhile for large
+        scripts that are reloaded frequently.
+        
+        Only this interpreter is affected, even if it was created from a `Program`.
+        
         If the script is invalid, an exception is raised.
         """
-        (new_nodes, new_functions) = parser.parse(script)
-        self._nodes.update(new_nodes)
-        self._functions.update(new_functions)
-        
-    def get_log(self):
+        definitions = None
+        if incremental:
+            if self._definitions is None:
+                self._definitions = ParseCache(max_entries=self._definitions_limit)
+            definitions = self._definitions
+        (new_nodes, new_functions) = _digest(script, self._optimize, definitions)
+        
+        #Everything is replaced, rather than updated, so that a `Program` shared with other
+        #interpreters never changes
+        nodes = dict(self._nodes)
+        nodes.update(new_nodes)
+        functions = dict(self._functions)
+        functions.update(new_functions)
+        (self._nodes, self._functions) = (nodes, functions)
+        self._namespace_generation = sites.next_generation() #Every call-site links to its function again
+        self._synchronous = {} #Forget replaced definitions' expressions
+        self._sites = {}
+        self._compiled = (dict(self._compiled[0]), dict(self._compiled[1])) #Unchanged definitions stay compiled
+        if self._engine:
+            self._engine = self._engine.__class__(self, self._compiled)
+        
+    def get_log(self, level=log.DEBUG):
         """
         Returns the interpreter's execution log, a list of strings, which may be helpful for
         troubleshooting misbehaving scripts.
+        
+        Only the newest entries are retained, as set by `set_log_capacity()`, and only those
+        recorded at or above `level`, one of the constants in `log`, are returned.
         """
-        return self._log
+        return self._log.get_entries(level)
         
     def list_functions(self):
         """
@@ -377,23 +704,16 @@ class Interpreter:
         
         Names should be fully qualified and MUST contain at least one scope-delimiter (dot).
         
+        Every site in a script that has cached a function from the registry looks it up again
+        afterwards. Only this interpreter is affected, even if it was created from a `Program`.
+        
         A ``ValueError`` is raised if the function-list is ill-formed.
         """
-        name_re = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)+$')
-        for (name, function) in functions: #Validate the list.
-            if not type(name) in types.StringTypes:
-                raise ValueError("%(name)r is not a string" % {
-                 'name': name,
-                })
-            if not name_re.match(name):
-                raise ValueError("'%(name)s' is not a valid scoped identifier" % {
-                 'name': name,
-                })
-            if not isinstance(function, collections.Callable):
-                raise ValueError("%(function)r is not a function" % {
-                 'function': function,
-                })
-        self._scoped_functions.update(dict(functions))
+        _check_functions(functions)
+        scoped_functions = dict(self._scoped_functions) #A `Program`'s registry never changes
+        scoped_functions.update(dict(functions))
+        self._scoped_functions = scoped_functions
+        self._scoped_generation = sites.next_generation()
 
     def release_locks(self, current_thread_is_dead=True):
         """
@@ -413,9 +733,69 @@ class Interpreter:
         """
         misbehaving_threads = self._lock_factory.release_dead(current_thread_is_dead)
         if misbehaving_threads:
-            self._log.append("The following misbehaving threads left locks in use: " + repr(misbehaving_threads))
+            self._log.warning("The following misbehaving threads left locks in use: %r", misbehaving_threads)
         return misbehaving_threads
         
+    def run_node_sync(self, node_name):
+        """
+        Executes the named node to completion, for scripts that never prompt, and returns the value
+        given to its ``exit`` statement, or ``None`` if it ends without one.
+        
+        If the node cannot be found, `NodeNotFoundError` is raised.
+        
+        If a problem occurs, an `ExecutionError` is raised.
+        
+        If anything prompts, execution is abandoned and `PromptError` is raised, with the prompt in
+        its ``prompt`` attribute.
+        """
+        generator = self.execute_node(node_name)
+        try:
+            prompt = generator.send(None)
+        except StatementExit as e:
+            return e.value
+        generator.close()
+        raise PromptError(node_name, prompt)
+        
+    def set_depth_limit(self, limit):
+        """
+        Sets the number of calls to the script's functions that may be nested within each run of
+        `execute_node()` or `execute_function()`, the latter counting as the first. A call beyond
+        it fails with a `DepthExceededError`, where it was made.
+        
+        Calls are kept on a stack of their own, rather than Python's, so the limit is bounded only
+        by memory, though every level of an `ExecutionError`'s location is reported. A value of 0
+        allows unlimited nesting. The default limit is 10,000.
+        """
+        self._depth_limit = limit
+        
+    def set_fuel_limit(self, limit):
+        """
+        Sets the units of fuel allowed to each run of `execute_node()` or `execute_function()`,
+        including every function and node it reaches, through calls and ``goto``s. A unit is
+        consumed each time a statement-list is executed: the body of a node or function, the branch
+        taken by a conditional, or an iteration of a loop. When none remain, execution is stopped.
+        
+        Threads spawned by a script are separate runs, with their own fuel. A value of 0, the
+        default, allows unlimited fuel.
+        """
+        self._fuel_limit = limit
+        self._metered = bool(self._fuel_limit or self._time_limit)
+        
+    def set_log_capacity(self, capacity):
+        """
+        Sets the number of entries retained by the execution log, discarding the oldest once it is
+        full. The default capacity is 1,024.
+        """
+        self._log.set_capacity(capacity)
+
+    def set_log_level(self, level):
+        """
+        Sets the lowest `level`, one of ``log.DEBUG``, ``log.INFO``, or ``log.WARNING``, at which
+        entries are recorded in the execution log; ``log.OFF`` records nothing, at almost no cost.
+        The default level is ``log.DEBUG``, recording everything.
+        """
+        self._log.set_level(level)
+
     def set_loop_limit(self, limit):
         """
         Sets the loop-iteration-`limit` for hard-breaking infinite loops. A value of 0 will disable
@@ -431,95 +811,31 @@ class Interpreter:
         """
         self._loop_limit = limit
         
-    def _assign(self, identifier, expression, _locals, evaluate_expression=True):
+    def set_time_limit(self, seconds):
         """
-        Assigns the result of an expression to a local variable, in either the local or global
-        scope.
-        
-        `identifier` is a two-item sequence containing the scope-identifier of the variable and
-        its name.
-        
-        `expression` is the expression to be evaluated.
-        
-        `_locals` is the current scope's local variables.
+        Sets the `seconds` of execution allowed to each run of `execute_node()` or
+        `execute_function()`, measured by a monotonic clock where available, whenever fuel would be
+        consumed, as described in `set_fuel_limit()`. Time spent waiting for responses to prompts is
+        not counted. When none remains, execution is stopped.
         
-        If `evaluate_expression` is False, the `expression` is stored directly, without processing.
-        This is meant for assigning pre-resolved values.
+        Threads spawned by a script are separate runs, with their own time. A value of 0, the
+        default, allows unlimited time.
         """
-        scope = self._get_assignment_scope(identifier[0], _locals)
-        value = expression
-        if evaluate_expression: #Resolve the term
-            try:
-                generator = self._evaluate_expression(expression, _locals)
-                try:
-                    prompt = generator.send(None) #Coroutine boilerplate
-                    while True:
-                        x = yield prompt
-                        prompt = generator.send(x)
-                except StopIteration:
-                    raise ValueError("Expression did not resolve to a term")
-            except StatementReturn as e:
-                value = e.value
-        scope[identifier[1]] = value
+        self._time_limit = seconds
+        self._metered = bool(self._fuel_limit or self._time_limit)
         
-    def _assign_augment(self, identifier, expression, method, _locals, evaluate_expression=True):
+    def _assign(self, identifier, value, _locals):
         """
-        Merges the result of an expression with a pre-existing local variable's value, in either the
-        local or global scope.
+        Assigns a resolved value to a local variable, in either the local or global scope.
         
         `identifier` is a two-item sequence containing the scope-identifier of the variable and
-        its name, `expression` is the expression to be evaluated, and `method` is the type of merge
-        to perform.
+        its name.
         
         `_locals` is the current scope's local variables.
-        
-        If `evaluate_expression` is False, the `expression` is stored directly, without processing.
-        This is meant for assigning pre-resolved values.
-        
-        If the operation is addition and the expression being added is a string or the value being
-        augmented is a string, both terms are converted appropriately.
         """
-        scope = self._identify_assignment_scope(identifier[1], _locals, identifier[0])
+        self._get_assignment_scope(identifier[0], _locals)[identifier[1]] = value
         
-        expression_result = expression
-        if evaluate_expression: #Resolve the term
-            try:
-                generator = self._evaluate_expression(expression, _locals)
-                try:
-                    prompt = generator.send(None) #Coroutine boilerplate
-                    while True:
-                        x = yield prompt
-                        prompt = generator.send(x)
-                except StopIteration:
-                    raise ValueError("Expression did not resolve to a term")
-            except StatementReturn as e:
-                expression_result = e.value
-                
-        if method == parser.ASSIGN_ADD:
-            if isinstance(scope[identifier[1]], types.StringTypes) or isinstance(expression_result, types.StringTypes): #Special handling for strings
-                scope[identifier[1]] = ''.join((str(scope[identifier[1]]), str(expression_result)))
-            elif type(scope[identifier[1]]) == Sequence and type(expression_result) == Sequence: #Special handling for sequences
-                scope[identifier[1]] = Sequence(scope[identifier[1]] + expression_result)
-            else:
-                scope[identifier[1]] += expression_result
-        elif method == parser.ASSIGN_SUBTRACT:
-            scope[identifier[1]] -= expression_result
-        elif method == parser.ASSIGN_MULTIPLY:
-            scope[identifier[1]] *= expression_result
-        elif method == parser.ASSIGN_DIVIDE:
-            scope[identifier[1]] /= float(expression_result)
-        elif method == parser.ASSIGN_DIVIDE_INTEGER:
-            scope[identifier[1]] //= expression_result
-            scope[identifier[1]] = int(scope[identifier[1]])
-        elif method == parser.ASSIGN_MOD:
-            if type(scope[identifier[1]]) == float or type(expression_result) == float:
-                scope[identifier[1]] = math.fmod(scope[identifier[1]], expression_result)
-            else:
-                scope[identifier[1]] %= expression_result
-        elif method == parser.ASSIGN_EXPONENTIATE:
-            scope[identifier[1]] = math.pow(scope[identifier[1]], expression_result)
-            
-    def _assign_sequence(self, destination, source_expression, _locals, evaluate_expression=True):
+    def _assign_sequence(self, destination, source, _locals):
         """
         Unpacks a Sequence into a series of bound variables.
         
@@ -535,377 +851,501 @@ class Interpreter:
         
         `destination` is a sequence containing unresolved local identifiers or Nones.
         
-        `source_expression` is the expression to be evaluated, which must resolve to a Sequence.
+        `source` is the resolved Sequence.
         
         `_locals` is the scope's local variable store.
+        """
+        self._unpack(destination, source, _locals)
         
-        `evaluate_expression` may be set to ``False`` if `source_expression` is already a resolved
-        sequence.
+    def _charge(self):
         """
-        source = source_expression
-        if evaluate_expression:
-            try: #Resolve the sequence
-                generator = self._evaluate_expression(source_expression, _locals)
-                try:
-                    prompt = generator.send(None) #Coroutine boilerplate
-                    while True:
-                        x = yield prompt
-                        prompt = generator.send(x)
-                except StopIteration:
-                    raise ValueError("Expression did not resolve to a term")
-            except StatementReturn as e: #Expected: occurs in lieu of a return
-                source = e.value
-                
-        if not isinstance(source, collections.Sequence):
-            raise ValueError("Attempted to unpack non-sequence")
+        Consumes a unit of the fuel of the run being metered in the current thread, raising
+        `FuelExhaustedError` if none remains, or `DeadlineExceededError` if its time is up.
+        """
+        meter = self._local.meter
+        if meter is None: #The run began before metering was enabled
+            return
+        if meter.fuel is not None:
+            meter.fuel -= 1
+            if meter.fuel < 0:
+                raise FuelExhaustedError("Execution ran out of fuel")
+        if meter.deadline is not None and _monotonic() > meter.deadline:
+            raise DeadlineExceededError("Execution ran out of time")
             
-        unbound_locals = [] #Unpack-target variable-slots that extend beyond the size of the source
-        if not len(source) == len(destination):
-            self._log.append("Attempted to unpack sequence of length %(source)i into %(destination)i slots" % {
-             'source': len(source),
-             'destination': len(destination),
-            })
-            if len(source) > len(destination):
-                self._log.append("Destination variables outside the unpack-domain will be bound with a value of None")
-                unbound_locals = [v for v in destination[len(source):] if not v[0] == parser.TERM_NONE]
-            else:
-                self._log.append("Source values outside the unpack-domain will be discarded")
-                
-        for (identifier, value) in zip(destination, source):
-            if identifier[0] == parser.TERM_NONE: #None may be used as a non-assigning placeholder
-                continue
-                
-            if not identifier[0] in (
-             parser.TERM_IDENTIFIER_LOCAL,
-             parser.TERM_IDENTIFIER_LOCAL_LOCAL, parser.TERM_IDENTIFIER_LOCAL_GLOBAL
-            ):
-                raise ValueError("Unable to assign value to non-variable in sequence-unpack")
-                
-            generator = self._assign(identifier, value, _locals, evaluate_expression=False)
-            try:
-                prompt = generator.send(None) #Coroutine boilerplate
-                while True:
-                    x = yield prompt
-                    prompt = generator.send(x)
-            except StopIteration:
-                pass
-                
-        for identifier in unbound_locals: #Set anything that was trimmed in the unpack to None to avoid resolution errors
-            generator = self._assign(identifier, None, _locals, evaluate_expression=False)
-            try:
-                prompt = generator.send(None) #Coroutine boilerplate
-                while True:
-                    x = yield prompt
-                    prompt = generator.send(x)
-            except StopIteration:
-                pass
-                
-    def _compare(self, expression_left, expression_right, method, _locals):
+    def _compare(self, expression, _locals):
         """
         Compares two expressions for logical equality.
         
-        `expression_left` and `expression_right` are the expressions to be evaluated and `method` is
-        the nature of the test to be performed.
+        `expression` is the comparison to be performed, (test, left, right), with both sides
+        evaluated before the test is applied.
         
         `_locals` is the current scope's local variables.
         
-        A boolean value is returned as the ``value`` attribute of a raised `StatementReturn`.
+        A boolean value is provided as the evaluator's `_Result`.
         """
-        #Resolve the left piece's value first, since it can be used for lazy evaluation of booleans.
-        result_left = result_right = None
-        try: #Resolve the left-hand side
-            generator = self._evaluate_expression(expression_left, _locals)
-            try:
-                prompt = generator.send(None) #Coroutine boilerplate
-                while True:
-                    x = yield prompt
-                    prompt = generator.send(x)
-            except StopIteration:
-                raise ValueError("Expression did not resolve to a term")
-        except StatementReturn as e: #Expected: occurs in lieu of a return
-            result_left = e.value
-            
-        if method in (parser.TEST_BOOL_OR, parser.TEST_BOOL_AND):
-            if method == parser.TEST_BOOL_OR and bool(result_left):
-                raise StatementReturn(result_left)
-            elif method == parser.TEST_BOOL_AND and not bool(result_left):
-                raise StatementReturn(result_left)
-                
-            try: #Resolve the right-hand side
-                generator = self._evaluate_expression(expression_right, _locals)
-                try:
-                    prompt = generator.send(None) #Coroutine boilerplate
-                    while True:
-                        x = yield prompt
-                        prompt = generator.send(x)
-                except StopIteration:
-                    raise ValueError("Expression did not resolve to a term")
-            except StatementReturn as e: #Expected: occurs in lieu of a return
-                raise StatementReturn(e.value)
-        else: #Lazy evaluation's not a useful option, so evaluate right upfront
-            try: #Resolve the right-hand side
-                generator = self._evaluate_expression(expression_right, _locals)
-                try:
-                    prompt = generator.send(None) #Coroutine boilerplate
-                    while True:
-                        x = yield prompt
-                        prompt = generator.send(x)
-                except StopIteration:
-                    raise ValueError("Expression did not resolve to a term")
-            except StatementReturn as e: #Expected: occurs in lieu of a return
-                result_right = e.value
-                
-            if method == parser.TEST_EQUALITY:
-                raise StatementReturn(result_left == result_right)
-            elif method == parser.TEST_INEQUALITY:
-                raise StatementReturn(result_left != result_right)
-            elif method == parser.TEST_GREATER_EQUAL:
-                raise StatementReturn(result_left >= result_right)
-            elif method == parser.TEST_GREATER:
-                raise StatementReturn(result_left > result_right)
-            elif method == parser.TEST_LESSER_EQUAL:
-                raise StatementReturn(result_left <= result_right)
-            elif method == parser.TEST_LESSER:
-                raise StatementReturn(result_left < result_right)
-                
-    def _compute(self, expression_left, expression_right, method, _locals):
+        result_left = yield self._evaluate_expression(expression[1], _locals)
+        result_right = yield self._evaluate_expression(expression[2], _locals)
+        yield _Result(operations.compare(expression[0], result_left, result_right))
+        
+    def _compute(self, expression, _locals):
         """
         Performs a mathematic operation on two expressions.
         
-        `expression_left` and `expression_right` are the expressions to be evaluated and `method` is
-        the nature of the operation to be performed.
+        `expression` is the operation to be performed, (operator, left, right).
         
         `_locals` is the current scope's local variables.
         
-        A numerical value is returned in most cases, though strings can be concatenated through
+        A numerical value is provided in most cases, though strings can be concatenated through
         addition. If either expression provides a string, the other expression is converted
         appropriately.
         
-        The returned value is in the ``value`` attribute of a raised `StatementReturn`.
+        The value is provided as the evaluator's `_Result`.
         """
         #Resolve the left and right pieces' values.
-        result_left = result_right = None
-        try: #Resolve the left-hand side
-            generator = self._evaluate_expression(expression_left, _locals)
-            try:
-                prompt = generator.send(None) #Coroutine boilerplate
-                while True:
-                    x = yield prompt
-                    prompt = generator.send(x)
-            except StopIteration:
-                raise ValueError("Expression did not resolve to a term")
-        except StatementReturn as e: #Expected: occurs in lieu of a return
-            result_left = e.value
-        try: #Resolve the right-hand side
-            generator = self._evaluate_expression(expression_right, _locals)
+        result_left = yield self._evaluate_expression(expression[1], _locals)
+        result_right = yield self._evaluate_expression(expression[2], _locals)
+        yield _Result(operations.compute(expression[0], result_left, result_right))
+        
+    def _deepen(self, depth):
+        """
+        Raises `DepthExceededError` if a run with `depth` calls in progress has no room for another
+        under the limit set by `set_depth_limit()`.
+        """
+        if self._depth_limit and depth >= self._depth_limit:
+            raise DepthExceededError("Calls nested more deeply than the limit of %(limit)i" % {
+             'limit': self._depth_limit,
+            })
+            
+    def _drive(self, generator, depth=0):
+        """
+        Runs the evaluator `generator` to completion, as a coroutine that offers only the prompts of
+        external functions to its caller.
+        
+        Every evaluator yielded by the running evaluator is run in its place until it finishes,
+        whereupon its `_Result` is sent back to the evaluator that yielded it, or its exception is
+        thrown in at the same point. Coroutines received in a `_Host` are run the same way, except
+        that anything they yield is a prompt and their results may be provided through
+        `StatementReturn` or `StopIteration`. A `_ScriptCall` is run the same way, too, as the
+        evaluation of its function, once `_deepen()` allows it; `depth` is the number of calls
+        that `generator` represents.
+        
+        When `generator` finishes, its result is raised as the ``value`` attribute of a
+        `StatementReturn`; exceptions it raises are passed through. The value of the
+        `StatementReturn` or `StatementExit` that ends the run is `marshalling.materialize()`d.
+        """
+        stack = [] #The evaluators waiting on the running one; only the running one may be external
+        calls = [] #The height of `stack` at which each call in progress is running
+        host = False #Whether the running generator is an external coroutine
+        value = None
+        failure = None
+        while True:
             try:
-                prompt = generator.send(None) #Coroutine boilerplate
-                while True:
-                    x = yield prompt
-                    prompt = generator.send(x)
+                if failure is None:
+                    yielded = generator.send(value)
+                else:
+                    (error, failure) = (failure, None)
+                    yielded = generator.throw(*error)
             except StopIteration:
-                raise ValueError("Expression did not resolve to a term")
-        except StatementReturn as e: #Expected: occurs in lieu of a return
-            result_right = e.value
-            
-        if method == parser.MATH_ADD:
-            if isinstance(result_left, types.StringTypes) or isinstance(result_right, types.StringTypes): #Special handling for strings
-                raise StatementReturn(''.join((str(result_left), str(result_right))))
-            elif type(result_left) == Sequence and type(result_right) == Sequence: #Special handling for sequences
-                raise StatementReturn(Sequence(result_left + result_right))
+                value = None
+            except StatementReturn as e:
+                if not stack:
+                    e.value = marshalling.materialize(e.value) #Handed back to the host
+                    raise
+                if host: #An external coroutine's result
+                    value = e.value
+                else: #A return-statement, which the parent evaluator handles
+                    failure = sys.exc_info()
+            except StatementExit as e:
+                if not stack:
+                    e.value = marshalling.materialize(e.value) #Handed back to the host
+                    raise
+                failure = sys.exc_info()
+            except Exception:
+                if not stack:
+                    raise
+                failure = sys.exc_info()
             else:
-                raise StatementReturn(result_left + result_right)
-        elif method == parser.MATH_SUBTRACT:
-            raise StatementReturn(result_left - result_right)
-        elif method == parser.MATH_MULTIPLY:
-            raise StatementReturn(result_left * result_right)
-        elif method == parser.MATH_DIVIDE:
-            raise StatementReturn(result_left / float(result_right))
-        elif method == parser.MATH_DIVIDE_INTEGER:
-            raise StatementReturn(int(result_left // result_right))
-        elif method == parser.MATH_MOD:
-            if type(result_left) == float or type(result_right) == float:
-                raise StatementReturn(math.fmod(result_left, result_right))
-            raise StatementReturn(result_left % result_right)
-        elif method == parser.MATH_EXPONENTIATE:
-            raise StatementReturn(math.pow(result_left, result_right))
+                if host: #A prompt, to be answered by the caller
+                    try:
+                        value = yield yielded
+                    except Exception: #The caller's response is an error to be raised by the coroutine
+                        failure = sys.exc_info()
+                    continue
+                    
+                kind = yielded.__class__
+                if kind is _Term: #Already resolved, so it goes straight back
+                    value = yielded.value
+                    continue
+                elif kind is _Result:
+                    value = yielded.value
+                elif kind is types.GeneratorType: #Delegation to a child-evaluator
+                    stack.append(generator)
+                    generator = yielded
+                    value = None
+                    continue
+                elif kind is _ScriptCall: #A call to a function of the script, run on the stack
+                    try:
+                        self._deepen(depth + len(calls))
+                    except DepthExceededError: #Raised where the call was made
+                        failure = sys.exc_info()
+                        continue
+                    stack.append(generator)
+                    calls.append(len(stack))
+                    generator = self._evaluate_function(yielded.site, yielded.arguments)
+                    value = None
+                    continue
+                elif kind is _Transfer: #A goto, from which control never returns
+                    del stack[:]
+                    del calls[:]
+                    depth = 0
+                    generator = self._evaluate_node(yielded.node)
+                    value = None
+                    continue
+                else: #Delegation to an external coroutine, in a `_Host`
+                    stack.append(generator)
+                    generator = yielded.generator
+                    host = True
+                    value = None
+                    continue
+                    
+            if not stack:
+                raise StatementReturn(marshalling.materialize(value)) #Handed back to the host
+            generator = stack.pop()
+            host = False
+            if calls and calls[-1] > len(stack): #The running call has finished
+                calls.pop()
             
-    def _evaluate_conditional(self, statement, _locals):
+    def _evaluate_and(self, expression, _locals):
+        """
+        Evaluates a logical conjunction, lazily, providing the left term as the evaluator's
+        `_Result` if it is false, and the right term otherwise.
+        
+        `_locals` is the current scope's local variables.
+        """
+        result_left = yield self._evaluate_expression(expression[1], _locals)
+        if not bool(result_left):
+            yield _Result(result_left)
+        result_right = yield self._evaluate_expression(expression[2], _locals)
+        yield _Result(result_right)
+        
+    def _evaluate_assignment(self, statement, _locals):
+        """
+        Completes an assignment whose expression may yield, as described in
+        `_execute_assignment()`.
+        """
+        value = yield self._evaluate_expression(statement[2], _locals)
+        self._assign(statement[1], value, _locals)
+        
+    def _evaluate_augmentation(self, statement, scope, _locals):
+        """
+        Completes an augmented assignment whose expression may yield, as described in
+        `_execute_augmentation()`; `scope` is the variable store identified before evaluation.
+        """
+        value = yield self._evaluate_expression(statement[2], _locals)
+        operations.augment(statement[0], scope, statement[1][1], value)
+        
+    def _evaluate_conditional(self, branches, start, _locals):
         """
         Processes a conditional-block, executing the appropriate statement-list, if any conditions
         are met.
         
-        `statement` is the statement being processed, minus the ``COND_IF`` head and `_locals` is
-        the local variable store.
+        `branches` are the branches of the statement being processed, minus the ``COND_IF`` head,
+        of which those before `start` have already been ruled out, and `_locals` is the local
+        variable store.
         
         Execution behaviour and exceptions are identical to `_process_statements`.
         """
-        statement_list = None
-        
-        allow = None
-        generator = self._evaluate_expression(statement[0][0], _locals)
-        try: #Resolve the if-condition's term
-            try:
-                prompt = generator.send(None) #Coroutine boilerplate
-                while True:
-                    x = yield prompt
-                    prompt = generator.send(x)
-            except StopIteration:
-                raise ValueError("Expression did not resolve to a term")
-        except StatementReturn as e: #Expected: occurs in lieu of a return
-            allow = e.value
+        for index in range(start, len(branches)):
+            (condition, statement_list) = _split_branch(index, branches[index])
+            if not condition is None:
+                allow = yield self._evaluate_expression(condition, _locals)
+                if not bool(allow):
+                    continue
+            if statement_list:
+                yield self._process_statements(statement_list, scope_locals=_locals, conditional=True)
+            return
             
-        if bool(allow):
-            statement_list = statement[0][1]
-        else:
-            for substatement in statement[1:]:
-                if substatement[0] == parser.COND_ELIF:
-                    generator = self._evaluate_expression(substatement[1], _locals)
-                    try: #Resolve the elif-condition's term
-                        try:
-                            prompt = generator.send(None) #Coroutine boilerplate
-                            while True:
-                                x = yield prompt
-                                prompt = generator.send(x)
-                        except StopIteration:
-                            raise ValueError("Expression did not resolve to a term")
-                    except StatementReturn as e: #Expected: occurs in lieu of a return
-                        allow = e.value
-                        
-                    if bool(allow):
-                        statement_list = substatement[2]
-                        break
-                elif substatement[0] == parser.COND_ELSE:
-                    statement_list = substatement[1]
-                    break
-                    
-        if statement_list:
-            generator = self._process_statements(statement_list, scope_locals=_locals, conditional=True)
-            try:
-                prompt = generator.send(None) #Coroutine boilerplate
-                while True:
-                    x = yield prompt
-                    prompt = generator.send(x)
-            except StopIteration:
-                pass
-                
-    def _evaluate_expression(self, expression, _locals):
+    def _evaluate_exit(self, statement, _locals):
         """
-        Evalues an expression and offers a term.
+        Completes an exit-statement whose expression may yield, as described in `_execute_exit()`.
+        """
+        value = yield self._evaluate_expression(statement[1], _locals)
+        raise StatementExit(value)
+        
+    def _evaluate_expression(self, expression, _locals):
+        """
+        Provides the evaluator for an expression, to be yielded in place of the term it offers.
         
         `expression` is the expression to be evaluated.
         
         `_locals` is the current scope's local variables.
         
-        ``StatementReturn`` is raised after the term has been resolved. This is normal; the term's
-        value is in its ``value`` attribute.
-        """
-        expression_type = expression[0]
-        
-        if expression_type in (parser.TERM_BOOL, parser.TERM_STRING, parser.TERM_INTEGER, parser.TERM_FLOAT):
-            raise StatementReturn(expression[1])
-        elif expression_type == parser.TERM_NONE:
-            raise StatementReturn(None)
-        elif expression_type in (
-         parser.TERM_IDENTIFIER_LOCAL,
-         parser.TERM_IDENTIFIER_LOCAL_LOCAL, parser.TERM_IDENTIFIER_LOCAL_GLOBAL
-        ):
-            raise StatementReturn(self._resolve_local_identifier(expression[1], _locals, scope=expression_type))
-        elif expression_type == parser.TERM_IDENTIFIER_SCOPED: #Only locally-scoped variables may have attributes
-            raise StatementReturn(self._resolve_scoped_identifier(expression[1], _locals))
-        elif expression_type in (
-         parser.MATH_EXPONENTIATE, parser.MATH_MULTIPLY, parser.MATH_DIVIDE,
-         parser.MATH_DIVIDE_INTEGER, parser.MATH_ADD, parser.MATH_SUBTRACT, parser.MATH_MOD,
-        ):
-            generator = self._compute(expression[1], expression[2], expression_type, _locals)
-            try:
-                prompt = generator.send(None) #Coroutine boilerplate
-                while True:
-                    x = yield prompt
-                    prompt = generator.send(x)
-            except StopIteration:
-                raise ValueError("StatementReturn not received")
-        elif expression_type in (
-         parser.TEST_EQUALITY, parser.TEST_INEQUALITY,
-         parser.TEST_GREATER_EQUAL, parser.TEST_GREATER, parser.TEST_LESSER_EQUAL, parser.TEST_LESSER,
-         parser.TEST_BOOL_OR, parser.TEST_BOOL_AND
-        ):
-            generator = self._compare(expression[1], expression[2], expression_type, _locals)
-            try:
-                prompt = generator.send(None) #Coroutine boilerplate
-                while True:
-                    x = yield prompt
-                    prompt = generator.send(x)
-            except StopIteration:
-                raise ValueError("StatementReturn not received")
-        elif expression_type in (parser.FUNCTIONCALL_LOCAL, parser.FUNCTIONCALL_SCOPED):
-            generator = self._invoke_function(expression, _locals)
-            try:
-                prompt = generator.send(None) #Coroutine boilerplate
-                while True:
-                    x = yield prompt
-                    prompt = generator.send(x)
-            except StopIteration:
-                raise ValueError("StatementReturn not received")
-        elif expression_type == parser.TEST_NEGATE:
-            generator = self._evaluate_expression(expression[1], _locals)
-            try:
-                prompt = generator.send(None) #Coroutine boilerplate
-                while True:
-                    x = yield prompt
-                    prompt = generator.send(x)
-            except StopIteration:
-                raise ValueError("StatementReturn not received")
-            except StatementReturn as e:
-                raise StatementReturn(not e.value)
-        elif expression_type == parser.SUFFIX:
-            generator = self._evaluate_expression(expression[1], _locals)
-            try:
-                prompt = generator.send(None) #Coroutine boilerplate
-                while True:
-                    x = yield prompt
-                    prompt = generator.send(x)
-            except StopIteration:
-                raise ValueError("StatementReturn not received")
-            except StatementReturn as e:
-                target = e.value
-                for token in expression[2][1].split('.'):
-                    target = getattr(target, token)
-                if expression[2][0] == parser.TERM_IDENTIFIER_SUFFIX:
-                    raise StatementReturn(self._marshall_type(target))
-                elif expression[2][0] == parser.FUNCTIONCALL_SUFFIX:
-                    generator = self._invoke_function((expression[2][0], target, expression[2][2]), _locals)
-                    try:
-                        prompt = generator.send(None) #Coroutine boilerplate
-                        while True:
-                            x = yield prompt
-                            prompt = generator.send(x)
-                    except StopIteration:
-                        raise ValueError("StatementReturn not received")
-        elif expression_type == parser.SEQUENCE:
-            sequence = []
-            for e in expression[1]:
-                generator = self._evaluate_expression(e, _locals)
-                try:
-                    try:
-                        prompt = generator.send(None) #Coroutine boilerplate
-                        while True:
-                            x = yield prompt
-                            prompt = generator.send(x)
-                    except StopIteration:
-                        raise ValueError("Expression did not resolve to a term")
-                except StatementReturn as e:
-                    sequence.append(e.value)
-            raise StatementReturn(Sequence(sequence))
+        Expressions that never yield, like constants and identifiers, are resolved immediately and
+        provided as a `_Term`.
+        """
+        if self._never_yields(expression):
+            return _Term(self._evaluate_term(expression, _locals))
+        return self._expression_evaluators[expression[0]](self, expression, _locals)
+        
+    def _evaluate_for(self, statement, _locals):
+        """
+        Completes a foreach-loop whose iterable may yield, as described in `_execute_for()`.
+        """
+        iterable = yield self._evaluate_expression(statement[2], _locals)
+        yield self._process_statements(statement[3], foreach_identifier=statement[1], foreach_iterable=iterable, scope_locals=_locals)
+        
+    def _evaluate_function(self, site, arguments):
+        """
+        Evaluates the function called at `site`, a `sites.CallSite`, as described in
+        `execute_function()`, except that its return-value is provided as the evaluator's `_Result`.
+        """
+        self._log.debug("Executing function '%s'...", site.call)
+        
+        function = self._link_function(site, _link_statements)
+        if function is None:
+            raise FunctionNotFoundError(str(site.call), "Function not defined")
+            
+        value = None
+        try:
+            yield self._process_statements(function, seed_locals=self._marshall_arguments(arguments), function=True)
+        except StatementsEnd:
+            pass
+        except StatementReturn as e:
+            value = e.value
+        except FlowControl:
+            raise
+        except ExecutionError as e:
+            raise ExecutionError(str(site.call), e.location_path, e.message, e.base_exception)
+        except Error as e: #Raised on entry, like running out of fuel
+            raise ExecutionError(str(site.call), [], str(e), e)
+        except Exception as e:
+            raise ExecutionError(str(site.call), [], "An unexpected error occurred: %(error)s : %(origin)s" % {
+             'error': str(e),
+             'origin': get_origin_details(),
+            }, e)
+        yield _Result(value)
+        
+    def _evaluate_negation(self, expression, _locals):
+        """
+        Evaluates an expression and provides the logical inverse of its term as the evaluator's
+        `_Result`.
+        
+        `_locals` is the current scope's local variables.
+        """
+        value = yield self._evaluate_expression(expression[1], _locals)
+        yield _Result(not value)
+        
+    def _evaluate_node(self, node_name):
+        """
+        Evaluates the named node, as described in `execute_node()`.
+        """
+        self._log.debug("Executing node '%s'...", node_name)
+        
+        node = self._nodes.get(node_name)
+        if node is None:
+            raise NodeNotFoundError(node_name, "Node not defined")
+            
+        try:
+            yield self._process_statements(node)
+        except StatementsEnd:
+            raise StatementExit(None) #The end of any node signifies a dead end.
+        except StatementExit as e:
+            raise StatementExit(e.value)
+        except StatementReturn as e: #Not actually legal, but suppressing it would be bad.
+            self._log.warning("Warning: exit-statement inferred from top-level return.")
+            raise StatementExit(e.value)
+        except ExecutionError as e:
+            raise ExecutionError(node_name, e.location_path, e.message, e.base_exception)
+        except Error as e: #Raised on entry, like running out of fuel
+            raise ExecutionError(node_name, [], str(e), e)
+        except Exception as e:
+            raise ExecutionError(node_name, [], "An unexpected error occurred: %(error)s : %(origin)s" % {
+             'error': str(e),
+             'origin': get_origin_details(),
+            }, e)
+            
+    def _evaluate_or(self, expression, _locals):
+        """
+        Evaluates a logical disjunction, lazily, providing the left term as the evaluator's
+        `_Result` if it is true, and the right term otherwise.
+        
+        `_locals` is the current scope's local variables.
+        """
+        result_left = yield self._evaluate_expression(expression[1], _locals)
+        if bool(result_left):
+            yield _Result(result_left)
+        result_right = yield self._evaluate_expression(expression[2], _locals)
+        yield _Result(result_right)
+        
+    def _evaluate_return(self, statement, _locals):
+        """
+        Completes a return-statement whose expression may yield, as described in
+        `_execute_return()`.
+        """
+        value = yield self._evaluate_expression(statement[1], _locals)
+        raise StatementReturn(value)
+        
+    def _evaluate_sequence(self, expression, _locals):
+        """
+        Evaluates each of the expressions in a sequence, in order, and provides a Sequence of their
+        terms as the evaluator's `_Result`.
+        
+        `_locals` is the current scope's local variables.
+        """
+        sequence = []
+        for e in expression[1]:
+            value = yield self._evaluate_expression(e, _locals)
+            sequence.append(value)
+        yield _Result(Sequence(sequence))
+        
+    def _evaluate_suffix(self, expression, _locals):
+        """
+        Evaluates a suffixed expression, resolving the attribute or invoking the method named by the
+        suffix on the expression's term, and provides the outcome as the evaluator's `_Result`.
+        
+        `_locals` is the current scope's local variables.
+        """
+        target = yield self._evaluate_expression(expression[1], _locals)
+        for token in self._get_site(expression[2]).elements:
+            target = getattr(target, token)
+        if expression[2][0] == parser.TERM_IDENTIFIER_SUFFIX:
+            yield _Result(self._marshall_type(target))
+        elif expression[2][0] == parser.FUNCTIONCALL_SUFFIX:
+            value = yield self._invoke_function((expression[2][0], target, expression[2][2]), _locals)
+            yield _Result(value)
             
         raise ValueError("Unknown expression encountered: %(expression)r" % {
          'expression': expression,
         })
         
-    def _execute_local_function(self, function_name, arguments, _locals):
+    def _evaluate_term(self, expression, _locals):
+        """
+        Evaluates an expression that never yields, as determined by `optimizer.never_yields()`,
+        without the coroutine protocol, and returns its term.
+        
+        `_locals` is the current scope's local variables.
+        """
+        evaluator = self._term_evaluators.get(expression[0])
+        if evaluator is None:
+            raise ValueError("Unknown expression encountered: %(expression)r" % {
+             'expression': expression,
+            })
+        return evaluator(self, expression, _locals)
+        
+    def _evaluate_unpacking(self, statement, _locals):
+        """
+        Completes a sequence-unpacking whose expression may yield, as described in
+        `_execute_unpacking()`.
+        """
+        value = yield self._evaluate_expression(statement[2], _locals)
+        self._assign_sequence(statement[1][1], value, _locals)
+        
+    def _execute_assignment(self, statement, _locals):
+        """
+        Handles an assignment-statement, completing it immediately if its expression never yields
+        and providing the evaluator that completes it otherwise.
+        
+        Like every statement-handler, this takes the `statement` and the `_locals` of the scope in
+        which it executes, and provides None if it has finished, or an evaluator, to be yielded by
+        `_process_statements()`, if it has not.
+        """
+        if self._never_yields(statement[2]):
+            self._assign(statement[1], self._evaluate_term(statement[2], _locals), _locals)
+            return None
+        return self._evaluate_assignment(statement, _locals)
+        
+    def _execute_augmentation(self, statement, _locals):
+        """
+        Handles an augmented assignment-statement, like ``x += 1;``, the variable of which must
+        already be declared before its expression is evaluated.
+        """
+        scope = self._identify_assignment_scope(statement[1][1], _locals, statement[1][0]) #Before evaluation
+        if self._never_yields(statement[2]):
+            operations.augment(statement[0], scope, statement[1][1], self._evaluate_term(statement[2], _locals))
+            return None
+        return self._evaluate_augmentation(statement, scope, _locals)
+        
+    def _execute_break(self, statement, _locals):
+        """
+        Handles a break-statement.
+        """
+        raise StatementBreak()
+        
+    def _execute_conditional(self, statement, _locals):
+        """
+        Handles a conditional-block, resolving conditions that never yield immediately and
+        providing the statement-list of the branch taken, if any; once a condition that may yield
+        is reached, the evaluator of the remaining branches is provided instead.
+        """
+        branches = statement[1:]
+        for (index, branch) in enumerate(branches):
+            (condition, statement_list) = _split_branch(index, branch)
+            if not condition is None:
+                if not self._never_yields(condition):
+                    return self._evaluate_conditional(branches, index, _locals)
+                if not bool(self._evaluate_term(condition, _locals)):
+                    continue
+            if statement_list:
+                return self._process_statements(statement_list, scope_locals=_locals, conditional=True)
+            return None
+        return None
+        
+    def _execute_continue(self, statement, _locals):
+        """
+        Handles a continue-statement.
+        """
+        raise StatementContinue()
+        
+    def _execute_exit(self, statement, _locals):
+        """
+        Handles an exit-statement.
+        """
+        if self._never_yields(statement[1]):
+            raise StatementExit(self._evaluate_term(statement[1], _locals))
+        return self._evaluate_exit(statement, _locals)
+        
+    def _execute_expression(self, statement, _locals):
+        """
+        Handles a statement that is just an expression, like a function-call, whose term is
+        discarded.
+        """
+        if self._never_yields(statement):
+            self._evaluate_term(statement, _locals)
+            return None
+        return self._expression_evaluators[statement[0]](self, statement, _locals)
+        
+    def _execute_for(self, statement, _locals):
+        """
+        Handles a foreach-loop, providing the statement-list that iterates over its iterable.
+        """
+        if self._never_yields(statement[2]):
+            iterable = self._evaluate_term(statement[2], _locals)
+            return self._process_statements(statement[3], foreach_identifier=statement[1], foreach_iterable=iterable, scope_locals=_locals)
+        return self._evaluate_for(statement, _locals)
+        
+    def _execute_function(self, function_name, arguments):
+        """
+        Executes the named function within the reference engine, as described in
+        `execute_function()`.
         """
-        Attempts to execute the named function with the given `arguments`, which take the form
-        of standard ``**kwargs``.
+        return self._drive(self._evaluate_function(sites.CallSite(function_name, arguments.keys()), arguments), 1)
+        
+    def _execute_goto(self, statement, _locals):
+        """
+        Handles a goto-statement, providing a `_Transfer` to the named node, which always ends with
+        a `StatementExit`, so that the driver abandons everything it was evaluating in favour of
+        the node.
+        
+        If the node cannot be found, `NodeNotFoundError` is raised.
+        """
+        if not statement[1] in self._nodes:
+            raise NodeNotFoundError(statement[1], "Node not defined")
+        return _Transfer(statement[1])
+        
+    def _execute_local_function(self, site, arguments, _locals, call_function=None):
+        """
+        Attempts to execute the function called at `site`, a `sites.CallSite`, with the given
+        `arguments`, which take the form of standard ``**kwargs``.
         
         The local variable scopes are searched for bound functions first, to allow users to do
         things like `x = call.play_file;` as a form of short-hand, with the interpreter's namespace
@@ -915,29 +1355,43 @@ class Interpreter:
         
         `_locals` is the current scope's local variables.
         
+        `call_function` is the callable, taking `site` and the arguments, through which the
+        interpreter's namespace is accessed; the engine's ``call_function()`` if not given.
+        
         The function's output is returned.
         
         If the function cannot be found, `FunctionNotFoundError` is raised.
         
         Any exceptions raised by the called function are passed through.
         """
-        try:
-            function = self._resolve_local_identifier(function_name, _locals)
-            if isinstance(function, collections.Callable):
-                return function(**arguments)
-            else:
-                raise VariableNotFoundError(function_name, "Local identifier is not a bound function")
-        except VariableNotFoundError:
-            return self.execute_function(function_name, arguments)
-        raise FunctionNotFoundError("Unable to find local function %(name)s(%(parameters)s)" % {
-         'name': function_name,
-         'parameters': ', '.join(arguments.keys()),
-        })
+        name = site.name
+        function = None
+        if name in _locals:
+            function = _locals[name]
+        elif name in self._globals:
+            function = self._globals[name]
+        if not function is None and site.is_callable(function):
+            return function(**marshalling.materialize_arguments(function, arguments))
+        return (call_function or self._engine.call_function)(site, arguments)
+        
+    def _execute_node(self, node_name):
+        """
+        Executes the named node within the reference engine, as described in `execute_node()`.
+        """
+        return self._drive(self._evaluate_node(node_name))
+        
+    def _execute_return(self, statement, _locals):
+        """
+        Handles a return-statement.
+        """
+        if self._never_yields(statement[1]):
+            raise StatementReturn(self._evaluate_term(statement[1], _locals))
+        return self._evaluate_return(statement, _locals)
         
-    def _execute_scoped_function(self, function_name, arguments, _locals):
+    def _execute_scoped_function(self, site, arguments, _locals):
         """
-        Attempts to execute the named function with the given `arguments`, which take the form
-        of standard ``**kwargs``.
+        Attempts to execute the function named at `site`, a `sites.Site`, with the given
+        `arguments`, which take the form of standard ``**kwargs``.
         
         The local variable scopes are searched for bound functions first, in case the function being
         called is an attribute of a locally bound variable, with the set of registered scoped
@@ -956,21 +1410,36 @@ class Interpreter:
         given parameters, are passed through. 
         """
         try:
-            function = self._resolve_scoped_identifier(function_name, _locals)
-            if isinstance(function, collections.Callable):
-                return function(**arguments)
+            function = self._resolve_scoped_identifier(site, _locals)
+            if site.is_callable(function):
+                return function(**marshalling.materialize_arguments(function, arguments))
             else:
-                raise ScopedVariableNotFoundError(function_name, "Scoped identifier is not a bound function")
+                raise ScopedVariableNotFoundError(site.identifier, "Scoped identifier is not a bound function")
         except ScopedVariableNotFoundError:
-            function = self._scoped_functions.get(function_name)
+            function = self._get_scoped_function(site)
             if not function:
-                raise ScopedFunctionNotFoundError(function_name, "Function not registered")
-            return function(**arguments)
+                raise ScopedFunctionNotFoundError(site.identifier, "Function not registered")
+            return function(**marshalling.materialize_arguments(function, arguments))
         raise ScopedFunctionNotFoundError("Unable to find scoped function %(name)s(%(parameters)s)" % {
-         'name': function_name,
+         'name': site.identifier,
          'parameters': ', '.join(arguments.keys()),
         })
         
+    def _execute_unpacking(self, statement, _locals):
+        """
+        Handles a sequence-unpacking statement, like ``[x, y] = pair;``.
+        """
+        if self._never_yields(statement[2]):
+            self._assign_sequence(statement[1][1], self._evaluate_term(statement[2], _locals), _locals)
+            return None
+        return self._evaluate_unpacking(statement, _locals)
+        
+    def _execute_while(self, statement, _locals):
+        """
+        Handles a while-loop, providing the statement-list that repeats while its condition holds.
+        """
+        return self._process_statements(statement[2], while_expression=statement[1], scope_locals=_locals)
+        
     def _get_assignment_scope(self, scope_identifier, _locals):
         """
         Returns the scope-variable-store for assignment indicated by the given identifier.
@@ -980,7 +1449,49 @@ class Interpreter:
         if scope_identifier == parser.TERM_IDENTIFIER_LOCAL_GLOBAL:
             return self._globals
         return _locals
+        
+    def _get_scoped_function(self, site):
+        """
+        Provides the scoped function registered under the identifier of `site`, a `sites.Site`, or
+        None, looking it up only if the registry has changed since `site` last did.
+        """
+        (generation, function) = site.binding
+        if not generation == self._scoped_generation:
+            function = self._scoped_functions.get(site.identifier)
+            site.binding = (self._scoped_generation, function) #Replaced whole, so threads never see half of it
+        if function is _BOUND: #Shared by every interpreter, so only the marker may be cached
+            return self._bound_functions.get(site.identifier)
+        return function
+        
+    def _get_site(self, expression):
+        """
+        Provides the reference engine's `sites.Site` for `expression`, a scoped identifier, a
+        scoped function-call, or the suffix of a suffixed expression, each of which names its
+        identifier second, or its `sites.CallSite` for a local function-call; it is kept for as long
+        as the namespace is unchanged.
+        """
+        entry = self._sites.get(id(expression))
+        if entry is None or not entry[0] is expression: #The identity of a collected expression may be reused
+            if expression[0] == parser.FUNCTIONCALL_LOCAL:
+                site = sites.CallSite(expression[1], expression[2].keys())
+            else:
+                site = sites.Site(expression[1])
+            entry = (expression, site)
+            self._sites[id(expression)] = entry
+        return entry[1]
 
+    def _goto(self, node_name):
+        """
+        Transfers control to the named node, which always ends with a `StatementExit`, by raising a
+        `StatementGoto` that unwinds everything being executed, so that `_transfer()` can run the
+        node in its place.
+        
+        If the node cannot be found, `NodeNotFoundError` is raised where the ``goto`` is.
+        """
+        if not node_name in self._nodes:
+            raise NodeNotFoundError(node_name, "Node not defined")
+        raise StatementGoto(node_name)
+        
     def _identify_assignment_scope(self, identifier, _locals, scope=parser.TERM_IDENTIFIER_LOCAL):
         """
         Provides the scope of a local identifier by first looking for it in the local scope, then
@@ -1016,71 +1527,111 @@ class Interpreter:
         
         Any alien types are marshalled into Prismscript-compatible forms.
         
-        ``StatementReturn`` is raised after any coroutine execution has completed. This is normal;
-        the function's return-value is in its ``value`` attribute.
+        The function's return-value is provided as the evaluator's `_Result`, after any coroutine
+        execution has completed.
         """
         arguments = {}
         for (argument, expr) in expression[2].items():
-            generator = self._evaluate_expression(expr, _locals)
-            try:
-                try:
-                    prompt = generator.send(None) #Coroutine boilerplate
-                    while True:
-                        x = yield prompt
-                        prompt = generator.send(x)
-                except StopIteration:
-                    raise ValueError("Argument-expression did not resolve to a term")
-            except StatementReturn as e: #Guaranteed to happen
-                arguments[argument] = e.value
-                
-        self._log.append("Invoking function '%(name)s(%(args)s)'..." % {
-         'name': expression[1],
-         'args': ', '.join(sorted(arguments.keys())),
-        })
+            arguments[argument] = yield self._evaluate_expression(expr, _locals)
+            
+        self._log.debug("Invoking function '%s'...", log.Call(expression[1], arguments))
         
         result = None
         try:
             if expression[0] == parser.FUNCTIONCALL_LOCAL:
-                result = self._execute_local_function(expression[1], arguments, _locals)
+                result = self._execute_local_function(self._get_site(expression), arguments, _locals, _ScriptCall)
             elif expression[0] == parser.FUNCTIONCALL_SCOPED:
-                result = self._execute_scoped_function(expression[1], arguments, _locals)
+                result = self._execute_scoped_function(self._get_site(expression), arguments, _locals)
             elif expression[0] == parser.FUNCTIONCALL_SUFFIX:
-                result = expression[1](**arguments)
+                result = expression[1](**marshalling.materialize_arguments(expression[1], arguments))
         except StatementReturn as e:
-            raise StatementReturn(self._marshall_type(e.value))
+            result = _Result(e.value)
             
-        if type(result) == types.GeneratorType:
+        if isinstance(result, _Result):
+            result = result.value
+        elif isinstance(result, _ScriptCall): #Evaluated on the driver's stack, not through another driver
+            result = yield result
+        elif type(result) == types.GeneratorType: #The function is expected to raise a `StatementReturn` if it has a value
+            result = yield _Host(result)
+        yield _Result(self._marshall_type(result))
+        
+    def _link_function(self, site, link):
+        """
+        Provides the function called at `site`, a `sites.CallSite`, as `link` makes it ready to
+        run, given its signature and statements, or None if no such function is defined.
+        
+        What `link` provides is bound to `site`, so that it is looked up again only once the
+        namespace has been extended.
+        """
+        (generation, function) = site.binding
+        if not generation == self._namespace_generation:
+            function = None
+            statements = self._functions.get(site.signature)
+            if not statements is None:
+                function = link(site.signature, statements)
+            site.binding = (self._namespace_generation, function) #Replaced whole, so threads never see half of it
+        return function
+        
+    def _marshall_arguments(self, arguments):
+        """
+        Provides a new dictionary of the values in `arguments`, by parameter-name, each coerced
+        as by `_marshall_type()`.
+        """
+        marshall = marshalling.marshall
+        return dict((parameter, marshall(value)) for (parameter, value) in arguments.items())
+        
+    #Coerces data received from external sources into equivalent, Prismscript-compatible formats,
+    #through the converters that every interpreter shares; see `marshalling`
+    _marshall_type = staticmethod(marshalling.marshall)
+    
+    def _meter(self, generator):
+        """
+        Runs `generator`, the execution of a node or function, as a coroutine that charges what it
+        consumes to a `_Meter`: that of the run being metered in the current thread, if any, which
+        reached it through an external function, or a new one.
+        
+        Time spent waiting for responses to prompts is not charged.
+        """
+        local = self._local
+        meter = local.meter
+        owner = meter is None #Whether this is the run, responsible for tracking its time
+        if owner:
+            meter = _Meter(self._fuel_limit or None, self._time_limit or None)
+        value = None
+        failure = None
+        while True:
+            previous = local.meter
+            local.meter = meter
+            if owner and not meter.time is None:
+                meter.deadline = _monotonic() + meter.time
             try:
-                prompt = result.send(None) #Coroutine boilerplate
-                while True:
-                    x = yield prompt
-                    prompt = result.send(x)
-            except StopIteration: #Let None be returned.
-                pass
-            except StatementReturn as e: #The function is expected to raise a `StatementReturn` if it has a value
-                raise StatementReturn(self._marshall_type(e.value))
-            raise StatementReturn(None) #None is the standard otherwise.
-        else:
-            raise StatementReturn(self._marshall_type(result))
-            
-    def _marshall_type(self, data):
-        """
-        Coerces `data` received from external sources into equivalent, Prismscript-compatible
-        formats.
-        """
-        if not type(data) == String and isinstance(data, types.StringTypes):
-            #Python strings/unicodes -> String
-            return String(data)
-        elif not type(data) in (Sequence, String) and isinstance(data, collections.Sequence):
-            #Python sequences -> Sequence
-            return Sequence((self._marshall_type(d) for d in data))
-        elif not type(data) == Dictionary and isinstance(data, collections.Mapping):
-            #Python mappings -> Dictionary
-            return Dictionary(((self._marshall_type(k), self._marshall_type(v)) for (k, v) in data.items()))
-        elif not type(data) == Set and isinstance(data, collections.Set):
-            #Python sets -> Set
-            return Set((self._marshall_type(d) for d in data))
-        return data
+                if failure is None:
+                    prompt = generator.send(value)
+                else:
+                    (error, failure) = (failure, None)
+                    prompt = generator.throw(*error)
+            finally:
+                local.meter = previous
+                if owner and not meter.time is None:
+                    meter.time = meter.deadline - _monotonic()
+            try:
+                value = yield prompt
+            except GeneratorExit:
+                generator.close()
+                raise
+            except Exception: #The caller's response is an error to be raised where it prompted
+                failure = sys.exc_info()
+                
+    def _never_yields(self, expression):
+        """
+        Indicates whether `expression` never yields, as determined by `optimizer.never_yields()`,
+        remembering the answer for as long as the namespace is unchanged.
+        """
+        entry = self._synchronous.get(id(expression))
+        if entry is None or not entry[0] is expression: #The identity of a collected expression may be reused
+            entry = (expression, optimizer.never_yields(expression))
+            self._synchronous[id(expression)] = entry
+        return entry[1]
         
     def _process_statements(self,
      statement_list,
@@ -1131,13 +1682,13 @@ class Interpreter:
             raise ValueError("A while-loop cannot also be a foreach-loop -- this is a design issue")
             
         if not while_expression is None:
-            self._log.append("Entering while-loop...")
+            self._log.debug("Entering while-loop...")
         elif not foreach_iterable is None:
-            self._log.append("Entering foreach-loop...")
+            self._log.debug("Entering foreach-loop...")
         elif function:
-            self._log.append("Entering function...")
+            self._log.debug("Entering function...")
         else:
-            self._log.append("Entering node...")
+            self._log.debug("Entering node...")
             
         _locals = {} #A namespace for local variables
         if not scope_locals is None: #This scope is bridged with another, so they should share the same local variables
@@ -1149,176 +1700,48 @@ class Interpreter:
         if not foreach_iterable is None:
             _foreach_iterable = iter(foreach_iterable)
             
+        statement_handlers = self._statement_handlers
+        execute_expression = _EXECUTE_EXPRESSION
+        
         _while_expression = while_expression
         if while_expression is None: #Let the loop execute; this is inverted at the end.
-            _while_expression = (parser.TERM_BOOL, True)
+            _while_expression = _TRUE
         iteration_count = 0
         while True:
             if self._loop_limit and self._loop_limit < iteration_count:
-                self._log.append("Hard-breaking loop for exceeding iteration-limit of %(limit)i cycles" % {
-                 'limit': self._loop_limit,
-                })
+                self._log.warning("Hard-breaking loop for exceeding iteration-limit of %i cycles", self._loop_limit)
                 break
                 
             if _foreach_iterable and foreach_identifier: #Definitely a foreach-loop
-                generator = None
                 try:
-                    if foreach_identifier[0] == parser.SEQUENCE:
-                        generator = self._assign_sequence(foreach_identifier[1], next(_foreach_iterable), _locals, evaluate_expression=False)
-                    else:
-                        generator = self._assign(foreach_identifier, next(_foreach_iterable), _locals, evaluate_expression=False)
+                    value = next(_foreach_iterable)
                 except StopIteration: #Iterator's exhausted
                     break
-                try:
-                    prompt = generator.send(None) #Coroutine boilerplate
-                    while True:
-                        x = yield prompt
-                        prompt = generator.send(x)
-                except StopIteration:
-                    pass
+                if foreach_identifier[0] == parser.SEQUENCE:
+                    self._assign_sequence(foreach_identifier[1], value, _locals)
+                else:
+                    self._assign(foreach_identifier, value, _locals)
             elif foreach_identifier:
                 raise ValueError("A foreach-loop cannot iterate over a non-collection")
             else: #Possibly a while-loop
-                generator = self._evaluate_expression(_while_expression, _locals)
-                try: #Resolve the while-loop's term
-                    try:
-                        prompt = generator.send(None) #Coroutine boilerplate
-                        while True:
-                            x = yield prompt
-                            prompt = generator.send(x)
-                    except StopIteration:
-                        pass
-                except StatementReturn as e: #Expected: occurs in lieu of a return
-                    if not bool(e.value):
-                        break
-                        
+                if self._never_yields(_while_expression): #Resolve the while-loop's term
+                    allow = self._evaluate_term(_while_expression, _locals)
+                else:
+                    allow = yield self._evaluate_expression(_while_expression, _locals)
+                if not bool(allow):
+                    break
+                    
+            if self._metered: #Every pass through a statement-list consumes fuel
+                self._charge()
+                
             i = 0 #Statement-enumerator for exception-tracing.
             try:
                 for (i, statement) in enumerate(statement_list):
-                    statement_type = statement[0]
-                    
-                    if statement_type == parser.ASSIGN:
-                        generator = self._assign(statement[1], statement[2], _locals)
+                    evaluator = statement_handlers.get(statement[0], execute_expression)(self, statement, _locals)
+                    if not evaluator is None: #The statement can only be completed by the driver
                         try:
-                            prompt = generator.send(None) #Coroutine boilerplate
-                            while True:
-                                x = yield prompt
-                                prompt = generator.send(x)
-                        except StopIteration:
-                            pass
-                    elif statement_type in (
-                     parser.ASSIGN_ADD, parser.ASSIGN_SUBTRACT, parser.ASSIGN_EXPONENTIATE,
-                     parser.ASSIGN_MULTIPLY, parser.ASSIGN_DIVIDE, parser.ASSIGN_DIVIDE_INTEGER,
-                     parser.ASSIGN_MOD,
-                    ):
-                        generator = self._assign_augment(statement[1], statement[2], statement_type, _locals)
-                        try:
-                            prompt = generator.send(None) #Coroutine boilerplate
-                            while True:
-                                x = yield prompt
-                                prompt = generator.send(x)
-                        except StopIteration:
-                            pass
-                    elif statement_type == parser.ASSIGN_SEQUENCE:
-                        generator = self._assign_sequence(statement[1][1], statement[2], _locals)
-                        try:
-                            prompt = generator.send(None) #Coroutine boilerplate
-                            while True:
-                                x = yield prompt
-                                prompt = generator.send(x)
-                        except StopIteration:
-                            pass
-                    elif statement_type == parser.STMT_RETURN:
-                        generator = self._evaluate_expression(statement[1], _locals)
-                        try:
-                            prompt = generator.send(None) #Coroutine boilerplate
-                            while True:
-                                x = yield prompt
-                                prompt = generator.send(x)
-                        except StopIteration:
-                            raise ValueError("StatementReturn not received")
-                    elif statement_type == parser.STMT_GOTO:
-                        generator = self.execute_node(statement[1])
-                        try:
-                            prompt = generator.send(None) #Coroutine boilerplate
-                            while True:
-                                x = yield prompt
-                                prompt = generator.send(x)
-                        except StopIteration:
-                            raise StatementsEnd()
-                    elif statement_type == parser.COND_IF:
-                        try:
-                            generator = self._evaluate_conditional(statement[1:], _locals)
-                            try:
-                                prompt = generator.send(None) #Coroutine boilerplate
-                                while True:
-                                    x = yield prompt
-                                    prompt = generator.send(x)
-                            except StopIteration:
-                                pass
-                        except StatementsEnd:
-                            pass
-                    elif statement_type == parser.COND_WHILE:
-                        try:
-                            generator = self._process_statements(statement[2], while_expression=statement[1], scope_locals=_locals)
-                            try:
-                                prompt = generator.send(None) #Coroutine boilerplate
-                                while True:
-                                    x = yield prompt
-                                    prompt = generator.send(x)
-                            except StopIteration:
-                                pass
-                        except StatementsEnd:
-                            pass
-                    elif statement_type == parser.COND_FOR:
-                        try:
-                            generator = self._evaluate_expression(statement[2], _locals)
-                            try:
-                                try:
-                                    prompt = generator.send(None) #Coroutine boilerplate
-                                    while True:
-                                        x = yield prompt
-                                        prompt = generator.send(x)
-                                except StopIteration:
-                                    raise ValueError("StatementReturn not received")
-                            except StatementReturn as e:
-                                generator = self._process_statements(statement[3], foreach_identifier=statement[1], foreach_iterable=e.value, scope_locals=_locals)
-                                try:
-                                    prompt = generator.send(None) #Coroutine boilerplate
-                                    while True:
-                                        x = yield prompt
-                                        prompt = generator.send(x)
-                                except StopIteration:
-                                    pass
-                        except StatementsEnd:
-                            pass
-                    elif statement_type == parser.STMT_BREAK:
-                        raise StatementBreak()
-                    elif statement_type == parser.STMT_CONTINUE:
-                        raise StatementContinue()
-                    elif statement_type == parser.STMT_EXIT:
-                        try:
-                            generator = self._evaluate_expression(statement[1], _locals)
-                            try:
-                                prompt = generator.send(None) #Coroutine boilerplate
-                                while True:
-                                    x = yield prompt
-                                    prompt = generator.send(x)
-                            except StopIteration:
-                                raise ValueError("StatementReturn not received")
-                        except StatementReturn as e:
-                            raise StatementExit(e.value)
-                    else:
-                        try:
-                            generator = self._evaluate_expression(statement, _locals)
-                            try:
-                                prompt = generator.send(None) #Coroutine boilerplate
-                                while True:
-                                    x = yield prompt
-                                    prompt = generator.send(x)
-                            except StopIteration:
-                                raise ValueError("StatementReturn not received")
-                        except StatementReturn as e:
+                            yield evaluator
+                        except StatementsEnd: #A nested statement-list ran to completion
                             pass
             except StatementBreak:
                 if conditional:
@@ -1349,7 +1772,7 @@ class Interpreter:
                 }, e)
                 
             if not while_expression: #It's not actually a loop, so kill it. This is benign in the case of a foreach.
-                _while_expression = (parser.TERM_BOOL, False)
+                _while_expression = _FALSE
             iteration_count += 1
             
         raise StatementsEnd()
@@ -1368,9 +1791,9 @@ class Interpreter:
         """
         return self._identify_assignment_scope(identifier, _locals, scope)[identifier]
         
-    def _resolve_scoped_identifier(self, identifier, _locals):
+    def _resolve_scoped_identifier(self, site, _locals):
         """
-        Provides the value of a scoped identifier.
+        Provides the value of the scoped identifier named at `site`, a `sites.Site`.
         
         Since the intent of the language for which this interpreter was written is such that all
         variables have to be bound locally, the root must exist in either the local or global store,
@@ -1379,31 +1802,196 @@ class Interpreter:
         
         Within the context of Python, reflection makes this hierarchy very easy to traverse.
         
-        `identifier` is the name of the variable to be retrieved, and `locals` is the current
-        scope's local variable store.
+        `_locals` is the current scope's local variable store.
         
-        A `VariableNotFoundError` is raised if the requested identifier's root has not been
-        declared, and `ScopedVariableNotFoundError` is raised if the identifier could not be found
+        A `ScopedVariableNotFoundError` is raised if the requested identifier's root has not been
+        declared and no function is registered under it, or if the identifier could not be found
         under the root.
         """
-        elements = identifier.split('.')
-        variable = None
-        try:
-            variable = self._resolve_local_identifier(elements[0], _locals)
-        except VariableNotFoundError:
-            scoped_function = self._scoped_functions.get(identifier) #See if it's a reference to a scoped function.
+        root = site.root
+        if root in _locals:
+            variable = _locals[root]
+        elif root in self._globals:
+            variable = self._globals[root]
+        else:
+            scoped_function = self._get_scoped_function(site) #See if it's a reference to a scoped function.
             if scoped_function:
                 return scoped_function
-            raise ScopedVariableNotFoundError(identifier, "Unable to resolve scoped identifier: root is not a bound local variable")
-        if variable is None or type(variable) in (bool, int, long, float) or type(variable) in types.StringTypes:
-            raise ScopedVariableNotFoundError(identifier, "Unable to resolve scoped identifier: found a primitive data-type as a local referent")
+            raise ScopedVariableNotFoundError(site.identifier, "Unable to resolve scoped identifier: root is not a bound local variable")
+        if type(variable) in _PRIMITIVES:
+            raise ScopedVariableNotFoundError(site.identifier, "Unable to resolve scoped identifier: found a primitive data-type as a local referent")
             
         try:
-            for element in elements[1:]:
+            for element in site.path:
                 variable = getattr(variable, element)
             return variable
         except Exception as e:
-            raise ScopedVariableNotFoundError(identifier, "Unable to resolve scoped identifier: %(error)s" % {
+            raise ScopedVariableNotFoundError(site.identifier, "Unable to resolve scoped identifier: %(error)s" % {
              'error': str(e),
             })
             
+    def _term_and(self, expression, _locals):
+        """
+        Provides the term of a logical conjunction that never yields, as in `_evaluate_and()`.
+        """
+        result_left = self._evaluate_term(expression[1], _locals)
+        if not bool(result_left):
+            return result_left
+        return self._evaluate_term(expression[2], _locals)
+        
+    def _term_comparison(self, expression, _locals):
+        """
+        Provides the term of a comparison that never yields, as in `_compare()`.
+        """
+        result_left = self._evaluate_term(expression[1], _locals)
+        result_right = self._evaluate_term(expression[2], _locals)
+        return operations.compare(expression[0], result_left, result_right)
+        
+    def _term_computation(self, expression, _locals):
+        """
+        Provides the term of a mathematic operation that never yields, as in `_compute()`.
+        """
+        result_left = self._evaluate_term(expression[1], _locals)
+        result_right = self._evaluate_term(expression[2], _locals)
+        return operations.compute(expression[0], result_left, result_right)
+        
+    def _term_constant(self, expression, _locals):
+        """
+        Provides the value of a boolean, string, integer, or float constant.
+        """
+        return expression[1]
+        
+    def _term_local_identifier(self, expression, _locals):
+        """
+        Provides the value of a local identifier, as in `_resolve_local_identifier()`.
+        """
+        return self._resolve_local_identifier(expression[1], _locals, scope=expression[0])
+        
+    def _term_negation(self, expression, _locals):
+        """
+        Provides the logical inverse of an expression that never yields.
+        """
+        return not self._evaluate_term(expression[1], _locals)
+        
+    def _term_none(self, expression, _locals):
+        """
+        Provides None.
+        """
+        return None
+        
+    def _term_or(self, expression, _locals):
+        """
+        Provides the term of a logical disjunction that never yields, as in `_evaluate_or()`.
+        """
+        result_left = self._evaluate_term(expression[1], _locals)
+        if bool(result_left):
+            return result_left
+        return self._evaluate_term(expression[2], _locals)
+        
+    def _term_scoped_identifier(self, expression, _locals):
+        """
+        Provides the value of a scoped identifier, as in `_resolve_scoped_identifier()`.
+        """
+        return self._resolve_scoped_identifier(self._get_site(expression), _locals)
+        
+    def _term_sequence(self, expression, _locals):
+        """
+        Provides a Sequence of the terms of expressions that never yield.
+        """
+        return Sequence([self._evaluate_term(e, _locals) for e in expression[1]])
+        
+    def _term_sequence_constant(self, expression, _locals):
+        """
+        Provides a fresh copy of a Sequence prebuilt by the optimizer.
+        """
+        return Sequence(expression[1])
+        
+    def _term_suffix(self, expression, _locals):
+        """
+        Provides the attribute named by the suffix of an expression that never yields, as in
+        `_evaluate_suffix()`.
+        """
+        target = self._evaluate_term(expression[1], _locals)
+        for token in self._get_site(expression[2]).elements:
+            target = getattr(target, token)
+        if expression[2][0] == parser.TERM_IDENTIFIER_SUFFIX:
+            return self._marshall_type(target)
+            
+        raise ValueError("Unknown expression encountered: %(expression)r" % {
+         'expression': expression,
+        })
+        
+    def _transfer(self, generator):
+        """
+        Runs `generator`, the execution of a node or function by the engine, as a coroutine that
+        passes its prompts through, and, whenever a ``goto`` ends it, runs the target node in its
+        place; the reference engine handles ``goto``s itself, in `_drive()`.
+        
+        Every transfer replaces everything that was being executed, so a run holds only the node
+        it is in, no matter how many ``goto``s brought it there. The value of the `StatementReturn`
+        or `StatementExit` that ends the run is `marshalling.materialize()`d.
+        """
+        value = None
+        failure = None
+        while True:
+            try:
+                if failure is None:
+                    prompt = generator.send(value)
+                else:
+                    (error, failure) = (failure, None)
+                    prompt = generator.throw(*error)
+            except StatementGoto as e:
+                generator = self._engine.execute_node(e.node)
+                value = None
+                continue
+            except (StatementReturn, StatementExit) as e:
+                e.value = marshalling.materialize(e.value) #Handed back to the host
+                raise
+            try:
+                value = yield prompt
+            except GeneratorExit:
+                generator.close()
+                raise
+            except Exception: #The caller's response is an error to be raised where it prompted
+                failure = sys.exc_info()
+                
+    def _unpack(self, destination, source, _locals):
+        """
+        Unpacks the resolved Sequence `source` into the bound variables, or Nones, in `destination`,
+        as described in `_assign_sequence`.
+        
+        `_locals` is the scope's local variable store.
+        """
+        if not isinstance(source, collections.Sequence):
+            raise ValueError("Attempted to unpack non-sequence")
+            
+        unbound_locals = [] #Unpack-target variable-slots that extend beyond the size of the source
+        if not len(source) == len(destination):
+            self._log.info("Attempted to unpack sequence of length %i into %i slots", len(source), len(destination))
+            if len(source) > len(destination):
+                self._log.info("Destination variables outside the unpack-domain will be bound with a value of None")
+                unbound_locals = [v for v in destination[len(source):] if not v[0] == parser.TERM_NONE]
+            else:
+                self._log.info("Source values outside the unpack-domain will be discarded")
+                
+        for (identifier, value) in zip(destination, source):
+            if identifier[0] == parser.TERM_NONE: #None may be used as a non-assigning placeholder
+                continue
+                
+            if not identifier[0] in (
+             parser.TERM_IDENTIFIER_LOCAL,
+             parser.TERM_IDENTIFIER_LOCAL_LOCAL, parser.TERM_IDENTIFIER_LOCAL_GLOBAL
+            ):
+                raise ValueError("Unable to assign value to non-variable in sequence-unpack")
+                
+            self._get_assignment_scope(identifier[0], _locals)[identifier[1]] = value
+            
+        for identifier in unbound_locals: #Set anything that was trimmed in the unpack to None to avoid resolution errors
+            self._get_assignment_scope(identifier[0], _locals)[identifier[1]] = None
+            
+
+#The reference engine's dispatch-tables, as functions that take the interpreter as their first argument
+Interpreter._statement_handlers = _resolve(_STATEMENT_HANDLERS)
+Interpreter._expression_evaluators = _resolve(_EXPRESSION_EVALUATORS)
+Interpreter._term_evaluators = _resolve(_TERM_EVALUATORS)
+_EXECUTE_EXPRESSION = Interpreter.__dict__['_execute_expression'] #The handler of any statement that is just an expression
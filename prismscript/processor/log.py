@@ -0,0 +1,139 @@
+"""
+log
+===
+Purpose
+-------
+Provides the execution log shared by every engine: a fixed-capacity ring of entries, each recorded
+at a severity level, whose messages are formatted only when the log is read.
+
+Notes
+-----
+Recording an entry costs one append to a bounded ``collections.deque``, which is atomic, so
+threads may record entries concurrently without a lock. Messages are stored as a
+template and its arguments; nothing is formatted until `Log.get_entries()` is called.
+
+At ``OFF``, or any level above ``DEBUG``, the methods of discarded levels are replaced with a
+function that does nothing, so that the cost of a silent log is that of an empty call.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import collections
+
+DEBUG = 10 #: Routine tracing: nodes and functions executed, loops and statement-lists entered.
+INFO = 20 #: Noteworthy, but harmless, behaviour, like an unpacking of mismatched length.
+WARNING = 30 #: Behaviour the script's author probably did not intend, like a hard-broken loop.
+OFF = 100 #: Nothing is recorded.
+
+_CAPACITY = 1024 #The number of entries retained by default
+
+def _discard(message, *arguments):
+    """
+    Stands in for the recording-methods of levels that are not being recorded.
+    """
+
+class Call:
+    """
+    Describes a function-call, as ``name(a, b)``, when formatted, rather than when it is recorded.
+    """
+    name = None #The name of the function
+    parameters = None #The names of the arguments passed to it
+
+    def __init__(self, name, parameters):
+        self.name = name
+        self.parameters = tuple(parameters)
+
+    def __str__(self):
+        return "%(name)s(%(parameters)s)" % {
+         'name': self.name,
+         'parameters': ', '.join(sorted(self.parameters)),
+        }
+
+class Log:
+    """
+    A bounded, leveled record of an interpreter's execution.
+    """
+    _entries = None #The retained (level, message, arguments) entries, oldest first
+    _level = DEBUG #The lowest level recorded
+
+    def __init__(self, capacity=_CAPACITY, level=DEBUG):
+        """
+        Creates an empty log that retains the newest `capacity` entries recorded at or above
+        `level`.
+        """
+        self._entries = collections.deque((), capacity)
+        self.set_level(level)
+
+    def debug(self, message, *arguments):
+        """
+        Records `message`, a %-template to be formatted with `arguments`, at ``DEBUG``.
+        """
+        self._entries.append((DEBUG, message, arguments))
+
+    def info(self, message, *arguments):
+        """
+        Records `message`, a %-template to be formatted with `arguments`, at ``INFO``.
+        """
+        self._entries.append((INFO, message, arguments))
+
+    def warning(self, message, *arguments):
+        """
+        Records `message`, a %-template to be formatted with `arguments`, at ``WARNING``.
+        """
+        self._entries.append((WARNING, message, arguments))
+
+    def clear(self):
+        """
+        Discards every retained entry.
+        """
+        self._entries.clear()
+
+    def get_capacity(self):
+        """
+        Provides the number of entries retained.
+        """
+        return self._entries.maxlen
+
+    def get_entries(self, level=DEBUG):
+        """
+        Provides the formatted messages of every retained entry recorded at or above `level`,
+        oldest first.
+        """
+        entries = list(self._entries) #Copied in one step, so concurrent recording is harmless
+        return [
+         (message % arguments if arguments else message)
+         for (entry_level, message, arguments) in entries if entry_level >= level
+        ]
+
+    def get_level(self):
+        """
+        Provides the lowest level recorded.
+        """
+        return self._level
+
+    def set_capacity(self, capacity):
+        """
+        Changes the number of entries retained to `capacity`, keeping the newest.
+        """
+        self._entries = collections.deque(self._entries, capacity)
+
+    def set_level(self, level):
+        """
+        Records entries at or above `level` from now on; ``OFF`` records nothing.
+        """
+        self._level = level
+        for (method_level, name) in ((DEBUG, 'debug'), (INFO, 'info'), (WARNING, 'warning')):
+            if method_level < level:
+                setattr(self, name, _discard)
+            elif name in self.__dict__: #Restore the class's method
+                delattr(self, name)
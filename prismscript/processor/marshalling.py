@@ -0,0 +1,185 @@
+"""
+marshalling
+===========
+Purpose
+-------
+Coerces data received from the host, whether returned by a function or passed to one of the
+script's, into equivalent, Prismscript-compatible formats, through a registry of converters, keyed
+by exact type, that every `Interpreter` shares.
+
+Notes
+-----
+A converter takes a value and provides what the script receives in its place. `identity` hands a
+value over as it is, without copying it, as is done for numbers, booleans, and the language's own
+types; embedders may register it, or any converter of their own, for types like ``bytes``,
+``array.array``, or ``numpy.ndarray``, through `register_converter()`.
+
+A type for which nothing has been registered is classified once, the first time one of its values
+is seen, against the ``collections`` ABCs: strings become `String`s, and sequences, mappings, and
+sets are viewed in place, as `LazySequence`, `LazyDictionary`, and `LazySet`; anything else is
+handed over as it is. The verdict is remembered, so every later value of the type is converted with
+a single lookup. A type registered with an ABC only after its values have been seen is not
+reclassified; register a converter for it instead.
+
+Old-style instances share a single type, whatever their class, so they are classified every time.
+
+Views are the script's alone: whatever goes back to the host, as the arguments of anything but the
+language's own methods or as the value of a ``return`` or ``exit`` that ends a run, is first
+`materialize()`d, so the host always receives the `Sequence`, `Dictionary`, or `Set` that a view
+stands in for, which are the built-in types' subclasses.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import collections
+import types
+
+#Python 2.x/3.x compatibility
+try: #'long' was replaced by 'int' in py3k
+    long
+except NameError: #Make them aliases
+    long = int
+try: #StringTypes were unified in py3k
+    types.StringTypes
+except AttributeError:
+    types.StringTypes = (str,)
+_INSTANCE = getattr(types, 'InstanceType', None) #Shared by every old-style instance, whatever its class
+
+from .grammar.parser import (
+ Dictionary, Set, Sequence, String,
+ LazyDictionary, LazySet, LazySequence,
+)
+
+_converters = {} #Every type's converter, whether built in, registered, or classified, by exact type
+
+def identity(value):
+    """
+    Hands `value` over to the script as it is, without copying it.
+    """
+    return value
+
+def _view_sequence(value):
+    return LazySequence(value, marshall)
+
+def _view_mapping(value):
+    return LazyDictionary(value, marshall)
+
+def _view_set(value):
+    return LazySet(value, marshall)
+
+def _classify(data):
+    """
+    Converts `data`, a value of a type with no known converter, remembering the converter that
+    the ABCs call for.
+    """
+    if isinstance(data, types.StringTypes):
+        converter = String
+    elif isinstance(data, collections.Sequence):
+        converter = _view_sequence
+    elif isinstance(data, collections.Mapping):
+        converter = _view_mapping
+    elif isinstance(data, collections.Set):
+        converter = _view_set
+    else:
+        converter = identity
+    kind = type(data)
+    if not kind is _INSTANCE:
+        _converters[kind] = converter
+    return converter(data)
+
+def marshall(data):
+    """
+    Provides `data`, received from the host, in a Prismscript-compatible format.
+    """
+    converter = _converters.get(type(data), _classify)
+    if converter is identity:
+        return data
+    return converter(data)
+
+def materialize(value, _seen=None):
+    """
+    Provides `value` as it is to be handed back to the host: a view is replaced by the mutable copy
+    that its first write would make, and so is every view nested within it, or within a `Sequence`
+    or `Dictionary`, which are changed in place. A view shares its copy from then on, so the script
+    sees no difference.
+    """
+    kind = type(value)
+    if kind in _VIEWS:
+        value = value._write()
+        kind = type(value)
+    if kind is Sequence or kind is Dictionary:
+        if _seen is None:
+            _seen = set()
+        elif id(value) in _seen: #A container that holds itself
+            return value
+        _seen.add(id(value))
+        if kind is Sequence:
+            elements = enumerate(value)
+        else:
+            elements = list(value.items())
+        for (key, element) in elements:
+            if type(element) in _NESTING:
+                materialized = materialize(element, _seen)
+                if not materialized is element:
+                    value[key] = materialized
+    return value
+
+def materialize_arguments(function, arguments):
+    """
+    Provides `arguments`, a dictionary of values by parameter-name, as they are to be passed to
+    `function`, with each value `materialize()`d in place, unless `function` is a method of one of
+    the language's own values, which takes views as they are.
+    """
+    if not type(getattr(function, '__self__', None)) in _LANGUAGE:
+        for (parameter, value) in arguments.items():
+            if type(value) in _NESTING:
+                arguments[parameter] = materialize(value)
+    return arguments
+
+def register_converter(kind, converter):
+    """
+    Has every `Interpreter` convert values whose exact type is `kind` with `converter`, which takes
+    the value and provides what the script receives in its place; `identity` hands the value over
+    as it is.
+
+    Subclasses of `kind` are unaffected.
+    """
+    _converters[kind] = converter
+
+def unregister_converter(kind):
+    """
+    Has every `Interpreter` convert values whose exact type is `kind` as though no converter had
+    been registered for it.
+    """
+    converter = _BUILT_IN.get(kind)
+    if converter is None: #Classified again when next seen
+        _converters.pop(kind, None)
+    else:
+        _converters[kind] = converter
+
+_BUILT_IN = dict( #Converters known from the start, by exact type
+ [(kind, identity) for kind in (
+  type(None), bool, int, long, float,
+  String, Sequence, Dictionary, Set,
+  LazySequence, LazyDictionary, LazySet,
+ )] +
+ [(kind, String) for kind in types.StringTypes] +
+ [(kind, _view_sequence) for kind in (list, tuple)] +
+ [(dict, _view_mapping)] +
+ [(kind, _view_set) for kind in (set, frozenset)]
+)
+_converters.update(_BUILT_IN)
+
+_VIEWS = frozenset((LazySequence, LazyDictionary, LazySet)) #Replaced by what they stand in for
+_NESTING = _VIEWS.union((Sequence, Dictionary)) #What may hold a view
+_LANGUAGE = _NESTING.union((String, Set)) #The language's own values, whose methods take views
@@ -0,0 +1,178 @@
+"""
+operations
+==========
+Purpose
+-------
+Defines the language's arithmetic, comparison, and augmented-assignment operators on
+already-resolved values, so that everything that needs to apply them, whether at run-time or ahead
+of it, does so identically.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import math
+import operator
+import types
+
+#Python 2.x/3.x compatibility
+try: #StringTypes were unified in py3k
+    types.StringTypes
+except AttributeError:
+    types.StringTypes = (str,)
+
+from .grammar import parser
+from .grammar.parser import Sequence, LazySequence
+
+_SEQUENCES = (Sequence, LazySequence) #Concatenated into a new Sequence
+
+def _add(left, right):
+    if isinstance(left, types.StringTypes) or isinstance(right, types.StringTypes): #Special handling for strings
+        return ''.join((str(left), str(right)))
+    elif type(left) in _SEQUENCES and type(right) in _SEQUENCES: #Special handling for sequences
+        return Sequence(left + right)
+    return left + right
+
+def _divide(left, right):
+    return left / float(right)
+
+def _divide_integer(left, right):
+    return int(left // right)
+
+def _mod(left, right):
+    if type(left) == float or type(right) == float:
+        return math.fmod(left, right)
+    return left % right
+
+_COMPUTATIONS = {
+ parser.MATH_ADD: _add,
+ parser.MATH_SUBTRACT: operator.sub,
+ parser.MATH_MULTIPLY: operator.mul,
+ parser.MATH_DIVIDE: _divide,
+ parser.MATH_DIVIDE_INTEGER: _divide_integer,
+ parser.MATH_MOD: _mod,
+ parser.MATH_EXPONENTIATE: math.pow,
+}
+_COMPARISONS = {
+ parser.TEST_EQUALITY: operator.eq,
+ parser.TEST_INEQUALITY: operator.ne,
+ parser.TEST_GREATER_EQUAL: operator.ge,
+ parser.TEST_GREATER: operator.gt,
+ parser.TEST_LESSER_EQUAL: operator.le,
+ parser.TEST_LESSER: operator.lt,
+}
+
+def _augment_add(scope, name, value):
+    if isinstance(scope[name], types.StringTypes) or isinstance(value, types.StringTypes): #Special handling for strings
+        scope[name] = ''.join((str(scope[name]), str(value)))
+    elif type(scope[name]) in _SEQUENCES and type(value) in _SEQUENCES: #Special handling for sequences
+        scope[name] = Sequence(scope[name] + value)
+    else:
+        scope[name] += value
+
+def _augment_subtract(scope, name, value):
+    scope[name] -= value
+
+def _augment_multiply(scope, name, value):
+    scope[name] *= value
+
+def _augment_divide(scope, name, value):
+    scope[name] /= float(value)
+
+def _augment_divide_integer(scope, name, value):
+    scope[name] //= value
+    scope[name] = int(scope[name])
+
+def _augment_mod(scope, name, value):
+    if type(scope[name]) == float or type(value) == float:
+        scope[name] = math.fmod(scope[name], value)
+    else:
+        scope[name] %= value
+
+def _augment_exponentiate(scope, name, value):
+    scope[name] = math.pow(scope[name], value)
+
+_AUGMENTATIONS = {
+ parser.ASSIGN_ADD: _augment_add,
+ parser.ASSIGN_SUBTRACT: _augment_subtract,
+ parser.ASSIGN_MULTIPLY: _augment_multiply,
+ parser.ASSIGN_DIVIDE: _augment_divide,
+ parser.ASSIGN_DIVIDE_INTEGER: _augment_divide_integer,
+ parser.ASSIGN_MOD: _augment_mod,
+ parser.ASSIGN_EXPONENTIATE: _augment_exponentiate,
+}
+
+def augment(method, scope, name, value):
+    """
+    Merges `value` into the variable `name`, held in the dictionary `scope`, through the augmented
+    assignment identified by `method`.
+
+    Merges happen in place wherever the existing value supports it, exactly as with Python's own
+    augmented assignments, except that strings are concatenated as by `compute()`.
+    """
+    get_augmentation(method)(scope, name, value)
+
+def compute(method, left, right):
+    """
+    Applies the mathematic operation identified by `method` to `left` and `right`.
+
+    Strings can be concatenated through addition: if either value is a string, the other is
+    converted appropriately. Division always produces a float, integer-division always produces an
+    int, and exponentiation always goes through `math.pow`.
+    """
+    return get_computation(method)(left, right)
+
+def compare(method, left, right):
+    """
+    Applies the non-boolean test identified by `method` to `left` and `right`, providing a bool.
+
+    Boolean tests are not handled here, since they need to be able to avoid resolving their
+    right-hand side.
+    """
+    return get_comparison(method)(left, right)
+
+def get_computation(method):
+    """
+    Provides the function that `compute()` applies for `method`, taking ``(left, right)``, so that
+    callers which know the operation ahead of time can resolve it once.
+    """
+    computation = _COMPUTATIONS.get(method)
+    if computation is None:
+        raise ValueError("Unknown mathematic operation: %(method)r" % {
+         'method': method,
+        })
+    return computation
+
+def get_augmentation(method):
+    """
+    Provides the function that `augment()` applies for `method`, taking ``(scope, name, value)``,
+    so that callers which know the assignment ahead of time can resolve it once.
+    """
+    augmentation = _AUGMENTATIONS.get(method)
+    if augmentation is None:
+        raise ValueError("Unknown augmented assignment: %(method)r" % {
+         'method': method,
+        })
+    return augmentation
+
+def get_comparison(method):
+    """
+    Provides the function that `compare()` applies for `method`, taking ``(left, right)``, so that
+    callers which know the test ahead of time can resolve it once.
+    """
+    comparison = _COMPARISONS.get(method)
+    if comparison is None:
+        raise ValueError("Unknown test: %(method)r" % {
+         'method': method,
+        })
+    return comparison
+
@@ -0,0 +1,288 @@
+"""
+optimizer
+=========
+Purpose
+-------
+Rewrites digested scripts before they are handed to the interpreter, so that work which would
+produce the same result on every pass is done once, ahead of time.
+
+Constant arithmetic, comparisons, boolean tests, negations, and string-concatenations are folded
+into terms, and sequence-literals made up entirely of terms are prebuilt, so that evaluating one
+only copies it, rather than evaluating each of its elements. Conditional branches that can never be
+taken, ``while``-loops that can never be entered, ``for``-loops over empty literals, and
+expressions whose values are discarded without any side-effects are removed.
+
+`never_yields()` identifies expressions that can never reach a function, which the engines may
+evaluate without the coroutine protocol.
+
+Notes
+-----
+Folding applies `operations`, exactly as the interpreter would, so results are identical, down to
+their types; anything that would raise an exception, or that would produce a sequence, is left to be
+evaluated at run-time, where its behaviour is unchanged.
+
+Prebuilt sequences are held as tuples, in ``SEQUENCE_CONSTANT`` expressions, and every evaluation
+provides a new `Sequence` copied from one, so scripts still receive distinct, mutable objects.
+Sequences that are the targets of unpacking or ``for``-loops are never prebuilt.
+
+Trees are never modified in place, since the parser's cache may share them with other consumers;
+new ones are built instead.
+
+A statement that is removed from its body is replaced by a ``None`` term, evaluated and discarded
+like any other, unless nothing follows it, so that every statement keeps its position and
+`ExecutionError`s report the same locations as they would for the source.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import types
+
+#Python 2.x/3.x compatibility
+try: #'long' was replaced by 'int' in py3k
+    long
+except NameError: #Make them aliases
+    long = int
+try: #StringTypes were unified in py3k
+    types.StringTypes
+except AttributeError:
+    types.StringTypes = (str,)
+
+from . import operations
+from .grammar import parser
+
+MAX_FOLDED_LENGTH = 4096 #: The longest string that folding may produce; longer ones are left alone.
+
+_CONSTANTS = frozenset((
+ parser.TERM_NONE, parser.TERM_BOOL, parser.TERM_STRING, parser.TERM_INTEGER, parser.TERM_FLOAT,
+))
+_PURE = _CONSTANTS.union((parser.SEQUENCE_CONSTANT,)) #Expressions whose evaluation has no effects
+_MATHS = frozenset((
+ parser.MATH_EXPONENTIATE, parser.MATH_MULTIPLY, parser.MATH_DIVIDE, parser.MATH_DIVIDE_INTEGER,
+ parser.MATH_ADD, parser.MATH_SUBTRACT, parser.MATH_MOD,
+))
+_TESTS = frozenset((
+ parser.TEST_EQUALITY, parser.TEST_INEQUALITY,
+ parser.TEST_GREATER_EQUAL, parser.TEST_GREATER, parser.TEST_LESSER_EQUAL, parser.TEST_LESSER,
+))
+_CALLS = frozenset((parser.FUNCTIONCALL_LOCAL, parser.FUNCTIONCALL_SCOPED))
+_PLACEHOLDER = (parser.TERM_NONE, None) #Stands in for a removed statement, so the next keeps its position
+_ASSIGNMENTS = frozenset((
+ parser.ASSIGN, parser.ASSIGN_ADD, parser.ASSIGN_SUBTRACT, parser.ASSIGN_EXPONENTIATE,
+ parser.ASSIGN_MULTIPLY, parser.ASSIGN_DIVIDE, parser.ASSIGN_DIVIDE_INTEGER, parser.ASSIGN_MOD,
+ parser.ASSIGN_SEQUENCE,
+))
+
+def optimize(digest):
+    """
+    Provides an optimised copy of `digest`, a (``nodes``, ``functions``) tuple, as produced by
+    `parser.parse()`.
+    """
+    (nodes, functions) = digest
+    return (
+     dict((name, optimize_statements(statements)) for (name, statements) in nodes.items()),
+     dict((signature, optimize_statements(statements)) for (signature, statements) in functions.items()),
+    )
+
+def optimize_statements(statements):
+    """
+    Provides an optimised copy of the statement-list `statements`, in which every statement that
+    remains has the same position as in the original.
+    """
+    optimized = []
+    removed = 0 #Statements removed since the last that was kept, which only trail it if none follow
+    for statement in statements:
+        statement = _optimize_statement(statement)
+        if statement is None:
+            removed += 1
+        else:
+            optimized.extend([_PLACEHOLDER] * removed)
+            removed = 0
+            optimized.append(statement)
+    return optimized
+
+def fold(expression):
+    """
+    Provides a copy of `expression` in which every constant sub-expression has been replaced by a
+    term.
+    """
+    expression_type = expression[0]
+    if expression_type in _MATHS:
+        left = fold(expression[1])
+        right = fold(expression[2])
+        if left[0] in _CONSTANTS and right[0] in _CONSTANTS:
+            term = _fold_operation(operations.compute, expression_type, left[1], right[1])
+            if term is not None:
+                return term
+        return (expression_type, left, right)
+    elif expression_type in _TESTS:
+        left = fold(expression[1])
+        right = fold(expression[2])
+        if left[0] in _CONSTANTS and right[0] in _CONSTANTS:
+            term = _fold_operation(operations.compare, expression_type, left[1], right[1])
+            if term is not None:
+                return term
+        return (expression_type, left, right)
+    elif expression_type in (parser.TEST_BOOL_OR, parser.TEST_BOOL_AND):
+        left = fold(expression[1])
+        right = fold(expression[2])
+        if left[0] in _PURE: #The outcome is either the left term or whatever the right provides
+            if bool(left[1]) == (expression_type == parser.TEST_BOOL_OR):
+                return left
+            return right
+        return (expression_type, left, right)
+    elif expression_type == parser.TEST_NEGATE:
+        operand = fold(expression[1])
+        if operand[0] in _PURE:
+            return (parser.TERM_BOOL, not operand[1])
+        return (expression_type, operand)
+    elif expression_type in (parser.FUNCTIONCALL_LOCAL, parser.FUNCTIONCALL_SCOPED):
+        return (expression_type, expression[1], _fold_arguments(expression[2]))
+    elif expression_type == parser.SUFFIX:
+        suffix = expression[2]
+        if suffix[0] == parser.FUNCTIONCALL_SUFFIX:
+            suffix = (suffix[0], suffix[1], _fold_arguments(suffix[2]))
+        return (expression_type, fold(expression[1]), suffix)
+    elif expression_type == parser.SEQUENCE:
+        elements = [fold(element) for element in expression[1]]
+        for element in elements:
+            if not element[0] in _CONSTANTS:
+                return (expression_type, elements)
+        return (parser.SEQUENCE_CONSTANT, tuple(element[1] for element in elements))
+    return expression
+
+def never_yields(expression):
+    """
+    Indicates whether evaluating `expression` can never reach a function, and so can never reach a
+    coroutine that prompts, making it safe to evaluate without the coroutine protocol.
+    """
+    expression_type = expression[0]
+    if expression_type in _CALLS:
+        return False
+    elif expression_type in _MATHS or expression_type in _TESTS or expression_type in (parser.TEST_BOOL_OR, parser.TEST_BOOL_AND):
+        return never_yields(expression[1]) and never_yields(expression[2])
+    elif expression_type == parser.TEST_NEGATE:
+        return never_yields(expression[1])
+    elif expression_type == parser.SUFFIX:
+        return expression[2][0] != parser.FUNCTIONCALL_SUFFIX and never_yields(expression[1])
+    elif expression_type == parser.SEQUENCE:
+        return not False in [never_yields(element) for element in expression[1]]
+    return True
+
+def _fold_arguments(arguments):
+    return dict((name, fold(expression)) for (name, expression) in arguments.items())
+
+def _fold_operation(operation, method, left, right):
+    """
+    Applies `operation` to the constant values `left` and `right`, providing the result as a term,
+    or ``None`` if it cannot be folded.
+    """
+    if method == parser.MATH_MULTIPLY: #Don't let string-repetition bloat the tree
+        for (string, count) in ((left, right), (right, left)):
+            if isinstance(string, types.StringTypes) and type(count) in (bool, int, long) and len(string) * count > MAX_FOLDED_LENGTH:
+                return None
+    try:
+        value = operation(method, left, right)
+    except Exception: #Leave it to fail at run-time, where it can be reported properly
+        return None
+    return _make_term(value)
+
+def _make_term(value):
+    """
+    Provides a term that evaluates to `value`, or ``None`` if there is no such term.
+    """
+    value_type = type(value)
+    if value is None:
+        return (parser.TERM_NONE, None)
+    elif value_type == bool:
+        return (parser.TERM_BOOL, value)
+    elif value_type in (int, long):
+        return (parser.TERM_INTEGER, value)
+    elif value_type == float:
+        return (parser.TERM_FLOAT, value)
+    elif isinstance(value, types.StringTypes) and len(value) <= MAX_FOLDED_LENGTH:
+        return (parser.TERM_STRING, value)
+    return None
+
+def _is_constant_false(expression):
+    return expression[0] in _PURE and not expression[1]
+
+def _optimize_statement(statement):
+    """
+    Provides an optimised copy of `statement`, or ``None`` if it has no effect.
+    """
+    statement_type = statement[0]
+    if statement_type in _ASSIGNMENTS:
+        return (statement_type, statement[1], fold(statement[2]))
+    elif statement_type in (parser.STMT_RETURN, parser.STMT_EXIT):
+        return (statement_type, fold(statement[1]))
+    elif statement_type in (parser.STMT_GOTO, parser.STMT_BREAK, parser.STMT_CONTINUE):
+        return statement
+    elif statement_type == parser.COND_IF:
+        return _optimize_conditional(statement)
+    elif statement_type == parser.COND_WHILE:
+        condition = fold(statement[1])
+        if _is_constant_false(condition):
+            return None
+        return (statement_type, condition, optimize_statements(statement[2]))
+    elif statement_type == parser.COND_FOR:
+        iterable = fold(statement[2])
+        if iterable[0] in (parser.SEQUENCE_CONSTANT, parser.TERM_STRING) and not iterable[1]: #Nothing to iterate over
+            return None
+        return (statement_type, statement[1], iterable, optimize_statements(statement[3]))
+
+    #An expression, evaluated only for its side-effects
+    expression = fold(statement)
+    if expression[0] in _PURE:
+        return None
+    return expression
+
+def _optimize_conditional(statement):
+    """
+    Provides an optimised copy of the ``if``-statement `statement`, without any branches that can
+    never be taken, or ``None`` if none of its branches can have any effect.
+    """
+    branches = [] #(condition, statements) pairs, where a condition of None always holds
+    for (i, branch) in enumerate(statement[1:]):
+        if i == 0:
+            (condition, statements) = branch
+        elif branch[0] == parser.COND_ELIF:
+            (condition, statements) = branch[1:]
+        else:
+            (condition, statements) = (None, branch[1])
+
+        if condition is not None:
+            condition = fold(condition)
+            if condition[0] in _PURE:
+                if not condition[1]: #Never taken
+                    continue
+                condition = None
+        branches.append((condition, optimize_statements(statements)))
+        if condition is None: #Nothing beyond this branch can be reached
+            break
+
+    if branches and branches[-1][0] is None and not branches[-1][1]: #Taking it would do nothing
+        branches.pop()
+    if not branches:
+        return None
+
+    (condition, statements) = branches[0]
+    if condition is None:
+        condition = (parser.TERM_BOOL, True)
+    conditional = [parser.COND_IF, (condition, statements)]
+    for (condition, statements) in branches[1:]:
+        if condition is None:
+            conditional.append((parser.COND_ELSE, statements))
+        else:
+            conditional.append((parser.COND_ELIF, condition, statements))
+    return conditional
+
@@ -0,0 +1,106 @@
+"""
+sites
+=====
+Purpose
+-------
+Provides the inline caches that every engine keeps at each site in a script that names a scoped
+identifier, like ``panel.input``, the attributes of a suffix, like ``x.keys``, or a function of the
+script itself, like ``count(n=1)``, so that what never changes between one execution of the site and
+the next is worked out only once.
+
+Notes
+-----
+A `Site` holds its identifier already split into its root and attribute-path, the scoped function
+registered under the identifier, if any, and, for each type of value it has called, whether values
+of that type can be called at all. Nothing that depends on the state of a particular value, like
+the attributes themselves, is cached, since any of them may change at any time.
+
+The registered function is stamped with the generation of the registry from which it came. Every
+change to any interpreter's registry takes a new generation from a single, process-wide counter, so
+a site shared by several interpreters, as in the modules generated by the ``python`` engine, never
+mistakes one registry for another, and a site never outlives a change to its own.
+
+A `CallSite`, which calls a function of the script, is bound the same way to the compiled body of
+the function it calls, stamped with the generation of the namespace, which changes whenever the
+namespace is extended, so a call is linked to its function once, rather than looked up every time.
+It describes itself, as ``name(a, b)``, only when an error or the log needs it to.
+
+A site remembers the verdicts of only a few types; one that sees more than that, like a site in a
+generic helper-function, simply works each verdict out again, every time, as though it had no cache.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import collections
+import itertools
+import types
+
+from . import log
+
+#Python 2.x/3.x compatibility
+_INSTANCE = getattr(types, 'InstanceType', None) #Shared by every old-style instance, whatever its class
+
+_POLYMORPHISM = 4 #The number of types for which a site remembers its verdicts
+
+_generations = itertools.count(1)
+
+def next_generation():
+    """
+    Provides a generation, for a registry that has just changed, that no other has ever had.
+    """
+    return next(_generations)
+
+class Site:
+    """
+    The inline cache of one site in a script.
+    """
+    identifier = None #The identifier, as written
+    elements = None #Every element of the identifier, in order
+    root = None #The first element, which names a variable or begins a registered function's name
+    path = None #The elements after the root
+    binding = (0, None) #The generation of a registry and the function it registers under `identifier`
+    _callable = None #Whether values of each type may be called, by type
+
+    def __init__(self, identifier):
+        self.identifier = identifier
+        self.elements = tuple(identifier.split('.'))
+        self.root = self.elements[0]
+        self.path = self.elements[1:]
+        self._callable = {}
+
+    def is_callable(self, value):
+        """
+        Indicates whether `value` can be called, as a ``collections.Callable``.
+        """
+        kind = type(value)
+        verdict = self._callable.get(kind)
+        if verdict is None:
+            verdict = isinstance(value, collections.Callable)
+            if not kind is _INSTANCE and len(self._callable) < _POLYMORPHISM:
+                self._callable[kind] = verdict
+        return verdict
+
+class CallSite(Site):
+    """
+    The inline cache of one call to a function of the script, whose `binding` is to the compiled
+    body of that function, by the generation of the namespace from which it came.
+    """
+    name = None #The name of the function
+    signature = None #The (name, parameters) under which the namespace holds the function
+    call = None #A `log.Call` that describes the call, as ``name(a, b)``, when formatted
+
+    def __init__(self, name, parameters):
+        Site.__init__(self, name)
+        self.name = name
+        self.signature = (name, frozenset(parameters))
+        self.call = log.Call(name, parameters)
@@ -32,6 +32,12 @@ from grammar.tests import primitive
 from grammar.tests import structure
 from grammar.tests import expressions
 from grammar.tests import realistic
+from grammar.tests import caching
+from grammar.tests import concurrency
+from grammar.tests import tables
+from grammar.tests import backends
+from grammar.tests import incremental
+from grammar.tests import lexing
 
 if __name__ == '__main__':
     all_tests = unittest.TestSuite((
@@ -60,6 +66,14 @@ if __name__ == '__main__':
      unittest.TestSuite((
       unittest.TestLoader().loadTestsFromTestCase(realistic.TheoreticalTestCase),
      )),
+     unittest.TestSuite((
+      unittest.TestLoader().loadTestsFromTestCase(caching.CacheTestCase),
+      unittest.TestLoader().loadTestsFromTestCase(concurrency.ThreadedTestCase),
+      unittest.TestLoader().loadTestsFromTestCase(tables.TablesTestCase),
+      unittest.TestLoader().loadTestsFromTestCase(backends.BackendTestCase),
+      unittest.TestLoader().loadTestsFromTestCase(incremental.IncrementalTestCase),
+      unittest.TestLoader().loadTestsFromTestCase(lexing.LexingTestCase),
+     )),
     ))
     unittest.TextTestRunner().run(all_tests)
     
@@ -25,15 +25,35 @@ from ..interpreter import (
  StatementReturn, StatementExit,
 )
 
+_engine = interpreter.ENGINE_TREE #The engine with which interpreters are constructed
+
 #Data-access functions
 ######################
 def get_interpreter(name):
     """
-    Provides an interpreter instance, with source identified by ``name``.
+    Provides an interpreter instance, with source identified by ``name``, running on the engine
+    selected through `set_engine()`.
     """
     return interpreter.Interpreter(open('processor/test_sources/%(name)s.src' % {
      'name': name,
-    }).read())
+    }).read(), engine=_engine)
+    
+def get_program(name, functions=()):
+    """
+    Provides a program, with source identified by ``name`` and the given scoped `functions`, whose
+    interpreters run on the engine selected through `set_engine()`.
+    """
+    return interpreter.Program(open('processor/test_sources/%(name)s.src' % {
+     'name': name,
+    }).read(), functions=functions, engine=_engine)
+    
+def set_engine(engine):
+    """
+    Selects the `engine` with which `get_interpreter()` and `get_program()` construct interpreters,
+    so that the same tests can be run against each of them.
+    """
+    global _engine
+    _engine = engine
 
 def execute_no_yield(generator):
     """
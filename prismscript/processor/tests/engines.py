@@ -0,0 +1,306 @@
+"""
+tests.engines
+=============
+Purpose
+-------
+Offers support for testing that every execution engine behaves exactly like the reference engine.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from .. import bytecode
+from .. import interpreter
+from .. import transpiler
+from ..grammar import parser
+from ..errors import ExecutionError
+from . import (
+ get_interpreter, execute_no_yield,
+ StatementReturn, StatementExit,
+)
+import stdlib
+import discover_functions
+
+_SOURCES = ('conditionals', 'expressions', 'nodes', 'nodes_exit',) #Everything that runs without arguments
+_NONDETERMINISTIC = frozenset(('sequence_shuffle',))
+
+_PROMPTING_SCRIPT = """
+prompting{
+    total = 0;
+    while(total < 10){
+        if(test.ask(question='more?') && total >= 0){
+            total += 2 * test.ask(question='how many?') + 1;
+        }else{
+            break;
+        }
+    }
+    answers = [total, test.ask(question='done?')];
+    exit total;
+}
+"""
+
+_RECURSIVE_SCRIPT = """
+count(n){
+    if(n > 0){
+        if(n == 1){
+            test.ask(question='bottom?');
+        }
+        return count(n=n - 1) + 1;
+    }
+    return 0;
+}
+"""
+
+_BRANCHING_SCRIPT = """
+branching{
+    x = 1;
+    if(x > 1){
+        exit 'if';
+    }elif(test.ask(question='elif?')){
+        exit 'elif';
+    }else{
+        exit 'else';
+    }
+}
+"""
+
+_FAILING_SCRIPT = """
+failing{
+    x = 0;
+    while(x < 3){
+        x += 1;
+        if(x == 2){
+            y = 1 / (x - 2);
+        }
+    }
+}
+"""
+
+_SLOTTED_SCRIPT = """
+slotted(a){
+    b = a + g;
+    [c, d] = [b, None];
+    e = c / 0;
+}
+"""
+
+def _ask(question):
+    answer = yield question
+    raise StatementReturn(answer)
+
+def _run(interpreter, kind, name):
+    """
+    Executes the named node or argument-free function, providing a description of its outcome.
+    """
+    if kind == 'node':
+        generator = interpreter.execute_node(name)
+    else:
+        generator = interpreter.execute_function(name, {})
+    try:
+        for prompt in generator:
+            generator.send(None)
+    except (StatementReturn, StatementExit) as e:
+        return (e.__class__.__name__, e.value)
+    except ExecutionError as e:
+        return ('ExecutionError', e.location_path)
+    except Exception as e:
+        return (e.__class__.__name__,)
+    return None
+
+class EngineTestCase(unittest.TestCase):
+    def _build(self, name, engine):
+        if engine is None: #The engine selected for the test-run
+            instance = get_interpreter(name)
+        else:
+            instance = interpreter.Interpreter(open('processor/test_sources/%(name)s.src' % {
+             'name': name,
+            }).read(), engine=engine)
+        instance.register_scoped_functions(discover_functions.scan(stdlib, ''))
+        instance.register_scoped_functions([('test.test', lambda: 82)])
+        return instance
+
+    def test_equivalence(self):
+        for name in _SOURCES:
+            reference = self._build(name, interpreter.ENGINE_TREE)
+            candidate = self._build(name, None)
+            entry_points = [('node', node) for node in sorted(reference.list_nodes())]
+            entry_points.extend(sorted(
+             ('function', function) for (function, parameters) in reference.list_functions()
+             if not parameters and not function in _NONDETERMINISTIC
+            ))
+            for (kind, entry_point) in entry_points:
+                self.assertEquals(
+                 _run(candidate, kind, entry_point), _run(reference, kind, entry_point),
+                 "%(kind)s '%(name)s' in %(source)s behaved differently" % {
+                  'kind': kind,
+                  'name': entry_point,
+                  'source': name,
+                 }
+                )
+            self.assertEquals(candidate.get_log(), reference.get_log())
+
+    def test_prompts(self):
+        answers = {'more?': True, 'how many?': 2, 'done?': None}
+        instance = get_interpreter('nodes')
+        instance.extend_namespace(_PROMPTING_SCRIPT)
+        instance.register_scoped_functions([('test.ask', _ask)])
+        generator = instance.execute_node('prompting')
+        prompts = []
+        try:
+            prompt = next(generator)
+            while True:
+                prompts.append(prompt)
+                prompt = generator.send(answers[prompt])
+        except StatementExit as e:
+            self.assertEquals(e.value, 10)
+        else:
+            self.fail("StatementExit not received")
+        self.assertEquals(prompts, ['more?', 'how many?'] * 2 + ['done?'])
+
+    def test_deep_recursion(self):
+        depth = sys.getrecursionlimit() * 2 #Far deeper than nested generators could go
+        instance = get_interpreter('nodes')
+        instance.extend_namespace(_RECURSIVE_SCRIPT)
+        instance.register_scoped_functions([('test.ask', _ask)])
+        generator = instance.execute_function('count', {'n': depth})
+        self.assertEquals(next(generator), 'bottom?')
+        try:
+            generator.send(True)
+        except StatementReturn as e:
+            self.assertEquals(e.value, depth)
+        else:
+            self.fail("StatementReturn not received")
+
+    def test_error_location(self):
+        locations = []
+        for engine in (interpreter.ENGINE_TREE, None):
+            instance = self._build('nodes', engine)
+            instance.extend_namespace(_FAILING_SCRIPT)
+            locations.append(_run(instance, 'node', 'failing'))
+        self.assertEquals(locations[0], ('ExecutionError', ['failing', '2', '2', '1']))
+        self.assertEquals(locations[1], locations[0])
+
+    def test_recompilation(self):
+        instance = get_interpreter('nodes_exit')
+        self.assertEquals(_run(instance, 'node', 'n_exit'), ('StatementExit', 'test'))
+        instance.extend_namespace("n_exit{\n    exit 'changed';\n}\n")
+        self.assertEquals(_run(instance, 'node', 'n_exit'), ('StatementExit', 'changed'))
+
+    def test_unknown_engine(self):
+        self.assertRaises(ValueError, interpreter.Interpreter, 'node{}', engine='unknown')
+
+
+class ReferenceTestCase(unittest.TestCase):
+    def test_deep_prompts(self):
+        depth = 50
+        instance = interpreter.Interpreter(_RECURSIVE_SCRIPT, engine=interpreter.ENGINE_TREE)
+        instance.register_scoped_functions([('test.ask', _ask)])
+        generator = instance.execute_function('count', {'n': depth})
+        self.assertEquals(next(generator), 'bottom?')
+        try:
+            generator.send(True)
+        except StatementReturn as e:
+            self.assertEquals(e.value, depth)
+        else:
+            self.fail("StatementReturn not received")
+            
+    def test_thrown_prompt_errors(self):
+        def ask(question):
+            try:
+                yield question
+            except KeyError:
+                raise StatementReturn('recovered')
+        instance = interpreter.Interpreter(_RECURSIVE_SCRIPT, engine=interpreter.ENGINE_TREE)
+        instance.register_scoped_functions([('test.ask', ask)])
+        generator = instance.execute_function('count', {'n': 3})
+        self.assertEquals(next(generator), 'bottom?')
+        try: #Raised by the prompting coroutine, not at the top of the stack
+            generator.throw(KeyError('bottom?'))
+        except StatementReturn as e:
+            self.assertEquals(e.value, 3)
+        else:
+            self.fail("StatementReturn not received")
+
+    def test_yielding_branches(self):
+        instance = interpreter.Interpreter(_BRANCHING_SCRIPT, engine=interpreter.ENGINE_TREE)
+        instance.register_scoped_functions([('test.ask', _ask)])
+        for (answer, expected) in ((True, 'elif'), (False, 'else')):
+            generator = instance.execute_node('branching')
+            self.assertEquals(next(generator), 'elif?')
+            try:
+                generator.send(answer)
+            except StatementExit as e:
+                self.assertEquals(e.value, expected)
+            else:
+                self.fail("StatementExit not received")
+
+class TranspilerTestCase(unittest.TestCase):
+    def setUp(self):
+        self._cache_directory = transpiler.get_cache_directory()
+        self._directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        transpiler.set_cache_directory(self._cache_directory)
+        shutil.rmtree(self._directory)
+
+    def test_native_control_flow(self):
+        source = transpiler.generate(parser.parse(_FAILING_SCRIPT)[0]['failing'])
+        self.assertTrue("\n        while " in source)
+        self.assertTrue("\n            if " in source)
+        self.assertFalse("yield" in source) #Nothing in it can prompt
+
+        source = transpiler.generate(parser.parse(_PROMPTING_SCRIPT)[0]['prompting'])
+        self.assertTrue("yield" in source)
+
+    def test_cache_directory(self):
+        transpiler.set_cache_directory(self._directory)
+        script = "cached{\n    exit %(directory)r;\n}\n" % { #Unique, so nothing has compiled it yet
+         'directory': self._directory,
+        }
+        self.assertEquals(transpiler.compile_digest(parser.parse(script)), 1)
+        files = []
+        for (path, directories, names) in os.walk(self._directory):
+            files.extend(os.path.splitext(name)[1] for name in names)
+        expected = ['.py']
+        if not sys.dont_write_bytecode:
+            expected.append('.pyc')
+        self.assertEquals(sorted(files), expected)
+
+        instance = interpreter.Interpreter(script, optimize=False, engine=interpreter.ENGINE_PYTHON)
+        self.assertEquals(_run(instance, 'node', 'cached'), ('StatementExit', self._directory))
+
+class BytecodeTestCase(unittest.TestCase):
+    def test_frames(self):
+        code = bytecode.compile_statements(parser.parse(_RECURSIVE_SCRIPT)[1][('count', frozenset(('n',)))])
+        self.assertEquals(code.names, ('n', 'test.ask', 'count'))
+        self.assertEquals(len(code.instructions), len(code.positions))
+        self.assertEquals([opcode for (opcode, a, b, c, d) in code.instructions].count(bytecode.CALL_LOCAL), 1)
+
+    def test_slots(self):
+        code = bytecode.compile_statements(parser.parse(_SLOTTED_SCRIPT)[1][('slotted', frozenset(('a',)))], parameters=('a',))
+        self.assertEquals(code.names[:1], ('a',))
+        self.assertEquals(code.indices['c'], code.names.index('c'))
+
+        instance = interpreter.Interpreter(_SLOTTED_SCRIPT, engine=interpreter.ENGINE_BYTECODE)
+        instance.globals['g'] = 1 #Read through the unassigned slot of `g`
+        try:
+            execute_no_yield(instance.execute_function('slotted', {'a': 1}))
+        except ExecutionError as e: #Every assigned slot is reported by name
+            self.assertTrue("locals: [('a', 1), ('b', 2), ('c', 2), ('d', None)]" in e.message, e.message)
+        else:
+            self.fail("ExecutionError not received")
@@ -0,0 +1,144 @@
+"""
+tests.limits
+============
+Purpose
+-------
+Ensures that fuel, time, and depth limits stop runaway scripts, however they run away, and that
+they account for each run as a whole.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import time
+import unittest
+
+from . import (
+ get_interpreter, execute_no_yield,
+ StatementReturn, StatementExit,
+)
+from ..errors import (
+ ExecutionError,
+ FuelExhaustedError, DeadlineExceededError, DepthExceededError,
+)
+
+_SCRIPT = """
+counting{
+    i = 0;
+    while(i < 10){
+        i += 1;
+        if(i > 100){
+            exit 'never';
+        }
+    }
+    exit i;
+}
+skipping{
+    while(True){
+        continue;
+    }
+}
+recursing{
+    exit descend(n=0);
+}
+descend(n){
+    return descend(n=n + 1);
+}
+nesting{
+    exit nest(n=9);
+}
+nest(n){
+    if(n > 0){
+        return nest(n=n - 1) + 1;
+    }
+    return 0;
+}
+chaining{
+    goto chaining;
+}
+prompting{
+    exit test.ask(question='again?');
+}
+"""
+
+def _ask(question):
+    answer = yield question
+    raise StatementReturn(answer)
+
+class LimitTestCase(unittest.TestCase):
+    _interpreter = None
+
+    def setUp(self):
+        self._interpreter = get_interpreter('nodes')
+        self._interpreter.extend_namespace(_SCRIPT)
+        self._interpreter.register_scoped_functions([('test.ask', _ask)])
+
+    def _assertStopped(self, node, error):
+        try:
+            execute_no_yield(self._interpreter.execute_node(node))
+        except ExecutionError as e:
+            self.assertTrue(isinstance(e.base_exception, error), repr(e.base_exception))
+            self.assertEquals(e.message, str(e.base_exception)) #Reported as itself, wherever it was raised
+        else:
+            self.fail("ExecutionError not received")
+
+    def test_depth(self):
+        #Room for every call, from nest(n=9) to nest(n=0), in each of two runs, then no limit at all
+        for limit in (10, 10, 0):
+            self._interpreter.set_depth_limit(limit)
+            try:
+                execute_no_yield(self._interpreter.execute_node('nesting'))
+            except StatementExit as e:
+                self.assertEquals(e.value, 9)
+            else:
+                self.fail("StatementExit not received")
+
+        self._interpreter.set_depth_limit(9)
+        self._assertStopped('nesting', DepthExceededError)
+        self._interpreter.set_depth_limit(50)
+        self._assertStopped('recursing', DepthExceededError)
+
+    def test_fuel(self):
+        self._interpreter.set_fuel_limit(11) #The node's body, then each of ten iterations
+        for run in range(2): #Every run has its own fuel
+            try:
+                execute_no_yield(self._interpreter.execute_node('counting'))
+            except StatementExit as e:
+                self.assertEquals(e.value, 10)
+            else:
+                self.fail("StatementExit not received")
+
+        self._interpreter.set_fuel_limit(10)
+        self._assertStopped('counting', FuelExhaustedError)
+
+    def test_fuel_runaways(self):
+        self._interpreter.set_loop_limit(0)
+        self._interpreter.set_fuel_limit(50)
+        for node in ('skipping', 'recursing', 'chaining'):
+            self._assertStopped(node, FuelExhaustedError)
+
+    def test_time(self):
+        self._interpreter.set_loop_limit(0)
+        self._interpreter.set_time_limit(0.05)
+        self._assertStopped('skipping', DeadlineExceededError)
+
+    def test_time_excludes_prompts(self):
+        self._interpreter.set_time_limit(0.05)
+        generator = self._interpreter.execute_node('prompting')
+        self.assertEquals(next(generator), 'again?')
+        time.sleep(0.1)
+        try:
+            generator.send('answered')
+        except StatementExit as e:
+            self.assertEquals(e.value, 'answered')
+        else:
+            self.fail("StatementExit not received")
@@ -0,0 +1,90 @@
+"""
+tests.log
+=========
+Purpose
+-------
+Ensures that the execution log retains only its newest entries, honours its level, and formats
+nothing until it is read.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import unittest
+
+from . import (
+ execute_no_yield, get_interpreter,
+ StatementExit,
+)
+from .. import log
+
+_LOOPING_SCRIPT = """
+looping{
+    while(True){
+    }
+}
+"""
+
+class LogTestCase(unittest.TestCase):
+    def test_capacity(self):
+        entries = log.Log(capacity=3)
+        for i in range(5):
+            entries.debug("entry %i", i)
+        self.assertEquals(entries.get_entries(), ['entry 2', 'entry 3', 'entry 4'])
+        entries.set_capacity(2)
+        self.assertEquals(entries.get_capacity(), 2)
+        self.assertEquals(entries.get_entries(), ['entry 3', 'entry 4'])
+
+    def test_levels(self):
+        entries = log.Log(level=log.INFO)
+        entries.debug("debug")
+        entries.info("info")
+        entries.warning("warning")
+        self.assertEquals(entries.get_entries(), ['info', 'warning'])
+        self.assertEquals(entries.get_entries(log.WARNING), ['warning'])
+
+        entries.set_level(log.OFF)
+        entries.warning("silenced")
+        entries.set_level(log.DEBUG)
+        entries.debug("debug")
+        self.assertEquals(entries.get_entries(), ['info', 'warning', 'debug'])
+
+    def test_deferred_formatting(self):
+        formatted = []
+        class Described:
+            def __str__(self):
+                formatted.append(True)
+                return 'described'
+        entries = log.Log()
+        entries.debug("%s: %s", Described(), log.Call('f', {'b': 1, 'a': 2}))
+        entries.debug("100% literal")
+        self.assertEquals(formatted, [])
+        self.assertEquals(entries.get_entries(), ['described: f(a, b)', '100% literal'])
+
+    def test_interpreter_log(self):
+        instance = get_interpreter('nodes')
+        instance.extend_namespace(_LOOPING_SCRIPT)
+        instance.set_loop_limit(5)
+        instance.set_log_level(log.WARNING)
+        self.assertRaises(StatementExit, execute_no_yield, instance.execute_node('looping'))
+        self.assertEquals(instance.get_log(), ["Hard-breaking loop for exceeding iteration-limit of 5 cycles"])
+
+        instance.set_log_level(log.OFF)
+        self.assertRaises(StatementExit, execute_no_yield, instance.execute_node('looping'))
+        self.assertEquals(len(instance.get_log()), 1)
+
+        instance.set_log_level(log.DEBUG)
+        instance.set_log_capacity(2)
+        self.assertRaises(StatementExit, execute_no_yield, instance.execute_node('looping'))
+        self.assertEquals(instance.get_log(log.DEBUG), [
+         "Entering while-loop...", "Hard-breaking loop for exceeding iteration-limit of 5 cycles",
+        ])
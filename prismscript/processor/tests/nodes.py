@@ -18,12 +18,39 @@ This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unpo
 To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
 letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
 """
+import inspect
 import unittest
 
 from . import (
  get_interpreter, execute_no_yield,
  StatementExit,
 )
+from ..errors import ExecutionError, NodeNotFoundError, PromptError, StatementReturn
+
+_TRANSITIONS = 5000 #Well beyond Python's recursion-limit
+_STATE_MACHINE = """
+ping{
+    global count = count + 1;
+    test.depth();
+    if(count < %(transitions)i){
+        goto pong;
+    }
+    exit count;
+}
+pong{
+    test.ask();
+    goto ping;
+}
+stray{
+    goto nowhere;
+}
+""" % {
+ 'transitions': _TRANSITIONS,
+}
+
+def _ask():
+    answer = yield 'next?'
+    raise StatementReturn(answer)
 
 class SimpleTestCase(unittest.TestCase):
     _interpreter = None
@@ -122,3 +149,81 @@ class ExitTestCase(unittest.TestCase):
         else:
             self.fail("StatementExit not received")
             
+    def test_run_node_sync(self):
+        self.assertEquals(self._interpreter.run_node_sync('goto_exit'), 'test')
+        
+    def test_run_node_sync_prompt(self):
+        def ask():
+            yield 'more?'
+        self._interpreter.register_scoped_functions([('test.ask', ask)])
+        self._interpreter.extend_namespace("prompting{\n    exit test.ask();\n}\n")
+        try:
+            self._interpreter.run_node_sync('prompting')
+        except PromptError as e:
+            self.assertEquals(e.prompt, 'more?')
+        else:
+            self.fail("PromptError not received")
+            
+class TransferTestCase(unittest.TestCase):
+    _interpreter = None
+    _depths = None
+    
+    def setUp(self):
+        self._interpreter = get_interpreter('nodes')
+        self._interpreter.extend_namespace(_STATE_MACHINE)
+        self._depths = set()
+        self._interpreter.register_scoped_functions([
+         ('test.depth', lambda: self._depths.add(len(inspect.stack(0)))),
+         ('test.ask', _ask),
+        ])
+        
+    def test_transitions(self):
+        self._interpreter.globals['count'] = 0
+        generator = self._interpreter.execute_node('ping')
+        prompts = 0
+        try:
+            prompt = next(generator)
+            while True:
+                prompts += 1
+                prompt = generator.send(None)
+        except StatementExit as e:
+            self.assertEquals(e.value, _TRANSITIONS)
+        else:
+            self.fail("StatementExit not received")
+        self.assertEquals(prompts, _TRANSITIONS - 1)
+        self.assertEquals(len(self._depths), 1) #No transition runs any deeper than the first
+        
+    def test_missing_target(self):
+        try:
+            execute_no_yield(self._interpreter.execute_node('stray'))
+        except ExecutionError as e:
+            self.assertEquals(e.location_path, ['stray', '1'])
+            self.assertTrue(isinstance(e.base_exception, NodeNotFoundError))
+        else:
+            self.fail("ExecutionError not received")
+            
+class ExtensionTestCase(unittest.TestCase):
+    _interpreter = None
+    
+    def setUp(self):
+        self._interpreter = get_interpreter('nodes_exit')
+        
+    def _execute(self, node):
+        try:
+            execute_no_yield(self._interpreter.execute_node(node))
+        except StatementExit as e:
+            return e.value
+        self.fail("StatementExit not received")
+        
+    def test_incremental(self):
+        script = "first{\n    exit 1;\n}\nsecond{\n    goto first;\n}\n"
+        self._interpreter.extend_namespace(script, incremental=True)
+        self.assertEquals(self._execute('second'), 1)
+        self._interpreter.extend_namespace(script.replace('exit 1;', 'exit 2;'), incremental=True)
+        self.assertEquals(self._execute('second'), 2)
+        self.assertEquals(self._execute('n_exit'), 'test')
+        
+    def test_incremental_error(self):
+        self.assertRaises(ValueError, self._interpreter.extend_namespace, "first{\n    exit 1\n}", True)
+        self.assertRaises(NodeNotFoundError, self._interpreter.execute_node('first').send, None)
+        
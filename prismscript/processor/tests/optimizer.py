@@ -0,0 +1,223 @@
+"""
+tests.optimizer
+===============
+Purpose
+-------
+Ensures that the optimizer folds constants and removes unreachable code without changing what
+scripts do.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import copy
+import unittest
+
+from . import (
+ execute_no_yield,
+ StatementExit,
+)
+from .. import interpreter
+from .. import optimizer
+from ..errors import ExecutionError
+from ..grammar import parser
+
+_SCRIPT = """
+arithmetic{
+    exit [7 / 2, 7 \\ 2, 2 ^ 3, 7.5 % 2, 7 % 2, 1 + 2 * 3 - 4, -5 - -5];
+}
+strings{
+    exit ["a" + 1, 1.5 + "b", "ab" * 2, "x" == "x", "a" < "b"];
+}
+booleans{
+    x = 5;
+    exit [False || x, True || x, None && x, 1 && x, !0, !"a", 1 < 2 && 2 < 1];
+}
+branches{
+    x = 1;
+    if(False){
+        exit 1;
+    }elif(x == 1){
+        y = 2;
+    }else{
+        exit 3;
+    }
+    if(1){
+        y += 1;
+    }else{
+        exit 4;
+    }
+    while(False){
+        exit 5;
+    }
+    for(z in []){
+        exit 6;
+    }
+    2 + 2;
+    exit y;
+}
+sequences{
+    results = [];
+    i = 0;
+    while(i < 3){
+        x = [1, "a", 2 + 3];
+        x.append(item=i);
+        results.append(item=x);
+        [a, b, c] = [1, 2, 3];
+        i += a;
+    }
+    for([a, b] in [[1, 2], [3, 4]]){
+        results.append(item=[a, b]);
+    }
+    exit results;
+}
+"""
+
+def _optimize(body):
+    return optimizer.optimize(parser.parse('node{%(body)s}' % {
+     'body': body,
+    }))[0]['node']
+
+class OptimizerTestCase(unittest.TestCase):
+    def _execute(self, interpreter, node):
+        try:
+            execute_no_yield(interpreter.execute_node(node))
+        except StatementExit as e:
+            return e.value
+        self.fail("StatementExit not received")
+
+    def test_equivalence(self):
+        optimized = interpreter.Interpreter(_SCRIPT)
+        literal = interpreter.Interpreter(_SCRIPT, optimize=False)
+        for node in ('arithmetic', 'strings', 'booleans', 'branches', 'sequences'):
+            expected = self._execute(literal, node)
+            value = self._execute(optimized, node)
+            self.assertEqual(repr(value), repr(expected)) #Types must match, too
+        self.assertEqual(self._execute(optimized, 'branches'), 3)
+
+    def test_arithmetic(self):
+        self.assertEqual(_optimize('x = 7 / 2;'), [(parser.ASSIGN, (parser.TERM_IDENTIFIER_LOCAL, 'x'), (parser.TERM_FLOAT, 3.5))])
+        self.assertEqual(_optimize('x = 2 ^ 3;')[0][2], (parser.TERM_FLOAT, 8.0))
+        self.assertEqual(_optimize('x = 7 \\ 2;')[0][2], (parser.TERM_INTEGER, 3))
+        self.assertEqual(_optimize('x = 1 + y * 2 * 3;')[0][2], (
+         parser.MATH_ADD, (parser.TERM_INTEGER, 1), (
+          parser.MATH_MULTIPLY, (
+           parser.MATH_MULTIPLY, (parser.TERM_IDENTIFIER_LOCAL, 'y'), (parser.TERM_INTEGER, 2)
+          ), (parser.TERM_INTEGER, 3)
+         )
+        ))
+
+    def test_deferred_errors(self):
+        self.assertEqual(_optimize('x = 1 / 0;')[0][2][0], parser.MATH_DIVIDE)
+        self.assertEqual(_optimize('x = "a" - 1;')[0][2][0], parser.MATH_SUBTRACT)
+        self.assertEqual(_optimize('x = "ab" * 5000;')[0][2][0], parser.MATH_MULTIPLY)
+        self.assertEqual(_optimize('x = [1] + [2];')[0][2][0], parser.MATH_ADD)
+        try:
+            execute_no_yield(interpreter.Interpreter('node{x = 1 / 0;}').execute_node('node'))
+        except ExecutionError:
+            pass
+        else:
+            self.fail("ExecutionError not received")
+
+    def test_booleans(self):
+        self.assertEqual(_optimize('x = False || f();')[0][2], (parser.FUNCTIONCALL_LOCAL, 'f', {}))
+        self.assertEqual(_optimize('x = 0 && f();')[0][2], (parser.TERM_INTEGER, 0))
+        self.assertEqual(_optimize('x = f() && False;')[0][2][0], parser.TEST_BOOL_AND)
+        self.assertEqual(_optimize('x = !None;')[0][2], (parser.TERM_BOOL, True))
+
+    def test_dead_branches(self):
+        self.assertEqual(_optimize('if(False){a();}elif(x){b();}else{c();}'), [[
+         parser.COND_IF,
+         ((parser.TERM_IDENTIFIER_LOCAL, 'x'), [(parser.FUNCTIONCALL_LOCAL, 'b', {})]),
+         (parser.COND_ELSE, [(parser.FUNCTIONCALL_LOCAL, 'c', {})]),
+        ]])
+        self.assertEqual(_optimize('if(x){a();}elif(1){b();}elif(y){c();}'), [[
+         parser.COND_IF,
+         ((parser.TERM_IDENTIFIER_LOCAL, 'x'), [(parser.FUNCTIONCALL_LOCAL, 'a', {})]),
+         (parser.COND_ELSE, [(parser.FUNCTIONCALL_LOCAL, 'b', {})]),
+        ]])
+        self.assertEqual(_optimize('if(True){a();}else{b();}'), [[
+         parser.COND_IF, ((parser.TERM_BOOL, True), [(parser.FUNCTIONCALL_LOCAL, 'a', {})]),
+        ]])
+        self.assertEqual(_optimize('if(x){a();}else{}'), [[
+         parser.COND_IF, ((parser.TERM_IDENTIFIER_LOCAL, 'x'), [(parser.FUNCTIONCALL_LOCAL, 'a', {})]),
+        ]])
+        self.assertEqual(_optimize('if(x){}'), [[parser.COND_IF, ((parser.TERM_IDENTIFIER_LOCAL, 'x'), [])]])
+        self.assertEqual(_optimize('if(False){a();} if(True){} while(0){a();} for(x in []){a();} 1 + 1; "a";'), [])
+        self.assertEqual(len(_optimize('while(True){} for(x in [1]){} while(x){}')), 3)
+
+    def test_positions(self):
+        self.assertEqual(_optimize('1 + 2; x = 1;'), [
+         (parser.TERM_NONE, None),
+         (parser.ASSIGN, (parser.TERM_IDENTIFIER_LOCAL, 'x'), (parser.TERM_INTEGER, 1)),
+        ])
+        engines = (interpreter.ENGINE_TREE, interpreter.ENGINE_CLOSURE, interpreter.ENGINE_PYTHON, interpreter.ENGINE_BYTECODE)
+        for (source, path) in (
+         ('n{ 1 + 2; z = q; }', ['n', '2']),
+         ('n{ while(False){ } if(False){ } z = q; }', ['n', '3']),
+         ('n{ x = 1; if(x){ "a"; z = q; } }', ['n', '2', '2']),
+        ):
+            for engine in engines:
+                messages = []
+                for optimize in (True, False):
+                    try:
+                        execute_no_yield(interpreter.Interpreter(source, optimize=optimize, engine=engine).execute_node('n'))
+                    except ExecutionError as e:
+                        self.assertEqual(e.location_path, path)
+                        messages.append(str(e))
+                    else:
+                        self.fail("ExecutionError not received")
+                self.assertEqual(messages[0], messages[1])
+            
+    def test_constant_sequences(self):
+        self.assertEqual(_optimize('x = [1, "a", None, 2 + 3];')[0][2], (parser.SEQUENCE_CONSTANT, (1, 'a', None, 5)))
+        self.assertEqual(_optimize('x = [[1], y];')[0][2], (
+         parser.SEQUENCE, [(parser.SEQUENCE_CONSTANT, (1,)), (parser.TERM_IDENTIFIER_LOCAL, 'y')]
+        ))
+        self.assertEqual(_optimize('[a, b] = [1, 2];'), [(
+         parser.ASSIGN_SEQUENCE,
+         (parser.SEQUENCE, [(parser.TERM_IDENTIFIER_LOCAL, 'a'), (parser.TERM_IDENTIFIER_LOCAL, 'b')]),
+         (parser.SEQUENCE_CONSTANT, (1, 2)),
+        )])
+        self.assertEqual(_optimize('for([a] in x){}')[0][1], (parser.SEQUENCE, [(parser.TERM_IDENTIFIER_LOCAL, 'a')]))
+        self.assertEqual(_optimize('x = [] || y; z = ![0];'), [
+         (parser.ASSIGN, (parser.TERM_IDENTIFIER_LOCAL, 'x'), (parser.TERM_IDENTIFIER_LOCAL, 'y')),
+         (parser.ASSIGN, (parser.TERM_IDENTIFIER_LOCAL, 'z'), (parser.TERM_BOOL, False)),
+        ])
+
+    def test_never_yields(self):
+        def expression(source):
+            return parser.parse('node{x = %(source)s;}' % {
+             'source': source,
+            })[0]['node'][0][2]
+        for source in ('1 + y * 2', '!y || y < 3', '[y, [1, y]]', 'y.z.w', 'y.get(key=1).real'):
+            self.assertEqual(
+             optimizer.never_yields(expression(source)), not '(' in source,
+             "%(source)s was misjudged" % {
+              'source': source,
+             }
+            )
+        self.assertFalse(optimizer.never_yields(expression('[1, !(y && f())]')))
+        
+    def test_fresh_sequences(self):
+        value = self._execute(interpreter.Interpreter(_SCRIPT), 'sequences')
+        self.assertEqual(value, [[1, 'a', 5, 0], [1, 'a', 5, 1], [1, 'a', 5, 2], [1, 2], [3, 4]])
+        self.assertEqual(len(set(id(v) for v in value)), 5)
+        for v in value:
+            self.assertTrue(type(v) is interpreter.Sequence)
+
+    def test_isolation(self):
+        digest = parser.parse(_SCRIPT)
+        original = copy.deepcopy(digest)
+        optimizer.optimize(digest)
+        self.assertEqual(digest, original)
+        self.assertEqual(parser.parse(_SCRIPT), original)
@@ -0,0 +1,88 @@
+"""
+tests.programs
+==============
+Purpose
+-------
+Ensures that interpreters created from the same program share everything it holds, while keeping
+their globals, logs, locks, and namespaces to themselves, and that the program never changes.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import unittest
+
+from .. import interpreter
+from ..errors import ExecutionError, ScopedFunctionNotFoundError
+from . import (
+ get_program, execute_no_yield,
+ StatementExit,
+)
+
+def _run(instance, node):
+    try:
+        execute_no_yield(instance.execute_node(node))
+    except StatementExit as e:
+        return e.value
+    raise AssertionError("StatementExit not received")
+
+class ProgramTestCase(unittest.TestCase):
+    _program = None
+
+    def setUp(self):
+        self._program = get_program('programs', functions=[('test.step', lambda: 1)])
+
+    def test_isolation(self):
+        (first, second) = (self._program.create_session(), self._program.create_session())
+        first.globals['count'] = 10
+        second.globals['count'] = 20
+        for expected in (11, 12):
+            self.assertEquals(_run(first, 'counting'), expected)
+        self.assertEquals(_run(second, 'counting'), 21)
+        self.assertEquals(len(first.get_log()), 2 * len(second.get_log()))
+
+    def test_sharing(self):
+        (first, second) = (self._program.create_session(), self._program.create_session())
+        self.assertTrue(first._nodes is second._nodes)
+        self.assertTrue(first._scoped_functions is second._scoped_functions)
+        self.assertTrue(first._compiled is second._compiled)
+
+    def test_extension(self):
+        (first, second) = (self._program.create_session(), self._program.create_session())
+        self.assertEquals(_run(first, 'answering'), 1) #Linked before the namespace is extended
+        first.extend_namespace("answer(){\n    return 2;\n}\n")
+        first.register_scoped_functions([('test.step', lambda: 5)])
+        first.globals['count'] = 0
+        second.globals['count'] = 0
+        self.assertEquals(_run(first, 'answering'), 2)
+        self.assertEquals(_run(first, 'counting'), 5)
+        self.assertEquals(_run(second, 'answering'), 1)
+        self.assertEquals(_run(second, 'counting'), 1)
+        self.assertEquals(_run(self._program.create_session(), 'answering'), 1)
+
+    def test_bound_functions(self):
+        (first, second) = (self._program.create_session(), self._program.create_session())
+        for instance in (first, second, first):
+            _run(instance, 'locking')
+        self.assertEquals(len(first._lock_factory._locks), 2)
+        self.assertEquals(len(second._lock_factory._locks), 1)
+
+        try:
+            _run(self._program.create_session(threading=False), 'locking')
+        except ExecutionError as e:
+            self.assertTrue(isinstance(e.base_exception, ScopedFunctionNotFoundError), repr(e.base_exception))
+        else:
+            self.fail("ExecutionError not received")
+
+    def test_validation(self):
+        self.assertRaises(ValueError, get_program, 'programs', functions=[('step', lambda: 1)])
+        self.assertRaises(ValueError, interpreter.Program, 'node{}', engine='unknown')
@@ -0,0 +1,126 @@
+"""
+tests.sites
+===========
+Purpose
+-------
+Ensures that the caches kept at each site in a script never outlive what they cache: a change to
+the registry of scoped functions, a variable that comes to shadow a registered function, a function
+of the script that is redefined or defined only later, or a different interpreter running the same
+compiled code.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import unittest
+
+from ..errors import ExecutionError, FunctionNotFoundError
+from . import (
+ get_interpreter, execute_no_yield,
+ StatementExit,
+)
+from .. import sites
+
+_SCRIPT = """
+calling{
+    exit test.value();
+}
+shadowing{
+    results = [];
+    for(i in [1, 2]){
+        results.append(item=test.value());
+        test = test.make();
+    }
+    exit results;
+}
+"""
+
+_LINKING_SCRIPT = """
+linking{
+    exit answer(n=1);
+}
+"""
+
+_FIRST_DEFINITION = """
+answer(n){
+    return n + 1;
+}
+"""
+
+_SECOND_DEFINITION = """
+answer(n){
+    return n * 10;
+}
+"""
+
+class _Holder(object):
+    def make(self):
+        return self
+
+    def value(self):
+        return 'bound'
+
+class SiteTestCase(unittest.TestCase):
+    def _build(self, value):
+        instance = get_interpreter('nodes')
+        instance.extend_namespace(_SCRIPT)
+        instance.register_scoped_functions([
+         ('test.value', lambda: value),
+         ('test.make', _Holder),
+        ])
+        return instance
+
+    def _exit(self, instance, node):
+        try:
+            execute_no_yield(instance.execute_node(node))
+        except StatementExit as e:
+            return e.value
+        self.fail("StatementExit not received")
+
+    def test_reregistration(self):
+        instance = self._build('first')
+        self.assertEquals(self._exit(instance, 'calling'), 'first')
+        instance.register_scoped_functions([('test.value', lambda: 'second')])
+        self.assertEquals(self._exit(instance, 'calling'), 'second')
+
+    def test_shadowing(self):
+        instance = self._build('registered')
+        self.assertEquals(self._exit(instance, 'shadowing'), ['registered', 'bound'])
+
+    def test_shared_code(self):
+        instances = [self._build(value) for value in ('first', 'second')]
+        for k in range(2): #Alternating, in case the instances share what they compile
+            self.assertEquals([self._exit(instance, 'calling') for instance in instances], ['first', 'second'])
+
+    def test_relinking(self):
+        instance = get_interpreter('nodes')
+        instance.extend_namespace(_LINKING_SCRIPT)
+        try:
+            self._exit(instance, 'linking')
+            self.fail("ExecutionError not received")
+        except ExecutionError as e:
+            self.assertTrue(isinstance(e.base_exception, FunctionNotFoundError))
+            self.assertTrue('answer(n)' in str(e))
+        instance.extend_namespace(_FIRST_DEFINITION)
+        for k in range(2): #Linked, then called through the link
+            self.assertEquals(self._exit(instance, 'linking'), 2)
+        instance.extend_namespace(_SECOND_DEFINITION)
+        self.assertEquals(self._exit(instance, 'linking'), 10)
+
+    def test_polymorphism(self):
+        site = sites.Site('test.value')
+        self.assertEquals((site.root, site.path), ('test', ('value',)))
+        values = [len, _Holder, _Holder(), 1, 'x', None, lambda: None, [], _Holder().value]
+        for k in range(2): #Remembered, then recalled or worked out again
+            self.assertEquals([site.is_callable(value) for value in values], [
+             True, True, False, False, False, False, True, False, True,
+            ])
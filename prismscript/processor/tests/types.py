@@ -18,13 +18,19 @@ This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unpo
 To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
 letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
 """
+import collections
+import json
 import unittest
 
 from . import (
  get_interpreter, execute_no_yield,
  StatementReturn, StatementExit,
 )
-from ..grammar.parser import (Dictionary, Set, Sequence)
+from ..grammar.parser import (
+ Dictionary, Set, Sequence,
+ LazyDictionary, LazySet, LazySequence,
+)
+from .. import marshalling
 
 class _BaseTestCase(unittest.TestCase):
     _interpreter = None
@@ -75,7 +81,7 @@ class RecursionTestCase(_BaseTestCase):
             execute_no_yield(self._interpreter.execute_function('convert', {'v': value}))
         except StatementReturn as e:
             self.assertEquals(e.value, value)
-            self.assertTrue(isinstance(e.value, Sequence))
+            self.assertTrue(isinstance(e.value, Sequence)) #Views are never handed to the host
             self.assertTrue(isinstance(e.value[1], Sequence))
         else:
             self.fail("StatementReturn not received")
@@ -91,3 +97,130 @@ class RecursionTestCase(_BaseTestCase):
         else:
             self.fail("StatementReturn not received")
             
+class HostTestCase(_BaseTestCase):
+    _received = None #The values received by ``host.dump()``
+    
+    def setUp(self):
+        _BaseTestCase.setUp(self)
+        self._received = []
+        self._interpreter.register_scoped_functions((('host.dump', self._dump),))
+        
+    def _dump(self, value, nested):
+        self._received.extend((value, nested[1]))
+        return json.dumps([value, nested])
+        
+    def _send(self, value):
+        try:
+            execute_no_yield(self._interpreter.execute_function('send', {'v': value}))
+        except StatementReturn as e:
+            return json.loads(e.value)
+        self.fail("StatementReturn not received")
+        
+    def test_list(self):
+        self.assertEquals(self._send((1, (2, 3))), [[1, [2, 3]], [1, [1, [2, 3]]]])
+        for value in self._received:
+            self.assertTrue(isinstance(value, list))
+            self.assertTrue(isinstance(value[1], list))
+            
+    def test_dict(self):
+        self.assertEquals(self._send({'a': {'b': 1}}), [{'a': {'b': 1}}, [1, {'a': {'b': 1}}]])
+        for value in self._received:
+            self.assertTrue(isinstance(value, dict))
+            self.assertTrue(isinstance(value['a'], dict))
+            
+class _Temperature(object):
+    def __init__(self, kelvin):
+        self.kelvin = kelvin
+        
+class _Rows(list):
+    pass
+    
+class _Buffer(object): #Stands in for a host type that would otherwise be copied, like ``bytes``
+    def __init__(self, data):
+        self._data = data
+        
+    def __len__(self):
+        return len(self._data)
+        
+    def __getitem__(self, index):
+        return self._data[index]
+collections.Sequence.register(_Buffer)
+    
+class RegistryTestCase(_BaseTestCase):
+    def tearDown(self):
+        for kind in (_Buffer, _Temperature, list):
+            marshalling.unregister_converter(kind)
+            
+    def _convert(self, value, instance=None):
+        try:
+            execute_no_yield((instance or self._interpreter).execute_function('convert', {'v': value}))
+        except StatementReturn as e:
+            return e.value
+        self.fail("StatementReturn not received")
+        
+    def test_identity(self):
+        value = _Buffer([1, 2, 3])
+        self.assertTrue(isinstance(self._convert(value), Sequence)) #Viewed, and materialized on return
+        marshalling.register_converter(_Buffer, marshalling.identity)
+        self.assertTrue(self._convert(value) is value)
+        
+    def test_converter(self):
+        marshalling.register_converter(_Temperature, lambda value: value.kelvin - 273.15)
+        self.assertAlmostEqual(self._convert(_Temperature(300.0)), 26.85)
+        self.assertAlmostEqual(self._convert(_Temperature(300.0), get_interpreter('types')), 26.85) #Shared
+        marshalling.unregister_converter(_Temperature)
+        self.assertTrue(isinstance(self._convert(_Temperature(300.0)), _Temperature))
+        
+    def test_exact_type(self):
+        marshalling.register_converter(list, marshalling.identity)
+        value = _Rows([1, 2])
+        for k in range(2): #Classified, then recalled
+            self.assertTrue(isinstance(self._convert(value), Sequence))
+        marshalling.unregister_converter(list)
+        self.assertTrue(isinstance(self._convert([1, 2]), Sequence)) #Built in again
+        
+class ViewTestCase(_BaseTestCase):
+    def _view(self, kind, source):
+        converted = []
+        def marshall(value):
+            converted.append(value)
+            return value
+        return (kind(source, marshall), converted)
+        
+    def test_lazy(self):
+        (view, converted) = self._view(LazySequence, ('a', 'b', 'c'))
+        self.assertEquals(view.get(index=-1), 'c')
+        self.assertEquals(view.length, 3)
+        self.assertEquals(converted, ['c'])
+        self.assertRaises(IndexError, view.get, index=-5)
+        self.assertRaises(IndexError, view.get, index=3)
+        
+    def test_copy_on_write(self):
+        value = [1, [2, 3]]
+        try:
+            execute_no_yield(self._interpreter.execute_function('change', {'v': value}))
+        except StatementReturn as e:
+            self.assertEquals(e.value, [1, [2, 3, 4], 5])
+            self.assertTrue(isinstance(e.value, Sequence))
+        else:
+            self.fail("StatementReturn not received")
+        self.assertEquals(value, [1, [2, 3]])
+        
+    def test_dictionary(self):
+        (view, converted) = self._view(LazyDictionary, {'a': 1, 'b': 2})
+        self.assertEquals(view.get(key='b'), 2)
+        self.assertEquals(view.get(key='c', default=0), 0)
+        self.assertEquals(converted, [2])
+        view.put(key='c', value=3)
+        self.assertEquals(view, {'a': 1, 'b': 2, 'c': 3})
+        self.assertTrue(isinstance(view.copy(), Dictionary))
+        
+    def test_set(self):
+        source = set([1, 2])
+        (view, converted) = self._view(LazySet, source)
+        self.assertTrue(view.contains(item=1))
+        self.assertEquals(converted, [])
+        view.add(item=3)
+        self.assertEquals(view, set([1, 2, 3]))
+        self.assertEquals(source, set([1, 2]))
+            
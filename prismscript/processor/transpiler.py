@@ -0,0 +1,898 @@
+"""
+transpiler
+==========
+Purpose
+-------
+Provides an execution engine that translates each node and function, ahead of its first execution,
+into Python source: one function per definition, with the script's ``if``, ``while``, and ``for``
+statements rendered as their native Python equivalents and every expression inlined, so that
+CPython's own bytecode runs the script, rather than anything that walks its tree.
+
+Notes
+-----
+Anything that may prompt, meaning any function-call, is followed in place by a ``yield`` of whatever
+it needs run, including a call to one of the script's own functions, so a definition that contains
+one compiles into a generator, run by `driver.drive()`, and recursion in a script never recurses in
+Python; everything else, including a ``goto``, which never returns control, compiles into a plain
+function. Operands evaluated before a call are held in temporaries, so side-effects occur in the
+same order as they would under the reference engine.
+
+Every generated line is associated with the position of the statement from which it was produced.
+When an exception escapes a definition, the line at which it left the generated code identifies the
+statement, so `ExecutionError`s report the same locations as the reference engine, without any
+handlers being set up while the script runs.
+
+Generated modules are compiled once per process and shared by every `Interpreter`. If a directory
+is provided through `set_cache_directory()`, each is also written there as a ``.py`` file and
+imported, so that CPython keeps its bytecode in a ``.pyc`` and later processes skip compilation;
+`compile_digest()` populates it ahead of time. Modules are named for a hash of their source, so a
+changed definition never picks up a stale one, but anyone who can write to the directory can run
+code in the host, so it must be private to the application.
+
+Meta
+----
+:Authors:
+    Neil Tallim <flan@uguu.ca>
+
+:Version: 1.0.0 : Oct. 17, 2026
+
+Legal
+-----
+This work is licensed under the Creative Commons Attribution-ShareAlike 3.0 Unported License.
+To view a copy of this license, visit http://creativecommons.org/licenses/by-sa/3.0/ or send a
+letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, California, 94105, USA.
+"""
+import hashlib
+import io
+import keyword
+import math
+import os
+import re
+import sys
+import tempfile
+import types
+
+#Python 2.x/3.x compatibility
+try: #'long' was replaced by 'int' in py3k
+    long
+except NameError: #Make them aliases
+    long = int
+try: #'unicode' was renamed 'str' in py3k
+    unicode
+except NameError:
+    unicode = str
+try: #Modules are loaded through importlib in py3k
+    import importlib.util
+    def _load_module(name, path):
+        specification = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(specification)
+        specification.loader.exec_module(module) #Bytecode is kept in __pycache__
+        return module
+except ImportError:
+    import imp
+    def _load_module(name, path):
+        try:
+            return imp.load_source(name, path) #Bytecode is kept alongside the source
+        finally:
+            sys.modules.pop(name, None)
+
+from .errors import (
+ Error,
+ ExecutionError,
+ NodeNotFoundError, FunctionNotFoundError,
+ VariableNotFoundError,
+ FlowControl,
+ StatementReturn, StatementExit, StatementGoto,
+ get_origin_details,
+)
+from . import driver
+from . import log
+from . import marshalling
+from . import operations
+from . import optimizer
+from . import sites
+from .grammar import parser
+from .grammar.parser import Sequence, String
+
+_FORMAT = 6 #Identifies the layout of generated modules; change it whenever the runtime below does
+
+_cache_directory = None #The directory in which generated modules are kept, if any
+_definitions = {} #Compiled definitions, keyed by the hash of their source, shared by every engine
+
+_KIND_NODE = 1
+_KIND_FUNCTION = 2
+_ENTRY_MESSAGES = {
+ _KIND_NODE: "Entering node...",
+ _KIND_FUNCTION: "Entering function...",
+}
+
+_CONSTANTS = frozenset((
+ parser.TERM_NONE, parser.TERM_BOOL, parser.TERM_INTEGER, parser.TERM_FLOAT,
+))
+_OPERATIONS = { #Templates for each operation, taking (left, right), matching `operations`
+ parser.MATH_ADD: "_add(%s, %s)",
+ parser.MATH_SUBTRACT: "(%s - %s)",
+ parser.MATH_MULTIPLY: "(%s * %s)",
+ parser.MATH_DIVIDE: "(%s / float(%s))",
+ parser.MATH_DIVIDE_INTEGER: "int(%s // %s)",
+ parser.MATH_MOD: "_mod(%s, %s)",
+ parser.MATH_EXPONENTIATE: "_pow(%s, %s)",
+ parser.TEST_EQUALITY: "(%s == %s)",
+ parser.TEST_INEQUALITY: "(%s != %s)",
+ parser.TEST_GREATER_EQUAL: "(%s >= %s)",
+ parser.TEST_GREATER: "(%s > %s)",
+ parser.TEST_LESSER_EQUAL: "(%s <= %s)",
+ parser.TEST_LESSER: "(%s < %s)",
+}
+_AUGMENTATIONS = {
+ parser.ASSIGN_ADD: '_augment_add',
+ parser.ASSIGN_SUBTRACT: '_augment_subtract',
+ parser.ASSIGN_MULTIPLY: '_augment_multiply',
+ parser.ASSIGN_DIVIDE: '_augment_divide',
+ parser.ASSIGN_DIVIDE_INTEGER: '_augment_divide_integer',
+ parser.ASSIGN_MOD: '_augment_mod',
+ parser.ASSIGN_EXPONENTIATE: '_augment_exponentiate',
+}
+_LITERALS = _CONSTANTS.union((parser.TERM_STRING,))
+_CALLS = frozenset((parser.FUNCTIONCALL_LOCAL, parser.FUNCTIONCALL_SCOPED))
+_SETTLED = re.compile(r'^_[tc]\d+$') #Temporaries and constants, which never need to be held
+
+class _MisplacedFlowControl(Exception):
+    """
+    Raised by a ``break`` or ``continue`` that was compiled outside of any loop.
+    """
+    statement = None
+
+    def __init__(self, statement):
+        Exception.__init__(self, statement)
+        self.statement = statement
+
+def _undeclared(name):
+    raise VariableNotFoundError(name, "Local identifier not declared")
+
+def _unknown(message):
+    raise ValueError(message)
+
+def _hard_break(interpreter):
+    interpreter._log.warning("Hard-breaking loop for exceeding iteration-limit of %i cycles", interpreter._loop_limit)
+
+def _log_invocation(interpreter, function, arguments):
+    interpreter._log.debug("Invoking function '%s'...", log.Call(function, arguments))
+
+def _settle(interpreter, result):
+    """
+    Provides the marshalled value of `result`, or a `driver.Host` if it is a coroutine, which the
+    generated code must have driven.
+    """
+    if type(result) == types.GeneratorType:
+        return driver.Host(result)
+    return interpreter._marshall_type(result)
+
+def _call_local(interpreter, _locals, site, arguments):
+    _log_invocation(interpreter, site.name, arguments)
+    try:
+        result = interpreter._execute_local_function(site, arguments, _locals, driver.Call)
+    except StatementReturn as e:
+        return interpreter._marshall_type(e.value)
+    if result.__class__ is driver.Call: #A function of the script, which the generated code must have driven
+        return result
+    return _settle(interpreter, result)
+
+def _call_scoped(interpreter, _locals, site, arguments):
+    _log_invocation(interpreter, site.identifier, arguments)
+    try:
+        return _settle(interpreter, interpreter._execute_scoped_function(site, arguments, _locals))
+    except StatementReturn as e:
+        return interpreter._marshall_type(e.value)
+
+def _call_bound(interpreter, function, arguments):
+    _log_invocation(interpreter, function, arguments)
+    try:
+        return _settle(interpreter, function(**marshalling.materialize_arguments(function, arguments)))
+    except StatementReturn as e:
+        return interpreter._marshall_type(e.value)
+
+_RUNTIME = { #Everything generated code may refer to, bound once per module
+ '_StatementReturn': StatementReturn,
+ '_StatementExit': StatementExit,
+ '_MisplacedFlowControl': _MisplacedFlowControl,
+ '_Pending': driver.Delegation,
+ '_Sequence': Sequence,
+ '_Site': sites.Site,
+ '_CallSite': sites.CallSite,
+ '_String': String,
+ '_add': operations.get_computation(parser.MATH_ADD),
+ '_mod': operations.get_computation(parser.MATH_MOD),
+ '_pow': operations.get_computation(parser.MATH_EXPONENTIATE),
+ '_undeclared': _undeclared,
+ '_unknown': _unknown,
+ '_hard_break': _hard_break,
+ '_call_local': _call_local,
+ '_call_scoped': _call_scoped,
+ '_call_bound': _call_bound,
+}
+_RUNTIME.update((name, operations.get_augmentation(method)) for (method, name) in _AUGMENTATIONS.items())
+
+def get_cache_directory():
+    """
+    Provides the directory in which generated modules are kept, or ``None`` if they are compiled
+    in memory.
+    """
+    return _cache_directory
+
+def set_cache_directory(directory):
+    """
+    Has generated modules kept in `directory`, which is created if necessary, as ``.py`` files
+    alongside their bytecode; ``None``, the default, compiles them in memory.
+
+    Anything in the directory may be imported into the host, so it must not be writable by anyone
+    the host does not trust.
+    """
+    global _cache_directory
+    if directory is not None and not os.path.isdir(directory):
+        os.makedirs(directory)
+    _cache_directory = directory
+
+def compile_digest(digest):
+    """
+    Compiles every node and function in `digest`, a (``nodes``, ``functions``) tuple, as produced
+    by `parser.parse()` and optionally `optimizer.optimize()`, so that nothing needs to be
+    generated when they are first executed, and so that the cache directory, if set, is populated
+    for later processes.
+
+    The number of definitions compiled is returned.
+    """
+    (nodes, functions) = digest
+    for statements in nodes.values():
+        _compile(statements, _KIND_NODE)
+    for statements in functions.values():
+        _compile(statements, _KIND_FUNCTION)
+    return len(nodes) + len(functions)
+
+def generate(statements, kind=_KIND_NODE):
+    """
+    Provides the Python source generated for the statement-list `statements`, for inspection.
+    """
+    return _generate_module(statements, kind)[0]
+
+class _Definition:
+    """
+    A compiled node or function.
+    """
+    run = None #The generated function, taking (interpreter, _locals)
+    blocking = False #Whether `run` provides a generator
+    _code = None #The code-object of `run`, used to find it in tracebacks
+    _positions = None #The statement-position of every line in the generated module, by line-number
+
+    def __init__(self, run, blocking, positions):
+        self.run = run
+        self.blocking = blocking
+        self._code = run.__code__
+        self._positions = positions
+
+    def locate(self, traceback):
+        """
+        Provides the position of the statement through which `traceback` left the generated code,
+        or ``None`` if it never entered it.
+        """
+        while traceback is not None:
+            if traceback.tb_frame.f_code is self._code:
+                return self._positions[traceback.tb_lineno]
+            traceback = traceback.tb_next
+        return None
+
+    def describe_error(self, container_name, error, interpreter, _locals):
+        """
+        Wraps `error`, which was raised while `container_name` was executing, in an
+        `ExecutionError` that identifies the statement responsible, exactly as the reference engine
+        would.
+        """
+        position = self.locate(sys.exc_info()[2])
+        if position is None:
+            if isinstance(error, ExecutionError):
+                return ExecutionError(container_name, error.location_path, error.message, error.base_exception)
+            elif isinstance(error, Error): #Raised on entry, like running out of fuel
+                return ExecutionError(container_name, [], str(error), error)
+            return ExecutionError(container_name, [], "An unexpected error occurred: %(error)s : %(origin)s" % {
+             'error': str(error),
+             'origin': get_origin_details(),
+            }, error)
+        elif isinstance(error, _MisplacedFlowControl):
+            return ExecutionError(container_name, position, "`%(statement)s` statement not allowed outside of a loop" % {
+             'statement': error.statement,
+            }, None)
+        elif isinstance(error, ExecutionError):
+            return ExecutionError(container_name, position + error.location_path, error.message, error.base_exception)
+        elif isinstance(error, Error):
+            return ExecutionError(container_name, position, str(error), error)
+        return ExecutionError(container_name, position, "An unexpected error occurred: %(error)s : %(origin)s | locals: %(locals)r | globals: %(globals)r" % {
+         'error': str(error),
+         'origin': get_origin_details(),
+         'locals': sorted(_locals.items()),
+         'globals': sorted(interpreter._globals.items()),
+        }, error)
+
+class PythonEngine:
+    """
+    Executes an `Interpreter`'s nodes and functions as generated Python code.
+    """
+    _interpreter = None #The interpreter whose namespace and operating environment are used
+    _nodes = None #Compiled nodes, as (statements, definition) pairs, keyed by name
+    _functions = None #Compiled functions, as (statements, definition) pairs, keyed by signature
+
+    def __init__(self, interpreter, compiled):
+        """
+        Runs the nodes and functions of `interpreter`, caching their compiled forms in `compiled`,
+        a (nodes, functions) pair of dictionaries, which may be shared with other engines.
+        """
+        self._interpreter = interpreter
+        (self._nodes, self._functions) = compiled
+
+    def call_function(self, site, arguments):
+        """
+        Begins execution of the function called at `site`, a `sites.CallSite`, exactly as
+        `Interpreter.execute_function()`.
+        """
+        return driver.drive(self._interpreter, driver.enter(self._run_function, site, arguments), self._run_function, 1)
+
+    def execute_function(self, function_name, arguments):
+        """
+        Begins execution of the named function, exactly as `Interpreter.execute_function()`.
+        """
+        return self.call_function(sites.CallSite(function_name, arguments.keys()), arguments)
+
+    def execute_node(self, node_name):
+        """
+        Begins execution of the named node, exactly as `Interpreter.execute_node()`.
+        """
+        return driver.drive(self._interpreter, self._run_node(node_name), self._run_function)
+
+    def _link_function(self, signature, statements):
+        """
+        Provides the compiled form of the function with the given `signature`.
+        """
+        return _get_definition(self._functions, signature, statements, _KIND_FUNCTION)
+
+    def _run_blocking_function(self, site, definition, _locals):
+        """
+        Provides the generator that runs `definition`, the blocking function called at `site`.
+        """
+        try:
+            yield definition.run(self._interpreter, _locals)
+        except FlowControl:
+            raise
+        except Exception as e:
+            raise definition.describe_error(str(site.call), e, self._interpreter, _locals)
+        raise StatementReturn(None)
+
+    def _run_function(self, site, arguments):
+        """
+        Runs the function called at `site`, a `sites.CallSite`, as `driver.drive()` runs a
+        `driver.Call`: if nothing in it is blocking, its result is raised as a `StatementReturn` on
+        the spot; otherwise, a generator that raises it is provided.
+        """
+        interpreter = self._interpreter
+        interpreter._log.debug("Executing function '%s'...", site.call)
+
+        definition = interpreter._link_function(site, self._link_function)
+        if definition is None:
+            raise FunctionNotFoundError(str(site.call), "Function not defined")
+
+        _locals = {}
+        try:
+            _locals.update(interpreter._marshall_arguments(arguments))
+            if definition.blocking:
+                return self._run_blocking_function(site, definition, _locals)
+            definition.run(interpreter, _locals)
+        except FlowControl:
+            raise
+        except Exception as e:
+            raise definition.describe_error(str(site.call), e, interpreter, _locals)
+        raise StatementReturn(None)
+
+    def _run_node(self, node_name):
+        """
+        Provides the generator, to be run by `driver.drive()`, that executes the named node.
+        """
+        interpreter = self._interpreter
+        interpreter._log.debug("Executing node '%s'...", node_name)
+
+        statements = interpreter._nodes.get(node_name)
+        if statements is None:
+            raise NodeNotFoundError(node_name, "Node not defined")
+        definition = _get_definition(self._nodes, node_name, statements, _KIND_NODE)
+
+        _locals = {}
+        try:
+            if definition.blocking:
+                yield definition.run(interpreter, _locals)
+            else:
+                definition.run(interpreter, _locals)
+        except StatementExit as e:
+            raise StatementExit(e.value)
+        except StatementReturn as e: #Not actually legal, but suppressing it would be bad.
+            interpreter._log.warning("Warning: exit-statement inferred from top-level return.")
+            raise StatementExit(e.value)
+        except StatementGoto: #Handled by `Interpreter._transfer()`
+            raise
+        except Exception as e:
+            raise definition.describe_error(node_name, e, interpreter, _locals)
+        raise StatementExit(None) #The end of any node signifies a dead end.
+
+def _get_definition(cache, key, statements, kind):
+    """
+    Provides the compiled form of `statements`, from `cache` if it was built from the same list.
+    """
+    entry = cache.get(key)
+    if entry is None or not entry[0] is statements:
+        entry = (statements, _compile(statements, kind))
+        cache[key] = entry
+    return entry[1]
+
+#Compilation
+############
+def _compile(statements, kind):
+    """
+    Provides a `_Definition` for `statements`, generating and compiling it only if no identical
+    source has been compiled before.
+    """
+    (source, blocking, positions) = _generate_module(statements, kind)
+    if isinstance(source, unicode):
+        encoded = source.encode('utf-8')
+    else:
+        encoded = source
+        source = source.decode('utf-8')
+    key = hashlib.sha1(encoded).hexdigest()
+
+    definition = _definitions.get(key)
+    if definition is None:
+        if _cache_directory is None:
+            namespace = {}
+            exec(compile(source, '<prismscript:%(key)s>' % {'key': key,}, 'exec'), namespace)
+            define = namespace['define']
+        else:
+            define = _load_module(*_store(key, source)).define
+        definition = _Definition(define(_RUNTIME), blocking, positions)
+        _definitions[key] = definition
+    elif _cache_directory is not None: #Compiled before the directory was set, so write it out
+        _store(key, source)
+    return definition
+
+def _store(key, source):
+    """
+    Writes `source` to the cache directory, unless it is already there, providing the name of the
+    module identified by `key` and the path to its file.
+    """
+    name = 'prismscript_%(key)s' % {'key': key,}
+    path = os.path.join(_cache_directory, name + '.py')
+    try:
+        with io.open(path, 'r', encoding='utf-8') as cached:
+            current = cached.read() == source
+    except (IOError, OSError):
+        current = False
+    if not current: #Written beside its destination, then moved into place, so it is never seen partially
+        (descriptor, temporary) = tempfile.mkstemp(suffix='.tmp', dir=_cache_directory)
+        with io.open(descriptor, 'w', encoding='utf-8') as output:
+            output.write(source)
+        if os.path.exists(path): #Windows will not replace a file through a rename
+            os.remove(path)
+        os.rename(temporary, path)
+    return (name, path)
+
+class _Source:
+    """
+    Accumulates the body of a generated function, recording the position of the statement from
+    which each line was produced.
+    """
+    lines = None #The body's lines
+    positions = None #The statement-position of each line
+    constants = None #Lines that prepare values once, when the module is loaded
+    blocking = False #Whether anything in the body may prompt
+    _count = 0 #The number of names allocated so far
+
+    def __init__(self):
+        self.lines = []
+        self.positions = []
+        self.constants = []
+
+    def add(self, depth, line, position):
+        self.lines.append('    ' * depth + line)
+        self.positions.append(position)
+
+    def name(self, prefix):
+        self._count += 1
+        return '%(prefix)s%(count)i' % {
+         'prefix': prefix,
+         'count': self._count,
+        }
+
+    def constant(self, code):
+        """
+        Provides the name of a value prepared once, from `code`, when the module is loaded.
+        """
+        name = self.name('_c')
+        self.constants.append('%(name)s = %(code)s' % {
+         'name': name,
+         'code': code,
+        })
+        return name
+
+    def hold(self, depth, code, position):
+        """
+        Provides the name of a new temporary assigned the value of `code`.
+        """
+        name = self.name('_t')
+        self.add(depth, '%(name)s = %(code)s' % {
+         'name': name,
+         'code': code,
+        }, position)
+        return name
+
+    def delegate(self, depth, delegation, position):
+        """
+        Adds the ``yield`` that has `delegation` run by `driver.drive()`, which sends its value back
+        into the same name.
+        """
+        self.blocking = True
+        self.add(depth, '%(delegation)s = yield %(delegation)s' % {'delegation': delegation,}, position)
+
+def _generate_module(statements, kind):
+    """
+    Provides the source of a module that defines ``define(runtime)``, which provides the generated
+    function for `statements`, along with whether it is a generator and the statement-position of
+    every line, indexed by line-number.
+    """
+    source = _Source()
+    source.add(0, 'interpreter._log.debug(%(message)r)' % {'message': _ENTRY_MESSAGES[kind],}, None)
+    _generate_charge(source, 0, None)
+    _generate_statements(source, statements, 0, [], False)
+
+    lines = [
+     '#Generated by the prismscript transpiler, format %(format)i; do not edit' % {'format': _FORMAT,},
+     'def define(runtime):',
+    ]
+    lines.extend('    %(name)s = runtime[%(name)r]' % {'name': name,} for name in sorted(_RUNTIME))
+    lines.extend('    ' + line for line in source.constants)
+    lines.extend((
+     '    def run(interpreter, _locals):',
+     '        _globals = interpreter._globals',
+     '        _marshall = interpreter._marshall_type',
+    ))
+    positions = [None] * (len(lines) + 1) #Line-numbers start at 1
+    lines.extend('        ' + line for line in source.lines)
+    positions.extend(source.positions)
+    lines.append('    return run')
+    positions.append(None)
+    return ('\n'.join(lines) + '\n', source.blocking, positions)
+
+def _literal(value):
+    """
+    Provides Python source that reproduces `value`, down to its type.
+    """
+    value_type = type(value)
+    if value_type == float and (math.isinf(value) or math.isnan(value)):
+        return "float('%(value)r')" % {'value': value,}
+    elif value_type == String:
+        return '_String(%(value)r)' % {'value': unicode(value),}
+    elif value_type == tuple:
+        return '(%(values)s)' % {'values': ''.join(_literal(element) + ', ' for element in value),}
+    elif value_type == list:
+        return '[%(values)s]' % {'values': ', '.join(_literal(element) for element in value),}
+    return repr(value)
+
+#Statements
+###########
+def _generate_statements(source, statements, depth, path, looping):
+    """
+    Adds `statements` to `source`, at `depth`, where `path` is the position of the body and
+    `looping` indicates whether it is inside a loop.
+    """
+    if not statements:
+        source.add(depth, 'pass', path or None)
+    for (i, statement) in enumerate(statements):
+        _generate_statement(source, statement, depth, path + [str(i + 1)], looping)
+
+def _generate_statement(source, statement, depth, position, looping):
+    statement_type = statement[0]
+    if statement_type == parser.ASSIGN:
+        (scope, name) = statement[1]
+        value = _generate_expression(source, statement[2], depth, position)
+        source.add(depth, '%(store)s[%(name)r] = %(value)s' % {
+         'store': scope == parser.TERM_IDENTIFIER_LOCAL_GLOBAL and '_globals' or '_locals',
+         'name': name,
+         'value': value,
+        }, position)
+    elif statement_type in _AUGMENTATIONS:
+        (scope, name) = statement[1]
+        store = 'interpreter._identify_assignment_scope(%(name)r, _locals, %(scope)r)' % {
+         'name': name,
+         'scope': scope,
+        }
+        if _blocks(statement[2]): #The scope is identified before anything is evaluated
+            store = source.hold(depth, store, position)
+        source.add(depth, '%(augmentation)s(%(store)s, %(name)r, %(value)s)' % {
+         'augmentation': _AUGMENTATIONS[statement_type],
+         'store': store,
+         'name': name,
+         'value': _generate_expression(source, statement[2], depth, position),
+        }, position)
+    elif statement_type == parser.ASSIGN_SEQUENCE:
+        value = _generate_expression(source, statement[2], depth, position)
+        source.add(depth, 'interpreter._unpack(%(destination)s, %(value)s, _locals)' % {
+         'destination': source.constant(_literal(statement[1][1])),
+         'value': value,
+        }, position)
+    elif statement_type == parser.STMT_RETURN:
+        source.add(depth, 'raise _StatementReturn(%(value)s)' % {
+         'value': _generate_expression(source, statement[1], depth, position),
+        }, position)
+    elif statement_type == parser.STMT_EXIT:
+        source.add(depth, 'raise _StatementExit(%(value)s)' % {
+         'value': _generate_expression(source, statement[1], depth, position),
+        }, position)
+    elif statement_type == parser.STMT_GOTO: #Control never returns, so nothing waits on the target node
+        source.add(depth, 'interpreter._goto(%(name)r)' % {
+         'name': statement[1],
+        }, position)
+    elif statement_type in (parser.STMT_BREAK, parser.STMT_CONTINUE):
+        flow = statement_type == parser.STMT_BREAK and 'break' or 'continue'
+        if looping:
+            source.add(depth, flow, position)
+        else: #Reported against the outermost statement, as the reference engine does
+            source.add(depth, 'raise _MisplacedFlowControl(%(flow)r)' % {
+             'flow': flow,
+            }, position[:1])
+    elif statement_type == parser.COND_IF:
+        _generate_conditional(source, statement[1:], depth, position, looping)
+    elif statement_type == parser.COND_WHILE:
+        _generate_while(source, statement[1], statement[2], depth, position)
+    elif statement_type == parser.COND_FOR:
+        _generate_for(source, statement[1], statement[2], statement[3], depth, position)
+    else: #An expression, evaluated only for its side-effects
+        value = _generate_expression(source, statement, depth, position)
+        if not _SETTLED.match(value):
+            source.add(depth, value, position)
+
+def _generate_conditional(source, statement, depth, position, looping):
+    """
+    Adds the ``if``-statement `statement`, minus its ``COND_IF`` head.
+    """
+    for (i, branch) in enumerate(statement):
+        if i == 0:
+            (condition, statements) = branch
+        elif branch[0] == parser.COND_ELIF:
+            (condition, statements) = branch[1:]
+        else:
+            (condition, statements) = (None, branch[1])
+
+        if condition is None:
+            source.add(depth, 'else:', position)
+        else:
+            if i == 0:
+                clause = 'if'
+            elif _blocks(condition): #The condition must be evaluated within the previous `else`
+                source.add(depth, 'else:', position)
+                depth += 1
+                clause = 'if'
+            else:
+                clause = 'elif'
+            source.add(depth, '%(clause)s %(condition)s:' % {
+             'clause': clause,
+             'condition': _generate_expression(source, condition, depth, position),
+            }, position)
+
+        if statements:
+            source.add(depth + 1, "interpreter._log.debug('Entering node...')", position)
+            _generate_charge(source, depth + 1, position)
+            _generate_statements(source, statements, depth + 1, position, looping)
+        else:
+            source.add(depth + 1, 'pass', position)
+
+def _generate_charge(source, depth, position):
+    """
+    Adds the consumption of a unit of fuel, made on every pass through a statement-list.
+    """
+    source.add(depth, 'if interpreter._metered:', position)
+    source.add(depth + 1, 'interpreter._charge()', position)
+
+def _generate_limit(source, depth, counter, position):
+    """
+    Adds the loop-limit check, made after every iteration that completes without a ``continue``,
+    which is equivalent to the reference engine's checking before the next.
+    """
+    source.add(depth, '%(counter)s += 1' % {'counter': counter,}, position)
+    source.add(depth, 'if interpreter._loop_limit and interpreter._loop_limit < %(counter)s:' % {
+     'counter': counter,
+    }, position)
+    source.add(depth + 1, '_hard_break(interpreter)', position)
+    source.add(depth + 1, 'break', position)
+
+def _generate_while(source, condition, statements, depth, position):
+    source.add(depth, "interpreter._log.debug('Entering while-loop...')", position)
+    counter = source.name('_n')
+    source.add(depth, '%(counter)s = 0' % {'counter': counter,}, position)
+    if _blocks(condition):
+        source.add(depth, 'while True:', position)
+        source.add(depth + 1, 'if not %(condition)s:' % {
+         'condition': _generate_expression(source, condition, depth + 1, position),
+        }, position)
+        source.add(depth + 2, 'break', position)
+    else:
+        source.add(depth, 'while %(condition)s:' % {
+         'condition': _generate_expression(source, condition, depth, position),
+        }, position)
+    _generate_charge(source, depth + 1, position)
+    _generate_statements(source, statements, depth + 1, position, True)
+    _generate_limit(source, depth + 1, counter, position)
+
+def _generate_for(source, identifier, iterable, statements, depth, position):
+    values = source.hold(depth, _generate_expression(source, iterable, depth, position), position)
+    source.add(depth, 'if %(values)s is None:' % {'values': values,}, position)
+    #Logged as the reference engine does, which treats it as a plain body
+    source.add(depth + 1, "interpreter._log.debug('Entering node...')", position)
+    source.add(depth + 1, "raise ValueError('A foreach-loop cannot iterate over a non-collection')", position)
+    source.add(depth, "interpreter._log.debug('Entering foreach-loop...')", position)
+    counter = source.name('_n')
+    source.add(depth, '%(counter)s = 0' % {'counter': counter,}, position)
+    value = source.name('_v')
+    source.add(depth, 'for %(value)s in %(values)s:' % {
+     'value': value,
+     'values': values,
+    }, position)
+    if identifier[0] == parser.SEQUENCE:
+        source.add(depth + 1, 'interpreter._unpack(%(destination)s, %(value)s, _locals)' % {
+         'destination': source.constant(_literal(identifier[1])),
+         'value': value,
+        }, position)
+    else:
+        source.add(depth + 1, '%(store)s[%(name)r] = %(value)s' % {
+         'store': identifier[0] == parser.TERM_IDENTIFIER_LOCAL_GLOBAL and '_globals' or '_locals',
+         'name': identifier[1],
+         'value': value,
+        }, position)
+    _generate_charge(source, depth + 1, position)
+    _generate_statements(source, statements, depth + 1, position, True)
+    _generate_limit(source, depth + 1, counter, position)
+
+#Expressions
+############
+def _blocks(expression):
+    """
+    Indicates whether evaluating `expression` may prompt.
+    """
+    return not optimizer.never_yields(expression)
+
+def _generate_operands(source, expressions, depth, position):
+    """
+    Provides code for each of `expressions`, holding in temporaries any that must be evaluated
+    before a later one prompts.
+    """
+    blocking = [_blocks(expression) for expression in expressions]
+    operands = []
+    for (i, expression) in enumerate(expressions):
+        operand = _generate_expression(source, expression, depth, position)
+        if True in blocking[i + 1:] and not expression[0] in _LITERALS and not _SETTLED.match(operand):
+            operand = source.hold(depth, operand, position)
+        operands.append(operand)
+    return operands
+
+def _generate_expression(source, expression, depth, position):
+    """
+    Provides code that evaluates `expression`, adding to `source`, at `depth`, anything that must
+    happen first.
+    """
+    expression_type = expression[0]
+    if expression_type in _CONSTANTS:
+        return _literal(expression[1])
+    elif expression_type == parser.TERM_STRING:
+        return source.constant(_literal(expression[1]))
+    elif expression_type == parser.SEQUENCE_CONSTANT: #Prebuilt by the optimizer; hand out a fresh copy
+        return '_Sequence(%(values)s)' % {'values': source.constant(_literal(expression[1])),}
+    elif expression_type == parser.TERM_IDENTIFIER_LOCAL:
+        return "(_locals[%(name)r] if %(name)r in _locals else interpreter._resolve_local_identifier(%(name)r, _locals))" % {
+         'name': expression[1],
+        }
+    elif expression_type in (parser.TERM_IDENTIFIER_LOCAL_LOCAL, parser.TERM_IDENTIFIER_LOCAL_GLOBAL):
+        return "(%(store)s[%(name)r] if %(name)r in %(store)s else _undeclared(%(name)r))" % {
+         'store': expression_type == parser.TERM_IDENTIFIER_LOCAL_GLOBAL and '_globals' or '_locals',
+         'name': expression[1],
+        }
+    elif expression_type == parser.TERM_IDENTIFIER_SCOPED:
+        return 'interpreter._resolve_scoped_identifier(%(site)s, _locals)' % {
+         'site': source.constant('_Site(%(name)r)' % {'name': expression[1],}),
+        }
+    elif expression_type in _OPERATIONS:
+        return _OPERATIONS[expression_type] % tuple(_generate_operands(source, expression[1:3], depth, position))
+    elif expression_type in (parser.TEST_BOOL_OR, parser.TEST_BOOL_AND):
+        return _generate_boolean(source, expression_type == parser.TEST_BOOL_OR, expression[1], expression[2], depth, position)
+    elif expression_type == parser.TEST_NEGATE:
+        return '(not %(operand)s)' % {
+         'operand': _generate_expression(source, expression[1], depth, position),
+        }
+    elif expression_type in _CALLS:
+        if expression_type == parser.FUNCTIONCALL_SCOPED: #Found through the site's cache
+            target = source.constant('_Site(%(name)r)' % {'name': expression[1],})
+        else: #Linked to its function by the site
+            target = source.constant('_CallSite(%(name)r, %(parameters)r)' % {
+             'name': expression[1],
+             'parameters': tuple(sorted(expression[2].keys())),
+            })
+        return _generate_call(source, '%(caller)s(interpreter, _locals, %(target)s, %(arguments)s)' % {
+         'caller': expression_type == parser.FUNCTIONCALL_LOCAL and '_call_local' or '_call_scoped',
+         'target': target,
+         'arguments': _generate_arguments(source, expression[2], depth, position),
+        }, depth, position)
+    elif expression_type == parser.SUFFIX:
+        return _generate_suffix(source, expression[1], expression[2], depth, position)
+    elif expression_type == parser.SEQUENCE:
+        return '_Sequence([%(elements)s])' % {
+         'elements': ', '.join(_generate_operands(source, expression[1], depth, position)),
+        }
+    #Fail only if it is actually reached, as the reference engine would
+    return '_unknown(%(message)r)' % {
+     'message': "Unknown expression encountered: %(expression)r" % {
+      'expression': expression,
+     },
+    }
+
+def _generate_boolean(source, disjunction, left, right, depth, position):
+    left = _generate_expression(source, left, depth, position)
+    if not _blocks(right):
+        return '(%(left)s %(operator)s %(right)s)' % {
+         'left': left,
+         'operator': disjunction and 'or' or 'and',
+         'right': _generate_expression(source, right, depth, position),
+        }
+
+    value = source.hold(depth, left, position) #The right side is reached only if needed
+    source.add(depth, '%(test)s %(value)s:' % {
+     'test': disjunction and 'if not' or 'if',
+     'value': value,
+    }, position)
+    source.add(depth + 1, '%(value)s = %(right)s' % {
+     'value': value,
+     'right': _generate_expression(source, right, depth + 1, position),
+    }, position)
+    return value
+
+def _generate_suffix(source, base, suffix, depth, position):
+    target = '(%(base)s)' % {'base': _generate_expression(source, base, depth, position),}
+    for token in suffix[1].split('.'):
+        if keyword.iskeyword(token) or token in ('None', 'True', 'False', 'print', 'exec', 'nonlocal'):
+            target = 'getattr(%(target)s, %(token)r)' % {
+             'target': target,
+             'token': token,
+            }
+        else:
+            target = '%(target)s.%(token)s' % {
+             'target': target,
+             'token': token,
+            }
+
+    if suffix[0] == parser.TERM_IDENTIFIER_SUFFIX:
+        return '_marshall(%(target)s)' % {'target': target,}
+
+    if [True for expression in suffix[2].values() if _blocks(expression)]: #Resolved before any argument
+        target = source.hold(depth, target, position)
+    return _generate_call(source, '_call_bound(interpreter, %(target)s, %(arguments)s)' % {
+     'target': target,
+     'arguments': _generate_arguments(source, suffix[2], depth, position),
+    }, depth, position)
+
+def _generate_arguments(source, arguments, depth, position):
+    names = list(arguments.keys())
+    values = _generate_operands(source, [arguments[name] for name in names], depth, position)
+    return '{%(arguments)s}' % {
+     'arguments': ', '.join('%r: %s' % (name, value) for (name, value) in zip(names, values)),
+    }
+
+def _generate_call(source, call, depth, position):
+    """
+    Adds `call`, which invokes a function through one of the ``_call_*()`` helpers, followed by
+    the ``yield`` that has the driver run whatever coroutine or `driver.Call` it may provide, and
+    provides the name of the temporary that receives its value.
+    """
+    value = source.hold(depth, call, position)
+    source.add(depth, 'if isinstance(%(value)s, _Pending):' % {'value': value,}, position)
+    source.delegate(depth + 1, value, position)
+    return value
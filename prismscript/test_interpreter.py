@@ -22,6 +22,8 @@ letter to Creative Commons, 171 Second Street, Suite 300, San Francisco, Califor
 """
 import unittest
 
+from processor import interpreter
+from processor import tests
 from processor.tests import expressions
 from processor.tests import nodes
 from processor.tests import functions
@@ -29,12 +31,25 @@ from processor.tests import conditionals
 from processor.tests import complex
 from processor.tests import threading
 from processor.tests import types
+from processor.tests import optimizer
+from processor.tests import engines
+from processor.tests import log
+from processor.tests import limits
+from processor.tests import sites
+from processor.tests import programs
 
-if __name__ == '__main__':
-    all_tests = unittest.TestSuite((
+_ENGINES = (
+ interpreter.ENGINE_TREE, interpreter.ENGINE_CLOSURE, interpreter.ENGINE_PYTHON, interpreter.ENGINE_BYTECODE,
+)
+
+def _build_suite():
+    return unittest.TestSuite((
      unittest.TestSuite((
       unittest.TestLoader().loadTestsFromTestCase(types.MarshallingTestCase),
       unittest.TestLoader().loadTestsFromTestCase(types.RecursionTestCase),
+      unittest.TestLoader().loadTestsFromTestCase(types.ViewTestCase),
+      unittest.TestLoader().loadTestsFromTestCase(types.HostTestCase),
+      unittest.TestLoader().loadTestsFromTestCase(types.RegistryTestCase),
      )),
      unittest.TestSuite((
       unittest.TestLoader().loadTestsFromTestCase(expressions.ScopesTestCase),
@@ -49,6 +64,8 @@ if __name__ == '__main__':
      unittest.TestSuite((
       unittest.TestLoader().loadTestsFromTestCase(nodes.SimpleTestCase),
       unittest.TestLoader().loadTestsFromTestCase(nodes.ExitTestCase),
+      unittest.TestLoader().loadTestsFromTestCase(nodes.TransferTestCase),
+      unittest.TestLoader().loadTestsFromTestCase(nodes.ExtensionTestCase),
      )),
      unittest.TestSuite((
       unittest.TestLoader().loadTestsFromTestCase(functions.MathTestCase),
@@ -66,7 +83,35 @@ if __name__ == '__main__':
       unittest.TestLoader().loadTestsFromTestCase(threading.ThreadTestCase),
       unittest.TestLoader().loadTestsFromTestCase(threading.LockTestCase),
      )),
+     unittest.TestSuite((
+      unittest.TestLoader().loadTestsFromTestCase(optimizer.OptimizerTestCase),
+     )),
+     unittest.TestSuite((
+      unittest.TestLoader().loadTestsFromTestCase(engines.EngineTestCase),
+      unittest.TestLoader().loadTestsFromTestCase(engines.ReferenceTestCase),
+      unittest.TestLoader().loadTestsFromTestCase(engines.TranspilerTestCase),
+      unittest.TestLoader().loadTestsFromTestCase(engines.BytecodeTestCase),
+     )),
+     unittest.TestSuite((
+      unittest.TestLoader().loadTestsFromTestCase(log.LogTestCase),
+     )),
+     unittest.TestSuite((
+      unittest.TestLoader().loadTestsFromTestCase(limits.LimitTestCase),
+     )),
+     unittest.TestSuite((
+      unittest.TestLoader().loadTestsFromTestCase(sites.SiteTestCase),
+     )),
+     unittest.TestSuite((
+      unittest.TestLoader().loadTestsFromTestCase(programs.ProgramTestCase),
+     )),
     ))
-    unittest.TextTestRunner().run(all_tests)
+    
+if __name__ == '__main__':
+    for engine in _ENGINES: #Every engine has to pass the same tests
+        print("Testing the '%(engine)s' engine..." % {
+         'engine': engine,
+        })
+        tests.set_engine(engine)
+        unittest.TextTestRunner().run(_build_suite())
     
 